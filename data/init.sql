@@ -52,6 +52,7 @@ CREATE TABLE IF NOT EXISTS instruction (
     id_cocktail INTEGER REFERENCES cocktail(id_cocktail) ON DELETE CASCADE,
     langue VARCHAR(5) NOT NULL,
     texte TEXT,
+    document TSVECTOR,  -- recherche plein texte (nom, ingrédients, texte)
     PRIMARY KEY (id_instruction, langue)
 );
 
@@ -63,6 +64,9 @@ CREATE TABLE IF NOT EXISTS cocktail_ingredient (
     id_ingredient INTEGER NOT NULL REFERENCES ingredient(id_ingredient) ON DELETE CASCADE,
     qte NUMERIC(10,3),
     unite VARCHAR(100),
+    qte_normalisee NUMERIC(12,3),  -- qte en ml (liquide) ou en g (solide)
+    type_unite VARCHAR(20),        -- liquide, solide, autre
+    unite_canonique VARCHAR(100),  -- unite sans quantite (voir unite_comparee)
     PRIMARY KEY (id_cocktail, id_ingredient)
 );
 
@@ -85,6 +89,8 @@ CREATE TABLE IF NOT EXISTS stock (
     id_ingredient INTEGER REFERENCES ingredient(id_ingredient) ON DELETE CASCADE,
     quantite NUMERIC(10,3),
     id_unite INTEGER REFERENCES unite(id_unite),
+    qte_normalisee NUMERIC(12,3),  -- quantite en ml (liquide) ou en g (solide)
+    type_unite VARCHAR(20),        -- liquide, solide, autre
     PRIMARY KEY (id_utilisateur, id_ingredient)
 );
 
@@ -114,3 +120,65 @@ CREATE TABLE IF NOT EXISTS avis (
     date_modification TIMESTAMP(0) DEFAULT NOW() NOT NULL,
     PRIMARY KEY (id_utilisateur, id_cocktail)
 );
+
+-- ================================
+-- TABLE cocktails_realisables_utilisateur
+-- ================================
+-- Résumé calculé hors ligne (python -m src.jobs.calculer_realisables)
+CREATE TABLE IF NOT EXISTS cocktails_realisables_utilisateur (
+    id_utilisateur INTEGER PRIMARY KEY
+        REFERENCES utilisateur(id_utilisateur) ON DELETE CASCADE,
+    ids_cocktails INTEGER[] NOT NULL,
+    nb_cocktails INTEGER NOT NULL,
+    nb_nouveaux INTEGER NOT NULL,  -- réalisables depuis le calcul précédent
+    date_calcul TIMESTAMP(0) DEFAULT NOW() NOT NULL
+);
+
+-- ================================
+-- TABLE reprise_tache
+-- ================================
+-- Dernier utilisateur traité par une tâche hors ligne interrompue
+CREATE TABLE IF NOT EXISTS reprise_tache (
+    nom_tache VARCHAR(50) PRIMARY KEY,
+    dernier_id_utilisateur INTEGER NOT NULL,
+    date_maj TIMESTAMP(0) DEFAULT NOW() NOT NULL
+);
+
+-- ================================
+-- Migrations des bases existantes
+-- ================================
+-- Quantités normalisées (remplies par python -m src.jobs.normaliser_quantites)
+ALTER TABLE cocktail_ingredient ADD COLUMN IF NOT EXISTS qte_normalisee NUMERIC(12,3);
+ALTER TABLE cocktail_ingredient ADD COLUMN IF NOT EXISTS type_unite VARCHAR(20);
+ALTER TABLE cocktail_ingredient ADD COLUMN IF NOT EXISTS unite_canonique VARCHAR(100);
+ALTER TABLE stock ADD COLUMN IF NOT EXISTS qte_normalisee NUMERIC(12,3);
+ALTER TABLE stock ADD COLUMN IF NOT EXISTS type_unite VARCHAR(20);
+
+-- Version des identifiants (pseudo, mot de passe) portée par les jetons : un
+-- jeton d'une version antérieure est révoqué
+ALTER TABLE utilisateur
+    ADD COLUMN IF NOT EXISTS version_identifiants INTEGER NOT NULL DEFAULT 0;
+
+-- Recherche plein texte sur le nom, les ingrédients et les instructions
+-- (documents remplis par InstructionDAO ; pour les instructions existantes :
+-- python -m src.jobs.indexer_instructions)
+ALTER TABLE instruction ADD COLUMN IF NOT EXISTS document TSVECTOR;
+CREATE INDEX IF NOT EXISTS instruction_document_idx
+    ON instruction USING GIN (document);
+
+-- Dictionnaire de recherche d'une langue d'instruction ('simple' : sans
+-- racinisation ni mots vides)
+CREATE OR REPLACE FUNCTION config_recherche(langue TEXT) RETURNS REGCONFIG
+LANGUAGE SQL IMMUTABLE AS $$
+    SELECT CASE LOWER(langue)
+        WHEN 'en' THEN 'english'
+        WHEN 'fr' THEN 'french'
+        WHEN 'es' THEN 'spanish'
+        WHEN 'de' THEN 'german'
+        WHEN 'it' THEN 'italian'
+        WHEN 'pt' THEN 'portuguese'
+        WHEN 'nl' THEN 'dutch'
+        ELSE 'simple'
+    END::REGCONFIG
+$$;
+
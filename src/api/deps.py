@@ -2,6 +2,9 @@
 Provides token and user authentication dependencies.
 """
 
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from functools import partial
 from typing import Annotated
 
 import jwt
@@ -10,10 +13,12 @@ from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
 
+from src.dao.cache_utilisateurs import CacheUtilisateurs
 from src.dao.utilisateur_dao import UtilisateurDAO
-from src.models import TokenPayload, User
+from src.models import TokenPayload, User, UserClaims
 from src.service.utilisateur_service import UtilisateurService
 from src.utils import securite
+from src.utils.contexte_logs import definir_utilisateur
 from src.utils.exceptions import DAOError, UserNotFoundError
 from src.utils.settings import settings
 
@@ -23,13 +28,28 @@ reusable_oauth2 = OAuth2PasswordBearer(
 
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
+# Même schéma, sans erreur si le jeton est absent (routes ouvertes à tous)
+reusable_oauth2_optionnel = OAuth2PasswordBearer(
+    tokenUrl=f"{settings.ROOT_PATH}{settings.API_STR}/login/access-token",
+    auto_error=False,
+)
 
-def get_user(token: TokenDep) -> User:
-    """Retrieve the current user from a JWT token.
 
-    :param token: JWT token dependency
-    :raises HTTPException: Raised if credentials are invalid or user not found
-    :return: The authenticated User object
+def _identifiants_invalides() -> HTTPException:
+    """Build the error returned for an invalid or revoked token."""
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _decoder_jeton(token: str) -> tuple[int, TokenPayload]:
+    """Decode a JWT token and return the user ID with the token claims.
+
+    :param token: JWT token
+    :raises HTTPException: Raised if the token is invalid or has no subject
+    :return: The user ID and the token payload
     """
     try:
         payload = jwt.decode(
@@ -38,23 +58,25 @@ def get_user(token: TokenDep) -> User:
             algorithms=[securite.ALGORITHM],
         )
         token_data = TokenPayload.model_validate(payload)
+        id_utilisateur = int(token_data.sub or "")
+    except (InvalidTokenError, ValidationError, ValueError):
+        raise _identifiants_invalides() from None
+    return id_utilisateur, token_data
 
-        if not token_data.sub:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
 
-        user_service = UtilisateurService(UtilisateurDAO())
-        return user_service.read(id_utilisateur=int(token_data.sub))
+def _lecteur(id_utilisateur: int) -> Callable[[], User]:
+    """Return the function reading a user from the database."""
+    return partial(
+        UtilisateurService(UtilisateurDAO()).read,
+        id_utilisateur=id_utilisateur,
+    )
 
-    except (InvalidTokenError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        ) from None
+
+@contextmanager
+def _lecture_utilisateur() -> Generator[None]:
+    """Translate the errors raised while reading the user into HTTP errors."""
+    try:
+        yield
     except UserNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -67,4 +89,94 @@ def get_user(token: TokenDep) -> User:
         ) from None
 
 
+def get_user(token: TokenDep) -> User:
+    """Retrieve the current user from a JWT token.
+
+    :param token: JWT token dependency
+    :raises HTTPException: Raised if credentials are invalid or revoked, or
+        user not found
+    :return: The authenticated User object
+    """
+    id_utilisateur, token_data = _decoder_jeton(token)
+
+    # Utilisateur gardé en mémoire : pas de requête dans le cas courant
+    with _lecture_utilisateur():
+        utilisateur = CacheUtilisateurs().obtenir(
+            id_utilisateur,
+            _lecteur(id_utilisateur),
+        )
+    if (
+        token_data.ver is not None
+        and token_data.ver != utilisateur.version_identifiants
+    ):
+        raise _identifiants_invalides()
+    definir_utilisateur(id_utilisateur)
+    return utilisateur
+
+
 CurrentUser = Annotated[User, Depends(get_user)]
+
+
+def get_user_optionnel(
+    token: Annotated[str | None, Depends(reusable_oauth2_optionnel)],
+) -> User | None:
+    """Retrieve the current user if a token was sent.
+
+    :param token: JWT token dependency, None if absent
+    :raises HTTPException: Raised if a token is sent but is invalid
+    :return: The authenticated User object, or None without token
+    """
+    return get_user(token) if token else None
+
+
+OptionalUser = Annotated[User | None, Depends(get_user_optionnel)]
+
+
+def get_user_claims(token: TokenDep) -> UserClaims:
+    """Retrieve the current user's identity from the signed token claims.
+
+    Only the credentials version is checked, against the in-memory user
+    cache: the user is not read from the database in the common case. A
+    token issued before a password or pseudo change is revoked.
+
+    :param token: JWT token dependency
+    :raises HTTPException: Raised if credentials are invalid or revoked, or
+        user not found
+    :return: The user ID and pseudo
+    """
+    id_utilisateur, token_data = _decoder_jeton(token)
+    if token_data.pseudo is None or token_data.ver is None:
+        # Jeton émis avant l'ajout des claims : identité lue comme avant
+        utilisateur = get_user(token)
+        return UserClaims(
+            id_utilisateur=utilisateur.id_utilisateur,
+            pseudo=utilisateur.pseudo,
+        )
+
+    with _lecture_utilisateur():
+        version = CacheUtilisateurs().version_identifiants(
+            id_utilisateur,
+            _lecteur(id_utilisateur),
+        )
+    if token_data.ver != version:
+        raise _identifiants_invalides()
+    definir_utilisateur(id_utilisateur)
+    return UserClaims(id_utilisateur=id_utilisateur, pseudo=token_data.pseudo)
+
+
+CurrentUserClaims = Annotated[UserClaims, Depends(get_user_claims)]
+
+
+def get_user_claims_optionnel(
+    token: Annotated[str | None, Depends(reusable_oauth2_optionnel)],
+) -> UserClaims | None:
+    """Retrieve the current user's identity if a token was sent.
+
+    :param token: JWT token dependency, None if absent
+    :raises HTTPException: Raised if a token is sent but is invalid or revoked
+    :return: The user ID and pseudo, or None without token
+    """
+    return get_user_claims(token) if token else None
+
+
+OptionalUserClaims = Annotated[UserClaims | None, Depends(get_user_claims_optionnel)]
@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Path, Query, status
 
-from src.api.deps import CurrentUser
+from src.api.deps import CurrentUserClaims
 from src.dao.cocktail_dao import CocktailDAO
 from src.models.acces import AccessList, AccessResponse, PrivateCocktailsList
 from src.models.cocktail import CocktailPriveCreate, IngredientCreate
@@ -38,7 +38,7 @@ cocktail_service = CocktailService(CocktailDAO())
     status_code=status.HTTP_201_CREATED,
 )
 def create_private_cocktail(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
     cocktail_prive: CocktailPriveCreate,
 ) -> dict:
     """Crée un nouveau cocktail privé pour l'utilisateur connecté.
@@ -48,7 +48,7 @@ def create_private_cocktail(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
     cocktail_prive : CocktailPriveCreate
         Données du cocktail à créer avec ses ingrédients
@@ -160,7 +160,7 @@ def create_private_cocktail(
     status_code=status.HTTP_201_CREATED,
 )
 def create_ingredient(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
     ingredient: IngredientCreate,
 ) -> dict:
     """Crée un nouvel ingrédient dans la base de données.
@@ -170,7 +170,7 @@ def create_ingredient(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié
     ingredient : IngredientCreate
         Données de l'ingrédient à créer
@@ -200,7 +200,7 @@ def create_ingredient(
     summary="Retirer un cocktail de ma liste privée (par nom)",
 )
 def remove_cocktail_from_private_list_by_name(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
     cocktail_name: Annotated[
         str,
         Query(..., description="Le nom du cocktail à retirer", min_length=1),
@@ -212,7 +212,7 @@ def remove_cocktail_from_private_list_by_name(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
     cocktail_name : str
         Le nom du cocktail à retirer (insensible à la casse)
@@ -258,7 +258,7 @@ def remove_cocktail_from_private_list_by_name(
     status_code=201,
 )
 def grant_access(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
     user_pseudo: Annotated[
         str,
         Query(..., description="Le pseudo de l'utilisateur à qui donner l'accès"),
@@ -270,7 +270,7 @@ def grant_access(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
     user_pseudo : str
         Le pseudo de l'utilisateur qui recevra l'accès
@@ -314,7 +314,7 @@ def grant_access(
     summary="Retirer l'accès à un utilisateur",
 )
 def revoke_access(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
     user_pseudo: Annotated[
         str,
         Query(..., description="Le pseudo de l'utilisateur dont retirer l'accès"),
@@ -326,7 +326,7 @@ def revoke_access(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
     user_pseudo : str
         Le pseudo de l'utilisateur dont retirer l'accès
@@ -363,7 +363,7 @@ def revoke_access(
     summary="Voir qui a accès à mes cocktails privés",
 )
 def get_access_list(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> AccessList:
     """Récupère la liste des utilisateurs ayant accès à vos cocktails privés.
 
@@ -371,7 +371,7 @@ def get_access_list(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -408,7 +408,7 @@ def get_access_list(
     summary="Voir les cocktails privés d'un autre utilisateur",
 )
 def view_private_cocktails(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
     owner_pseudo: Annotated[
         str,
         Path(description="Le pseudo du propriétaire des cocktails"),
@@ -420,7 +420,7 @@ def view_private_cocktails(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
     owner_pseudo : str
         Le pseudo du propriétaire des cocktails à consulter
@@ -461,7 +461,7 @@ def view_private_cocktails(
     summary="Voir mes propres cocktails privés",
 )
 def get_my_private_cocktails(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> PrivateCocktailsList:
     """Récupère la liste de vos propres cocktails privés.
 
@@ -469,7 +469,7 @@ def get_my_private_cocktails(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
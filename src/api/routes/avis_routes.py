@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, HTTPException
 
-from src.api.deps import CurrentUser
+from src.api.deps import CurrentUserClaims
 from src.models.avis import AvisCreate, AvisSummary
 from src.service.avis_service import AvisService
 from src.utils.exceptions import (
@@ -37,7 +37,7 @@ Ajoute ou modifie un avis sur un cocktail.
 )
 def add_avis(
     avis: AvisCreate,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Ajoute ou modifie un avis sur un cocktail.
 
@@ -50,7 +50,7 @@ def add_avis(
     ----------
     avis : AvisCreate
         Objet contenant nom_cocktail, note (optionnel), commentaire (optionnel)
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -104,7 +104,7 @@ Supprime mon avis sur un cocktail.
 )
 def delete_avis(
     nom_cocktail: str,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Supprime l'avis de l'utilisateur connecté sur un cocktail.
 
@@ -114,7 +114,7 @@ def delete_avis(
     ----------
     nom_cocktail : str
         Le nom du cocktail dont supprimer l'avis
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -182,14 +182,14 @@ Récupère tous mes avis (format simplifié).
 ```
 """,
 )
-def get_mes_avis(current_user: CurrentUser) -> dict:
+async def get_mes_avis(current_user: CurrentUserClaims) -> dict:
     """Récupère tous les avis de l'utilisateur connecté au format simplifié.
 
     L'utilisateur est automatiquement récupéré depuis le token JWT.
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -208,7 +208,7 @@ def get_mes_avis(current_user: CurrentUser) -> dict:
 
     """
     try:
-        return service.get_mes_avis_simple(
+        return await service.get_mes_avis_simple_async(
             id_utilisateur=current_user.id_utilisateur,
             pseudo=current_user.pseudo,
         )
@@ -232,14 +232,17 @@ Récupère tous les avis d'un cocktail.
 - Date de modification
 """,
 )
-def get_avis_cocktail(nom_cocktail: str, _current_user: CurrentUser) -> list:
+async def get_avis_cocktail(
+    nom_cocktail: str,
+    _current_user: CurrentUserClaims,
+) -> list:
     """Récupère tous les avis d'un cocktail (endpoint public).
 
     Parameters
     ----------
     nom_cocktail : str
         Le nom du cocktail
-    _current_user : CurrentUser
+    _current_user : CurrentUserClaims
         L'utilisateur authentifié (non utilisé, endpoint public)
 
     Returns
@@ -257,7 +260,7 @@ def get_avis_cocktail(nom_cocktail: str, _current_user: CurrentUser) -> list:
 
     """
     try:
-        return service.get_avis_cocktail(nom_cocktail)
+        return await service.get_avis_cocktail_async(nom_cocktail)
     except CocktailNotFoundError as e:
         raise HTTPException(
             status_code=404,
@@ -281,14 +284,17 @@ Récupère un résumé statistique des avis d'un cocktail.
 - Nombre de favoris
 """,
 )
-def get_avis_summary(nom_cocktail: str, _current_user: CurrentUser) -> AvisSummary:
+async def get_avis_summary(
+    nom_cocktail: str,
+    _current_user: CurrentUserClaims,
+) -> AvisSummary:
     """Récupère un résumé statistique des avis d'un cocktail.
 
     Parameters
     ----------
     nom_cocktail : str
         Le nom du cocktail
-    _current_user : CurrentUser
+    _current_user : CurrentUserClaims
         L'utilisateur authentifié (non utilisé, endpoint public)
 
     Returns
@@ -306,7 +312,7 @@ def get_avis_summary(nom_cocktail: str, _current_user: CurrentUser) -> AvisSumma
 
     """
     try:
-        return service.get_avis_summary(nom_cocktail)
+        return await service.get_avis_summary_async(nom_cocktail)
     except CocktailNotFoundError as e:
         raise HTTPException(
             status_code=404,
@@ -4,19 +4,172 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.deps import CurrentUser
+from src.api.deps import CurrentUserClaims, OptionalUserClaims
 from src.dao.cocktail_dao import CocktailDAO
-from src.models.cocktail import CocktailAvecInstructions
+from src.models.cocktail import (
+    CocktailAvecInstructions,
+    FiltresCatalogue,
+    FiltresTirage,
+)
 from src.service.cocktail_service import CocktailService
-from src.utils.exceptions import CocktailSearchError, ServiceError
+from src.utils.exceptions import (
+    CocktailSearchError,
+    EmptyFieldError,
+    InvalidCursorError,
+    ServiceError,
+)
 
 router = APIRouter(prefix="/cocktails", tags=["Cocktails"])
 
 cocktail_service = CocktailService(cocktail_dao=CocktailDAO())
 
 
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="🗂️ Parcourir le catalogue",
+    description="""
+Parcourt le catalogue filtré par **catégorie**, **verre**, **alcool** et
+**ingrédients** requis ou exclus, trié par nom.
+
+Les valeurs d'un même filtre se cumulent (`?verre=Highball glass&verre=Coupe`) ;
+les filtres différents se combinent. La réponse donne aussi, pour chaque
+facette, le nombre de cocktails de chacune de ses valeurs compte tenu des
+autres filtres.
+
+**Exemple de réponse :**
+```json
+{
+  "cocktails": [
+    {
+      "id_cocktail": 11000,
+      "nom": "Mojito",
+      "categorie": "Cocktail",
+      "verre": "Highball glass",
+      "alcool": true,
+      "image": "https://..."
+    }
+  ],
+  "nombre_cocktails": 1,
+  "facettes": {
+    "categorie": [{"valeur": "Cocktail", "nombre": 1}],
+    "verre": [{"valeur": "Highball glass", "nombre": 1}],
+    "alcool": [{"valeur": true, "nombre": 1}]
+  },
+  "curseur_suivant": null
+}
+```
+
+**Pagination :** passer `curseur_suivant` dans `curseur` pour obtenir la page
+suivante (null en fin de liste).
+""",
+)
+async def parcourir_catalogue(
+    filtres: Annotated[FiltresCatalogue, Query()],
+) -> dict:
+    """Parcourt le catalogue par facettes.
+
+    Parameters
+    ----------
+    filtres : FiltresCatalogue
+        Facettes, ingrédients requis et exclus, pagination
+
+    Returns
+    -------
+    dict
+        Une page de cocktails, leur nombre total et les comptes des facettes
+
+    Raises
+    ------
+    HTTPException
+        400 si le curseur est invalide
+        500 si erreur serveur
+
+    """
+    try:
+        return await cocktail_service.parcourir_catalogue_async(
+            filtres.selection(),
+            filtres.limit,
+            filtres.curseur,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    except ServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
+
+
+@router.get(
+    "/aleatoire",
+    status_code=status.HTTP_200_OK,
+    summary="🎲 Cocktails au hasard",
+    description="""
+Tire au hasard `nombre` cocktails distincts, avec leurs instructions.
+
+Les mêmes filtres que `GET /cocktails` (catégorie, verre, alcool, ingrédients
+requis ou exclus) peuvent restreindre le tirage. Avec
+`max_ingredients_manquants` (authentification requise), seuls les cocktails
+réalisables avec le stock de l'utilisateur, à ce nombre d'ingrédients près,
+sont tirés.
+
+Moins de `nombre` cocktails sont retournés si peu de cocktails sont retenus.
+""",
+)
+async def tirer_cocktails_aleatoires(
+    filtres: Annotated[FiltresTirage, Query()],
+    current_user: OptionalUserClaims,
+) -> dict:
+    """Tire des cocktails au hasard.
+
+    Parameters
+    ----------
+    filtres : FiltresTirage
+        Nombre de cocktails, facettes, ingrédients et faisabilité
+    current_user : OptionalUserClaims
+        Utilisateur connecté, s'il a envoyé un jeton
+
+    Returns
+    -------
+    dict
+        Les cocktails tirés avec leurs instructions
+
+    Raises
+    ------
+    HTTPException
+        401 si la faisabilité est demandée sans être connecté
+        500 si erreur serveur
+
+    """
+    id_utilisateur = None
+    if filtres.max_ingredients_manquants is not None:
+        if current_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Connexion requise pour filtrer sur le stock",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        id_utilisateur = current_user.id_utilisateur
+    try:
+        return await cocktail_service.tirer_cocktails_aleatoires_async(
+            filtres.nombre,
+            filtres.selection(),
+            id_utilisateur,
+            filtres.max_ingredients_manquants or 0,
+        )
+    except ServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
+
+
 @router.get("/sequence/{sequence}")
-def rechercher_cocktail_par_sequence_debut(
+async def rechercher_cocktail_par_sequence_debut(
     sequence: str,
     max_resultats: int = 10,
 ) -> dict:
@@ -76,7 +229,7 @@ def rechercher_cocktail_par_sequence_debut(
 
     try:
         cocktails_avec_instructions = (
-            cocktail_service.rechercher_cocktail_par_sequence_debut(
+            await cocktail_service.rechercher_cocktail_par_sequence_debut_async(
                 sequence,
                 max_resultats,
             )
@@ -120,7 +273,7 @@ def rechercher_cocktail_par_sequence_debut(
 
 
 @router.get("/nom/{nom}")
-def rechercher_cocktail_par_nom(nom: str) -> CocktailAvecInstructions:
+async def rechercher_cocktail_par_nom(nom: str) -> CocktailAvecInstructions:
     """Récupère tous le cocktail via son nom.
 
     Parameters
@@ -141,7 +294,8 @@ def rechercher_cocktail_par_nom(nom: str) -> CocktailAvecInstructions:
 
     """
     try:
-        cocktail, instructions = cocktail_service.rechercher_cocktail_par_nom(nom)
+        resultat = await cocktail_service.rechercher_cocktail_par_nom_async(nom)
+        cocktail, instructions = resultat
 
     except CocktailSearchError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -162,13 +316,113 @@ def rechercher_cocktail_par_nom(nom: str) -> CocktailAvecInstructions:
     )
 
 
+@router.get(
+    "/recherche",
+    status_code=status.HTTP_200_OK,
+    summary="🔎 Recherche plein texte",
+    description="""
+Recherche des cocktails dans leur **nom**, leurs **ingrédients** et leurs
+**instructions**, classés par pertinence.
+
+**Syntaxe :** `citron menthe` (tous les mots), `"jus de citron"` (expression
+exacte), `rhum or vodka`, `-sucre` (exclusion). Les mots sont ramenés à leur
+racine selon la `langue` des instructions (en, fr, es, de, it, pt, nl).
+
+**Exemple de réponse :**
+```json
+{
+  "resultats": [
+    {
+      "id_cocktail": 11000,
+      "nom": "Mojito",
+      "categorie": "Cocktail",
+      "verre": "Highball glass",
+      "alcool": true,
+      "image": "https://...",
+      "instructions": "Muddle mint leaves with sugar and lime juice...",
+      "rang": 1.2
+    }
+  ],
+  "nombre_resultats": 1,
+  "texte": "mint",
+  "langue": "en",
+  "curseur_suivant": null
+}
+```
+
+**Pagination :** passer `curseur_suivant` dans `curseur` pour obtenir la page
+suivante (null en fin de liste).
+""",
+)
+async def rechercher_plein_texte(
+    texte: Annotated[
+        str,
+        Query(min_length=1, description="Termes recherchés"),
+    ],
+    langue: Annotated[
+        str,
+        Query(min_length=2, max_length=5, description="Langue des instructions"),
+    ] = "en",
+    limit: Annotated[
+        int,
+        Query(ge=1, le=100, description="Nombre de cocktails par page"),
+    ] = 20,
+    curseur: Annotated[
+        str | None,
+        Query(description="Valeur de curseur_suivant de la page précédente"),
+    ] = None,
+) -> dict:
+    """Recherche plein texte classée dans les cocktails.
+
+    Parameters
+    ----------
+    texte : str
+        Les termes recherchés
+    langue : str
+        Langue des instructions (défaut: en)
+    limit : int
+        Taille de la page (1-100, défaut: 20)
+    curseur : str | None
+        Curseur de la page suivante, retourné dans curseur_suivant
+
+    Returns
+    -------
+    dict
+        Les cocktails trouvés, du plus pertinent au moins pertinent
+
+    Raises
+    ------
+    HTTPException
+        400 si le texte est vide ou le curseur invalide
+        500 si erreur serveur
+
+    """
+    try:
+        return await cocktail_service.rechercher_plein_texte_async(
+            texte,
+            langue,
+            limit,
+            curseur,
+        )
+    except (EmptyFieldError, InvalidCursorError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    except ServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
+
+
 @router.get(
     "/realisables",
     status_code=status.HTTP_200_OK,
     summary="Récupérer les cocktails réalisables",
 )
-def get_cocktails_realisables(
-    current_user: CurrentUser,
+async def get_cocktails_realisables(
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Récupère les cocktails réalisables avec le stock actuel de l'utilisateur.
 
@@ -180,7 +434,7 @@ def get_cocktails_realisables(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -199,7 +453,9 @@ def get_cocktails_realisables(
     """
     try:
         service = CocktailService(CocktailDAO())
-        return service.get_cocktails_realisables(current_user.id_utilisateur)
+        return await service.get_cocktails_realisables_async(
+            current_user.id_utilisateur,
+        )
     except ServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -238,13 +494,17 @@ triés par nombre d'ingrédients manquants croissant.
     }
   ],
   "nombre_cocktails": 1,
-  "max_ingredients_manquants": 3
+  "max_ingredients_manquants": 3,
+  "curseur_suivant": null
 }
 ```
+
+**Pagination :** avec `limit`, seule une page est retournée ; passer
+`curseur_suivant` dans `curseur` pour obtenir la suivante (null en fin de liste).
 """,
 )
-def get_cocktails_quasi_realisables(
-    current_user: CurrentUser,
+async def get_cocktails_quasi_realisables(
+    current_user: CurrentUserClaims,
     max_ingredients_manquants: Annotated[
         int,
         Query(
@@ -253,15 +513,31 @@ def get_cocktails_quasi_realisables(
             description="Nombre maximum d'ingrédients manquants acceptés",
         ),
     ] = 3,
+    limit: Annotated[
+        int | None,
+        Query(
+            ge=1,
+            le=100,
+            description="Nombre de cocktails par page (tous si absent)",
+        ),
+    ] = None,
+    curseur: Annotated[
+        str | None,
+        Query(description="Valeur de curseur_suivant de la page précédente"),
+    ] = None,
 ) -> dict:
     """Récupérer les cocktails quasi-réalisables.
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         Dépendance de l'utilisateur connecté
     max_ingredients_manquants : int
         Nombre max d'ingrédients manquants (1-5, défaut: 3)
+    limit : int | None
+        Taille de la page (1-100, tous les cocktails si absent)
+    curseur : str | None
+        Curseur de la page suivante, retourné dans curseur_suivant
 
     Returns
     -------
@@ -271,13 +547,16 @@ def get_cocktails_quasi_realisables(
     Raises
     ------
     HTTPException
+        400 si le curseur est invalide
         500 si erreur serveur
 
     """
     if max_ingredients_manquants == 0:
         try:
             service = CocktailService(CocktailDAO())
-            return service.get_cocktails_realisables(current_user.id_utilisateur)
+            return await service.get_cocktails_realisables_async(
+                current_user.id_utilisateur,
+            )
         except ServiceError as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -285,10 +564,17 @@ def get_cocktails_quasi_realisables(
             ) from e
     try:
         service = CocktailService(CocktailDAO())
-        return service.get_cocktails_quasi_realisables(
+        return await service.get_cocktails_quasi_realisables_async(
             current_user.id_utilisateur,
             max_ingredients_manquants,
+            limit=limit,
+            curseur=curseur,
         )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
     except ServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -299,3 +585,76 @@ def get_cocktails_quasi_realisables(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erreur serveur : {e}",
         ) from e
+
+
+@router.get(
+    "/meilleurs-achats",
+    status_code=status.HTTP_200_OK,
+    summary="🛒 Ingrédients à acheter en priorité",
+    description="""
+Indique quels ingrédients acheter pour débloquer le plus de cocktails.
+
+🔒 Authentification requise
+
+**Fonctionnalité :**
+Parmi les cocktails presque réalisables, choisit au plus `nb_achats`
+ingrédients qui, une fois achetés, rendent réalisables le plus de cocktails.
+
+**Exemple de réponse :**
+```json
+{
+  "ingredients_a_acheter": [
+    {"id_ingredient": 12, "nom": "Lime"},
+    {"id_ingredient": 4, "nom": "Mint"}
+  ],
+  "cocktails_debloques": [
+    {"id_cocktail": 11000, "nom": "Mojito", "...": "..."}
+  ],
+  "nombre_cocktails_debloques": 1,
+  "nb_achats": 3
+}
+```
+""",
+)
+async def get_meilleurs_achats(
+    current_user: CurrentUserClaims,
+    nb_achats: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=10,
+            description="Nombre maximum d'ingrédients à acheter",
+        ),
+    ] = 3,
+) -> dict:
+    """Récupérer les ingrédients à acheter pour débloquer le plus de cocktails.
+
+    Parameters
+    ----------
+    current_user : CurrentUserClaims
+        Dépendance de l'utilisateur connecté
+    nb_achats : int
+        Nombre maximum d'ingrédients à acheter (1-10, défaut: 3)
+
+    Returns
+    -------
+    dict
+        Ingrédients à acheter et cocktails qu'ils débloquent
+
+    Raises
+    ------
+    HTTPException
+        500 si erreur serveur
+
+    """
+    try:
+        service = CocktailService(CocktailDAO())
+        return await service.get_meilleurs_achats_async(
+            current_user.id_utilisateur,
+            nb_achats,
+        )
+    except ServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        ) from e
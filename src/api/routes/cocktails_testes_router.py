@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.deps import CurrentUser
+from src.api.deps import CurrentUserClaims
 from src.models.cocktail_prive import CocktailResponse
 from src.service.cocktail_utilisateur_service import CocktailUtilisateurService
 
@@ -19,14 +19,14 @@ service = CocktailUtilisateurService()
     description="Récupère tous les cocktails testés par l'utilisateur connecté. "
     "L'utilisateur propriétaire est automatiquement récupéré depuis le token JWT.",
 )
-def get_mes_cocktails_testes(current_user: CurrentUser) -> list[CocktailResponse]:
+def get_mes_cocktails_testes(current_user: CurrentUserClaims) -> list[CocktailResponse]:
     """Récupère tous les cocktails testés par l'utilisateur connecté.
 
     L'utilisateur est automatiquement récupéré depuis le token JWT.
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -75,7 +75,7 @@ def ajouter_cocktail_teste(
         str,
         Query(description="Le nom du cocktail à marquer commetesté"),
     ],
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Ajoute un cocktail aux cocktails testés pour l'utilisateur connecté.
 
@@ -88,7 +88,7 @@ def ajouter_cocktail_teste(
     ----------
     nom_cocktail : str
         Le nom du cocktail à marquer comme testé
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -152,7 +152,7 @@ def retirer_cocktail_teste(
         str,
         Query(description="Le nom du cocktail dont retirer le statut testé"),
     ],
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Retire un cocktail des cocktails testés pour l'utilisateur connecté.
 
@@ -164,7 +164,7 @@ def retirer_cocktail_teste(
     ----------
     nom_cocktail : str
         Le nom du cocktail dont retirer le statut testé
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
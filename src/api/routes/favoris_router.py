@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, HTTPException
 
-from src.api.deps import CurrentUser
+from src.api.deps import CurrentUserClaims
 from src.service.avis_service import AvisService
 from src.utils.exceptions import AvisNotFoundError, CocktailNotFoundError, ServiceError
 
@@ -28,7 +28,7 @@ Vous pourrez ajouter note/commentaire plus tard avec POST /add.
 )
 def add_favoris(
     nom_cocktail: str,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Ajoute un cocktail aux favoris de l'utilisateur connecté.
 
@@ -41,7 +41,7 @@ def add_favoris(
     ----------
     nom_cocktail : str
         Le nom du cocktail à ajouter aux favoris
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -92,14 +92,14 @@ Récupère la liste de mes cocktails favoris (format simplifié).
 ```
 """,
 )
-def get_mes_favoris(current_user: CurrentUser) -> dict:
+def get_mes_favoris(current_user: CurrentUserClaims) -> dict:
     """Récupère la liste des cocktails favoris de l'utilisateur connecté.
 
     L'utilisateur est automatiquement récupéré depuis le token JWT.
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -141,7 +141,7 @@ Retire un cocktail des favoris.
 )
 def remove_favoris(
     nom_cocktail: str,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Retire un cocktail des favoris de l'utilisateur connecté.
 
@@ -153,7 +153,7 @@ def remove_favoris(
     ----------
     nom_cocktail : str
         Le nom du cocktail à retirer des favoris
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
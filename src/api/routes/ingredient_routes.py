@@ -4,8 +4,8 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Path, Query, status
 
-from src.api.deps import CurrentUser
-from src.dao.ingredient_dao import IngredientDAO
+from src.api.deps import CurrentUserClaims
+from src.dao.ingredient_dao import AsyncIngredientDAO
 from src.service.ingredient_service import IngredientService
 from src.utils.exceptions import IngredientNotFoundError
 from src.utils.text_utils import normalize_ingredient_name
@@ -33,7 +33,7 @@ Utile pour :
 - Recherche "juice" : retourne "Apple Juice", "Orange Juice", "Cranberry Juice", etc.
 """,
 )
-def search_ingredient(
+async def search_ingredient(
     nom_ingredient: Annotated[
         str,
         Path(
@@ -81,8 +81,10 @@ def search_ingredient(
     """
     try:
         normalized_nom_ingredient = normalize_ingredient_name(nom_ingredient)
-        ingredient_dao = IngredientDAO()
-        results = ingredient_dao.search_by_name(normalized_nom_ingredient, limit=limit)
+        results = await AsyncIngredientDAO().search_by_name(
+            normalized_nom_ingredient,
+            limit=limit,
+        )
 
         return {
             "query_originale": nom_ingredient,
@@ -102,8 +104,8 @@ def search_ingredient(
     "/vérifier-alcool",
     summary="Vérifier si un ingrédient contient de l'alcool (par nom)",
 )
-def check_ingredient_alcohol_by_name(
-    _current_user: CurrentUser,
+async def check_ingredient_alcohol_by_name(
+    _current_user: CurrentUserClaims,
     name: Annotated[
         str,
         Query(
@@ -117,7 +119,7 @@ def check_ingredient_alcohol_by_name(
 
     Parameters
     ----------
-    _current_user : CurrentUser
+    _current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
     name : str
         Le nom de l'ingrédient à vérifier
@@ -141,7 +143,7 @@ def check_ingredient_alcohol_by_name(
 
     """
     try:
-        result = service.check_if_alcoholic_by_name(name)
+        result = await service.check_if_alcoholic_by_name_async(name)
 
     except IngredientNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query
 
-from src.api.deps import CurrentUser
+from src.api.deps import CurrentUserClaims
 from src.service.liste_course_service import ListeCourseService
 from src.utils.exceptions import (
     IngredientNotFoundError,
@@ -32,14 +32,14 @@ Récupère ma liste de course complète.
 - Nombre d'items cochés
 """,
 )
-def get_my_liste_course(current_user: CurrentUser) -> dict:
+def get_my_liste_course(current_user: CurrentUserClaims) -> dict:
     """Récupère la liste de course complète de l'utilisateur connecté.
 
     L'utilisateur est automatiquement récupéré depuis le token JWT.
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -148,7 +148,7 @@ def add_to_liste_course(
             example="ml",
         ),
     ],
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Ajoute un ingrédient à la liste de course.
 
@@ -167,7 +167,7 @@ def add_to_liste_course(
         Quantité à acheter (doit être > 0)
     unite : str
         Abréviation de l'unité (ex: 'ml', 'cl', 'g', 'kg')
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -234,7 +234,7 @@ la conversion se fait automatiquement si les unités sont compatibles.
 )
 def mark_as_bought(
     nom_ingredient: str,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Retire un ingrédient de la liste de course et l'ajoute au stock.
 
@@ -248,7 +248,7 @@ def mark_as_bought(
     ----------
     nom_ingredient : str
         Le nom de l'ingrédient à marquer comme acheté
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -301,7 +301,7 @@ Retire un ingrédient de la liste de course SANS l'ajouter au stock.
 )
 def remove_from_liste_course(
     nom_ingredient: str,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Retire un ingrédient de la liste de course SANS l'ajouter au stock.
 
@@ -314,7 +314,7 @@ def remove_from_liste_course(
     ----------
     nom_ingredient : str
         Le nom de l'ingrédient à retirer
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -364,7 +364,7 @@ Vide complètement la liste de course.
 Les ingrédients ne sont PAS ajoutés au stock.
 """,
 )
-def clear_liste_course(current_user: CurrentUser) -> dict:
+def clear_liste_course(current_user: CurrentUserClaims) -> dict:
     """Vide complètement la liste de course.
 
     ⚠️ Supprime TOUS les ingrédients sans les ajouter au stock.
@@ -373,7 +373,7 @@ def clear_liste_course(current_user: CurrentUser) -> dict:
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -418,7 +418,7 @@ Pour retirer et ajouter au stock, utilisez '/achete/{nom_ingredient}'.
 )
 def toggle_effectue(
     nom_ingredient: str,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict:
     """Bascule le statut 'effectué' d'un item de la liste de course.
 
@@ -431,7 +431,7 @@ def toggle_effectue(
     ----------
     nom_ingredient : str
         Le nom de l'ingrédient à cocher/décocher
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -3,7 +3,7 @@
 from datetime import timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from src.dao.utilisateur_dao import UtilisateurDAO
@@ -28,20 +28,31 @@ service = UtilisateurService(utilisateur_dao=UtilisateurDAO())
 
 
 @router.post("/login/access-token")
-def login_access_token(
+async def login_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    background_tasks: BackgroundTasks,
 ) -> Token:
     """Authenticate user and return an access token.
 
+    If the stored hash does not use the configured bcrypt cost, the password
+    is rehashed in the background once the response is sent.
+
     :param form_data: OAuth2 password request form
+    :param background_tasks: tasks run after the response
     :raises HTTPException: Raised if authentication fails
     :return: Token object with access token and type
     """
     try:
-        user = UtilisateurService(UtilisateurDAO()).authenticate(
+        user = await service.authenticate_async(
             pseudo=form_data.username,
             mot_de_passe=form_data.password,
         )
+        if service.hachage_a_migrer(user):
+            background_tasks.add_task(
+                service.migrer_hachage_async,
+                user,
+                form_data.password,
+            )
 
         access_token_expires = timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -49,6 +60,8 @@ def login_access_token(
         access_token = securite.create_access_token(
             user.id_utilisateur,
             expires_delta=access_token_expires,
+            pseudo=user.pseudo,
+            version=user.version_identifiants,
         )
         return Token(access_token=access_token, token_type=settings.TOKEN_TYPE)
 
@@ -60,10 +73,10 @@ def login_access_token(
 
 
 @router.post("/login/inscription")
-def creer_compte(donnees: UserRegister) -> str:
+async def creer_compte(donnees: UserRegister) -> str:
     """Créer un nouveau compte utilisateur."""
     try:
-        return service.creer_compte(donnees)
+        return await service.creer_compte_async(donnees)
     except EmptyFieldError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.deps import CurrentUser
+from src.api.deps import CurrentUserClaims
 from src.models.stock import Stock, StockItem, StockItemAddByName, StockItemRemove
 from src.service.stock_service import StockService
 from src.utils.exceptions import (
@@ -110,7 +110,7 @@ Pour voir la liste complète : `GET /api/ref/ingredients`
 )
 def add_to_stock(
     item: StockItemAddByName,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict[str, str]:
     """Ajoute ou met à jour un ingrédient dans le stock de l'utilisateur connecté.
 
@@ -123,7 +123,7 @@ def add_to_stock(
     ----------
     item : StockItemAddByName
         Objet contenant nom_ingredient, quantite, unite (abréviation)
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -197,8 +197,8 @@ Récupère le stock de l'utilisateur connecté.
 - `only_available=false` : Tous les ingrédients du stock (même ceux à 0)
 """,
 )
-def get_my_stock(
-    current_user: CurrentUser,
+async def get_my_stock(
+    current_user: CurrentUserClaims,
     *,
     only_available: Annotated[
         bool,
@@ -211,7 +211,7 @@ def get_my_stock(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
     only_available : bool, optional
         Si True, retourne uniquement les ingrédients avec quantité > 0 (défaut: True)
@@ -236,7 +236,7 @@ def get_my_stock(
 
     """
     try:
-        stock = service.get_user_stock(
+        stock = await service.get_user_stock_async(
             id_utilisateur=current_user.id_utilisateur,
             only_available=only_available,
         )
@@ -274,7 +274,7 @@ Le nom sera normalisé automatiquement (ex: "vodka" : "Vodka")
 )
 def get_my_ingredient(
     nom_ingredient: str,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> StockItem:
     """Récupère un ingrédient spécifique du stock par son nom.
 
@@ -286,7 +286,7 @@ def get_my_ingredient(
     ----------
     nom_ingredient : str
         Le nom de l'ingrédient à récupérer
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -365,7 +365,7 @@ utilisez `DELETE /ingredient/{nom_ingredient}`
 )
 def remove_quantity_from_stock(
     item: StockItemRemove,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict[str, str]:
     """Retire une quantité spécifique d'un ingrédient du stock.
 
@@ -379,7 +379,7 @@ def remove_quantity_from_stock(
     ----------
     item : StockItemRemove
         Objet contenant nom_ingredient et quantite à retirer
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -462,7 +462,7 @@ Le nom sera normalisé automatiquement (ex: "vodka" : "Vodka")
 )
 def delete_ingredient_completely(
     nom_ingredient: str,
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> dict[str, str]:
     """Supprime complètement un ingrédient du stock.
 
@@ -477,7 +477,7 @@ def delete_ingredient_completely(
     ----------
     nom_ingredient : str
         Le nom de l'ingrédient à supprimer complètement
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -541,7 +541,7 @@ avec indication de ce que vous possédez.
 """,
 )
 def get_full_stock(
-    current_user: CurrentUser,
+    current_user: CurrentUserClaims,
 ) -> list[dict]:
     """Récupère TOUS les ingrédients existants avec leur quantité dans le stock.
 
@@ -552,7 +552,7 @@ def get_full_stock(
 
     Parameters
     ----------
-    current_user : CurrentUser
+    current_user : CurrentUserClaims
         L'utilisateur authentifié (injecté automatiquement)
 
     Returns
@@ -223,7 +223,7 @@ def changer_pseudo(
     },
     tags=["Compte"],
 )
-def changer_mot_de_passe(
+async def changer_mot_de_passe(
     donnees: UserChangePassword,
     _current_user: CurrentUser,
 ) -> str:
@@ -241,7 +241,7 @@ def changer_mot_de_passe(
     - Le nouveau mot de passe est automatiquement haché
     """
     try:
-        return service.changer_mot_de_passe(donnees)
+        return await service.changer_mot_de_passe_async(donnees)
     except EmptyFieldError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -410,7 +410,7 @@ def obtenir_date_inscription(
     },
     tags=["Compte"],
 )
-def supprimer_compte(donnees: UserDelete, _current_user: CurrentUser) -> str:
+async def supprimer_compte(donnees: UserDelete, _current_user: CurrentUser) -> str:
     """Supprimer un compte utilisateur après authentification.
 
     L'utilisateur doit fournir son pseudo et mot de passe pour confirmer
@@ -420,7 +420,7 @@ def supprimer_compte(donnees: UserDelete, _current_user: CurrentUser) -> str:
     empêcher les suppressions non autorisées.
     """
     try:
-        return service.supprimer_compte(donnees)
+        return await service.supprimer_compte_async(donnees)
     except EmptyFieldError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
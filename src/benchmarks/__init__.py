@@ -0,0 +1 @@
+"""Scripts de mesure des performances des calculs du projet."""
@@ -0,0 +1,163 @@
+"""Mesure du calcul des cocktails réalisables et quasi-réalisables.
+
+Compare, sur un catalogue synthétique, la boucle ligne à ligne de
+CocktailService.build_cocktails_dict (une ligne par couple cocktail/ingrédient)
+au moteur vectorisé de l'index des recettes, et vérifie que les deux donnent
+les mêmes résultats. Mesure aussi la réévaluation incrémentale faite par le
+cache des cocktails réalisables après la modification d'un ingrédient, et le
+choix des meilleurs achats (couverture maximale gloutonne).
+
+Utilisation :
+    python -m src.benchmarks.bench_faisabilite [nb_cocktails] [nb_ingredients]
+"""
+
+import sys
+import time
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.dao.index_recettes import InstantaneIndex
+from src.service.cocktail_service import CocktailService
+
+UNITES = ("ml", "cl", "oz", "g", "tsp", "dash", None)
+NB_REPETITIONS = 50
+
+
+def generer_catalogue(
+    nb_cocktails: int,
+    nb_ingredients: int,
+    graine: int = 42,
+) -> tuple[list[dict], list[dict]]:
+    """Génère un catalogue et un stock aléatoires (reproductibles).
+
+    Parameters
+    ----------
+    nb_cocktails : int
+        Nombre de cocktails du catalogue
+    nb_ingredients : int
+        Nombre d'ingrédients distincts
+    graine : int
+        Graine du générateur aléatoire
+
+    Returns
+    -------
+    tuple[list[dict], list[dict]]
+        Les lignes du catalogue (format get_tous_cocktails_avec_ingredients)
+        et les lignes du stock (format StockDAO.get_stock)
+
+    """
+    rng = np.random.default_rng(graine)
+    catalogue = []
+    for id_cocktail in range(1, nb_cocktails + 1):
+        nb = int(rng.integers(2, 8))
+        ingredients = sorted(rng.choice(nb_ingredients, nb, replace=False))
+        catalogue.extend(
+            {
+                "id_cocktail": id_cocktail,
+                "nom": f"Cocktail {id_cocktail}",
+                "categorie": "Cocktail",
+                "verre": "Highball glass",
+                "alcool": True,
+                "image": "cocktail.jpg",
+                "id_ingredient": int(id_ingredient) + 1,
+                "qte": float(rng.integers(1, 60)),
+                "unite": UNITES[int(rng.integers(len(UNITES)))],
+                "nom_ingredient": f"Ingrédient {id_ingredient + 1}",
+            }
+            for id_ingredient in ingredients
+        )
+
+    stock = [
+        {
+            "id_ingredient": int(id_ingredient) + 1,
+            "quantite": float(rng.integers(1, 100)),
+            "code_unite": UNITES[int(rng.integers(len(UNITES)))],
+        }
+        for id_ingredient in rng.choice(
+            nb_ingredients,
+            nb_ingredients // 3,
+            replace=False,
+        )
+    ]
+    return catalogue, stock
+
+
+def joindre_stock(catalogue: list[dict], stock: list[dict]) -> list[dict]:
+    """Reproduit les lignes de CocktailDAO.get_cocktails_quasi_realisables."""
+    par_ingredient = {row["id_ingredient"]: row for row in stock}
+    lignes = []
+    for row in catalogue:
+        en_stock = par_ingredient.get(row["id_ingredient"], {})
+        lignes.append(
+            {
+                **row,
+                "quantite_requise": row["qte"],
+                "unite_requise": row["unite"],
+                "quantite_stock": en_stock.get("quantite"),
+                "unite_stock": en_stock.get("code_unite"),
+            },
+        )
+    return lignes
+
+
+def chronometrer(fonction: Callable[[], object]) -> float:
+    """Durée moyenne d'un appel, en millisecondes."""
+    debut = time.perf_counter()
+    for _ in range(NB_REPETITIONS):
+        fonction()
+    return (time.perf_counter() - debut) * 1000 / NB_REPETITIONS
+
+
+def main(nb_cocktails: int = 600, nb_ingredients: int = 500) -> None:
+    """Lance la mesure et affiche les durées moyennes."""
+    catalogue, stock = generer_catalogue(nb_cocktails, nb_ingredients)
+    lignes_jointes = joindre_stock(catalogue, stock)
+    service = CocktailService(MagicMock())
+
+    def boucle() -> list[dict]:
+        return service.filter_and_format_cocktails(
+            service.build_cocktails_dict(lignes_jointes),
+            3,
+        )
+
+    index = InstantaneIndex(catalogue)
+
+    def matrice() -> list[dict]:
+        return service.filter_and_format_cocktails(
+            index.cocktails_quasi_realisables(index.evaluer(stock), 3),
+            3,
+        )
+
+    if boucle() != matrice():
+        sys.exit("Résultats différents entre la boucle et la matrice")
+
+    faisabilite = index.evaluer(stock)
+    modifie = {stock[0]["id_ingredient"]}
+
+    mesures = {
+        "construction de l'index": chronometrer(lambda: InstantaneIndex(catalogue)),
+        "quasi-réalisables, boucle": chronometrer(boucle),
+        "quasi-réalisables, matrice": chronometrer(matrice),
+        "réalisables, matrice": chronometrer(
+            lambda: index.cocktails_realisables(index.evaluer(stock)),
+        ),
+        "réévaluation d'un ingrédient": chronometrer(
+            lambda: index.reevaluer(faisabilite, stock, modifie),
+        ),
+        "meilleurs achats (3)": chronometrer(
+            lambda: index.meilleurs_achats(faisabilite, 3),
+        ),
+    }
+
+    sys.stdout.write(
+        f"{nb_cocktails} cocktails, {nb_ingredients} ingrédients, "
+        f"{len(catalogue)} lignes, {len(stock)} ingrédients en stock\n",
+    )
+    for nom, duree in mesures.items():
+        sys.stdout.write(f"{nom:<30} {duree:8.3f} ms\n")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -0,0 +1,115 @@
+"""Mesure du coût par appel du décorateur @log.
+
+Compare une fonction non décorée à la même fonction décorée, synchrone et
+asynchrone, quand les logs du décorateur sont désactivés (cas de l'API sans
+configuration de logs) et quand ils sont activés (messages formatés par un
+handler qui n'écrit nulle part).
+
+Utilisation :
+    python -m src.benchmarks.bench_log [nb_appels]
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from collections.abc import Callable
+
+from src.utils.log_decorator import log
+
+LOGGER = logging.getLogger("src.utils.log_decorator")
+
+
+class _HandlerFormatant(logging.Handler):
+    """Handler qui formate chaque message sans l'écrire."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Met en forme le message."""
+        self.format(record)
+
+
+def lire(pseudo: str, limite: int, mot_de_passe: str | None = None) -> list:
+    """Retourne une liste de lignes (arguments, mot de passe et liste)."""
+    return [{"id": i, "pseudo": pseudo, "mdp": mot_de_passe} for i in range(limite)]
+
+
+async def lire_async(
+    pseudo: str,
+    limite: int,
+    mot_de_passe: str | None = None,
+) -> list:
+    """Version asynchrone de lire."""
+    await asyncio.sleep(0)
+    return lire(pseudo, limite, mot_de_passe)
+
+
+class DAOFictif:
+    """Les mêmes fonctions, décorées comme les méthodes des DAO."""
+
+    lire = staticmethod(log(lire))
+    lire_async = staticmethod(log(lire_async))
+
+
+def chronometrer(fonction: Callable[[], object], nb_appels: int) -> float:
+    """Durée moyenne d'un appel, en microsecondes."""
+    debut = time.perf_counter()
+    for _ in range(nb_appels):
+        fonction()
+    return (time.perf_counter() - debut) * 1e6 / nb_appels
+
+
+def chronometrer_async(
+    fonction: Callable[[], object],
+    nb_appels: int,
+) -> float:
+    """Durée moyenne d'un appel d'une coroutine, en microsecondes."""
+
+    async def boucle() -> float:
+        debut = time.perf_counter()
+        for _ in range(nb_appels):
+            await fonction()
+        return (time.perf_counter() - debut) * 1e6 / nb_appels
+
+    return asyncio.run(boucle())
+
+
+def mesurer(nb_appels: int) -> dict[str, float]:
+    """Mesure le surcoût du décorateur dans la configuration courante."""
+    nue = chronometrer(lambda: lire("alice", 10, "secret"), nb_appels)
+    nue_async = chronometrer_async(
+        lambda: lire_async("alice", 10, "secret"),
+        nb_appels,
+    )
+    return {
+        "synchrone": chronometrer(
+            lambda: DAOFictif.lire("alice", 10, "secret"),
+            nb_appels,
+        )
+        - nue,
+        "asynchrone": chronometrer_async(
+            lambda: DAOFictif.lire_async("alice", 10, "secret"),
+            nb_appels,
+        )
+        - nue_async,
+    }
+
+
+def main(nb_appels: int = 100_000) -> None:
+    """Lance la mesure et affiche le surcoût moyen par appel."""
+    LOGGER.propagate = False
+    LOGGER.setLevel(logging.INFO)
+    desactives = mesurer(nb_appels)
+
+    LOGGER.addHandler(_HandlerFormatant())
+    LOGGER.setLevel(logging.DEBUG)
+    actives = mesurer(nb_appels // 10)
+
+    sys.stdout.write(f"Surcoût de @log par appel ({nb_appels} appels)\n")
+    for nom, surcout in desactives.items():
+        sys.stdout.write(f"{nom + ', logs désactivés':<30} {surcout:8.3f} us\n")
+    for nom, surcout in actives.items():
+        sys.stdout.write(f"{nom + ', logs activés':<30} {surcout:8.3f} us\n")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:]))
@@ -34,7 +34,7 @@ class AccesDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                     SELECT id_utilisateur
@@ -75,7 +75,7 @@ class AccesDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                     SELECT id_cocktail
@@ -142,7 +142,7 @@ class AccesDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                     SELECT id_cocktail
@@ -197,7 +197,7 @@ class AccesDAO(metaclass=Singleton):
         if owner_id == viewer_id:
             return True
 
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                     SELECT 1
@@ -239,7 +239,7 @@ class AccesDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                     SELECT DISTINCT u.pseudo
@@ -291,7 +291,10 @@ class AccesDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
                     """
                         SELECT c.id_cocktail, c.nom, c.categorie, c.verre, c.alcool,
@@ -384,7 +387,7 @@ class AccesDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                     SELECT 1
@@ -434,7 +437,7 @@ class AccesDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                     DELETE FROM acces
@@ -469,7 +472,7 @@ class AccesDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                     SELECT 1
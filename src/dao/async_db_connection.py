@@ -0,0 +1,94 @@
+"""Module gérant la connexion asynchrone à la base de données PostgreSQL.
+
+Il fournit une classe singleton AsyncDBConnection, pendant asynchrone de
+DBConnection, basée sur le pool de connexions asynchrone de psycopg 3.
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+import dotenv
+from psycopg import AsyncConnection
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+from src.dao.curseurs_mesures import CurseurAsyncMesure
+from src.utils.exceptions import PoolTimeoutError
+from src.utils.settings import settings
+from src.utils.singleton import Singleton
+
+
+class AsyncDBConnection(metaclass=Singleton):
+    """Classe de connexion asynchrone à la base de données.
+
+    Elle partage un unique pool de connexions asynchrones entre les DAO async.
+    """
+
+    def __init__(self) -> None:
+        """Création du pool (ouvert au premier emprunt)."""
+        dotenv.load_dotenv()
+
+        self.__pool = AsyncConnectionPool(
+            conninfo="",
+            kwargs={
+                "host": os.environ["POSTGRES_HOST"],
+                "port": os.environ["POSTGRES_PORT"],
+                "dbname": os.environ["POSTGRES_DATABASE"],
+                "user": os.environ["POSTGRES_USER"],
+                "password": os.environ["POSTGRES_PASSWORD"],
+                "row_factory": dict_row,
+                "cursor_factory": CurseurAsyncMesure,
+            },
+            min_size=settings.POSTGRES_POOL_MIN_SIZE,
+            max_size=settings.POSTGRES_POOL_MAX_SIZE,
+            timeout=settings.POSTGRES_POOL_TIMEOUT,
+            open=False,
+        )
+        self.__ouvert = False
+        self.__verrou = asyncio.Lock()
+
+    @property
+    def pool(self) -> AsyncConnectionPool:
+        """Pool de connexions asynchrones sous-jacent."""
+        return self.__pool
+
+    async def open(self) -> None:
+        """Ouvre le pool s'il ne l'est pas encore."""
+        if self.__ouvert:
+            return
+        async with self.__verrou:
+            if not self.__ouvert:
+                await self.__pool.open()
+                self.__ouvert = True
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncGenerator[AsyncConnection]:
+        """Fournit une connexion asynchrone pour une transaction.
+
+        La transaction est validée à la sortie du bloc `async with` (annulée en
+        cas d'exception) puis la connexion est rendue au pool.
+
+        Raises
+        ------
+        PoolTimeoutError
+            Si aucune connexion ne se libère avant le timeout du pool
+
+        """
+        await self.open()
+        try:
+            async with self.__pool.connection() as connection:
+                yield connection
+        except PoolTimeout as e:
+            raise PoolTimeoutError(message=str(e)) from e
+
+    def stats(self) -> dict[str, int]:
+        """Statistiques du pool de connexions asynchrones."""
+        return self.__pool.get_stats()
+
+    async def close(self) -> None:
+        """Ferme le pool de connexions s'il a été ouvert."""
+        if self.__ouvert:
+            await self.__pool.close()
+            self.__ouvert = False
@@ -2,10 +2,88 @@
 sur la table acces dans la base de données.
 """
 
+from src.dao.async_db_connection import AsyncDBConnection
 from src.dao.db_connection import DBConnection
 from src.utils.log_decorator import log
 from src.utils.singleton import Singleton
 
+_SQL_SELECT_AVIS = """
+    SELECT
+        a.id_utilisateur,
+        u.pseudo as pseudo_utilisateur,
+        a.id_cocktail,
+        c.nom as nom_cocktail,
+        a.note,
+        a.commentaire,
+        a.favoris,
+        a.date_creation,
+        a.date_modification
+    FROM avis a
+    JOIN utilisateur u ON a.id_utilisateur = u.id_utilisateur
+    JOIN cocktail c ON a.id_cocktail = c.id_cocktail
+"""
+
+_SQL_AVIS_PAR_UTILISATEUR_ET_COCKTAIL = (
+    _SQL_SELECT_AVIS
+    + """
+    WHERE a.id_utilisateur = %(id_utilisateur)s
+      AND a.id_cocktail = %(id_cocktail)s
+"""
+)
+
+_SQL_AVIS_PAR_COCKTAIL = (
+    _SQL_SELECT_AVIS
+    + """
+    WHERE a.id_cocktail = %(id_cocktail)s
+    ORDER BY a.date_creation DESC
+"""
+)
+
+_SQL_AVIS_PAR_UTILISATEUR = (
+    _SQL_SELECT_AVIS
+    + """
+    WHERE a.id_utilisateur = %(id_utilisateur)s
+    ORDER BY a.date_creation DESC
+"""
+)
+
+_SQL_FAVORIS_PAR_UTILISATEUR = (
+    _SQL_SELECT_AVIS
+    + """
+    WHERE a.id_utilisateur = %(id_utilisateur)s
+      AND a.favoris = TRUE
+    ORDER BY a.date_modification DESC
+"""
+)
+
+_SQL_RESUME_AVIS = """
+    SELECT
+        c.id_cocktail,
+        c.nom as nom_cocktail,
+        COUNT(a.id_cocktail) as nombre_avis,
+        AVG(a.note) as note_moyenne,
+        SUM(CASE WHEN a.favoris THEN 1 ELSE 0 END) as nombre_favoris
+    FROM cocktail c
+    LEFT JOIN avis a ON c.id_cocktail = a.id_cocktail
+    WHERE c.id_cocktail = %(id_cocktail)s
+    GROUP BY c.id_cocktail, c.nom
+"""
+
+
+def _formater_resume(result: dict) -> dict:
+    """Convertit la ligne brute du résumé des avis en types Python simples."""
+    return {
+        "id_cocktail": result["id_cocktail"],
+        "nom_cocktail": result["nom_cocktail"],
+        "nombre_avis": int(result["nombre_avis"]) if result["nombre_avis"] else 0,
+        "note_moyenne": float(result["note_moyenne"])
+        if result["note_moyenne"]
+        else None,
+        "nombre_favoris": int(result["nombre_favoris"])
+        if result["nombre_favoris"]
+        else 0,
+    }
+
 
 class AvisDAO(metaclass=Singleton):
     """DAO pour gérer les avis sur les cocktails."""
@@ -37,7 +115,7 @@ class AvisDAO(metaclass=Singleton):
             L'avis créé ou modifié
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 INSERT INTO avis (id_utilisateur, id_cocktail, note, commentaire,
@@ -95,25 +173,9 @@ class AvisDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                SELECT
-                    a.id_utilisateur,
-                    u.pseudo as pseudo_utilisateur,
-                    a.id_cocktail,
-                    c.nom as nom_cocktail,
-                    a.note,
-                    a.commentaire,
-                    a.favoris,
-                    a.date_creation,
-                    a.date_modification
-                FROM avis a
-                JOIN utilisateur u ON a.id_utilisateur = u.id_utilisateur
-                JOIN cocktail c ON a.id_cocktail = c.id_cocktail
-                WHERE a.id_utilisateur = %(id_utilisateur)s
-                  AND a.id_cocktail = %(id_cocktail)s
-                """,
+                _SQL_AVIS_PAR_UTILISATEUR_ET_COCKTAIL,
                 {
                     "id_utilisateur": id_utilisateur,
                     "id_cocktail": id_cocktail,
@@ -147,25 +209,9 @@ class AvisDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                SELECT
-                    a.id_utilisateur,
-                    u.pseudo as pseudo_utilisateur,
-                    a.id_cocktail,
-                    c.nom as nom_cocktail,
-                    a.note,
-                    a.commentaire,
-                    a.favoris,
-                    a.date_creation,
-                    a.date_modification
-                FROM avis a
-                JOIN utilisateur u ON a.id_utilisateur = u.id_utilisateur
-                JOIN cocktail c ON a.id_cocktail = c.id_cocktail
-                WHERE a.id_cocktail = %(id_cocktail)s
-                ORDER BY a.date_creation DESC
-                """,
+                _SQL_AVIS_PAR_COCKTAIL,
                 {"id_cocktail": id_cocktail},
             )
             return cursor.fetchall()
@@ -196,25 +242,9 @@ class AvisDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                SELECT
-                    a.id_utilisateur,
-                    u.pseudo as pseudo_utilisateur,
-                    a.id_cocktail,
-                    c.nom as nom_cocktail,
-                    a.note,
-                    a.commentaire,
-                    a.favoris,
-                    a.date_creation,
-                    a.date_modification
-                FROM avis a
-                JOIN utilisateur u ON a.id_utilisateur = u.id_utilisateur
-                JOIN cocktail c ON a.id_cocktail = c.id_cocktail
-                WHERE a.id_utilisateur = %(id_utilisateur)s
-                ORDER BY a.date_creation DESC
-                """,
+                _SQL_AVIS_PAR_UTILISATEUR,
                 {"id_utilisateur": id_utilisateur},
             )
             return cursor.fetchall()
@@ -242,7 +272,7 @@ class AvisDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 DELETE FROM avis
@@ -279,38 +309,13 @@ class AvisDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                SELECT
-                    c.id_cocktail,
-                    c.nom as nom_cocktail,
-                    COUNT(a.id_cocktail) as nombre_avis,
-                    AVG(a.note) as note_moyenne,
-                    SUM(CASE WHEN a.favoris THEN 1 ELSE 0 END) as nombre_favoris
-                FROM cocktail c
-                LEFT JOIN avis a ON c.id_cocktail = a.id_cocktail
-                WHERE c.id_cocktail = %(id_cocktail)s
-                GROUP BY c.id_cocktail, c.nom
-                """,
+                _SQL_RESUME_AVIS,
                 {"id_cocktail": id_cocktail},
             )
             result = cursor.fetchone()
-            if result:
-                return {
-                    "id_cocktail": result["id_cocktail"],
-                    "nom_cocktail": result["nom_cocktail"],
-                    "nombre_avis": int(result["nombre_avis"])
-                    if result["nombre_avis"]
-                    else 0,
-                    "note_moyenne": float(result["note_moyenne"])
-                    if result["note_moyenne"]
-                    else None,
-                    "nombre_favoris": int(result["nombre_favoris"])
-                    if result["nombre_favoris"]
-                    else 0,
-                }
-            return None
+            return _formater_resume(result) if result else None
 
     @staticmethod
     @log
@@ -337,26 +342,9 @@ class AvisDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                SELECT
-                    a.id_utilisateur,
-                    u.pseudo as pseudo_utilisateur,
-                    a.id_cocktail,
-                    c.nom as nom_cocktail,
-                    a.note,
-                    a.commentaire,
-                    a.favoris,
-                    a.date_creation,
-                    a.date_modification
-                FROM avis a
-                JOIN utilisateur u ON a.id_utilisateur = u.id_utilisateur
-                JOIN cocktail c ON a.id_cocktail = c.id_cocktail
-                WHERE a.id_utilisateur = %(id_utilisateur)s
-                  AND a.favoris = TRUE
-                ORDER BY a.date_modification DESC
-                """,
+                _SQL_FAVORIS_PAR_UTILISATEUR,
                 {"id_utilisateur": id_utilisateur},
             )
             return cursor.fetchall()
@@ -381,7 +369,7 @@ class AvisDAO(metaclass=Singleton):
             {"favoris": True, "deja_en_favoris": bool}
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT favoris
@@ -443,7 +431,7 @@ class AvisDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT favoris
@@ -476,3 +464,84 @@ class AvisDAO(metaclass=Singleton):
             )
 
             return True
+
+
+class AsyncAvisDAO(metaclass=Singleton):
+    """Versions asynchrones des méthodes de lecture de AvisDAO."""
+
+    @staticmethod
+    async def _fetchall(requete: str, parametres: dict) -> list[dict]:
+        """Exécute une requête de lecture et retourne toutes les lignes."""
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(requete, parametres)
+            return await cursor.fetchall()
+
+    @staticmethod
+    async def _fetchone(requete: str, parametres: dict) -> dict | None:
+        """Exécute une requête de lecture et retourne la première ligne."""
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(requete, parametres)
+            return await cursor.fetchone()
+
+    @log
+    async def get_avis_by_user_and_cocktail(
+        self,
+        id_utilisateur: int,
+        id_cocktail: int,
+    ) -> dict | None:
+        """Récupère un avis spécifique d'un utilisateur sur un cocktail.
+
+        Voir AvisDAO.get_avis_by_user_and_cocktail.
+        """
+        return await self._fetchone(
+            _SQL_AVIS_PAR_UTILISATEUR_ET_COCKTAIL,
+            {"id_utilisateur": id_utilisateur, "id_cocktail": id_cocktail},
+        )
+
+    @log
+    async def get_avis_by_cocktail(self, id_cocktail: int) -> list[dict]:
+        """Récupère tous les avis d'un cocktail.
+
+        Voir AvisDAO.get_avis_by_cocktail.
+        """
+        return await self._fetchall(
+            _SQL_AVIS_PAR_COCKTAIL,
+            {"id_cocktail": id_cocktail},
+        )
+
+    @log
+    async def get_avis_by_user(self, id_utilisateur: int) -> list[dict]:
+        """Récupère tous les avis d'un utilisateur.
+
+        Voir AvisDAO.get_avis_by_user.
+        """
+        return await self._fetchall(
+            _SQL_AVIS_PAR_UTILISATEUR,
+            {"id_utilisateur": id_utilisateur},
+        )
+
+    @log
+    async def get_avis_summary(self, id_cocktail: int) -> dict | None:
+        """Récupère un résumé statistique des avis pour un cocktail.
+
+        Voir AvisDAO.get_avis_summary.
+        """
+        result = await self._fetchone(_SQL_RESUME_AVIS, {"id_cocktail": id_cocktail})
+        return _formater_resume(result) if result else None
+
+    @log
+    async def get_favoris_by_user(self, id_utilisateur: int) -> list[dict]:
+        """Récupère tous les cocktails favoris d'un utilisateur avec leurs avis.
+
+        Voir AvisDAO.get_favoris_by_user.
+        """
+        return await self._fetchall(
+            _SQL_FAVORIS_PAR_UTILISATEUR,
+            {"id_utilisateur": id_utilisateur},
+        )
@@ -0,0 +1,237 @@
+"""Cache par utilisateur des cocktails réalisables.
+
+Chaque utilisateur possède une version de stock, augmentée par les DAO à
+chaque écriture dans son stock (après validation de la transaction). Une
+évaluation du catalogue (Faisabilite) est mémorisée avec la version du stock
+sur laquelle elle a été calculée :
+
+- si la version n'a pas changé, l'évaluation est réutilisée telle quelle ;
+- sinon, seuls les ingrédients modifiés depuis sont réévalués, et donc seuls
+  les cocktails qui les utilisent ;
+- si l'index des recettes a été reconstruit, tout est réévalué.
+
+Les versions sont propres au processus : lorsque plusieurs processus servent
+l'API, les évaluations expirent au bout de REALISABLES_CACHE_TTL secondes.
+
+Les évaluations comme les versions sont gardées pour au plus
+REALISABLES_CACHE_MAX_USERS utilisateurs (les moins récemment utilisés sont
+oubliés). Les versions sont tirées d'un compteur commun à tous les
+utilisateurs, et un utilisateur dont la version a été oubliée reçoit la plus
+grande version oubliée : une version ne peut donc pas revenir à une valeur
+déjà vue, et une évaluation calculée avant l'oubli n'est jamais réutilisée à
+tort (au pire, le catalogue est réévalué en entier).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from src.dao.index_recettes import Faisabilite, InstantaneIndex
+from src.utils.settings import settings
+from src.utils.singleton import Singleton
+
+
+class _Evaluation:
+    """Évaluation mémorisée pour un utilisateur."""
+
+    def __init__(
+        self,
+        version: int,
+        index: InstantaneIndex,
+        faisabilite: Faisabilite,
+    ) -> None:
+        self.version = version
+        self.index = index
+        self.faisabilite = faisabilite
+        self.calculee_le = time.monotonic()
+
+
+class CacheRealisables(metaclass=Singleton):
+    """Cache des évaluations du catalogue, partagé par tout le processus."""
+
+    def __init__(self) -> None:
+        """Initialise un cache vide."""
+        self._verrou = threading.Lock()
+        self._compteur = 0
+        self._versions: OrderedDict[int, int] = OrderedDict()
+        # Version des utilisateurs absents de _versions
+        self._plancher = 0
+        # Version à laquelle chaque ingrédient a été modifié en dernier, pour
+        # les utilisateurs qui ont une évaluation mémorisée (None : modification
+        # non localisée, tout est à réévaluer)
+        self._modifications: dict[int, dict[int | None, int]] = {}
+        self._evaluations: OrderedDict[int, _Evaluation] = OrderedDict()
+
+    def signaler_modification(
+        self,
+        id_utilisateur: int,
+        id_ingredient: int | None = None,
+    ) -> None:
+        """Augmente la version du stock d'un utilisateur.
+
+        Parameters
+        ----------
+        id_utilisateur : int
+            ID de l'utilisateur dont le stock a changé
+        id_ingredient : int | None
+            Ingrédient modifié, ou None si la modification n'est pas localisée
+
+        """
+        with self._verrou:
+            self._compteur += 1
+            self._versions[id_utilisateur] = self._compteur
+            self._versions.move_to_end(id_utilisateur)
+            # Sans évaluation mémorisée, la nouvelle version suffit : la
+            # prochaine lecture évaluera tout le catalogue
+            if id_utilisateur in self._evaluations:
+                self._modifications.setdefault(id_utilisateur, {})[id_ingredient] = (
+                    self._compteur
+                )
+            while len(self._versions) > settings.REALISABLES_CACHE_MAX_USERS:
+                id_ancien, version_ancienne = self._versions.popitem(last=False)
+                self._plancher = max(self._plancher, version_ancienne)
+                self._modifications.pop(id_ancien, None)
+
+    def version(self, id_utilisateur: int) -> int:
+        """Retourne la version courante du stock d'un utilisateur."""
+        with self._verrou:
+            return self._versions.get(id_utilisateur, self._plancher)
+
+    def statistiques(self) -> dict:
+        """Retourne le nombre d'utilisateurs suivis (evaluations, versions...)."""
+        with self._verrou:
+            return {
+                "evaluations": len(self._evaluations),
+                "versions": len(self._versions),
+                "modifications": len(self._modifications),
+            }
+
+    def obtenir(
+        self,
+        id_utilisateur: int,
+        index: InstantaneIndex,
+        charger_stock: Callable[[], list[dict]],
+    ) -> Faisabilite:
+        """Retourne l'évaluation du catalogue pour le stock d'un utilisateur.
+
+        Parameters
+        ----------
+        id_utilisateur : int
+            ID de l'utilisateur
+        index : InstantaneIndex
+            Index courant des recettes
+        charger_stock : Callable[[], list[dict]]
+            Fonction chargeant le stock de l'utilisateur (StockDAO.get_stock),
+            appelée seulement si l'évaluation mémorisée est périmée
+
+        Returns
+        -------
+        Faisabilite
+            L'évaluation à jour
+
+        """
+        version, precedente, modifies = self._preparer(id_utilisateur, index)
+        if precedente is not None and not modifies:
+            return precedente.faisabilite
+
+        faisabilite = self._calculer(index, precedente, modifies, charger_stock())
+        self._memoriser(id_utilisateur, _Evaluation(version, index, faisabilite))
+        return faisabilite
+
+    async def obtenir_async(
+        self,
+        id_utilisateur: int,
+        index: InstantaneIndex,
+        charger_stock: Callable[[], Awaitable[list[dict]]],
+    ) -> Faisabilite:
+        """Version asynchrone de obtenir (chargement par un DAO asynchrone)."""
+        version, precedente, modifies = self._preparer(id_utilisateur, index)
+        if precedente is not None and not modifies:
+            return precedente.faisabilite
+
+        faisabilite = self._calculer(
+            index,
+            precedente,
+            modifies,
+            await charger_stock(),
+        )
+        self._memoriser(id_utilisateur, _Evaluation(version, index, faisabilite))
+        return faisabilite
+
+    def _preparer(
+        self,
+        id_utilisateur: int,
+        index: InstantaneIndex,
+    ) -> tuple[int, _Evaluation | None, set[int | None]]:
+        """Détermine ce qui doit être réévalué pour un utilisateur.
+
+        La version est lue avant le chargement du stock : une écriture validée
+        pendant le calcul sera donc réévaluée à la requête suivante.
+
+        Returns
+        -------
+        tuple[int, _Evaluation | None, set[int | None]]
+            La version courante, l'évaluation réutilisable (None s'il faut tout
+            évaluer) et les ingrédients modifiés depuis cette évaluation
+
+        """
+        with self._verrou:
+            version = self._versions.get(id_utilisateur, self._plancher)
+            precedente = self._evaluations.get(id_utilisateur)
+            if (
+                precedente is None
+                or precedente.index is not index
+                or time.monotonic() - precedente.calculee_le
+                >= settings.REALISABLES_CACHE_TTL
+            ):
+                return version, None, set()
+
+            self._evaluations.move_to_end(id_utilisateur)
+            if precedente.version == version:
+                return version, precedente, set()
+
+            modifies = {
+                id_ingredient
+                for id_ingredient, modifie_a in self._modifications.get(
+                    id_utilisateur,
+                    {},
+                ).items()
+                if modifie_a > precedente.version
+            }
+            if not modifies or None in modifies:
+                return version, None, set()
+            return version, precedente, modifies
+
+    @staticmethod
+    def _calculer(
+        index: InstantaneIndex,
+        precedente: _Evaluation | None,
+        modifies: set[int | None],
+        stock_rows: list[dict],
+    ) -> Faisabilite:
+        """Évalue tout le catalogue, ou seulement les ingrédients modifiés."""
+        if precedente is None:
+            return index.evaluer(stock_rows)
+        return index.reevaluer(precedente.faisabilite, stock_rows, modifies)
+
+    def _memoriser(self, id_utilisateur: int, evaluation: _Evaluation) -> None:
+        """Mémorise une évaluation, sauf si une plus récente l'a devancée."""
+        with self._verrou:
+            actuelle = self._evaluations.get(id_utilisateur)
+            if actuelle is not None and actuelle.version > evaluation.version:
+                return
+
+            self._evaluations[id_utilisateur] = evaluation
+            self._evaluations.move_to_end(id_utilisateur)
+            modifications = self._modifications.get(id_utilisateur, {})
+            for id_ingredient in [
+                id_ingredient
+                for id_ingredient, modifie_a in modifications.items()
+                if modifie_a <= evaluation.version
+            ]:
+                del modifications[id_ingredient]
+
+            while len(self._evaluations) > settings.REALISABLES_CACHE_MAX_USERS:
+                id_ancien, _ = self._evaluations.popitem(last=False)
+                self._modifications.pop(id_ancien, None)
@@ -0,0 +1,118 @@
+"""Cache des utilisateurs authentifiés.
+
+Chaque requête authentifiée relisait son utilisateur en base après la
+vérification du jeton. Les utilisateurs lus sont gardés en mémoire (les plus
+récemment utilisés, au plus USER_CACHE_MAX_USERS) pendant USER_CACHE_TTL
+secondes : la vérification d'un jeton se fait alors sans requête.
+
+Le cache sert aussi de table des versions d'identifiants : un jeton porte la
+version (utilisateur.version_identifiants) en vigueur à sa création, et il
+est révoqué dès que la version en mémoire diffère.
+
+Les DAO invalident l'utilisateur à chaque changement de pseudo ou de mot de
+passe et à la suppression du compte (après validation de la transaction). Un
+compteur de générations empêche de mémoriser un utilisateur lu avant une
+invalidation. Lorsque plusieurs processus servent l'API, une modification
+faite par un autre processus est vue au plus tard après USER_CACHE_TTL
+secondes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from src.models.utilisateurs import User
+from src.utils.settings import settings
+from src.utils.singleton import Singleton
+
+
+class CacheUtilisateurs(metaclass=Singleton):
+    """Cache des utilisateurs par id_utilisateur, partagé par tout le processus."""
+
+    def __init__(self) -> None:
+        """Initialise un cache vide."""
+        self._verrou = threading.Lock()
+        # id_utilisateur -> (utilisateur, date de lecture), du moins récent au
+        # plus récent utilisé
+        self._utilisateurs: OrderedDict[int, tuple[User, float]] = OrderedDict()
+        self._generation = 0
+        self.succes = 0
+        self.echecs = 0
+
+    def obtenir(self, id_utilisateur: int, charger: Callable[[], User]) -> User:
+        """Retourne un utilisateur, lu en base s'il n'est pas en mémoire.
+
+        Parameters
+        ----------
+        id_utilisateur : int
+            ID de l'utilisateur
+        charger : Callable[[], User]
+            Fonction lisant l'utilisateur en base (UtilisateurService.read)
+
+        Returns
+        -------
+        User
+            Une copie de l'utilisateur
+
+        """
+        return self._lire(id_utilisateur, charger).model_copy()
+
+    def version_identifiants(
+        self,
+        id_utilisateur: int,
+        charger: Callable[[], User],
+    ) -> int:
+        """Retourne la version des identifiants d'un utilisateur.
+
+        Comme obtenir, sans copier l'utilisateur : c'est la vérification faite
+        à chaque requête authentifiée par les seules claims du jeton.
+
+        Parameters
+        ----------
+        id_utilisateur : int
+            ID de l'utilisateur
+        charger : Callable[[], User]
+            Fonction lisant l'utilisateur en base (UtilisateurService.read)
+
+        """
+        return self._lire(id_utilisateur, charger).version_identifiants
+
+    def _lire(self, id_utilisateur: int, charger: Callable[[], User]) -> User:
+        """Retourne l'utilisateur mémorisé, lu en base s'il n'est pas en mémoire."""
+        with self._verrou:
+            entree = self._utilisateurs.get(id_utilisateur)
+            if (
+                entree is not None
+                and time.monotonic() - entree[1] < settings.USER_CACHE_TTL
+            ):
+                self._utilisateurs.move_to_end(id_utilisateur)
+                self.succes += 1
+                return entree[0]
+            self.echecs += 1
+            generation = self._generation
+
+        utilisateur = charger()
+        with self._verrou:
+            if generation == self._generation:
+                self._utilisateurs[id_utilisateur] = (utilisateur, time.monotonic())
+                self._utilisateurs.move_to_end(id_utilisateur)
+                while len(self._utilisateurs) > settings.USER_CACHE_MAX_USERS:
+                    self._utilisateurs.popitem(last=False)
+        return utilisateur
+
+    def invalider(self, ids_utilisateurs: list[int]) -> None:
+        """Retire des utilisateurs modifiés ou supprimés du cache."""
+        with self._verrou:
+            self._generation += 1
+            for id_utilisateur in ids_utilisateurs:
+                self._utilisateurs.pop(id_utilisateur, None)
+
+    def statistiques(self) -> dict:
+        """Retourne les compteurs du cache (succes, echecs, taille)."""
+        with self._verrou:
+            return {
+                "succes": self.succes,
+                "echecs": self.echecs,
+                "taille": len(self._utilisateurs),
+            }
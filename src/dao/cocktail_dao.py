@@ -2,14 +2,301 @@
 sur la table cocktail dans la base de données.
 """
 
+from psycopg import Error as AsyncDBError
 from psycopg2 import Error as DBError
+from psycopg2.extras import execute_values
 
 from src.business_object.cocktail import Cocktail
+from src.dao.async_db_connection import AsyncDBConnection
 from src.dao.db_connection import DBConnection
+from src.dao.index_noms import IndexNoms
+from src.dao.index_recettes import IndexRecettes
+from src.dao.instruction_dao import indexer_instructions
+from src.utils.conversion_unite import UnitConverter
 from src.utils.exceptions import DAOError
 from src.utils.log_decorator import log
+from src.utils.mesure import (
+    alias_unites,
+    analyser_mesures,
+    normaliser_mesure,
+    unite_comparee,
+)
 from src.utils.singleton import Singleton
 
+# Une ligne de valeurs par texte d'unité distinct : (unite, quantité lue dans
+# le texte, facteur vers ml ou g, type d'unité, unité comparée)
+_SQL_NORMALISER_QUANTITES = """
+    UPDATE cocktail_ingredient ci
+    SET qte_normalisee = COALESCE(
+            ROUND(COALESCE(ci.qte, v.quantite) * v.facteur, 2),
+            COALESCE(ci.qte, v.quantite)
+        ),
+        type_unite = v.type_unite,
+        unite_canonique = v.unite_canonique
+    FROM (VALUES %s) AS v (unite, quantite, facteur, type_unite, unite_canonique)
+    WHERE ci.unite IS NOT DISTINCT FROM v.unite
+    AND (
+        (
+            COALESCE(ci.qte, v.quantite) IS NOT NULL
+            AND (
+                ci.qte_normalisee IS NULL
+                OR (ci.type_unite IS NULL AND v.type_unite IS NOT NULL)
+            )
+        )
+        OR (ci.unite_canonique IS NULL AND v.unite_canonique IS NOT NULL)
+    )
+"""
+
+_SQL_COCKTAIL_PAR_NOM = """
+    SELECT *
+    FROM cocktail
+    WHERE nom = %(nom)s
+"""
+
+_SQL_COCKTAILS_PAR_SEQUENCE = """
+    SELECT *
+    FROM cocktail
+    WHERE nom ILIKE %(sequence)s
+    ORDER BY nom ASC
+    LIMIT %(max_resultats)s
+"""
+
+_SQL_TOUS_COCKTAILS = """
+    SELECT id_cocktail, nom, categorie, verre, alcool, image
+    FROM cocktail
+"""
+
+# Jokers de LIKE : une séquence qui en contient est confiée à la base
+_JOKERS_LIKE = frozenset("%_\\")
+
+_SQL_ID_PAR_NOM = """
+    SELECT id_cocktail
+    FROM cocktail
+    WHERE LOWER(TRIM(nom)) = LOWER(TRIM(%(cocktail_name)s))
+"""
+
+_SQL_TOUS_COCKTAILS_AVEC_INGREDIENTS = """
+    SELECT
+        c.id_cocktail,
+        c.nom,
+        c.categorie,
+        c.verre,
+        c.alcool,
+        c.image,
+        ci.id_ingredient,
+        ci.qte,
+        ci.unite,
+        ci.qte_normalisee,
+        ci.type_unite,
+        i.nom AS nom_ingredient
+    FROM cocktail c
+    LEFT JOIN cocktail_ingredient ci ON c.id_cocktail = ci.id_cocktail
+    LEFT JOIN ingredient i ON ci.id_ingredient = i.id_ingredient
+    ORDER BY c.id_cocktail, ci.id_ingredient
+"""
+
+_SQL_COCKTAILS_QUASI_REALISABLES = """
+    SELECT
+        c.id_cocktail,
+        c.nom,
+        c.categorie,
+        c.verre,
+        c.alcool,
+        c.image,
+        ci.id_ingredient,
+        ci.qte as quantite_requise,
+        ci.unite as unite_requise,
+        i.nom as nom_ingredient,
+        s.quantite as quantite_stock,
+        u_stock.abbreviation as unite_stock
+    FROM cocktail c
+    LEFT JOIN cocktail_ingredient ci ON c.id_cocktail = ci.id_cocktail
+    LEFT JOIN ingredient i ON ci.id_ingredient = i.id_ingredient
+    LEFT JOIN stock s ON ci.id_ingredient = s.id_ingredient
+        AND s.id_utilisateur = %(id_utilisateur)s
+    LEFT JOIN unite u_stock ON s.id_unite = u_stock.id_unite
+    ORDER BY c.id_cocktail, ci.id_ingredient
+"""
+
+# Mêmes règles que CocktailService.is_ingredient_available, évaluées en base :
+# un ingrédient est couvert si le stock (non nul) suffit en comparaison brute
+# (unité absente ou identique), en ml (deux unités liquides) ou en g (deux
+# unités solides). Les quantités normalisées stockées sont utilisées en
+# priorité ; la table des facteurs (UnitConverter) couvre les lignes non
+# normalisées et l'autre dimension des unités ambiguës (oz, tsp...). Les
+# unités sont comparées sous leur forme canonique, comme dans l'index (voir
+# unite_comparee) : colonne unite_canonique pour les recettes, table des
+# écritures connues (alias_unites) pour les abréviations du stock et les
+# recettes pas encore normalisées.
+_SQL_COCKTAILS_QUASI_REALISABLES_FILTRES = """
+    WITH facteur AS (
+        SELECT *
+        FROM unnest(
+            %(unites)s::text[],
+            %(facteurs_ml)s::float8[],
+            %(facteurs_g)s::float8[]
+        ) AS f(unite, ml, g)
+    ),
+    alias AS (
+        SELECT *
+        FROM unnest(%(ecritures)s::text[], %(alias)s::text[]) AS a(ecriture, unite)
+    ),
+    mesure AS (
+        SELECT
+            ci.id_cocktail,
+            ci.id_ingredient,
+            i.nom AS nom_ingredient,
+            COALESCE(ci.qte, 0) AS qte_requise,
+            COALESCE(
+                ci.unite_canonique, ar.unite, lower(trim(ci.unite))
+            ) AS unite_requise,
+            s.quantite AS qte_stock,
+            COALESCE(a_s.unite, lower(trim(u.abbreviation))) AS unite_stock,
+            CASE WHEN ci.type_unite = 'liquide' THEN ci.qte_normalisee
+                 ELSE ROUND((COALESCE(ci.qte, 0) * fr.ml)::numeric, 2)
+            END AS requis_ml,
+            CASE WHEN ci.type_unite = 'solide' THEN ci.qte_normalisee
+                 ELSE ROUND((COALESCE(ci.qte, 0) * fr.g)::numeric, 2)
+            END AS requis_g,
+            CASE WHEN s.type_unite = 'liquide' THEN s.qte_normalisee
+                 ELSE ROUND((s.quantite * fs.ml)::numeric, 2)
+            END AS stock_ml,
+            CASE WHEN s.type_unite = 'solide' THEN s.qte_normalisee
+                 ELSE ROUND((s.quantite * fs.g)::numeric, 2)
+            END AS stock_g
+        FROM cocktail_ingredient ci
+        JOIN ingredient i ON ci.id_ingredient = i.id_ingredient
+        LEFT JOIN stock s ON ci.id_ingredient = s.id_ingredient
+            AND s.id_utilisateur = %(id_utilisateur)s
+        LEFT JOIN unite u ON s.id_unite = u.id_unite
+        LEFT JOIN alias ar ON ar.ecriture = lower(trim(ci.unite))
+        LEFT JOIN alias a_s ON a_s.ecriture = lower(trim(u.abbreviation))
+        LEFT JOIN facteur fr ON fr.unite = lower(trim(ci.unite))
+        LEFT JOIN facteur fs ON fs.unite = lower(trim(u.abbreviation))
+    ),
+    couverture AS (
+        SELECT
+            id_cocktail,
+            id_ingredient,
+            nom_ingredient,
+            CASE
+                WHEN qte_stock IS NULL OR qte_stock = 0 THEN FALSE
+                WHEN COALESCE(unite_requise, '') = ''
+                    OR COALESCE(unite_stock, '') = ''
+                    OR unite_requise = unite_stock
+                    THEN qte_stock >= qte_requise
+                WHEN requis_ml IS NOT NULL AND stock_ml IS NOT NULL
+                    THEN stock_ml >= requis_ml
+                WHEN requis_g IS NOT NULL AND stock_g IS NOT NULL
+                    THEN stock_g >= requis_g
+                ELSE FALSE
+            END AS couvert
+        FROM mesure
+    ),
+    bilan AS (
+        SELECT
+            id_cocktail,
+            COUNT(*) AS nombre_ingredients_total,
+            COUNT(*) FILTER (WHERE NOT couvert) AS nombre_ingredients_manquants,
+            ARRAY_AGG(nom_ingredient ORDER BY id_ingredient)
+                FILTER (WHERE NOT couvert) AS ingredients_manquants,
+            ROUND(
+                100.0 * COUNT(*) FILTER (WHERE couvert) / COUNT(*),
+                2
+            )::float8 AS pourcentage_possession
+        FROM couverture
+        GROUP BY id_cocktail
+        HAVING COUNT(*) FILTER (WHERE NOT couvert)
+            BETWEEN 1 AND %(max_ingredients_manquants)s
+    )
+    SELECT
+        c.id_cocktail,
+        c.nom,
+        c.categorie,
+        c.verre,
+        c.alcool,
+        c.image,
+        b.ingredients_manquants,
+        b.nombre_ingredients_manquants,
+        b.nombre_ingredients_total,
+        b.pourcentage_possession
+    FROM bilan b
+    JOIN cocktail c ON b.id_cocktail = c.id_cocktail
+    -- Pagination par clé : cocktails strictement après la clé du curseur
+    WHERE %(apres_manquants)s::int IS NULL
+        OR (
+            b.nombre_ingredients_manquants,
+            -b.pourcentage_possession,
+            c.nom COLLATE "C",
+            c.id_cocktail
+        ) > (
+            %(apres_manquants)s,
+            %(apres_pourcentage)s::float8,
+            %(apres_nom)s COLLATE "C",
+            %(apres_id)s
+        )
+    ORDER BY b.nombre_ingredients_manquants, b.pourcentage_possession DESC,
+        c.nom COLLATE "C", c.id_cocktail
+    LIMIT %(limit)s
+"""
+
+_UNITES_CONVERTIBLES = sorted(
+    UnitConverter.LIQUID_TO_ML.keys() | UnitConverter.SOLID_TO_G.keys(),
+)
+_ALIAS_UNITES = alias_unites()
+_FACTEURS_CONVERSION = {
+    "unites": _UNITES_CONVERTIBLES,
+    "facteurs_ml": [UnitConverter.LIQUID_TO_ML.get(u) for u in _UNITES_CONVERTIBLES],
+    "facteurs_g": [UnitConverter.SOLID_TO_G.get(u) for u in _UNITES_CONVERTIBLES],
+    "ecritures": list(_ALIAS_UNITES),
+    "alias": list(_ALIAS_UNITES.values()),
+}
+
+
+def _parametres_quasi_realisables(
+    id_utilisateur: int,
+    max_ingredients_manquants: int,
+    limit: int | None,
+    apres: tuple | None,
+) -> dict:
+    """Paramètres de _SQL_COCKTAILS_QUASI_REALISABLES_FILTRES."""
+    apres_manquants, apres_pourcentage, apres_nom, apres_id = apres or (None,) * 4
+    return {
+        **_FACTEURS_CONVERSION,
+        "id_utilisateur": id_utilisateur,
+        "max_ingredients_manquants": max_ingredients_manquants,
+        "limit": limit,
+        "apres_manquants": apres_manquants,
+        "apres_pourcentage": apres_pourcentage,
+        "apres_nom": apres_nom,
+        "apres_id": apres_id,
+    }
+
+
+_SQL_AJOUT_INGREDIENT = """
+    INSERT INTO cocktail_ingredient
+        (id_cocktail, id_ingredient, qte, unite, qte_normalisee, type_unite,
+         unite_canonique)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+def _avec_jokers(sequence: str) -> bool:
+    """Indique si une séquence contient un joker de LIKE (% ou _)."""
+    return not _JOKERS_LIKE.isdisjoint(sequence)
+
+
+def _cocktail_depuis_ligne(ligne: dict) -> Cocktail:
+    """Construit un Cocktail à partir d'une ligne de la table cocktail."""
+    return Cocktail(
+        id_cocktail=ligne["id_cocktail"],
+        nom=ligne["nom"],
+        categorie=ligne["categorie"],
+        verre=ligne["verre"],
+        alcool=ligne["alcool"],
+        image=ligne["image"],
+    )
+
 
 class CocktailDAO(metaclass=Singleton):
     """Classe contenant les méthodes agissant sur les cocktails de la base
@@ -39,25 +326,10 @@ class CocktailDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
-            cursor.execute(
-                """SELECT *
-                FROM cocktail
-                WHERE nom = %(nom)s  """,
-                {"nom": nom.title()},
-            )
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
+            cursor.execute(_SQL_COCKTAIL_PAR_NOM, {"nom": nom.title()})
             res = cursor.fetchone()
-        cocktail = None
-        if res:
-            cocktail = Cocktail(
-                id_cocktail=res["id_cocktail"],
-                nom=res["nom"],
-                categorie=res["categorie"],
-                verre=res["verre"],
-                alcool=res["alcool"],
-                image=res["image"],
-            )
-        return cocktail
+        return _cocktail_depuis_ligne(res) if res else None
 
     @staticmethod
     @log
@@ -68,7 +340,9 @@ class CocktailDAO(metaclass=Singleton):
         """Recherche des cocktails dont le nom commence par une séquence donnée.
 
         La recherche est insensible à la casse et retourne les résultats
-        par ordre alphabétique.
+        par ordre alphabétique. Elle est servie par l'index des noms en
+        mémoire (IndexNoms), chargé depuis la base s'il est froid ; une
+        séquence contenant un joker de LIKE (% ou _) est confiée à la base.
 
         Parameters
         ----------
@@ -88,47 +362,88 @@ class CocktailDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT *                       "
-                "FROM cocktail                  "
-                "WHERE nom ILIKE %(sequence)s   "
-                "ORDER BY nom ASC               "
-                "LIMIT %(max_resultats)s        ",
-                {"sequence": sequence + "%", "max_resultats": max_resultats},
-            )
-            res = cursor.fetchall()
-
-        liste_cocktails = []
-        if res:
-            for raw_cocktail in res:
-                cocktail = Cocktail(
-                    id_cocktail=raw_cocktail["id_cocktail"],
-                    nom=raw_cocktail["nom"],
-                    categorie=raw_cocktail["categorie"],
-                    verre=raw_cocktail["verre"],
-                    alcool=raw_cocktail["alcool"],
-                    image=raw_cocktail["image"],
+        if _avec_jokers(sequence):
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(
+                    _SQL_COCKTAILS_PAR_SEQUENCE,
+                    {"sequence": sequence + "%", "max_resultats": max_resultats},
                 )
-                liste_cocktails.append(cocktail)
-        return liste_cocktails
+                res = cursor.fetchall()
+        else:
+            res = IndexNoms().rechercher(
+                sequence,
+                max_resultats,
+                CocktailDAO.get_tous_cocktails,
+            )
+
+        return [_cocktail_depuis_ligne(raw_cocktail) for raw_cocktail in res]
 
     @staticmethod
     @log
-    def rechercher_cocktail_aleatoire() -> Cocktail:
+    def get_tous_cocktails() -> list[dict]:
+        """Récupère toutes les lignes de la table cocktail.
+
+        Returns
+        -------
+        list[dict]
+            Les cocktails (id_cocktail, nom, categorie, verre, alcool, image)
+
+        """
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
+            cursor.execute(_SQL_TOUS_COCKTAILS)
+            return cursor.fetchall()
+
+    @staticmethod
+    @log
+    def rechercher_cocktail_aleatoire() -> Cocktail | None:
         """Récupère un cocktail aléatoire de la base de données.
 
         Returns
         -------
-        Cocktail
-        Un cocktail sélectionné aléatoirement
+        Cocktail | None
+            Un cocktail sélectionné aléatoirement, None si la table est vide
+
+        Raises
+        ------
+        DAOError
+            En cas d'erreur de base de données
+
+        """
+        cocktails = CocktailDAO.rechercher_cocktails_aleatoires(1)
+        return cocktails[0] if cocktails else None
+
+    @staticmethod
+    @log
+    def rechercher_cocktails_aleatoires(nombre: int) -> list[Cocktail]:
+        """Récupère des cocktails distincts tirés au hasard.
+
+        Le tirage est fait dans le tableau des identifiants de l'index des
+        noms en mémoire (IndexNoms), sans trier la table comme le ferait
+        ORDER BY RANDOM().
+
+        Parameters
+        ----------
+        nombre : int
+            Nombre de cocktails (moins si le catalogue en compte moins)
+
+        Returns
+        -------
+        list[Cocktail]
+            Les cocktails tirés
 
         Raises
         ------
         DAOError
-        En cas d'erreur de base de données
+            En cas d'erreur de base de données
 
         """
+        return [
+            _cocktail_depuis_ligne(ligne)
+            for ligne in IndexNoms().tirer(nombre, CocktailDAO.get_tous_cocktails)
+        ]
 
     @staticmethod
     @log
@@ -153,15 +468,8 @@ class CocktailDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
-            cursor.execute(
-                """
-                    SELECT id_cocktail
-                    FROM cocktail
-                    WHERE LOWER(TRIM(nom)) = LOWER(TRIM(%(cocktail_name)s))
-                    """,
-                {"cocktail_name": cocktail_name},
-            )
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
+            cursor.execute(_SQL_ID_PAR_NOM, {"cocktail_name": cocktail_name})
             result = cursor.fetchone()
             return result["id_cocktail"] if result else None
 
@@ -186,6 +494,9 @@ class CocktailDAO(metaclass=Singleton):
             - id_ingredient : int
             - qte : float
             - unite : str
+            - qte_normalisee : float | None (qte en ml ou en g)
+            - type_unite : str | None
+            - nom_ingredient : str
 
         Raises
         ------
@@ -194,24 +505,11 @@ class CocktailDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT
-                        c.id_cocktail,
-                        c.nom,
-                        c.categorie,
-                        c.verre,
-                        c.alcool,
-                        c.image,
-                        ci.id_ingredient,
-                        ci.qte,
-                        ci.unite
-                    FROM cocktail c
-                    LEFT JOIN cocktail_ingredient ci ON c.id_cocktail = ci.id_cocktail
-                    ORDER BY c.id_cocktail, ci.id_ingredient
-                    """,
-                )
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(_SQL_TOUS_COCKTAILS_AVEC_INGREDIENTS)
 
                 return cursor.fetchall()
 
@@ -239,30 +537,12 @@ class CocktailDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
-                    """
-                    SELECT
-                        c.id_cocktail,
-                        c.nom,
-                        c.categorie,
-                        c.verre,
-                        c.alcool,
-                        c.image,
-                        ci.id_ingredient,
-                        ci.qte as quantite_requise,
-                        ci.unite as unite_requise,
-                        i.nom as nom_ingredient,
-                        s.quantite as quantite_stock,
-                        u_stock.abbreviation as unite_stock
-                    FROM cocktail c
-                    LEFT JOIN cocktail_ingredient ci ON c.id_cocktail = ci.id_cocktail
-                    LEFT JOIN ingredient i ON ci.id_ingredient = i.id_ingredient
-                    LEFT JOIN stock s ON ci.id_ingredient = s.id_ingredient
-                        AND s.id_utilisateur = %(id_utilisateur)s
-                    LEFT JOIN unite u_stock ON s.id_unite = u_stock.id_unite
-                    ORDER BY c.id_cocktail, ci.id_ingredient
-                    """,
+                    _SQL_COCKTAILS_QUASI_REALISABLES,
                     {"id_utilisateur": id_utilisateur},
                 )
 
@@ -271,6 +551,58 @@ class CocktailDAO(metaclass=Singleton):
         except DBError as e:
             raise DAOError(message=None) from e
 
+    @staticmethod
+    def calculer_cocktails_quasi_realisables(
+        id_utilisateur: int,
+        max_ingredients_manquants: int,
+        *,
+        limit: int | None = None,
+        apres: tuple | None = None,
+    ) -> list[dict]:
+        """Récupère les cocktails auxquels il manque peu d'ingrédients (calcul en base).
+
+        Le décompte des ingrédients manquants est fait par la base (GROUP BY /
+        HAVING sur les quantités normalisées) : seuls les cocktails retenus
+        sont transférés, au lieu de tout le catalogue.
+
+        Parameters
+        ----------
+        id_utilisateur : int
+            ID de l'utilisateur
+        max_ingredients_manquants : int
+            Nombre maximum d'ingrédients manquants
+        limit : int | None
+            Nombre maximum de cocktails retournés (None : tous)
+        apres : tuple | None
+            Clé de tri (voir cle_quasi_realisable) après laquelle commencer
+
+        Returns
+        -------
+        list[dict]
+            Les cocktails ayant entre 1 et max_ingredients_manquants ingrédients
+            manquants, au format et dans l'ordre de
+            CocktailService.filter_and_format_cocktails
+
+        """
+        try:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(
+                    _SQL_COCKTAILS_QUASI_REALISABLES_FILTRES,
+                    _parametres_quasi_realisables(
+                        id_utilisateur,
+                        max_ingredients_manquants,
+                        limit,
+                        apres,
+                    ),
+                )
+                return cursor.fetchall()
+
+        except DBError as e:
+            raise DAOError(message=None) from e
+
     @staticmethod
     def ajouter_cocktail(cocktail: Cocktail) -> int:
         """Ajoute un cocktail dans la base de données.
@@ -292,7 +624,10 @@ class CocktailDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
                     """
                     INSERT INTO cocktail (nom, categorie, verre, alcool, image)
@@ -315,6 +650,17 @@ class CocktailDAO(metaclass=Singleton):
                 message=f"Erreur lors de l'ajout du cocktail : {e}",
             ) from e
 
+        IndexRecettes().invalider()
+        IndexNoms().ajouter(
+            {
+                "id_cocktail": id_cocktail,
+                "nom": cocktail.nom,
+                "categorie": cocktail.categorie,
+                "verre": cocktail.verre,
+                "alcool": cocktail.alcool,
+                "image": cocktail.image,
+            },
+        )
         return id_cocktail
 
     @staticmethod
@@ -343,7 +689,7 @@ class CocktailDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 DELETE FROM cocktail
@@ -351,7 +697,10 @@ class CocktailDAO(metaclass=Singleton):
                 """,
                 (id_cocktail,),
             )
-            return cursor.rowcount > 0
+            supprime = cursor.rowcount > 0
+        IndexRecettes().invalider()
+        IndexNoms().retirer(id_cocktail)
+        return supprime
 
     @staticmethod
     @log
@@ -375,13 +724,20 @@ class CocktailDAO(metaclass=Singleton):
             Unité de mesure
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                "INSERT INTO cocktail_ingredient "
-                "(id_cocktail, id_ingredient, qte, unite) "
-                "VALUES (%s, %s, %s, %s)",
-                (id_cocktail, id_ingredient, quantite, unite),
+                _SQL_AJOUT_INGREDIENT,
+                (
+                    id_cocktail,
+                    id_ingredient,
+                    quantite,
+                    unite,
+                    *normaliser_mesure(quantite, unite),
+                    unite_comparee(unite),
+                ),
             )
+            indexer_instructions(cursor, [id_cocktail])
+        IndexRecettes().invalider()
 
     @staticmethod
     @log
@@ -400,19 +756,79 @@ class CocktailDAO(metaclass=Singleton):
             Format: [{"id_ingredient": int, "quantite": float, "unite": str}]
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             for ingredient in ingredients:
                 cursor.execute(
-                    "INSERT INTO cocktail_ingredient "
-                    "(id_cocktail, id_ingredient, qte, unite) "
-                    "VALUES (%s, %s, %s, %s)",
+                    _SQL_AJOUT_INGREDIENT,
                     (
                         id_cocktail,
                         ingredient["id_ingredient"],
                         ingredient["quantite"],
                         ingredient["unite"],
+                        *normaliser_mesure(
+                            ingredient["quantite"],
+                            ingredient["unite"],
+                        ),
+                        unite_comparee(ingredient["unite"]),
                     ),
                 )
+            indexer_instructions(cursor, [id_cocktail])
+        IndexRecettes().invalider()
+
+    @staticmethod
+    @log
+    def normaliser_quantites() -> int:
+        """Remplit les quantités normalisées manquantes des recettes.
+
+        Chaque texte d'unité distinct n'est analysé qu'une fois (voir
+        analyser_mesure), puis toutes les lignes sont mises à jour en une seule
+        requête. La quantité lue dans le texte remplace une colonne qte vide
+        ("1 1/2 oz"), et les lignes dont l'unité n'était pas reconnue sont
+        normalisées si elle l'est désormais. L'unité comparée par la requête
+        des cocktails quasi-réalisables (unite_canonique) est remplie au passage.
+
+        Returns
+        -------
+        int
+            Nombre de lignes normalisées
+
+        """
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT DISTINCT unite FROM cocktail_ingredient "
+                "WHERE qte_normalisee IS NULL OR type_unite IS NULL "
+                "OR (unite_canonique IS NULL AND unite <> '')",
+            )
+            unites = [row["unite"] for row in cursor.fetchall()]
+            if not unites:
+                return 0
+
+            valeurs = []
+            for unite, mesure in zip(unites, analyser_mesures(unites), strict=True):
+                facteur, type_unite = UnitConverter.facteur_normalisation(
+                    mesure.unite,
+                )
+                valeurs.append(
+                    (
+                        unite,
+                        mesure.quantite,
+                        facteur,
+                        type_unite,
+                        unite_comparee(unite),
+                    ),
+                )
+            execute_values(
+                cursor,
+                _SQL_NORMALISER_QUANTITES,
+                valeurs,
+                template="(%s, %s::numeric, %s::numeric, %s, %s)",
+                page_size=len(valeurs),
+            )
+            nb_lignes = cursor.rowcount
+
+        if nb_lignes:
+            IndexRecettes().invalider()
+        return nb_lignes
 
     @staticmethod
     def cocktail_existe(nom: str) -> bool:
@@ -435,7 +851,7 @@ class CocktailDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection:
+            with DBConnection().connection() as connection:
                 with connection.cursor() as cursor:
                     cursor.execute(
                         "SELECT EXISTS(SELECT 1 FROM cocktail WHERE nom = %(nom)s)",
@@ -447,3 +863,170 @@ class CocktailDAO(metaclass=Singleton):
                 return False
         except Exception as e:
             raise DAOError from e
+
+
+class AsyncCocktailDAO(metaclass=Singleton):
+    """Versions asynchrones des méthodes de lecture de CocktailDAO.
+
+    Les requêtes sont identiques à celles de CocktailDAO mais passent par
+    AsyncDBConnection, ce qui libère la boucle d'événements pendant l'attente
+    de la base de données.
+    """
+
+    @staticmethod
+    @log
+    async def rechercher_cocktail_par_nom(nom) -> Cocktail | None:
+        """Recherche un cocktail par son nom exact.
+
+        Voir CocktailDAO.rechercher_cocktail_par_nom.
+        """
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(_SQL_COCKTAIL_PAR_NOM, {"nom": nom.title()})
+            res = await cursor.fetchone()
+        return _cocktail_depuis_ligne(res) if res else None
+
+    @staticmethod
+    @log
+    async def rechercher_cocktail_par_sequence_debut(
+        sequence,
+        max_resultats,
+    ) -> list[Cocktail]:
+        """Recherche des cocktails dont le nom commence par une séquence donnée.
+
+        Voir CocktailDAO.rechercher_cocktail_par_sequence_debut.
+        """
+        if _avec_jokers(sequence):
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(
+                    _SQL_COCKTAILS_PAR_SEQUENCE,
+                    {"sequence": sequence + "%", "max_resultats": max_resultats},
+                )
+                res = await cursor.fetchall()
+        else:
+            res = await IndexNoms().rechercher_async(
+                sequence,
+                max_resultats,
+                AsyncCocktailDAO.get_tous_cocktails,
+            )
+
+        return [_cocktail_depuis_ligne(raw_cocktail) for raw_cocktail in res]
+
+    @staticmethod
+    @log
+    async def rechercher_cocktails_aleatoires(nombre: int) -> list[Cocktail]:
+        """Récupère des cocktails distincts tirés au hasard.
+
+        Voir CocktailDAO.rechercher_cocktails_aleatoires.
+        """
+        return [
+            _cocktail_depuis_ligne(ligne)
+            for ligne in await IndexNoms().tirer_async(
+                nombre,
+                AsyncCocktailDAO.get_tous_cocktails,
+            )
+        ]
+
+    @staticmethod
+    @log
+    async def get_tous_cocktails() -> list[dict]:
+        """Récupère toutes les lignes de la table cocktail.
+
+        Voir CocktailDAO.get_tous_cocktails.
+        """
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(_SQL_TOUS_COCKTAILS)
+            return await cursor.fetchall()
+
+    @staticmethod
+    @log
+    async def get_cocktail_id_by_name(cocktail_name: str) -> int | None:
+        """Récupère l'identifiant d'un cocktail par son nom.
+
+        Voir CocktailDAO.get_cocktail_id_by_name.
+        """
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(_SQL_ID_PAR_NOM, {"cocktail_name": cocktail_name})
+            result = await cursor.fetchone()
+            return result["id_cocktail"] if result else None
+
+    @staticmethod
+    @log
+    async def get_tous_cocktails_avec_ingredients() -> list[dict]:
+        """Récupère tous les cocktails avec leurs ingrédients requis.
+
+        Voir CocktailDAO.get_tous_cocktails_avec_ingredients.
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(_SQL_TOUS_COCKTAILS_AVEC_INGREDIENTS)
+                return await cursor.fetchall()
+
+        except AsyncDBError as e:
+            raise DAOError(message=None) from e
+
+    @staticmethod
+    async def get_cocktails_quasi_realisables(id_utilisateur: int) -> list[dict]:
+        """Récupère tous les cocktails avec leurs ingrédients et le stock de
+        l'utilisateur.
+
+        Voir CocktailDAO.get_cocktails_quasi_realisables.
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(
+                    _SQL_COCKTAILS_QUASI_REALISABLES,
+                    {"id_utilisateur": id_utilisateur},
+                )
+                return await cursor.fetchall()
+
+        except AsyncDBError as e:
+            raise DAOError(message=None) from e
+
+    @staticmethod
+    async def calculer_cocktails_quasi_realisables(
+        id_utilisateur: int,
+        max_ingredients_manquants: int,
+        *,
+        limit: int | None = None,
+        apres: tuple | None = None,
+    ) -> list[dict]:
+        """Récupère les cocktails auxquels il manque peu d'ingrédients (calcul en base).
+
+        Voir CocktailDAO.calculer_cocktails_quasi_realisables.
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(
+                    _SQL_COCKTAILS_QUASI_REALISABLES_FILTRES,
+                    _parametres_quasi_realisables(
+                        id_utilisateur,
+                        max_ingredients_manquants,
+                        limit,
+                        apres,
+                    ),
+                )
+                return await cursor.fetchall()
+
+        except AsyncDBError as e:
+            raise DAOError(message=None) from e
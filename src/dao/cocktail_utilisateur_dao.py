@@ -4,12 +4,16 @@ sur la table prive dans la base de données.
 
 from src.business_object.cocktail import Cocktail
 from src.dao.db_connection import DBConnection
+from src.dao.index_noms import IndexNoms
+from src.dao.index_recettes import IndexRecettes
+from src.dao.instruction_dao import indexer_instructions
 from src.utils.exceptions import (
     CocktailNotFoundError,
     CocktailNotTestedError,
     PermissionDeniedError,
 )
 from src.utils.log_decorator import log
+from src.utils.mesure import normaliser_mesure
 from src.utils.singleton import Singleton
 
 
@@ -39,7 +43,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT c.id_cocktail,                           "
                 "       c.nom,                                   "
@@ -117,7 +121,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             "image": cocktail.image,
         }
 
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(sql_insert_cocktail, cocktail_params)
             res = cursor.fetchone()
             new_cocktail_id = res["id_cocktail"]
@@ -126,6 +130,8 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
                 "id_utilisateur": id_utilisateur,
             }
             cursor.execute(sql_insert_acces, acces_params)
+        IndexRecettes().invalider()
+        IndexNoms().ajouter({"id_cocktail": new_cocktail_id, **cocktail_params})
         return new_cocktail_id
 
     @staticmethod
@@ -150,7 +156,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT id_ingredient, qte FROM cocktail_ingredient WHERE "
                 "id_cocktail = %(id_cocktail)s",
@@ -187,7 +193,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT 1 FROM acces "
                 "WHERE id_utilisateur = %(id_utilisateur)s "
@@ -204,15 +210,36 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
                     "UPDATE cocktail_ingredient "
                     "SET qte = %(quantite)s "
                     "WHERE id_ingredient = %(id_ingredient)s "
-                    "AND id_cocktail = %(id_cocktail)s",
+                    "AND id_cocktail = %(id_cocktail)s "
+                    "RETURNING unite",
                     {
                         "quantite": quantite,
                         "id_ingredient": id_ingredient,
                         "id_cocktail": id_cocktail,
                     },
                 )
+                ligne = cursor.fetchone()
+                if ligne:
+                    qte_normalisee, type_unite = normaliser_mesure(
+                        quantite,
+                        ligne["unite"],
+                    )
+                    cursor.execute(
+                        "UPDATE cocktail_ingredient "
+                        "SET qte_normalisee = %(qte_normalisee)s, "
+                        "type_unite = %(type_unite)s "
+                        "WHERE id_ingredient = %(id_ingredient)s "
+                        "AND id_cocktail = %(id_cocktail)s",
+                        {
+                            "qte_normalisee": qte_normalisee,
+                            "type_unite": type_unite,
+                            "id_ingredient": id_ingredient,
+                            "id_cocktail": id_cocktail,
+                        },
+                    )
             else:
                 raise PermissionDeniedError
+        IndexRecettes().invalider()
 
     @staticmethod
     @log
@@ -243,7 +270,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT 1 FROM acces "
                 "WHERE id_utilisateur = %(id_utilisateur)s "
@@ -259,8 +286,10 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
                 cursor.execute(
                     "INSERT INTO cocktail_ingredient (id_cocktail,  "
                     "                                 id_ingredient,"
-                    "                                  qte)    "
+                    "                                  qte,"
+                    "                                  qte_normalisee)    "
                     "VALUES (%(id_cocktail)s, %(id_ingredient)s,    "
+                    "                                %(quantite)s,"
                     "                                %(quantite)s)  ",
                     {
                         "id_cocktail": id_cocktail,
@@ -268,8 +297,10 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
                         "quantite": quantite,
                     },
                 )
+                indexer_instructions(cursor, [id_cocktail])
             else:
                 raise PermissionDeniedError
+        IndexRecettes().invalider()
 
     @staticmethod
     @log
@@ -297,7 +328,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT 1 FROM acces "
                 "WHERE id_utilisateur = %(id_utilisateur)s "
@@ -319,8 +350,10 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
                         "id_cocktail": id_cocktail,
                     },
                 )
+                indexer_instructions(cursor, [id_cocktail])
             else:
                 raise PermissionDeniedError
+        IndexRecettes().invalider()
 
     @staticmethod
     @log
@@ -359,11 +392,13 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             "id_utilisateur": id_utilisateur,
         }
 
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 cursor.execute(sql_delete_acces, params),
                 cursor.execute(sql_delete_cocktail, params),
             )
+        IndexRecettes().invalider()
+        IndexNoms().retirer(id_cocktail)
 
     @staticmethod
     @log
@@ -386,7 +421,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT c.id_cocktail,                           "
                 "       c.nom,                                   "
@@ -437,7 +472,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "UPDATE avis                                "
                 "SET favoris = TRUE                         "
@@ -467,7 +502,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "UPDATE avis                                "
                 "SET favoris = FALSE                        "
@@ -500,7 +535,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT c.id_cocktail,                           "
                 "       c.nom,                                   "
@@ -556,7 +591,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT id_cocktail FROM cocktail WHERE LOWER(nom) = LOWER(%(nom)s)",
                 {"nom": nom_cocktail},
@@ -600,7 +635,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
         if not id_cocktail:
             raise CocktailNotFoundError(nom_cocktail)
 
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT teste
@@ -680,7 +715,7 @@ class CocktailUtilisateurDAO(metaclass=Singleton):
         if not id_cocktail:
             raise CocktailNotFoundError(nom_cocktail)
 
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT teste
@@ -0,0 +1,69 @@
+"""Curseurs qui mesurent chaque requête SQL exécutée par les DAO.
+
+DBConnection et AsyncDBConnection créent leurs curseurs avec ces classes :
+chaque execute alimente, dans le registre des métriques, la durée de la
+requête (réception des lignes comprise) et le nombre de lignes retournées
+ou modifiées, sous le nom de la méthode de DAO qui l'a lancée.
+"""
+
+import inspect
+import time
+from typing import Self
+
+from psycopg import AsyncCursor
+from psycopg2.extras import RealDictCursor
+
+from src.utils.metriques import DAO_DUREE, DAO_LIGNES, RegistreMetriques
+
+
+def _methode_appelante() -> str:
+    """Retourne le nom qualifié de la méthode qui a lancé la requête.
+
+    Les appels internes à ce module et à psycopg (execute_values,
+    connection.execute) sont sautés.
+    """
+    cadre = inspect.currentframe()
+    while cadre is not None and (
+        cadre.f_globals.get("__name__") == __name__
+        or cadre.f_globals.get("__name__", "").startswith("psycopg")
+    ):
+        cadre = cadre.f_back
+    return "inconnue" if cadre is None else cadre.f_code.co_qualname
+
+
+def _enregistrer(debut: float, lignes: int) -> None:
+    """Enregistre la durée et le nombre de lignes d'une requête."""
+    duree = time.perf_counter() - debut
+    methode = _methode_appelante()
+    registre = RegistreMetriques()
+    registre.observer(DAO_DUREE, duree, methode=methode)
+    registre.incrementer(DAO_LIGNES, max(lignes, 0), methode=methode)
+
+
+class CurseurMesure(RealDictCursor):
+    """Curseur psycopg2 (lignes en dictionnaires) qui mesure ses requêtes."""
+
+    def execute(self, query: object, params: object = None) -> None:
+        """Exécute une requête et la mesure."""
+        debut = time.perf_counter()
+        try:
+            return super().execute(query, params)
+        finally:
+            _enregistrer(debut, self.rowcount)
+
+
+class CurseurAsyncMesure(AsyncCursor):
+    """Curseur psycopg 3 asynchrone qui mesure ses requêtes."""
+
+    async def execute(
+        self,
+        query: object,
+        params: object = None,
+        **options: bool | None,
+    ) -> Self:
+        """Exécute une requête et la mesure."""
+        debut = time.perf_counter()
+        try:
+            return await super().execute(query, params, **options)
+        finally:
+            _enregistrer(debut, self.rowcount)
@@ -1,71 +1,282 @@
 """
 Module gérant la connexion à la base de données PostgreSQL.
-Il fournit une classe singleton DBConnection pour garantir qu'une seule connexion est ouverte.
+Il fournit un pool de connexions thread-safe (ConnectionPool) et une classe
+singleton DBConnection qui le partage entre tous les DAO.
 """
 
 import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 import dotenv
 import psycopg2
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_UNKNOWN,
+)
 
-from psycopg2.extras import RealDictCursor
+from src.dao.curseurs_mesures import CurseurMesure
+from src.utils.exceptions import PoolTimeoutError
+from src.utils.settings import settings
 from src.utils.singleton import Singleton
 
 
+class ConnectionPool:
+    """
+    Pool de connexions psycopg2 thread-safe.
+
+    Contrairement à psycopg2.pool.ThreadedConnectionPool, un appel à getconn
+    attend qu'une connexion se libère (dans la limite de `timeout` secondes)
+    au lieu de lever une erreur dès que le pool est plein, et les connexions
+    au-delà de `minconn` restent ouvertes une fois rendues.
+    """
+
+    def __init__(self, minconn, maxconn, timeout, **connect_kwargs):
+        """Ouvre les `minconn` premières connexions du pool."""
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError("Il faut 0 <= minconn <= maxconn et maxconn >= 1")
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self._connect_kwargs = connect_kwargs
+
+        self._condition = threading.Condition()
+        self._disponibles = deque()
+        self._ouvertes = 0
+        self._ferme = False
+
+        self._checkouts = 0
+        self._attentes = 0
+        self._timeouts = 0
+        self._rejetees = 0
+        self._attente_max = 0.0
+
+        for _ in range(minconn):
+            self._disponibles.append(self._connect())
+            self._ouvertes += 1
+
+    def _connect(self):
+        return psycopg2.connect(**self._connect_kwargs)
+
+    def getconn(self, timeout=None):
+        """
+        Emprunte une connexion au pool.
+
+        Bloque au plus `timeout` secondes (par défaut celui du pool) si les
+        `maxconn` connexions sont déjà empruntées, puis lève PoolTimeoutError.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        debut = time.monotonic()
+        a_attendu = False
+
+        with self._condition:
+            while True:
+                if self._ferme:
+                    raise PoolTimeoutError(message="Le pool de connexions est fermé")
+
+                if self._disponibles:
+                    connection = self._disponibles.pop()
+                    if connection.closed:
+                        self._ouvertes -= 1
+                        self._rejetees += 1
+                        continue
+                    break
+
+                if self._ouvertes < self.maxconn:
+                    self._ouvertes += 1
+                    connection = None
+                    break
+
+                restant = timeout - (time.monotonic() - debut)
+                if restant <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        message=f"Aucune connexion disponible après {timeout}s "
+                        f"({self.maxconn} connexions déjà empruntées)",
+                    )
+                a_attendu = True
+                self._condition.wait(restant)
+
+            self._checkouts += 1
+            if a_attendu:
+                self._attentes += 1
+                self._attente_max = max(self._attente_max, time.monotonic() - debut)
+
+        if connection is None:
+            try:
+                connection = self._connect()
+            except Exception:
+                with self._condition:
+                    self._ouvertes -= 1
+                    self._condition.notify()
+                raise
+
+        return connection
+
+    def putconn(self, connection, *, close=False):
+        """
+        Rend une connexion au pool.
+
+        Une transaction restée ouverte est annulée ; une connexion fermée ou
+        dans un état inconnu (socket cassée) est jetée au lieu d'être recyclée.
+        """
+        if not close and not connection.closed:
+            status = connection.info.transaction_status
+            if status == TRANSACTION_STATUS_UNKNOWN:
+                close = True
+            elif status != TRANSACTION_STATUS_IDLE:
+                try:
+                    connection.rollback()
+                except psycopg2.Error:
+                    close = True
+
+        with self._condition:
+            if close or connection.closed or self._ferme:
+                if not connection.closed:
+                    connection.close()
+                self._ouvertes -= 1
+                self._rejetees += 1
+            else:
+                self._disponibles.append(connection)
+            self._condition.notify()
+
+    def closeall(self):
+        """Ferme toutes les connexions disponibles et refuse les prochains emprunts.
+
+        Les connexions encore empruntées seront fermées lorsqu'elles seront rendues.
+        """
+        with self._condition:
+            self._ferme = True
+            while self._disponibles:
+                self._disponibles.pop().close()
+                self._ouvertes -= 1
+            self._condition.notify_all()
+
+    def stats(self):
+        """Retourne un instantané des statistiques du pool."""
+        with self._condition:
+            disponibles = len(self._disponibles)
+            return {
+                "min_size": self.minconn,
+                "max_size": self.maxconn,
+                "opened": self._ouvertes,
+                "in_use": self._ouvertes - disponibles,
+                "idle": disponibles,
+                "checkouts": self._checkouts,
+                "waits": self._attentes,
+                "timeouts": self._timeouts,
+                "discarded": self._rejetees,
+                "max_wait_ms": round(self._attente_max * 1000, 3),
+            }
+
+
+class _PorteeRequete:
+    """Connexion empruntée paresseusement pour toute la durée d'une requête."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection = None
+
+    @property
+    def connection(self):
+        """Connexion de la portée, empruntée au pool lors du premier accès."""
+        if self._connection is None:
+            self._connection = self._pool.getconn()
+        return self._connection
+
+    def liberer(self):
+        """Rend la connexion au pool si elle a été empruntée."""
+        if self._connection is not None:
+            self._pool.putconn(self._connection)
+            self._connection = None
+
+
+_portee_requete: ContextVar[_PorteeRequete | None] = ContextVar(
+    "portee_requete",
+    default=None,
+)
+
+
 class DBConnection(metaclass=Singleton):
     """
     Classe de connexion à la base de données
-    Elle permet de n'ouvrir qu'une seule et unique connexion
+    Elle partage un unique pool de connexions entre tous les DAO
     """
 
     def __init__(self):
-        """Ouverture de la connexion"""
+        """Création du pool de connexions"""
         dotenv.load_dotenv()
 
-        self.__connection = psycopg2.connect(
+        self.__pool = ConnectionPool(
+            settings.POSTGRES_POOL_MIN_SIZE,
+            settings.POSTGRES_POOL_MAX_SIZE,
+            settings.POSTGRES_POOL_TIMEOUT,
             host=os.environ["POSTGRES_HOST"],
             port=os.environ["POSTGRES_PORT"],
             database=os.environ["POSTGRES_DATABASE"],
             user=os.environ["POSTGRES_USER"],
             password=os.environ["POSTGRES_PASSWORD"],
-            cursor_factory=RealDictCursor,
+            cursor_factory=CurseurMesure,
         )
 
     @property
+    def pool(self):
+        return self.__pool
+
+    @contextmanager
     def connection(self):
-        return self.__connection
-
-
-# from psycopg2 import pool
-
-
-# class DBConnection:
-#     """Gère un pool de connexions à la base de données."""
-
-#     pool = None
-
-#     @classmethod
-#     def initialize_pool(cls, minconn=1, maxconn=5):
-#         """Initialise le pool de connexions."""
-#         if cls.pool is None:
-#             cls.pool = pool.SimpleConnectionPool(
-#                 minconn,
-#                 maxconn,
-#                 host=os.environ.get("DB_HOST"),
-#                 port=os.environ.get("DB_PORT"),
-#                 database=os.environ.get("DB_NAME"),
-#                 user=os.environ.get("DB_USER"),
-#                 password=os.environ.get("DB_PASSWORD"),
-#             )
-
-#     @classmethod
-#     def get_connection(cls):
-#         """Récupère une connexion du pool."""
-#         if cls._pool is None:
-#             cls.initialize_pool()
-#         return cls._pool.getconn()
-
-#     @classmethod
-#     def return_connection(cls, connection):
-#         """Retourne une connexion au pool."""
-#         if cls._pool:
-#             cls._pool.putconn(connection)
+        """
+        Fournit une connexion pour une transaction.
+
+        La transaction est validée à la sortie du bloc `with` (annulée en cas
+        d'exception). Dans une portée de requête, la connexion de la requête est
+        réutilisée ; sinon elle est empruntée au pool puis rendue.
+        """
+        portee = _portee_requete.get()
+        if portee is not None:
+            with portee.connection as connection:
+                yield connection
+            return
+
+        connection = self.__pool.getconn()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self.__pool.putconn(connection)
+
+    @contextmanager
+    def request_scope(self):
+        """
+        Ouvre une portée dans laquelle tous les DAO partagent une même connexion.
+
+        La connexion n'est empruntée qu'au premier accès à la base et rendue au
+        pool à la fin de la portée.
+        """
+        portee = _PorteeRequete(self.__pool)
+        token = _portee_requete.set(portee)
+        try:
+            yield portee
+        finally:
+            _portee_requete.reset(token)
+            portee.liberer()
+
+    def get_connection(self):
+        """Emprunte une connexion brute au pool (à rendre avec return_connection)."""
+        return self.__pool.getconn()
+
+    def return_connection(self, connection):
+        """Rend au pool une connexion obtenue avec get_connection."""
+        self.__pool.putconn(connection)
+
+    def stats(self):
+        """Statistiques du pool de connexions."""
+        return self.__pool.stats()
+
+    def close(self):
+        """Ferme le pool de connexions."""
+        self.__pool.closeall()
@@ -0,0 +1,73 @@
+"""Index en mémoire des trigrammes des noms d'ingrédients.
+
+Les suggestions proposées quand un nom d'ingrédient est introuvable (fautes de
+frappe) étaient calculées en base par SIMILARITY(nom, ...) sur toute la table.
+L'index donne les mêmes suggestions sans requête (voir IndexTrigrammes) ; il
+est tenu à jour par IngredientDAO.create_ingredient (voir IndexMemoire).
+"""
+
+from collections.abc import Awaitable, Callable
+
+from src.dao.index_memoire import IndexMemoire
+from src.utils.trigrammes import IndexTrigrammes
+
+# Similarité à dépasser pour qu'un ingrédient soit suggéré
+SEUIL_SUGGESTIONS = 0.2
+
+
+class IndexIngredients(IndexMemoire):
+    """Index des noms d'ingrédients partagé par tout le processus."""
+
+    _indexer = IndexTrigrammes
+
+    def rechercher(
+        self,
+        nom: str,
+        limit: int,
+        charger: Callable[[], list[dict]],
+    ) -> list[dict]:
+        """Retourne les ingrédients dont le nom est le plus similaire à nom.
+
+        Parameters
+        ----------
+        nom : str
+            Le nom recherché
+        limit : int
+            Nombre maximum de résultats
+        charger : Callable[[], list[dict]]
+            Fonction lisant toute la table ingredient, appelée si l'index est froid
+
+        Returns
+        -------
+        list[dict]
+            Les ingrédients (id_ingredient, nom), du plus similaire au moins
+            similaire
+
+        """
+        instantane = self._obtenir(charger)
+        with self._verrou:
+            resultat = instantane.rechercher(nom, limit, SEUIL_SUGGESTIONS)
+        return [dict(ligne) for ligne in resultat]
+
+    async def rechercher_async(
+        self,
+        nom: str,
+        limit: int,
+        charger: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """Version asynchrone de rechercher (chargement par un DAO asynchrone)."""
+        instantane = await self._obtenir_async(charger)
+        with self._verrou:
+            resultat = instantane.rechercher(nom, limit, SEUIL_SUGGESTIONS)
+        return [dict(ligne) for ligne in resultat]
+
+    def ajouter(self, ligne: dict) -> None:
+        """Ajoute un ingrédient créé (après validation de la transaction).
+
+        Parameters
+        ----------
+        ligne : dict
+            La ligne de la table ingredient (id_ingredient, nom)
+
+        """
+        self._modifier(lambda instantane: instantane.ajouter(ligne))
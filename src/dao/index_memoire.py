@@ -0,0 +1,90 @@
+"""Base des index en mémoire d'une table du catalogue.
+
+Un index est partagé par tout le processus : il est construit au démarrage de
+l'API (ou au premier usage) à partir d'une lecture complète de la table, tenu
+à jour par les DAO après chaque écriture validée, et reconstruit par sécurité
+au bout de RECIPE_INDEX_TTL secondes lorsque plusieurs processus servent l'API.
+
+Un compteur de générations, incrémenté à chaque écriture, empêche de publier
+un index construit à partir d'une lecture antérieure à une écriture.
+"""
+
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+from src.utils.settings import settings
+from src.utils.singleton import Singleton
+
+
+class IndexMemoire(metaclass=Singleton):
+    """Instantané d'une table, construit par _indexer et partagé par le processus.
+
+    Les sous-classes définissent _indexer (lignes de la table -> instantané) et
+    lisent ou modifient l'instantané sous self._verrou.
+    """
+
+    _indexer: Callable[[list[dict]], object]
+
+    def __init__(self) -> None:
+        """Initialise un index froid (construit au démarrage ou au premier usage)."""
+        self._verrou = threading.Lock()
+        self._instantane: object | None = None
+        self._construit_le = 0.0
+        self._generation = 0
+
+    def construire(self, charger: Callable[[], list[dict]]) -> None:
+        """Construit l'index (au démarrage de l'API).
+
+        Parameters
+        ----------
+        charger : Callable[[], list[dict]]
+            Fonction lisant toute la table
+
+        """
+        generation = self._generation
+        self._publier(self._indexer(charger()), generation)
+
+    def _obtenir(self, charger: Callable[[], list[dict]]) -> object:
+        """Retourne l'instantané courant, en le construisant s'il est froid."""
+        instantane = self._courant()
+        if instantane is None:
+            generation = self._generation
+            instantane = self._publier(self._indexer(charger()), generation)
+        return instantane
+
+    async def _obtenir_async(
+        self,
+        charger: Callable[[], Awaitable[list[dict]]],
+    ) -> object:
+        """Version asynchrone de _obtenir (chargement par un DAO asynchrone)."""
+        instantane = self._courant()
+        if instantane is None:
+            generation = self._generation
+            instantane = self._publier(self._indexer(await charger()), generation)
+        return instantane
+
+    def _modifier(self, modification: Callable[[object], None]) -> None:
+        """Applique une écriture validée à l'instantané, s'il est construit."""
+        with self._verrou:
+            self._generation += 1
+            if self._instantane is not None:
+                modification(self._instantane)
+
+    def _courant(self) -> object | None:
+        """Retourne l'instantané s'il est construit et encore frais."""
+        with self._verrou:
+            if (
+                self._instantane is not None
+                and time.monotonic() - self._construit_le < settings.RECIPE_INDEX_TTL
+            ):
+                return self._instantane
+            return None
+
+    def _publier(self, instantane: object, generation: int) -> object:
+        """Mémorise un instantané, sauf si la table a changé entre-temps."""
+        with self._verrou:
+            if generation == self._generation:
+                self._instantane = instantane
+                self._construit_le = time.monotonic()
+        return instantane
@@ -0,0 +1,192 @@
+"""Index en mémoire des noms de cocktails pour la recherche par préfixe.
+
+La recherche par début de nom (saisie semi-automatique) faisait un parcours
+complet de la table cocktail (nom ILIKE 'seq%'). L'index garde les noms en
+minuscules dans un tableau trié : les noms commençant par une séquence forment
+une tranche contiguë, trouvée par deux recherches dichotomiques.
+
+Il garde aussi les identifiants dans un tableau dense, pour tirer des
+cocktails au hasard sans parcourir la table (ORDER BY RANDOM() la trie
+entièrement).
+
+L'index est tenu à jour par les DAO à chaque ajout ou suppression de cocktail
+(voir IndexMemoire).
+"""
+
+from bisect import bisect_left, insort
+from collections.abc import Awaitable, Callable
+from heapq import nsmallest
+from operator import itemgetter
+
+import numpy as np
+
+from src.dao.index_memoire import IndexMemoire
+
+# Plus grand caractère Unicode : toute clé commençant par un préfixe est
+# strictement inférieure au préfixe suivi de ce caractère
+_FIN_PREFIXE = "\U0010ffff"
+
+_ORDRE_NOM = itemgetter("nom", "id_cocktail")
+
+
+def _cle(nom: str) -> str:
+    """Retourne la clé de recherche d'un nom (insensible à la casse)."""
+    return nom.lower()
+
+
+class _Instantane:
+    """Noms des cocktails triés par clé, avec les lignes de la table cocktail."""
+
+    def __init__(self, lignes: list[dict]) -> None:
+        """Indexe les lignes de la table cocktail."""
+        self.lignes = {ligne["id_cocktail"]: ligne for ligne in lignes}
+        # (nom en minuscules, id_cocktail), triés
+        self.cles = sorted(
+            (_cle(ligne["nom"]), ligne["id_cocktail"]) for ligne in lignes
+        )
+        # Identifiants sans trou, pour les tirages au hasard
+        self.ids = list(self.lignes)
+        self.positions = {id_cocktail: i for i, id_cocktail in enumerate(self.ids)}
+
+    def rechercher(self, sequence: str, max_resultats: int) -> list[dict]:
+        """Retourne les lignes dont le nom commence par la séquence, triées par nom."""
+        prefixe = _cle(sequence)
+        debut = bisect_left(self.cles, (prefixe,))
+        fin = bisect_left(self.cles, (prefixe + _FIN_PREFIXE,), debut)
+        # Même ordre que ORDER BY nom (collation C de la base)
+        return nsmallest(
+            max_resultats,
+            (self.lignes[id_cocktail] for _, id_cocktail in self.cles[debut:fin]),
+            key=_ORDRE_NOM,
+        )
+
+    def tirer(self, nombre: int) -> list[dict]:
+        """Retourne jusqu'à nombre lignes distinctes tirées au hasard."""
+        tirage = np.random.default_rng().choice(
+            len(self.ids),
+            size=min(nombre, len(self.ids)),
+            replace=False,
+        )
+        return [self.lignes[self.ids[position]] for position in tirage]
+
+    def ajouter(self, ligne: dict) -> None:
+        """Ajoute une ligne à l'index, ou la remplace si elle y figure déjà.
+
+        Une reconstruction à froid peut avoir lu une ligne que le DAO ajoute
+        ensuite : sa clé n'est alors pas dupliquée.
+        """
+        id_cocktail = ligne["id_cocktail"]
+        ancienne = self.lignes.get(id_cocktail)
+        if ancienne is None:
+            self.positions[id_cocktail] = len(self.ids)
+            self.ids.append(id_cocktail)
+        else:
+            del self.cles[bisect_left(self.cles, (_cle(ancienne["nom"]), id_cocktail))]
+        insort(self.cles, (_cle(ligne["nom"]), id_cocktail))
+        self.lignes[id_cocktail] = ligne
+
+    def retirer(self, id_cocktail: int) -> None:
+        """Retire une ligne de l'index, si elle y figure."""
+        ligne = self.lignes.pop(id_cocktail, None)
+        if ligne is not None:
+            del self.cles[bisect_left(self.cles, (_cle(ligne["nom"]), id_cocktail))]
+            # Le dernier identifiant prend la place du cocktail retiré
+            position = self.positions.pop(id_cocktail)
+            dernier = self.ids.pop()
+            if dernier != id_cocktail:
+                self.ids[position] = dernier
+                self.positions[dernier] = position
+
+
+class IndexNoms(IndexMemoire):
+    """Index des noms de cocktails partagé par tout le processus."""
+
+    _indexer = _Instantane
+
+    def rechercher(
+        self,
+        sequence: str,
+        max_resultats: int,
+        charger: Callable[[], list[dict]],
+    ) -> list[dict]:
+        """Retourne les cocktails dont le nom commence par une séquence.
+
+        Parameters
+        ----------
+        sequence : str
+            Début du nom (insensible à la casse)
+        max_resultats : int
+            Nombre maximum de résultats
+        charger : Callable[[], list[dict]]
+            Fonction lisant toute la table cocktail, appelée si l'index est froid
+
+        Returns
+        -------
+        list[dict]
+            Les lignes de la table cocktail, triées par nom
+
+        """
+        instantane = self._obtenir(charger)
+        with self._verrou:
+            return instantane.rechercher(sequence, max_resultats)
+
+    async def rechercher_async(
+        self,
+        sequence: str,
+        max_resultats: int,
+        charger: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """Version asynchrone de rechercher (chargement par un DAO asynchrone)."""
+        instantane = await self._obtenir_async(charger)
+        with self._verrou:
+            return instantane.rechercher(sequence, max_resultats)
+
+    def tirer(
+        self,
+        nombre: int,
+        charger: Callable[[], list[dict]],
+    ) -> list[dict]:
+        """Retourne des cocktails distincts tirés au hasard.
+
+        Parameters
+        ----------
+        nombre : int
+            Nombre de cocktails (moins si la table en compte moins)
+        charger : Callable[[], list[dict]]
+            Fonction lisant toute la table cocktail, appelée si l'index est froid
+
+        Returns
+        -------
+        list[dict]
+            Les lignes de la table cocktail, dans l'ordre du tirage
+
+        """
+        instantane = self._obtenir(charger)
+        with self._verrou:
+            return instantane.tirer(nombre)
+
+    async def tirer_async(
+        self,
+        nombre: int,
+        charger: Callable[[], Awaitable[list[dict]]],
+    ) -> list[dict]:
+        """Version asynchrone de tirer (chargement par un DAO asynchrone)."""
+        instantane = await self._obtenir_async(charger)
+        with self._verrou:
+            return instantane.tirer(nombre)
+
+    def ajouter(self, ligne: dict) -> None:
+        """Ajoute un cocktail créé (après validation de la transaction).
+
+        Parameters
+        ----------
+        ligne : dict
+            La ligne de la table cocktail (id_cocktail, nom, categorie, verre,
+            alcool, image)
+
+        """
+        self._modifier(lambda instantane: instantane.ajouter(ligne))
+
+    def retirer(self, id_cocktail: int) -> None:
+        """Retire un cocktail supprimé (après validation de la transaction)."""
+        self._modifier(lambda instantane: instantane.retirer(id_cocktail))
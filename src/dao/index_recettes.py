@@ -0,0 +1,675 @@
+"""Index des recettes du catalogue et moteur de faisabilité vectorisé.
+
+Le catalogue est représenté par une matrice creuse (cocktail, ingrédient) au
+format COO : une entrée par ingrédient de recette, avec la quantité requise
+en ml et en g (normalisée à l'insertion en base, voir UnitConverter.normaliser).
+Le stock d'un utilisateur devient un vecteur indexé par ingrédient ; une seule
+comparaison vectorisée donne alors, pour tous les cocktails à la fois, le nombre
+d'ingrédients manquants, et donc les cocktails réalisables (aucun manquant) et
+quasi-réalisables.
+
+L'index est partagé par tout le processus : il est construit au premier usage
+puis invalidé par les DAO à chaque modification du catalogue (et, par sécurité
+lorsque plusieurs processus servent l'API, au bout de RECIPE_INDEX_TTL secondes).
+"""
+
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from functools import cached_property
+
+import numpy as np
+
+from src.utils.conversion_unite import UnitConverter
+from src.utils.couverture import couverture_maximale, elements
+from src.utils.facettes import CatalogueFacettes
+from src.utils.mesure import analyser_mesure, unite_comparee
+from src.utils.settings import settings
+from src.utils.singleton import Singleton
+
+_SANS_UNITE = -1
+_UNITE_INCONNUE = -2
+_TOUTES = slice(None)
+
+
+class Mesures:
+    """Série de quantités décomposée en tableaux NumPy.
+
+    Attributes
+    ----------
+    brut : np.ndarray
+        Quantités telles que saisies
+    ml : np.ndarray
+        Quantités converties en ml (NaN si l'unité n'est pas liquide)
+    g : np.ndarray
+        Quantités converties en g (NaN si l'unité n'est pas solide)
+    unite : np.ndarray
+        Code de l'unité normalisée (-1 si aucune unité)
+
+    """
+
+    def __init__(self, taille: int) -> None:
+        """Initialise une série de mesures vides."""
+        self.brut = np.zeros(taille)
+        self.ml = np.full(taille, np.nan)
+        self.g = np.full(taille, np.nan)
+        self.unite = np.full(taille, _SANS_UNITE, dtype=np.int32)
+
+    def renseigner(
+        self,
+        position: int,
+        quantite: float,
+        unite: str | None,
+        code_unite: int,
+        normalisee: tuple[float | None, str | None] = (None, None),
+    ) -> None:
+        """Enregistre une mesure à la position donnée.
+
+        La quantité normalisée stockée en base (normalisee : colonnes
+        qte_normalisee et type_unite) est utilisée telle quelle ; la conversion
+        n'est faite ici que pour les lignes pas encore normalisées, ou pour
+        l'autre dimension des unités à la fois liquides et solides (oz, tsp...).
+        """
+        self.brut[position] = quantite
+        self.unite[position] = code_unite
+        qte_normalisee, type_unite = normalisee
+        if qte_normalisee is not None and type_unite == "liquide":
+            self.ml[position] = float(qte_normalisee)
+        elif UnitConverter.is_liquid_unit(unite):
+            self.ml[position] = UnitConverter.convert_to_ml(quantite, unite)
+        if qte_normalisee is not None and type_unite == "solide":
+            self.g[position] = float(qte_normalisee)
+        elif UnitConverter.is_solid_unit(unite):
+            self.g[position] = UnitConverter.convert_to_g(quantite, unite)
+
+    def effacer(self, position: int) -> None:
+        """Remet la mesure de la position donnée à vide."""
+        self.brut[position] = 0
+        self.ml[position] = np.nan
+        self.g[position] = np.nan
+        self.unite[position] = _SANS_UNITE
+
+    def copie(self) -> "Mesures":
+        """Retourne une copie indépendante des mesures."""
+        mesures = Mesures(0)
+        mesures.brut = self.brut.copy()
+        mesures.ml = self.ml.copy()
+        mesures.g = self.g.copy()
+        mesures.unite = self.unite.copy()
+        return mesures
+
+
+class StockVectorise:
+    """Stock d'un utilisateur sous forme de vecteurs indexés par ingrédient.
+
+    Attributes
+    ----------
+    present : np.ndarray
+        Masque des ingrédients du catalogue présents (quantité > 0) en stock
+    mesures : Mesures
+        Quantités en stock, colonne par colonne
+
+    """
+
+    def __init__(self, present: np.ndarray, mesures: Mesures) -> None:
+        """Initialise un stock vectorisé."""
+        self.present = present
+        self.mesures = mesures
+
+    def copie(self) -> "StockVectorise":
+        """Retourne une copie indépendante du stock."""
+        return StockVectorise(self.present.copy(), self.mesures.copie())
+
+
+class Faisabilite:
+    """Évaluation du catalogue pour le stock d'un utilisateur.
+
+    Une évaluation n'est jamais modifiée une fois construite : elle peut donc
+    être mise en cache et partagée entre requêtes.
+
+    Attributes
+    ----------
+    stock : StockVectorise
+        Le stock évalué
+    satisfaits : np.ndarray
+        Masque des entrées de la matrice couvertes par le stock
+    manquants : np.ndarray
+        Nombre d'ingrédients manquants de chaque cocktail
+
+    """
+
+    def __init__(
+        self,
+        stock: StockVectorise,
+        satisfaits: np.ndarray,
+        manquants: np.ndarray,
+    ) -> None:
+        """Initialise une évaluation."""
+        self.stock = stock
+        self.satisfaits = satisfaits
+        self.manquants = manquants
+
+
+class InstantaneIndex:
+    """Photographie du catalogue sous forme de matrice creuse.
+
+    Attributes
+    ----------
+    cocktails : list[dict]
+        Informations des cocktails, dans l'ordre du catalogue (une ligne de la
+        matrice par cocktail)
+    colonnes : dict[int, int]
+        Colonne de la matrice associée à chaque id_ingredient
+    nb_ingredients : np.ndarray
+        Nombre d'ingrédients de chaque recette
+
+    """
+
+    def __init__(self, lignes: list[dict]) -> None:
+        """Construit l'index à partir des lignes (cocktail, ingrédient).
+
+        Parameters
+        ----------
+        lignes : list[dict]
+            Lignes retournées par CocktailDAO.get_tous_cocktails_avec_ingredients
+
+        """
+        self.cocktails: list[dict] = []
+        self.colonnes: dict[int, int] = {}
+        self._codes_unites: dict[str, int] = {}
+        lignes_cocktail: dict[int, int] = {}
+        entrees = []
+
+        for ligne in lignes:
+            id_cocktail = ligne["id_cocktail"]
+            if id_cocktail not in lignes_cocktail:
+                lignes_cocktail[id_cocktail] = len(self.cocktails)
+                self.cocktails.append(
+                    {
+                        "id_cocktail": id_cocktail,
+                        "nom": ligne["nom"],
+                        "categorie": ligne["categorie"],
+                        "verre": ligne["verre"],
+                        "alcool": ligne["alcool"],
+                        "image": ligne["image"],
+                    },
+                )
+            if ligne["id_ingredient"]:
+                entrees.append((lignes_cocktail[id_cocktail], ligne))
+
+        nb_entrees = len(entrees)
+        self._ligne = np.empty(nb_entrees, dtype=np.int32)
+        self._colonne = np.empty(nb_entrees, dtype=np.int32)
+        self._requis = Mesures(nb_entrees)
+        self._noms_ingredients: list[str | None] = []
+        self._ingredients: list[dict] = []
+
+        for position, (ligne_cocktail, ligne) in enumerate(entrees):
+            colonne = self.colonnes.setdefault(
+                ligne["id_ingredient"],
+                len(self.colonnes),
+            )
+            if colonne == len(self._ingredients):
+                self._ingredients.append(
+                    {
+                        "id_ingredient": ligne["id_ingredient"],
+                        "nom": ligne.get("nom_ingredient"),
+                    },
+                )
+            self._ligne[position] = ligne_cocktail
+            self._colonne[position] = colonne
+            # L'unité peut contenir la quantité ("1 1/2 oz") : elle est lue
+            # dans le texte lorsque la colonne qte est vide
+            mesure = analyser_mesure(ligne["unite"])
+            self._requis.renseigner(
+                position,
+                float(ligne["qte"]) if ligne["qte"] else (mesure.quantite or 0),
+                mesure.unite,
+                self._code_unite(ligne["unite"], creer=True),
+                (ligne.get("qte_normalisee"), ligne.get("type_unite")),
+            )
+            self._noms_ingredients.append(ligne.get("nom_ingredient"))
+
+        self.nb_ingredients = np.bincount(self._ligne, minlength=len(self.cocktails))
+        # Entrées regroupées par colonne (vue CSC), pour les réévaluations
+        # limitées à quelques ingrédients
+        self._ordre_colonnes = np.argsort(self._colonne, kind="stable")
+        self._debut_colonnes = np.searchsorted(
+            self._colonne[self._ordre_colonnes],
+            np.arange(len(self.colonnes) + 1),
+        )
+
+    @cached_property
+    def facettes(self) -> CatalogueFacettes:
+        """Bitmaps des facettes et des ingrédients, construits au premier usage."""
+        return CatalogueFacettes(
+            self.cocktails,
+            zip(self._ligne.tolist(), self._noms_ingredients, strict=True),
+        )
+
+    def _code_unite(self, unite: str | None, *, creer: bool = False) -> int:
+        """Code entier de l'unité normalisée, pour les comparaisons vectorisées."""
+        unite_normalisee = unite_comparee(unite)
+        if not unite_normalisee:
+            return _SANS_UNITE
+        if creer:
+            return self._codes_unites.setdefault(
+                unite_normalisee,
+                len(self._codes_unites),
+            )
+        return self._codes_unites.get(unite_normalisee, _UNITE_INCONNUE)
+
+    def vectoriser_stock(self, stock_rows: list[dict]) -> StockVectorise:
+        """Construit le vecteur de stock d'un utilisateur.
+
+        Parameters
+        ----------
+        stock_rows : list[dict]
+            Lignes retournées par StockDAO.get_stock (id_ingredient, quantite,
+            code_unite)
+
+        Returns
+        -------
+        StockVectorise
+            Le stock indexé par colonne de la matrice ; les ingrédients absents
+            du catalogue sont ignorés
+
+        """
+        stock = StockVectorise(
+            np.zeros(len(self.colonnes), dtype=bool),
+            Mesures(len(self.colonnes)),
+        )
+        for row in stock_rows:
+            colonne = self.colonnes.get(row["id_ingredient"])
+            if colonne is not None:
+                self._renseigner_stock(stock, colonne, row)
+
+        return stock
+
+    def _renseigner_stock(
+        self,
+        stock: StockVectorise,
+        colonne: int,
+        row: dict | None,
+    ) -> None:
+        """Écrit une ligne de stock (None si l'ingrédient est absent) en colonne."""
+        stock.present[colonne] = bool(row and row["quantite"])
+        if not stock.present[colonne]:
+            stock.mesures.effacer(colonne)
+            return
+        stock.mesures.renseigner(
+            colonne,
+            float(row["quantite"]),
+            row["code_unite"],
+            self._code_unite(row["code_unite"]),
+            (row.get("qte_normalisee"), row.get("type_unite")),
+        )
+
+    def ingredients_satisfaits(
+        self,
+        stock: StockVectorise,
+        entrees: np.ndarray | slice = _TOUTES,
+    ) -> np.ndarray:
+        """Indique, pour chaque entrée de la matrice, si le stock la couvre.
+
+        Les règles sont celles de CocktailService.is_ingredient_available :
+        comparaison brute si l'une des unités manque ou si elles sont
+        identiques, en ml si les deux sont liquides, en g si les deux sont
+        solides, et ingrédient non couvert si les types sont incompatibles.
+
+        Parameters
+        ----------
+        stock : StockVectorise
+            Le stock de l'utilisateur
+        entrees : np.ndarray | slice
+            Entrées de la matrice à évaluer (toutes par défaut)
+
+        Returns
+        -------
+        np.ndarray
+            Masque booléen aligné sur les entrées évaluées
+
+        """
+        colonne = self._colonne[entrees]
+        requis_brut = self._requis.brut[entrees]
+        requis_ml = self._requis.ml[entrees]
+        requis_g = self._requis.g[entrees]
+        requis_unite = self._requis.unite[entrees]
+        brut = stock.mesures.brut[colonne]
+        ml = stock.mesures.ml[colonne]
+        g = stock.mesures.g[colonne]
+        unite = stock.mesures.unite[colonne]
+
+        comparaison_brute = (
+            (requis_unite == _SANS_UNITE)
+            | (unite == _SANS_UNITE)
+            | (requis_unite == unite)
+        )
+        deux_liquides = ~np.isnan(requis_ml) & ~np.isnan(ml)
+        # Les comparaisons avec NaN valent False : un type incompatible
+        # (liquide contre solide) ne couvre donc jamais la recette
+        suffisant = np.where(
+            comparaison_brute,
+            brut >= requis_brut,
+            np.where(deux_liquides, ml >= requis_ml, g >= requis_g),
+        )
+
+        return stock.present[colonne] & suffisant
+
+    def _entrees_des_colonnes(self, colonnes: Iterable[int]) -> np.ndarray:
+        """Retourne les entrées de la matrice portant sur des colonnes (vue CSC)."""
+        return np.concatenate(
+            [
+                self._ordre_colonnes[
+                    self._debut_colonnes[colonne] : self._debut_colonnes[colonne + 1]
+                ]
+                for colonne in colonnes
+            ]
+            or [np.empty(0, dtype=self._ordre_colonnes.dtype)],
+        )
+
+    def evaluer(self, stock_rows: list[dict]) -> Faisabilite:
+        """Évalue tout le catalogue pour un stock donné.
+
+        Seules les entrées des ingrédients en stock sont comparées (vue CSC) :
+        les autres ne peuvent pas être couvertes, et le coût dépend ainsi de
+        la taille du stock plutôt que de celle du catalogue.
+
+        Parameters
+        ----------
+        stock_rows : list[dict]
+            Lignes retournées par StockDAO.get_stock
+
+        Returns
+        -------
+        Faisabilite
+            Ingrédients couverts et nombre de manquants de chaque cocktail
+
+        """
+        stock = self.vectoriser_stock(stock_rows)
+        entrees = self._entrees_des_colonnes(np.flatnonzero(stock.present).tolist())
+        couvertes = entrees[self.ingredients_satisfaits(stock, entrees)]
+        satisfaits = np.zeros(len(self._ligne), dtype=bool)
+        satisfaits[couvertes] = True
+        manquants = self.nb_ingredients - np.bincount(
+            self._ligne[couvertes],
+            minlength=len(self.cocktails),
+        )
+        return Faisabilite(stock, satisfaits, manquants)
+
+    def reevaluer(
+        self,
+        faisabilite: Faisabilite,
+        stock_rows: list[dict],
+        ids_ingredients: set[int],
+    ) -> Faisabilite:
+        """Met à jour une évaluation après la modification de quelques ingrédients.
+
+        Seules les entrées de la matrice portant sur les ingrédients modifiés
+        sont réévaluées, et seuls les cocktails qui les utilisent voient leur
+        nombre de manquants changer. L'évaluation d'origine n'est pas modifiée.
+
+        Parameters
+        ----------
+        faisabilite : Faisabilite
+            Évaluation précédente, faite sur cet index
+        stock_rows : list[dict]
+            Lignes actuelles de StockDAO.get_stock
+        ids_ingredients : set[int]
+            Ingrédients dont le stock a changé depuis l'évaluation précédente
+
+        Returns
+        -------
+        Faisabilite
+            La nouvelle évaluation
+
+        """
+        colonnes = [
+            self.colonnes[id_ingredient]
+            for id_ingredient in ids_ingredients
+            if id_ingredient in self.colonnes
+        ]
+        if not colonnes:
+            return faisabilite
+
+        stock = faisabilite.stock.copie()
+        lignes = {row["id_ingredient"]: row for row in stock_rows}
+        for id_ingredient in ids_ingredients:
+            if id_ingredient in self.colonnes:
+                self._renseigner_stock(
+                    stock,
+                    self.colonnes[id_ingredient],
+                    lignes.get(id_ingredient),
+                )
+
+        entrees = self._entrees_des_colonnes(colonnes)
+        nouveaux = self.ingredients_satisfaits(stock, entrees)
+        ecarts = faisabilite.satisfaits[entrees].astype(np.int64) - nouveaux
+
+        satisfaits = faisabilite.satisfaits.copy()
+        satisfaits[entrees] = nouveaux
+        manquants = faisabilite.manquants.copy()
+        np.add.at(manquants, self._ligne[entrees], ecarts)
+
+        return Faisabilite(stock, satisfaits, manquants)
+
+    def cocktails_realisables(self, faisabilite: Faisabilite) -> list[dict]:
+        """Retourne les cocktails réalisables d'après une évaluation.
+
+        Parameters
+        ----------
+        faisabilite : Faisabilite
+            Évaluation du stock de l'utilisateur
+
+        Returns
+        -------
+        list[dict]
+            Informations des cocktails réalisables, dans l'ordre du catalogue
+
+        """
+        return [
+            dict(self.cocktails[ligne])
+            for ligne in np.flatnonzero(faisabilite.manquants == 0)
+        ]
+
+    def bitmap_faisables(
+        self,
+        faisabilite: Faisabilite,
+        max_ingredients_manquants: int = 0,
+    ) -> np.ndarray:
+        """Retourne le bitmap (voir facettes) des cocktails presque réalisables.
+
+        Parameters
+        ----------
+        faisabilite : Faisabilite
+            Évaluation du stock de l'utilisateur
+        max_ingredients_manquants : int
+            Nombre maximum d'ingrédients manquants (0 : réalisables)
+
+        Returns
+        -------
+        np.ndarray
+            Bitmap à combiner avec ceux de CatalogueFacettes.masque
+
+        """
+        return self.facettes.bitmap_catalogue(
+            np.flatnonzero(faisabilite.manquants <= max_ingredients_manquants),
+        )
+
+    def cocktails_quasi_realisables(
+        self,
+        faisabilite: Faisabilite,
+        max_ingredients_manquants: int,
+    ) -> dict:
+        """Retourne les cocktails auxquels il manque peu d'ingrédients.
+
+        Parameters
+        ----------
+        faisabilite : Faisabilite
+            Évaluation du stock de l'utilisateur
+        max_ingredients_manquants : int
+            Nombre maximum d'ingrédients manquants
+
+        Returns
+        -------
+        dict
+            Dictionnaire au format de CocktailService.build_cocktails_dict,
+            restreint aux cocktails ayant entre 1 et max_ingredients_manquants
+            ingrédients manquants
+
+        """
+        manquants = faisabilite.manquants
+        retenus = (manquants > 0) & (manquants <= max_ingredients_manquants)
+
+        cocktails_dict = {
+            self.cocktails[ligne]["id_cocktail"]: {
+                "info": dict(self.cocktails[ligne]),
+                "ingredients_manquants": [],
+                "total_ingredients": int(self.nb_ingredients[ligne]),
+            }
+            for ligne in np.flatnonzero(retenus)
+        }
+        for entree in np.flatnonzero(~faisabilite.satisfaits & retenus[self._ligne]):
+            id_cocktail = self.cocktails[self._ligne[entree]]["id_cocktail"]
+            cocktails_dict[id_cocktail]["ingredients_manquants"].append(
+                self._noms_ingredients[entree],
+            )
+
+        return cocktails_dict
+
+    def meilleurs_achats(
+        self,
+        faisabilite: Faisabilite,
+        nb_achats: int,
+    ) -> tuple[list[dict], list[dict]]:
+        """Choisit les ingrédients à acheter pour débloquer le plus de cocktails.
+
+        Seuls les cocktails auxquels il manque au plus nb_achats ingrédients
+        peuvent être débloqués : leurs ingrédients manquants sont codés en
+        bitsets, puis choisis par couverture maximale gloutonne.
+
+        Parameters
+        ----------
+        faisabilite : Faisabilite
+            Évaluation du stock de l'utilisateur
+        nb_achats : int
+            Nombre maximum d'ingrédients à acheter
+
+        Returns
+        -------
+        tuple[list[dict], list[dict]]
+            Les ingrédients à acheter (id_ingredient, nom), dans l'ordre du
+            choix, et les cocktails qu'ils rendent réalisables
+
+        """
+        manquants = faisabilite.manquants
+        retenus = (manquants > 0) & (manquants <= nb_achats)
+        entrees = np.flatnonzero(~faisabilite.satisfaits & retenus[self._ligne])
+        if not entrees.size:
+            return [], []
+
+        lignes, ligne_entree = np.unique(
+            self._ligne[entrees],
+            return_inverse=True,
+        )
+        colonnes, colonne_entree = np.unique(
+            self._colonne[entrees],
+            return_inverse=True,
+        )
+        ensembles = [0] * len(lignes)
+        for ligne, colonne in zip(
+            ligne_entree.tolist(),
+            colonne_entree.tolist(),
+            strict=True,
+        ):
+            ensembles[ligne] |= 1 << colonne
+
+        etapes, couverts = couverture_maximale(ensembles, nb_achats)
+
+        ingredients = [
+            dict(self._ingredients[colonnes[element]])
+            for complement in etapes
+            for element in elements(complement)
+        ]
+        cocktails = [
+            dict(self.cocktails[ligne])
+            for ligne, couvert in zip(lignes.tolist(), couverts, strict=True)
+            if couvert
+        ]
+        return ingredients, cocktails
+
+
+class IndexRecettes(metaclass=Singleton):
+    """Index des recettes partagé par tout le processus."""
+
+    def __init__(self) -> None:
+        """Initialise un index vide (construit au premier usage)."""
+        self._verrou = threading.Lock()
+        self._verrou_construction = threading.Lock()
+        self._instantane: InstantaneIndex | None = None
+        self._construit_le = 0.0
+        self._generation = 0
+
+    def obtenir(self, charger: Callable[[], list[dict]]) -> InstantaneIndex:
+        """Retourne l'index courant, en le construisant si nécessaire.
+
+        Parameters
+        ----------
+        charger : Callable[[], list[dict]]
+            Fonction chargeant les lignes du catalogue
+            (CocktailDAO.get_tous_cocktails_avec_ingredients)
+
+        Returns
+        -------
+        InstantaneIndex
+            L'index du catalogue
+
+        """
+        instantane = self._courant()
+        if instantane is not None:
+            return instantane
+
+        # Une seule construction à la fois : les autres threads attendent
+        # puis réutilisent l'index construit
+        with self._verrou_construction:
+            instantane = self._courant()
+            if instantane is not None:
+                return instantane
+            generation = self._generation
+            return self._publier(InstantaneIndex(charger()), generation)
+
+    async def obtenir_async(
+        self,
+        charger: Callable[[], Awaitable[list[dict]]],
+    ) -> InstantaneIndex:
+        """Version asynchrone de obtenir (chargement par un DAO asynchrone)."""
+        instantane = self._courant()
+        if instantane is not None:
+            return instantane
+
+        generation = self._generation
+        return self._publier(InstantaneIndex(await charger()), generation)
+
+    def invalider(self) -> None:
+        """Invalide l'index après une modification du catalogue."""
+        with self._verrou:
+            self._generation += 1
+            self._instantane = None
+
+    def _courant(self) -> InstantaneIndex | None:
+        """Retourne l'index s'il est construit et encore frais."""
+        with self._verrou:
+            if (
+                self._instantane is not None
+                and time.monotonic() - self._construit_le < settings.RECIPE_INDEX_TTL
+            ):
+                return self._instantane
+            return None
+
+    def _publier(self, instantane: InstantaneIndex, generation: int) -> InstantaneIndex:
+        """Mémorise un index construit, sauf si le catalogue a changé entre-temps."""
+        with self._verrou:
+            if generation == self._generation:
+                self._instantane = instantane
+                self._construit_le = time.monotonic()
+        return instantane
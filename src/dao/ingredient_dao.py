@@ -1,10 +1,36 @@
 """Classe DAO du business object Ingredient."""
 
+from src.dao.async_db_connection import AsyncDBConnection
 from src.dao.db_connection import DBConnection
+from src.dao.index_ingredients import IndexIngredients
 from src.utils.log_decorator import log
 from src.utils.singleton import Singleton
 from src.utils.text_utils import normalize_ingredient_name
 
+_SQL_TOUS_INGREDIENTS = """
+    SELECT id_ingredient, nom
+    FROM ingredient
+    ORDER BY nom
+"""
+
+_SQL_INGREDIENT_PAR_NOM = """
+    SELECT id_ingredient, nom
+    FROM ingredient
+    WHERE LOWER(nom) = LOWER(%(nom)s)
+"""
+
+_SQL_ALCOOL_PAR_ID = """
+    SELECT alcool
+    FROM ingredient
+    WHERE id_ingredient = %(ingredient_id)s
+"""
+
+_SQL_ALCOOL_PAR_NOM = """
+    SELECT alcool
+    FROM ingredient
+    WHERE LOWER(TRIM(nom)) = LOWER(TRIM(%(ingredient_name)s))
+"""
+
 
 class IngredientDAO(metaclass=Singleton):
     """DAO pour gérer les ingrédients."""
@@ -20,13 +46,9 @@ class IngredientDAO(metaclass=Singleton):
             Liste de tous les ingrédients.
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                SELECT id_ingredient, nom
-                FROM ingredient
-                ORDER BY nom
-                """,
+                _SQL_TOUS_INGREDIENTS,
             )
             return cursor.fetchall()
 
@@ -46,13 +68,9 @@ class IngredientDAO(metaclass=Singleton):
             L'ingrédient s'il existe, None sinon
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                SELECT id_ingredient, nom
-                FROM ingredient
-                WHERE LOWER(nom) = LOWER(%(nom)s)
-                """,
+                _SQL_INGREDIENT_PAR_NOM,
                 {"nom": nom},
             )
             return cursor.fetchone()
@@ -60,9 +78,13 @@ class IngredientDAO(metaclass=Singleton):
     @staticmethod
     @log
     def search_by_name(nom: str, limit: int = 10) -> list[dict]:
-        """Recherche des ingrédients dont le nom contient la chaîne donnée.
+        """Recherche des ingrédients dont le nom ressemble à la chaîne donnée.
         Utile pour l'auto-complétion et les suggestions.
 
+        Les ingrédients sont classés par similarité de trigrammes (celle de
+        pg_trgm, au-delà de 0.2) dans l'index en mémoire IndexIngredients :
+        aucune requête n'est faite tant que l'index est chaud.
+
         Parameters
         ----------
         nom : str
@@ -76,29 +98,18 @@ class IngredientDAO(metaclass=Singleton):
             Liste des ingrédients correspondants
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT id_ingredient, nom
-                FROM ingredient
-                WHERE SIMILARITY(nom, %(nom)s) > 0.2
-                ORDER BY SIMILARITY(nom, %(nom)s) DESC
-                LIMIT %(limit)s
-                """,
-                {"nom": nom, "limit": limit},
-            )
-            return cursor.fetchall()
+        return IndexIngredients().rechercher(
+            nom,
+            limit,
+            IngredientDAO.get_all_ingredients,
+        )
 
     @staticmethod
     def is_alcoholic(ingredient_id: int) -> bool:
         """Vérifie si un ingrédient contient de l'alcool."""
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                        SELECT alcool
-                        FROM ingredient
-                        WHERE id_ingredient = %(ingredient_id)s
-                        """,
+                _SQL_ALCOOL_PAR_ID,
                 {"ingredient_id": ingredient_id},
             )
             result = cursor.fetchone()
@@ -111,13 +122,9 @@ class IngredientDAO(metaclass=Singleton):
     @staticmethod
     def is_alcoholic_by_name(ingredient_name: str) -> bool:
         """Vérifie si un ingrédient contient de l'alcool en utilisant son nom."""
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
-                """
-                    SELECT alcool
-                    FROM ingredient
-                    WHERE LOWER(TRIM(nom)) = LOWER(TRIM(%(ingredient_name)s))
-                    """,
+                _SQL_ALCOOL_PAR_NOM,
                 {"ingredient_name": ingredient_name},
             )
             result = cursor.fetchone()
@@ -141,7 +148,7 @@ class IngredientDAO(metaclass=Singleton):
             Ingrédient trouvé ou None
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "SELECT id_ingredient, nom, alcool FROM ingredient "
                 "WHERE LOWER(nom) = LOWER(%s)",
@@ -172,14 +179,15 @@ class IngredientDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 "INSERT INTO ingredient (nom, alcool) VALUES (%s, %s) "
                 "RETURNING id_ingredient",
                 (nom, alcool),
             )
-            result = cursor.fetchone()
-            return result["id_ingredient"]
+            id_ingredient = cursor.fetchone()["id_ingredient"]
+        IndexIngredients().ajouter({"id_ingredient": id_ingredient, "nom": nom})
+        return id_ingredient
 
     @log
     def get_or_create_ingredient(self, nom: str, *, alcool: bool) -> int:
@@ -208,3 +216,75 @@ class IngredientDAO(metaclass=Singleton):
 
         # Créer l'ingrédient
         return self.create_ingredient(nom_normalise, alcool)
+
+
+class AsyncIngredientDAO(metaclass=Singleton):
+    """Versions asynchrones des méthodes de lecture de IngredientDAO."""
+
+    @staticmethod
+    @log
+    async def get_all_ingredients() -> list[dict]:
+        """Récupère tous les ingrédients.
+
+        Voir IngredientDAO.get_all_ingredients.
+        """
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(_SQL_TOUS_INGREDIENTS)
+            return await cursor.fetchall()
+
+    @staticmethod
+    @log
+    async def get_by_name(nom: str) -> dict | None:
+        """Cherche un ingrédient par son nom exact.
+
+        Voir IngredientDAO.get_by_name.
+        """
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(_SQL_INGREDIENT_PAR_NOM, {"nom": nom})
+            return await cursor.fetchone()
+
+    @staticmethod
+    @log
+    async def search_by_name(nom: str, limit: int = 10) -> list[dict]:
+        """Recherche des ingrédients dont le nom ressemble à la chaîne donnée.
+
+        Voir IngredientDAO.search_by_name.
+        """
+        return await IndexIngredients().rechercher_async(
+            nom,
+            limit,
+            AsyncIngredientDAO.get_all_ingredients,
+        )
+
+    @staticmethod
+    async def is_alcoholic(ingredient_id: int) -> bool | None:
+        """Vérifie si un ingrédient contient de l'alcool."""
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(_SQL_ALCOOL_PAR_ID, {"ingredient_id": ingredient_id})
+            result = await cursor.fetchone()
+
+        return None if result is None else result["alcool"]
+
+    @staticmethod
+    async def is_alcoholic_by_name(ingredient_name: str) -> bool | None:
+        """Vérifie si un ingrédient contient de l'alcool en utilisant son nom."""
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(
+                _SQL_ALCOOL_PAR_NOM,
+                {"ingredient_name": ingredient_name},
+            )
+            result = await cursor.fetchone()
+
+        return None if result is None else result["alcool"]
@@ -1,9 +1,144 @@
-"""Classe DAO agissant sur les instructions des cocktails."""
+"""Classe DAO agissant sur les instructions des cocktails.
 
+Chaque instruction porte un document de recherche plein texte (colonne
+document, index GIN) : le nom du cocktail (poids A), les noms de ses
+ingrédients (B) et le texte de l'instruction (C), analysés avec le
+dictionnaire de la langue de l'instruction (fonction SQL config_recherche).
+Il est calculé à l'ajout de l'instruction et recalculé quand les ingrédients
+du cocktail changent (voir indexer_instructions).
+"""
+
+from psycopg2.extras import RealDictCursor
+
+from src.dao.async_db_connection import AsyncDBConnection
 from src.dao.db_connection import DBConnection
 from src.utils.exceptions import DAOError, InstructionError
 from src.utils.log_decorator import log
 
+_SQL_INSTRUCTION = """
+    SELECT texte
+    FROM instruction
+    WHERE id_cocktail = %(id_cocktail)s
+    LIMIT 1;
+"""
+
+# Une instruction par cocktail (la première saisie), dans la langue demandée
+# ou, si elle vaut NULL, dans n'importe quelle langue
+_SQL_INSTRUCTIONS = """
+    SELECT DISTINCT ON (id_cocktail) id_cocktail, texte
+    FROM instruction
+    WHERE id_cocktail = ANY(%(ids_cocktails)s)
+    AND (%(langue)s::VARCHAR IS NULL OR langue = %(langue)s::VARCHAR)
+    ORDER BY id_cocktail, id_instruction;
+"""
+
+_SQL_INDEXER_INSTRUCTIONS = """
+    UPDATE instruction i
+    SET document =
+        SETWEIGHT(
+            TO_TSVECTOR(config_recherche(i.langue), COALESCE(c.nom, '')),
+            'A'
+        )
+        || SETWEIGHT(
+            TO_TSVECTOR(config_recherche(i.langue), COALESCE(ing.noms, '')),
+            'B'
+        )
+        || SETWEIGHT(
+            TO_TSVECTOR(config_recherche(i.langue), COALESCE(i.texte, '')),
+            'C'
+        )
+    FROM cocktail c
+    LEFT JOIN LATERAL (
+        SELECT STRING_AGG(g.nom, ' ') AS noms
+        FROM cocktail_ingredient ci
+        JOIN ingredient g ON g.id_ingredient = ci.id_ingredient
+        WHERE ci.id_cocktail = c.id_cocktail
+    ) ing ON TRUE
+    WHERE c.id_cocktail = i.id_cocktail
+    AND i.id_cocktail = ANY(%(ids_cocktails)s)
+"""
+
+_SQL_COCKTAILS_NON_INDEXES = """
+    SELECT DISTINCT id_cocktail
+    FROM instruction
+    WHERE document IS NULL
+    AND id_cocktail IS NOT NULL
+    ORDER BY id_cocktail
+"""
+
+# Recherche classée par pertinence (ts_rank_cd), paginée par la clé
+# (rang décroissant, id_cocktail) du dernier résultat de la page précédente.
+# La requête est analysée avec le dictionnaire de la langue demandée ; une
+# constante, ce qui permet l'usage de l'index GIN.
+_SQL_RECHERCHE_TEXTE = """
+    WITH resultats AS (
+        SELECT DISTINCT ON (i.id_cocktail)
+            i.id_cocktail,
+            i.texte,
+            TS_RANK_CD(
+                i.document,
+                WEBSEARCH_TO_TSQUERY(config_recherche(%(langue)s), %(texte)s)
+            ) AS rang
+        FROM instruction i
+        WHERE i.document @@ WEBSEARCH_TO_TSQUERY(
+            config_recherche(%(langue)s),
+            %(texte)s
+        )
+        AND LOWER(i.langue) = LOWER(%(langue)s)
+        ORDER BY i.id_cocktail, rang DESC
+    )
+    SELECT
+        c.id_cocktail,
+        c.nom,
+        c.categorie,
+        c.verre,
+        c.alcool,
+        c.image,
+        r.texte AS instructions,
+        r.rang
+    FROM resultats r
+    JOIN cocktail c ON c.id_cocktail = r.id_cocktail
+    WHERE %(apres_rang)s::REAL IS NULL
+    OR r.rang < %(apres_rang)s::REAL
+    OR (r.rang = %(apres_rang)s::REAL AND r.id_cocktail > %(apres_id)s::INTEGER)
+    ORDER BY r.rang DESC, r.id_cocktail
+    LIMIT %(limite)s
+"""
+
+
+def _parametres_recherche(
+    texte: str,
+    langue: str,
+    limite: int,
+    apres: tuple[float, int] | None,
+) -> dict:
+    """Construit les paramètres de _SQL_RECHERCHE_TEXTE."""
+    apres_rang, apres_id = apres or (None, None)
+    return {
+        "texte": texte,
+        "langue": langue,
+        "limite": limite,
+        "apres_rang": apres_rang,
+        "apres_id": apres_id,
+    }
+
+
+def indexer_instructions(cursor: RealDictCursor, ids_cocktails: list[int]) -> None:
+    """Recalcule les documents de recherche des instructions de cocktails.
+
+    A appeler dans la transaction qui modifie le cocktail, ses ingrédients
+    ou ses instructions.
+
+    Parameters
+    ----------
+    cursor : RealDictCursor
+        Curseur de la transaction en cours
+    ids_cocktails : list[int]
+        Les cocktails dont les instructions sont à réindexer
+
+    """
+    cursor.execute(_SQL_INDEXER_INSTRUCTIONS, {"ids_cocktails": list(ids_cocktails)})
+
 
 class InstructionDAO:
     """DAO pour accéder aux instructions de cocktails."""
@@ -25,16 +160,11 @@ class InstructionDAO:
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                SELECT texte
-                FROM instruction
-                WHERE id_cocktail = %(id_cocktail)s
-                LIMIT 1;
-            """,
-                    {"id_cocktail": id_cocktail},
-                )
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(_SQL_INSTRUCTION, {"id_cocktail": id_cocktail})
                 row = cursor.fetchone()
 
         except Exception as e:
@@ -46,6 +176,46 @@ class InstructionDAO:
 
         return None
 
+    @staticmethod
+    def get_instructions(
+        ids_cocktails: list[int],
+        langue: str | None = None,
+    ) -> dict[int, str | None]:
+        """Récupération en une requête des instructions de plusieurs cocktails.
+
+        Parameters
+        ----------
+        ids_cocktails : list[int]
+            Identifiants des cocktails dont on veut récupérer l'instruction.
+        langue : str | None, optional
+            Langue des instructions (par défaut : n'importe laquelle).
+
+        Returns
+        -------
+        dict[int, str | None]
+            Le texte de l'instruction de chaque cocktail qui en a une.
+
+        """
+        if not ids_cocktails:
+            return {}
+        try:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(
+                    _SQL_INSTRUCTIONS,
+                    {"ids_cocktails": list(ids_cocktails), "langue": langue},
+                )
+                rows = cursor.fetchall()
+
+        except Exception as e:
+            raise InstructionError(
+                message=f"Erreur lors de la récupération des instructions : {e}",
+            ) from e
+
+        return {row["id_cocktail"]: row["texte"] for row in rows}
+
     @staticmethod
     @log
     def ajouter_instruction(
@@ -76,7 +246,10 @@ class InstructionDAO:
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
                     """
                     INSERT INTO instruction (id_cocktail, langue, texte)
@@ -84,6 +257,7 @@ class InstructionDAO:
                     """,
                     (id_cocktail, langue, texte),
                 )
+                indexer_instructions(cursor, [id_cocktail])
 
         except Exception as e:
             raise DAOError(
@@ -91,3 +265,163 @@ class InstructionDAO:
             ) from e
 
         return True
+
+    @staticmethod
+    @log
+    def rechercher(
+        texte: str,
+        langue: str = "en",
+        limite: int = 20,
+        apres: tuple[float, int] | None = None,
+    ) -> list[dict]:
+        """Recherche plein texte dans les noms, ingrédients et instructions.
+
+        Parameters
+        ----------
+        texte : str
+            Les termes recherchés (syntaxe de websearch_to_tsquery : "mots
+            exacts", or, -exclu)
+        langue : str
+            Langue des instructions et du dictionnaire de recherche
+        limite : int
+            Nombre maximum de résultats
+        apres : tuple[float, int] | None
+            Clé (rang, id_cocktail) du dernier résultat de la page précédente
+
+        Returns
+        -------
+        list[dict]
+            Les cocktails (id_cocktail, nom, categorie, verre, alcool, image,
+            instructions, rang), du plus pertinent au moins pertinent
+
+        Raises
+        ------
+        DAOError
+            En cas d'erreur de base de données
+
+        """
+        try:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(
+                    _SQL_RECHERCHE_TEXTE,
+                    _parametres_recherche(texte, langue, limite, apres),
+                )
+                return cursor.fetchall()
+
+        except Exception as e:
+            raise DAOError(
+                message=f"Erreur lors de la recherche plein texte : {e}",
+            ) from e
+
+    @staticmethod
+    @log
+    def indexer_instructions_manquantes(taille_lot: int = 500) -> int:
+        """Indexe les instructions qui n'ont pas encore de document de recherche.
+
+        Parameters
+        ----------
+        taille_lot : int
+            Nombre de cocktails réindexés par transaction
+
+        Returns
+        -------
+        int
+            Nombre de cocktails réindexés
+
+        """
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
+            cursor.execute(_SQL_COCKTAILS_NON_INDEXES)
+            ids_cocktails = [row["id_cocktail"] for row in cursor.fetchall()]
+
+        for debut in range(0, len(ids_cocktails), taille_lot):
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                indexer_instructions(cursor, ids_cocktails[debut : debut + taille_lot])
+        return len(ids_cocktails)
+
+
+class AsyncInstructionDAO:
+    """Versions asynchrones des méthodes de lecture de InstructionDAO."""
+
+    @staticmethod
+    async def get_instruction(id_cocktail: int) -> str | None:
+        """Récupération du texte d'instruction pour un cocktail.
+
+        Voir InstructionDAO.get_instruction.
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(_SQL_INSTRUCTION, {"id_cocktail": id_cocktail})
+                row = await cursor.fetchone()
+
+        except Exception as e:
+            raise InstructionError(
+                message=f"Erreur lors de la récupération de l'instruction : {e}",
+            ) from e
+
+        return row["texte"] if row else None
+
+    @staticmethod
+    async def get_instructions(
+        ids_cocktails: list[int],
+        langue: str | None = None,
+    ) -> dict[int, str | None]:
+        """Récupération en une requête des instructions de plusieurs cocktails.
+
+        Voir InstructionDAO.get_instructions.
+        """
+        if not ids_cocktails:
+            return {}
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(
+                    _SQL_INSTRUCTIONS,
+                    {"ids_cocktails": list(ids_cocktails), "langue": langue},
+                )
+                rows = await cursor.fetchall()
+
+        except Exception as e:
+            raise InstructionError(
+                message=f"Erreur lors de la récupération des instructions : {e}",
+            ) from e
+
+        return {row["id_cocktail"]: row["texte"] for row in rows}
+
+    @staticmethod
+    @log
+    async def rechercher(
+        texte: str,
+        langue: str = "en",
+        limite: int = 20,
+        apres: tuple[float, int] | None = None,
+    ) -> list[dict]:
+        """Recherche plein texte dans les noms, ingrédients et instructions.
+
+        Voir InstructionDAO.rechercher.
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(
+                    _SQL_RECHERCHE_TEXTE,
+                    _parametres_recherche(texte, langue, limite, apres),
+                )
+                return await cursor.fetchall()
+
+        except Exception as e:
+            raise DAOError(
+                message=f"Erreur lors de la recherche plein texte : {e}",
+            ) from e
@@ -1,11 +1,42 @@
 """Class dao manipulant les listes de courses."""
 
+from psycopg2.extras import RealDictCursor
+
 from src.dao.db_connection import DBConnection
-from src.utils.conversion_unite import UnitConverter
+from src.dao.unite_dao import UniteDAO
 from src.utils.log_decorator import log
 from src.utils.singleton import Singleton
 
 
+def _fusionner(
+    cursor: RealDictCursor,
+    existant: tuple[float, int | None],
+    quantite: float,
+    id_unite: int | None,
+) -> tuple[float, int | None]:
+    """Retourne la quantité et l'unité d'un item après un nouvel ajout.
+
+    - Même unité : les quantités sont additionnées
+    - Deux unités liquides différentes : la somme est convertie dans l'unité
+      existante
+    - Sinon : la nouvelle quantité et la nouvelle unité remplacent l'existant
+    """
+    quantite_existante, id_unite_existante = existant
+    table = UniteDAO().get_table_conversion((id_unite_existante, id_unite), cursor)
+    if table.meme_unite(id_unite_existante, id_unite):
+        return quantite_existante + quantite, id_unite_existante
+
+    type_existant, facteur_existant = table.get(id_unite_existante)
+    if type_existant == "liquide" and table.types.get(id_unite) == "liquide":
+        total_ml = table.convert_many(
+            [quantite_existante, quantite],
+            [id_unite_existante, id_unite],
+        ).sum()
+        return float(total_ml) / facteur_existant, id_unite_existante
+
+    return quantite, id_unite
+
+
 class ListeCourseDAO(metaclass=Singleton):
     """DAO pour gérer la liste de course des utilisateurs."""
 
@@ -25,7 +56,7 @@ class ListeCourseDAO(metaclass=Singleton):
             Liste des items de la liste de course
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT
@@ -91,17 +122,14 @@ class ListeCourseDAO(metaclass=Singleton):
             En cas d'erreur de base de données
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             # Vérifier si l'ingrédient existe déjà dans la liste
             cursor.execute(
                 """
-                SELECT lc.quantite, lc.id_unite, u.type_unite as type_unite,
-                u.abbreviation
-                as code_unite
-                FROM liste_course lc
-                LEFT JOIN unite u ON lc.id_unite = u.id_unite
-                WHERE lc.id_utilisateur = %(id_utilisateur)s
-                AND lc.id_ingredient = %(id_ingredient)s
+                SELECT quantite, id_unite
+                FROM liste_course
+                WHERE id_utilisateur = %(id_utilisateur)s
+                AND id_ingredient = %(id_ingredient)s
                 """,
                 {
                     "id_utilisateur": id_utilisateur,
@@ -112,121 +140,28 @@ class ListeCourseDAO(metaclass=Singleton):
 
             if existing:
                 # L'ingrédient existe déjà
-                quantite_existante = float(existing["quantite"])
-                type_unite_existante = existing["type_unite"]
-                code_unite_existante = existing["code_unite"]
-
-                # Récupérer les infos de la nouvelle unité
-                cursor.execute(
-                    "SELECT abbreviation, type_unite FROM unite WHERE id_unite"
-                    "= %(id_unite)s",
-                    {"id_unite": id_unite},
+                nouvelle_quantite, nouvelle_unite = _fusionner(
+                    cursor,
+                    (float(existing["quantite"]), existing["id_unite"]),
+                    quantite,
+                    id_unite,
                 )
-                new_unite_info = cursor.fetchone()
-                code_unite_nouvelle = (
-                    new_unite_info["abbreviation"] if new_unite_info else None
+                cursor.execute(
+                    """
+                    UPDATE liste_course
+                    SET quantite = %(quantite)s,
+                        id_unite = %(id_unite)s,
+                        effectue = FALSE
+                    WHERE id_utilisateur = %(id_utilisateur)s
+                    AND id_ingredient = %(id_ingredient)s
+                    """,
+                    {
+                        "quantite": nouvelle_quantite,
+                        "id_unite": nouvelle_unite,
+                        "id_utilisateur": id_utilisateur,
+                        "id_ingredient": id_ingredient,
+                    },
                 )
-
-                code_existante_norm = UnitConverter.normalize_unit(code_unite_existante)
-                code_nouvelle_norm = UnitConverter.normalize_unit(code_unite_nouvelle)
-
-                if code_existante_norm == code_nouvelle_norm:
-                    # Même unité : additionner directement
-                    nouvelle_quantite = quantite_existante + quantite
-
-                    cursor.execute(
-                        """
-                        UPDATE liste_course
-                        SET quantite = %(nouvelle_quantite)s,
-                            effectue = FALSE
-                        WHERE id_utilisateur = %(id_utilisateur)s
-                        AND id_ingredient = %(id_ingredient)s
-                        """,
-                        {
-                            "nouvelle_quantite": nouvelle_quantite,
-                            "id_utilisateur": id_utilisateur,
-                            "id_ingredient": id_ingredient,
-                        },
-                    )
-                elif (
-                    type_unite_existante
-                    and new_unite_info
-                    and type_unite_existante == new_unite_info["type_unite"]
-                    and type_unite_existante == "liquide"
-                ):
-                    # Unités différentes mais même type (liquide) : convertir et
-                    # additionner
-                    code_unite_nouvelle = new_unite_info["abbreviation"]
-
-                    # Convertir tout en ml
-                    ml_existant = UnitConverter.convert_to_ml(
-                        quantite_existante,
-                        code_unite_existante,
-                    )
-                    ml_nouveau = UnitConverter.convert_to_ml(
-                        quantite,
-                        code_unite_nouvelle,
-                    )
-
-                    if ml_existant and ml_nouveau:
-                        # Additionner en ml et reconvertir vers l'unité existante
-                        total_ml = ml_existant + ml_nouveau
-                        facteur = UnitConverter.LIQUID_TO_ML.get(
-                            code_unite_existante.lower(),
-                            1,
-                        )
-                        nouvelle_quantite = total_ml / facteur
-
-                        cursor.execute(
-                            """
-                            UPDATE liste_course
-                            SET quantite = %(nouvelle_quantite)s,
-                                effectue = FALSE
-                            WHERE id_utilisateur = %(id_utilisateur)s
-                            AND id_ingredient = %(id_ingredient)s
-                            """,
-                            {
-                                "nouvelle_quantite": nouvelle_quantite,
-                                "id_utilisateur": id_utilisateur,
-                                "id_ingredient": id_ingredient,
-                            },
-                        )
-                    else:
-                        # Conversion impossible : remplacer
-                        cursor.execute(
-                            """
-                            UPDATE liste_course
-                            SET quantite = %(quantite)s,
-                                id_unite = %(id_unite)s,
-                                effectue = FALSE
-                            WHERE id_utilisateur = %(id_utilisateur)s
-                            AND id_ingredient = %(id_ingredient)s
-                            """,
-                            {
-                                "quantite": quantite,
-                                "id_unite": id_unite,
-                                "id_utilisateur": id_utilisateur,
-                                "id_ingredient": id_ingredient,
-                            },
-                        )
-                else:
-                    # Types différents ou non convertibles : remplacer
-                    cursor.execute(
-                        """
-                        UPDATE liste_course
-                        SET quantite = %(quantite)s,
-                            id_unite = %(id_unite)s,
-                            effectue = FALSE
-                        WHERE id_utilisateur = %(id_utilisateur)s
-                        AND id_ingredient = %(id_ingredient)s
-                        """,
-                        {
-                            "quantite": quantite,
-                            "id_unite": id_unite,
-                            "id_utilisateur": id_utilisateur,
-                            "id_ingredient": id_ingredient,
-                        },
-                    )
             else:
                 # L'ingrédient n'existe pas : créer
                 cursor.execute(
@@ -289,7 +224,7 @@ class ListeCourseDAO(metaclass=Singleton):
             L'item s'il existe, None sinon
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT lc.quantite, lc.id_unite, u.type_unite as type_unite,
@@ -327,7 +262,7 @@ class ListeCourseDAO(metaclass=Singleton):
             True si la suppression a réussi
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 DELETE FROM liste_course
@@ -357,7 +292,7 @@ class ListeCourseDAO(metaclass=Singleton):
             Nombre d'items supprimés
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 DELETE FROM liste_course
@@ -388,7 +323,7 @@ class ListeCourseDAO(metaclass=Singleton):
             Le nouveau statut (True si effectué, False sinon)
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 UPDATE liste_course
@@ -0,0 +1,265 @@
+"""Class dao du résumé hors ligne des cocktails réalisables par utilisateur."""
+
+from collections.abc import Iterator
+
+from psycopg2 import Error as DBError
+from psycopg2.extras import execute_values
+
+from src.dao.db_connection import DBConnection
+from src.utils.exceptions import DAOError
+from src.utils.log_decorator import log
+from src.utils.singleton import Singleton
+
+# Un utilisateur sans stock disponible a une ligne sans ingrédient, pour que
+# son résumé soit lui aussi calculé
+_SQL_STOCKS_PAR_UTILISATEUR = """
+    SELECT
+        u.id_utilisateur,
+        s.id_ingredient,
+        s.quantite,
+        un.abbreviation as code_unite,
+        s.qte_normalisee,
+        s.type_unite
+    FROM utilisateur u
+    LEFT JOIN stock s
+        ON s.id_utilisateur = u.id_utilisateur AND s.quantite > 0
+    LEFT JOIN unite un ON s.id_unite = un.id_unite
+    WHERE %(apres)s::int IS NULL OR u.id_utilisateur > %(apres)s
+    ORDER BY u.id_utilisateur
+"""
+
+_SQL_ENREGISTRER_RESUME = """
+    INSERT INTO cocktails_realisables_utilisateur AS r
+        (id_utilisateur, ids_cocktails, nb_cocktails, nb_nouveaux)
+    VALUES %s
+    ON CONFLICT (id_utilisateur) DO UPDATE SET
+        ids_cocktails = EXCLUDED.ids_cocktails,
+        nb_cocktails = EXCLUDED.nb_cocktails,
+        nb_nouveaux = CARDINALITY(ARRAY(
+            SELECT UNNEST(EXCLUDED.ids_cocktails)
+            EXCEPT
+            SELECT UNNEST(r.ids_cocktails)
+        )),
+        date_calcul = NOW()
+"""
+
+_SQL_ENREGISTRER_REPRISE = """
+    INSERT INTO reprise_tache (nom_tache, dernier_id_utilisateur)
+    VALUES (%(nom_tache)s, %(dernier_id_utilisateur)s)
+    ON CONFLICT (nom_tache) DO UPDATE SET
+        dernier_id_utilisateur = EXCLUDED.dernier_id_utilisateur,
+        date_maj = NOW()
+"""
+
+
+class RealisablesDAO(metaclass=Singleton):
+    """Lecture des stocks de tous les utilisateurs et écriture de leur résumé."""
+
+    @staticmethod
+    def iterer_stocks(
+        apres: int | None = None,
+        taille_lot: int = 2000,
+    ) -> Iterator[dict]:
+        """Parcourt les lignes de stock disponibles, triées par utilisateur.
+
+        Les lignes sont lues par un curseur côté serveur, par paquets de
+        taille_lot : le stock de tous les utilisateurs n'est jamais chargé en
+        entier en mémoire. Le curseur survit aux validations de transaction
+        faites sur la même connexion pendant le parcours.
+
+        Parameters
+        ----------
+        apres : int | None
+            Seuls les utilisateurs d'id strictement supérieur sont parcourus
+            (None pour tous)
+        taille_lot : int
+            Nombre de lignes lues à chaque aller-retour avec la base
+
+        Yields
+        ------
+        dict
+            id_utilisateur, puis les colonnes de StockDAO.get_stock utilisées
+            par InstantaneIndex (id_ingredient à None si l'utilisateur n'a pas
+            de stock disponible)
+
+        Raises
+        ------
+        DAOError
+            En cas d'erreur de base de données
+
+        """
+        try:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor(
+                    name="stocks_par_utilisateur",
+                    withhold=True,
+                ) as cursor,
+            ):
+                cursor.itersize = taille_lot
+                cursor.execute(_SQL_STOCKS_PAR_UTILISATEUR, {"apres": apres})
+                for row in cursor:
+                    yield dict(row)
+
+        except DBError as e:
+            raise DAOError(message=None) from e
+
+    @staticmethod
+    @log
+    def get_reprise(nom_tache: str) -> int | None:
+        """Récupère le dernier utilisateur traité par une tâche interrompue.
+
+        Parameters
+        ----------
+        nom_tache : str
+            Nom de la tâche
+
+        Returns
+        -------
+        int | None
+            L'id du dernier utilisateur dont le résumé est enregistré, None si
+            la tâche n'a pas de point de reprise
+
+        Raises
+        ------
+        DAOError
+            En cas d'erreur de base de données
+
+        """
+        try:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(
+                    "SELECT dernier_id_utilisateur FROM reprise_tache "
+                    "WHERE nom_tache = %(nom_tache)s",
+                    {"nom_tache": nom_tache},
+                )
+                row = cursor.fetchone()
+                return row["dernier_id_utilisateur"] if row else None
+
+        except DBError as e:
+            raise DAOError(message=None) from e
+
+    @staticmethod
+    def enregistrer_resumes(
+        resumes: list[tuple[int, list[int]]],
+        nom_tache: str,
+    ) -> None:
+        """Enregistre les résumés d'un lot d'utilisateurs et le point de reprise.
+
+        Les résumés et le point de reprise (le plus grand id du lot) sont
+        écrits dans la même transaction : après une interruption, la reprise
+        ne saute ni ne recalcule aucun utilisateur déjà enregistré.
+
+        Parameters
+        ----------
+        resumes : list[tuple[int, list[int]]]
+            Pour chaque utilisateur, son id et les id des cocktails réalisables
+        nom_tache : str
+            Nom de la tâche dont le point de reprise est mis à jour
+
+        Raises
+        ------
+        DAOError
+            En cas d'erreur de base de données
+
+        """
+        if not resumes:
+            return
+        try:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                execute_values(
+                    cursor,
+                    _SQL_ENREGISTRER_RESUME,
+                    [
+                        (id_utilisateur, ids, len(ids), len(ids))
+                        for id_utilisateur, ids in resumes
+                    ],
+                    template="(%s, %s::int[], %s, %s)",
+                )
+                cursor.execute(
+                    _SQL_ENREGISTRER_REPRISE,
+                    {
+                        "nom_tache": nom_tache,
+                        "dernier_id_utilisateur": max(
+                            id_utilisateur for id_utilisateur, _ in resumes
+                        ),
+                    },
+                )
+
+        except DBError as e:
+            raise DAOError(message=None) from e
+
+    @staticmethod
+    @log
+    def supprimer_reprise(nom_tache: str) -> None:
+        """Supprime le point de reprise d'une tâche terminée.
+
+        Parameters
+        ----------
+        nom_tache : str
+            Nom de la tâche
+
+        Raises
+        ------
+        DAOError
+            En cas d'erreur de base de données
+
+        """
+        try:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(
+                    "DELETE FROM reprise_tache WHERE nom_tache = %(nom_tache)s",
+                    {"nom_tache": nom_tache},
+                )
+
+        except DBError as e:
+            raise DAOError(message=None) from e
+
+    @staticmethod
+    @log
+    def get_resume(id_utilisateur: int) -> dict | None:
+        """Récupère le dernier résumé calculé pour un utilisateur.
+
+        Parameters
+        ----------
+        id_utilisateur : int
+            ID de l'utilisateur
+
+        Returns
+        -------
+        dict | None
+            ids_cocktails, nb_cocktails, nb_nouveaux et date_calcul, None si
+            aucun résumé n'a été calculé
+
+        Raises
+        ------
+        DAOError
+            En cas d'erreur de base de données
+
+        """
+        try:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(
+                    """
+                    SELECT ids_cocktails, nb_cocktails, nb_nouveaux, date_calcul
+                    FROM cocktails_realisables_utilisateur
+                    WHERE id_utilisateur = %(id_utilisateur)s
+                    """,
+                    {"id_utilisateur": id_utilisateur},
+                )
+                return cursor.fetchone()
+
+        except DBError as e:
+            raise DAOError(message=None) from e
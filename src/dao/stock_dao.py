@@ -1,10 +1,40 @@
 """Class dao manipulant les stocks."""
 
+from src.dao.async_db_connection import AsyncDBConnection
+from src.dao.cache_realisables import CacheRealisables
 from src.dao.db_connection import DBConnection
+from src.dao.unite_dao import UniteDAO
+from src.utils.conversion_unite import UnitConverter
 from src.utils.exceptions import DAOError, IngredientNotFoundError, InvalidQuantityError
 from src.utils.log_decorator import log, logging
 from src.utils.singleton import Singleton
 
+_SQL_STOCK = """
+    SELECT
+        s.id_ingredient,
+        i.nom as nom_ingredient,
+        s.quantite,
+        s.id_unite,
+        u.abbreviation as code_unite,
+        u.nom as nom_unite_complet,
+        s.qte_normalisee,
+        s.type_unite
+    FROM stock s
+    JOIN ingredient i ON s.id_ingredient = i.id_ingredient
+    LEFT JOIN unite u ON s.id_unite = u.id_unite
+    WHERE s.id_utilisateur = %(id_utilisateur)s
+"""
+
+
+def _requete_stock(*, only_available: bool) -> str:
+    """Construit la requête de lecture du stock d'un utilisateur."""
+    query = _SQL_STOCK
+
+    if only_available:
+        query += " AND s.quantite > 0"
+
+    return query + " ORDER BY i.nom"
+
 
 class StockDAO(metaclass=Singleton):
     """Classe contenant les méthodes agissants sur le stock d'un utilisateur."""
@@ -40,25 +70,43 @@ class StockDAO(metaclass=Singleton):
             True si l'opération a réussi
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        table = UniteDAO().get_table_conversion((id_unite,))
+        type_unite, facteur = table.get(id_unite)
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
-                INSERT INTO stock (id_utilisateur, id_ingredient, quantite, id_unite)
+                INSERT INTO stock (id_utilisateur, id_ingredient, quantite, id_unite,
+                                   qte_normalisee, type_unite)
                 VALUES (%(id_utilisateur)s, %(id_ingredient)s, %(quantite)s,
-                        %(id_unite)s)
+                        %(id_unite)s, %(qte_normalisee)s, %(type_unite)s)
                 ON CONFLICT (id_utilisateur, id_ingredient)
                 DO UPDATE SET
                     quantite = stock.quantite + EXCLUDED.quantite,
-                    id_unite = EXCLUDED.id_unite
+                    id_unite = EXCLUDED.id_unite,
+                    qte_normalisee = COALESCE(
+                        ROUND(
+                            (stock.quantite + EXCLUDED.quantite)
+                            * %(facteur)s::numeric,
+                            2
+                        ),
+                        stock.quantite + EXCLUDED.quantite
+                    ),
+                    type_unite = EXCLUDED.type_unite
                 """,
                 {
                     "id_utilisateur": id_utilisateur,
                     "id_ingredient": id_ingredient,
                     "quantite": quantite,
                     "id_unite": id_unite,
+                    "qte_normalisee": table.normaliser(quantite, id_unite)[0],
+                    "type_unite": type_unite,
+                    "facteur": facteur,
                 },
             )
-            return cursor.rowcount > 0
+            modifie = cursor.rowcount > 0
+
+        CacheRealisables().signaler_modification(id_utilisateur, id_ingredient)
+        return modifie
 
     @staticmethod
     @log
@@ -78,27 +126,11 @@ class StockDAO(metaclass=Singleton):
             Liste des items du stock (dictionnaires bruts)
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
-            query = """
-                SELECT
-                    s.id_ingredient,
-                    i.nom as nom_ingredient,
-                    s.quantite,
-                    s.id_unite,
-                    u.abbreviation as code_unite,
-                    u.nom as nom_unite_complet
-                FROM stock s
-                JOIN ingredient i ON s.id_ingredient = i.id_ingredient
-                LEFT JOIN unite u ON s.id_unite = u.id_unite
-                WHERE s.id_utilisateur = %(id_utilisateur)s
-            """
-
-            if only_available:
-                query += " AND s.quantite > 0"
-
-            query += " ORDER BY i.nom"
-
-            cursor.execute(query, {"id_utilisateur": id_utilisateur})
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                _requete_stock(only_available=only_available),
+                {"id_utilisateur": id_utilisateur},
+            )
 
             return cursor.fetchall()
 
@@ -123,7 +155,7 @@ class StockDAO(metaclass=Singleton):
             L'item s'il existe (dictionnaire brut), None sinon
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT
@@ -178,10 +210,10 @@ class StockDAO(metaclass=Singleton):
             Si la quantité à retirer est supérieure à la quantité disponible.
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
-                SELECT quantite
+                SELECT quantite, id_unite
                 FROM stock
                 WHERE id_utilisateur = %(id_utilisateur)s
                 AND id_ingredient = %(id_ingredient)s
@@ -221,29 +253,35 @@ class StockDAO(metaclass=Singleton):
                         "id_ingredient": id_ingredient,
                     },
                 )
-                return {
+                resultat = {
                     "nouvelle_quantite": 0.0,
                     "supprime": True,
                 }
-
-            cursor.execute(
-                """
-                UPDATE stock
-                SET quantite = %(nouvelle_quantite)s
-                WHERE id_utilisateur = %(id_utilisateur)s
-                AND id_ingredient = %(id_ingredient)s
-                """,
-                {
-                    "id_utilisateur": id_utilisateur,
-                    "id_ingredient": id_ingredient,
+            else:
+                cursor.execute(
+                    """
+                    UPDATE stock
+                    SET quantite = %(nouvelle_quantite)s,
+                        qte_normalisee = %(qte_normalisee)s
+                    WHERE id_utilisateur = %(id_utilisateur)s
+                    AND id_ingredient = %(id_ingredient)s
+                    """,
+                    {
+                        "id_utilisateur": id_utilisateur,
+                        "id_ingredient": id_ingredient,
+                        "nouvelle_quantite": nouvelle_quantite,
+                        "qte_normalisee": UniteDAO()
+                        .get_table_conversion((row["id_unite"],), cursor)
+                        .normaliser(nouvelle_quantite, row["id_unite"])[0],
+                    },
+                )
+                resultat = {
                     "nouvelle_quantite": nouvelle_quantite,
-                },
-            )
+                    "supprime": False,
+                }
 
-            return {
-                "nouvelle_quantite": nouvelle_quantite,
-                "supprime": False,
-            }
+        CacheRealisables().signaler_modification(id_utilisateur, id_ingredient)
+        return resultat
 
     @staticmethod
     @log
@@ -263,7 +301,7 @@ class StockDAO(metaclass=Singleton):
             True si la suppression a réussi
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 DELETE FROM stock
@@ -275,7 +313,11 @@ class StockDAO(metaclass=Singleton):
                     "id_ingredient": id_ingredient,
                 },
             )
-            return cursor.rowcount > 0
+            supprime = cursor.rowcount > 0
+
+        if supprime:
+            CacheRealisables().signaler_modification(id_utilisateur, id_ingredient)
+        return supprime
 
     @staticmethod
     @log
@@ -294,7 +336,7 @@ class StockDAO(metaclass=Singleton):
             Liste de tous les ingrédients avec leur quantité.
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT
@@ -330,16 +372,13 @@ class StockDAO(metaclass=Singleton):
             Les infos de l'unité (abbreviation, type) ou None
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT abbreviation, type_unite
-                FROM unite
-                WHERE id_unite = %(id_unite)s
-                """,
-                {"id_unite": id_unite},
-            )
-            return cursor.fetchone()
+        unite = UniteDAO().get_unite(id_unite)
+        if unite is None:
+            return None
+        return {
+            "abbreviation": unite["abbreviation"],
+            "type_unite": unite["type_unite"],
+        }
 
     @staticmethod
     @log
@@ -363,18 +402,7 @@ class StockDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT id_unite
-                    FROM unite
-                    WHERE LOWER(abbreviation) = LOWER(%(abbreviation)s)
-                    """,
-                    {"abbreviation": abbreviation},
-                )
-
-                result = cursor.fetchone()
-                return result["id_unite"] if result else None
+            return UniteDAO().get_id_par_abreviation(abbreviation)
 
         except Exception as e:
             logging.exception("Erreur lors de la récupération de l'ID de l'unité")
@@ -406,22 +434,114 @@ class StockDAO(metaclass=Singleton):
             True si l'opération a réussi
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
+        qte_normalisee, type_unite = (
+            UniteDAO().get_table_conversion((id_unite,)).normaliser(quantite, id_unite)
+        )
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
-                INSERT INTO stock (id_utilisateur, id_ingredient, quantite, id_unite)
+                INSERT INTO stock (id_utilisateur, id_ingredient, quantite, id_unite,
+                                   qte_normalisee, type_unite)
                 VALUES (%(id_utilisateur)s, %(id_ingredient)s, %(quantite)s,
-                        %(id_unite)s)
+                        %(id_unite)s, %(qte_normalisee)s, %(type_unite)s)
                 ON CONFLICT (id_utilisateur, id_ingredient)
                 DO UPDATE SET
                     quantite = EXCLUDED.quantite,
-                    id_unite = EXCLUDED.id_unite
+                    id_unite = EXCLUDED.id_unite,
+                    qte_normalisee = EXCLUDED.qte_normalisee,
+                    type_unite = EXCLUDED.type_unite
                 """,
                 {
                     "id_utilisateur": id_utilisateur,
                     "id_ingredient": id_ingredient,
                     "quantite": quantite,
                     "id_unite": id_unite,
+                    "qte_normalisee": qte_normalisee,
+                    "type_unite": type_unite,
                 },
             )
-            return cursor.rowcount > 0
+            modifie = cursor.rowcount > 0
+
+        CacheRealisables().signaler_modification(id_utilisateur, id_ingredient)
+        return modifie
+
+    @staticmethod
+    @log
+    def normaliser_quantites() -> int:
+        """Remplit les quantités normalisées manquantes des stocks.
+
+        Les lignes sont traitées par unité : une seule requête UPDATE par
+        unité distincte restant à normaliser.
+
+        Returns
+        -------
+        int
+            Nombre de lignes normalisées
+
+        """
+        utilisateurs = set()
+        nb_lignes = 0
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT DISTINCT s.id_unite, u.abbreviation
+                FROM stock s
+                LEFT JOIN unite u ON s.id_unite = u.id_unite
+                WHERE s.qte_normalisee IS NULL
+                """,
+            )
+            for row in cursor.fetchall():
+                facteur, type_unite = UnitConverter.facteur_normalisation(
+                    row["abbreviation"],
+                )
+                cursor.execute(
+                    """
+                    UPDATE stock
+                    SET qte_normalisee = COALESCE(
+                            ROUND(quantite * %(facteur)s::numeric, 2),
+                            quantite
+                        ),
+                        type_unite = %(type_unite)s
+                    WHERE id_unite IS NOT DISTINCT FROM %(id_unite)s
+                    AND qte_normalisee IS NULL
+                    RETURNING id_utilisateur
+                    """,
+                    {
+                        "facteur": facteur,
+                        "type_unite": type_unite,
+                        "id_unite": row["id_unite"],
+                    },
+                )
+                lignes = cursor.fetchall()
+                nb_lignes += len(lignes)
+                utilisateurs.update(ligne["id_utilisateur"] for ligne in lignes)
+
+        for id_utilisateur in utilisateurs:
+            CacheRealisables().signaler_modification(id_utilisateur)
+        return nb_lignes
+
+
+class AsyncStockDAO(metaclass=Singleton):
+    """Versions asynchrones des méthodes de lecture de StockDAO."""
+
+    @staticmethod
+    @log
+    async def get_stock(
+        id_utilisateur: int,
+        *,
+        only_available: bool = True,
+    ) -> list[dict]:
+        """Récupère le stock d'un utilisateur.
+
+        Voir StockDAO.get_stock.
+        """
+        async with (
+            AsyncDBConnection().connection() as connection,
+            connection.cursor() as cursor,
+        ):
+            await cursor.execute(
+                _requete_stock(only_available=only_available),
+                {"id_utilisateur": id_utilisateur},
+            )
+
+            return await cursor.fetchall()
@@ -1,12 +1,161 @@
-"""Classe DAO du business object Unite."""
+"""Classe DAO du business object Unite.
+
+La table unite est une petite table de référence, presque jamais modifiée :
+elle est gardée en mémoire par UniteDAO (chargée au démarrage de l'API ou au
+premier besoin) et relue à chaque création d'unité. Une recherche qui échoue
+en mémoire relit la table une fois avant de conclure, pour les unités créées
+par un autre processus ; ces relectures sont espacées d'au moins
+UNIT_RELOAD_COOLDOWN secondes, car les abréviations cherchées viennent des
+requêtes des utilisateurs (une suite d'unités inconnues ne relit pas la
+table à chaque fois).
+"""
+
+import time
+from collections.abc import Callable, Iterable
+
+from psycopg2.extras import RealDictCursor
 
 from src.dao.db_connection import DBConnection
+from src.utils.conversion_unite import TableConversion
 from src.utils.log_decorator import log
+from src.utils.settings import settings
+from src.utils.singleton import Singleton
+
+
+class _ReferenceUnites:
+    """Instantané de la table unite, indexé par id, abréviation et nom."""
+
+    def __init__(self, unites: list[dict]) -> None:
+        """Indexe les lignes de la table unite (triées par id_unite)."""
+        self.par_id = {unite["id_unite"]: unite for unite in unites}
+        self.par_abreviation: dict[str, int] = {}
+        self.par_nom: dict[str, int] = {}
+        for unite in unites:
+            if unite["abbreviation"]:
+                self.par_abreviation.setdefault(
+                    unite["abbreviation"].lower(),
+                    unite["id_unite"],
+                )
+            if unite["nom"]:
+                self.par_nom.setdefault(unite["nom"].lower(), unite["id_unite"])
+        self.conversion = TableConversion(unites)
+
 
+def _charger(cursor: RealDictCursor) -> _ReferenceUnites:
+    """Lit toute la table unite."""
+    cursor.execute(
+        "SELECT id_unite, nom, abbreviation, type_unite FROM unite ORDER BY id_unite",
+    )
+    return _ReferenceUnites(cursor.fetchall())
 
-class UniteDAO:
+
+class UniteDAO(metaclass=Singleton):
     """DAO pour gérer les unités de mesure."""
 
+    def __init__(self) -> None:
+        """Initialise le DAO sans table unite chargée."""
+        self._reference: _ReferenceUnites | None = None
+        self._relue_le = 0.0
+
+    def recharger(self, cursor: RealDictCursor | None = None) -> None:
+        """Relit la table unite en base.
+
+        Parameters
+        ----------
+        cursor : RealDictCursor | None
+            Curseur de la transaction en cours, pour relire la table sans
+            emprunter une autre connexion
+
+        """
+        if cursor is None:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as nouveau_cursor,
+            ):
+                self._reference = _charger(nouveau_cursor)
+        else:
+            self._reference = _charger(cursor)
+        self._relue_le = time.monotonic()
+
+    def _chercher(
+        self,
+        trouvee: Callable[[_ReferenceUnites], bool],
+        cursor: RealDictCursor | None = None,
+    ) -> _ReferenceUnites:
+        """Retourne la table en mémoire, relue si la recherche y échoue.
+
+        Une table relue il y a moins de UNIT_RELOAD_COOLDOWN secondes est
+        retournée telle quelle, même si la recherche y échoue.
+        """
+        reference = self._reference
+        if reference is None or (
+            not trouvee(reference)
+            and time.monotonic() - self._relue_le >= settings.UNIT_RELOAD_COOLDOWN
+        ):
+            self.recharger(cursor)
+            reference = self._reference
+        return reference
+
+    def get_table_conversion(
+        self,
+        ids_requis: Iterable[int | None] = (),
+        cursor: RealDictCursor | None = None,
+    ) -> TableConversion:
+        """Retourne la table de conversion compilée des unités.
+
+        Parameters
+        ----------
+        ids_requis : Iterable[int | None]
+            Unités qui doivent figurer dans la table (None est ignoré)
+        cursor : RealDictCursor | None
+            Curseur de la transaction en cours, si la table doit être relue
+
+        Returns
+        -------
+        TableConversion
+            La table id_unite -> (type, facteur vers ml ou g)
+
+        """
+        ids_requis = [id_unite for id_unite in ids_requis if id_unite is not None]
+        return self._chercher(
+            lambda reference: all(
+                id_unite in reference.par_id for id_unite in ids_requis
+            ),
+            cursor,
+        ).conversion
+
+    def get_unite(self, id_unite: int) -> dict | None:
+        """Retourne une unité (id_unite, nom, abbreviation, type_unite).
+
+        Parameters
+        ----------
+        id_unite : int
+            ID de l'unité
+
+        Returns
+        -------
+        dict | None
+            Une copie de l'unité, ou None si elle n'existe pas
+
+        """
+        reference = self._chercher(lambda reference: id_unite in reference.par_id)
+        unite = reference.par_id.get(id_unite)
+        return dict(unite) if unite else None
+
+    def get_id_par_abreviation(self, abbreviation: str) -> int | None:
+        """Retourne l'ID d'une unité d'après son abréviation (casse ignorée)."""
+        cle = abbreviation.lower()
+        return self._chercher(
+            lambda reference: cle in reference.par_abreviation,
+        ).par_abreviation.get(cle)
+
+    def get_id_par_nom(self, nom: str) -> int | None:
+        """Retourne l'ID d'une unité d'après son nom (casse ignorée)."""
+        cle = nom.lower()
+        return self._chercher(lambda reference: cle in reference.par_nom).par_nom.get(
+            cle,
+        )
+
     @staticmethod
     @log
     def get_or_create_unit(nom: str) -> int:
@@ -23,20 +172,12 @@ class UniteDAO:
             ID de l'unité
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT id_unite
-                FROM unite
-                WHERE LOWER(nom) = LOWER(%(nom)s)
-                """,
-                {"nom": nom},
-            )
-
-            row = cursor.fetchone()
-            if row:
-                return row["id_unite"]
+        dao = UniteDAO()
+        id_unite = dao.get_id_par_nom(nom)
+        if id_unite is not None:
+            return id_unite
 
+        with DBConnection().connection() as connection, connection.cursor() as cursor:
             cursor.execute(
                 """
                 INSERT INTO unite (nom)
@@ -46,7 +187,10 @@ class UniteDAO:
                 {"nom": nom},
             )
 
-            return cursor.fetchone()["id_unite"]
+            id_unite = cursor.fetchone()["id_unite"]
+            dao.recharger(cursor)
+
+        return id_unite
 
     @staticmethod
     @log
@@ -64,11 +208,5 @@ class UniteDAO:
             Nom de l'unité ou None si non trouvée
 
         """
-        with DBConnection().connection as connection, connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT nom FROM unite WHERE id_unite = %(id_unite)s",
-                {"id_unite": id_unite},
-            )
-
-            row = cursor.fetchone()
-            return row["nom"] if row else None
+        unite = UniteDAO().get_unite(id_unite)
+        return unite["nom"] if unite else None
@@ -1,9 +1,12 @@
 """Classe DAO du business object Utilisateur."""
 
+from psycopg.errors import UniqueViolation as AsyncUniqueViolation
 from psycopg2 import Error as DBError
 from psycopg2.errors import UniqueViolation
 
 from src.business_object.utilisateur import Utilisateur
+from src.dao.async_db_connection import AsyncDBConnection
+from src.dao.cache_utilisateurs import CacheUtilisateurs
 from src.dao.db_connection import DBConnection
 from src.models.utilisateurs import User, UserCreate, UserUpdatePassword
 from src.utils.exceptions import (
@@ -17,6 +20,102 @@ from src.utils.exceptions import (
 from src.utils.log_decorator import log
 from src.utils.singleton import Singleton
 
+_SQL_CREER_COMPTE = """
+    INSERT INTO utilisateur(pseudo, mail, date_naissance, mot_de_passe)
+    VALUES (%(pseudo)s, %(mail)s, %(date_naissance)s, %(mot_de_passe_hashed)s)
+    RETURNING *
+"""
+
+_SQL_UTILISATEUR_PAR_PSEUDO = """
+    SELECT
+        id_utilisateur,
+        pseudo,
+        mail,
+        date_naissance,
+        mot_de_passe,
+        date_inscription,
+        version_identifiants
+    FROM utilisateur
+    WHERE pseudo = %(pseudo)s
+"""
+
+_SQL_SUPPRIMER_COMPTE = """
+    DELETE FROM utilisateur
+    WHERE pseudo = %(pseudo)s
+    RETURNING id_utilisateur
+"""
+
+# Changer de mot de passe ou de pseudo révoque les jetons émis avant
+_SQL_CHANGER_MOT_DE_PASSE = """
+    UPDATE utilisateur
+    SET mot_de_passe = %(mot_de_passe_nouveau_hashed)s,
+        version_identifiants = version_identifiants + 1
+    WHERE pseudo = %(pseudo)s
+    RETURNING id_utilisateur
+"""
+
+# Le hachage n'est remplacé que s'il n'a pas changé depuis la connexion : un
+# changement de mot de passe concurrent n'est pas écrasé
+_SQL_REMPLACER_HACHAGE = """
+    UPDATE utilisateur
+    SET mot_de_passe = %(nouveau)s
+    WHERE id_utilisateur = %(id_utilisateur)s
+      AND mot_de_passe = %(ancien)s
+    RETURNING id_utilisateur
+"""
+
+
+def _verifier_compte(utilisateur: UserCreate) -> None:
+    """Vérifie que les champs obligatoires d'un compte à créer sont remplis."""
+    if not utilisateur.pseudo or not utilisateur.pseudo.strip():
+        raise EmptyFieldError(field="pseudo")
+    if not utilisateur.mail or not utilisateur.mail.strip():
+        raise EmptyFieldError(field="mail")
+    if (
+        not utilisateur.mot_de_passe_hashed
+        or not utilisateur.mot_de_passe_hashed.strip()
+    ):
+        raise EmptyFieldError(field="mot_de_passe")
+    if not utilisateur.date_naissance:
+        raise EmptyFieldError(field="date_naissance")
+
+
+def _parametres_compte(utilisateur: UserCreate) -> dict:
+    """Retourne les paramètres de _SQL_CREER_COMPTE."""
+    return {
+        "pseudo": utilisateur.pseudo,
+        "mail": utilisateur.mail,
+        "date_naissance": utilisateur.date_naissance,
+        "mot_de_passe_hashed": utilisateur.mot_de_passe_hashed,
+    }
+
+
+def _doublon(erreur: Exception, utilisateur: UserCreate) -> Exception:
+    """Retourne l'erreur métier d'une violation d'unicité à la création."""
+    error_message = str(erreur).lower()
+    if "pseudo" in error_message:
+        return UserAlreadyExistsError(utilisateur.pseudo)
+    if "mail" in error_message:
+        return MailAlreadyExistsError(utilisateur.mail)
+    return DAOError()
+
+
+def _utilisateur(res: dict) -> User:
+    """Construit un User à partir d'une ligne de la table utilisateur."""
+    return User(
+        id_utilisateur=res["id_utilisateur"],
+        pseudo=res["pseudo"],
+        mail=res["mail"],
+        date_naissance=res["date_naissance"].isoformat()
+        if res["date_naissance"]
+        else None,
+        mot_de_passe_hashed=res["mot_de_passe"],
+        date_inscription=res["date_inscription"].isoformat()
+        if res["date_inscription"]
+        else None,
+        version_identifiants=res["version_identifiants"],
+    )
+
 
 class UtilisateurDAO(metaclass=Singleton):
     """Classe contenant les méthodes agissant sur les utilisateurs de la base de
@@ -40,43 +139,17 @@ class UtilisateurDAO(metaclass=Singleton):
             False sinon
 
         """
-        if not utilisateur.pseudo or not utilisateur.pseudo.strip():
-            raise EmptyFieldError(field="pseudo")
-        if not utilisateur.mail or not utilisateur.mail.strip():
-            raise EmptyFieldError(field="mail")
-        if (
-            not utilisateur.mot_de_passe_hashed
-            or not utilisateur.mot_de_passe_hashed.strip()
-        ):
-            raise EmptyFieldError(field="mot_de_passe")
-        if not utilisateur.date_naissance:
-            raise EmptyFieldError(field="date_naissance")
+        _verifier_compte(utilisateur)
         res = None
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    INSERT INTO utilisateur(pseudo, mail, date_naissance, mot_de_passe)
-                    VALUES (%(pseudo)s, %(mail)s, %(date_naissance)s,
-                    %(mot_de_passe_hashed)s)
-                    RETURNING *
-                    """,
-                    {
-                        "pseudo": utilisateur.pseudo,
-                        "mail": utilisateur.mail,
-                        "date_naissance": utilisateur.date_naissance,
-                        "mot_de_passe_hashed": utilisateur.mot_de_passe_hashed,
-                    },
-                )
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(_SQL_CREER_COMPTE, _parametres_compte(utilisateur))
                 res = cursor.fetchone()
         except UniqueViolation as e:
-            error_message = str(e)
-
-            if "pseudo" in error_message.lower():
-                raise UserAlreadyExistsError(utilisateur.pseudo) from None
-            if "mail" in error_message.lower():
-                raise MailAlreadyExistsError(utilisateur.mail) from None
-            raise DAOError from None
+            raise _doublon(e, utilisateur) from None
 
         except Exception as e:
             raise DAOError from e
@@ -107,7 +180,10 @@ class UtilisateurDAO(metaclass=Singleton):
         """
         res = None
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
                     """
                         SELECT *
@@ -150,18 +226,16 @@ class UtilisateurDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                        DELETE FROM utilisateur
-                        WHERE pseudo=%(pseudo)s
-                        """,
-                    {"pseudo": pseudo},
-                )
-                res = cursor.rowcount
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(_SQL_SUPPRIMER_COMPTE, {"pseudo": pseudo})
+                ids_utilisateurs = [row["id_utilisateur"] for row in cursor.fetchall()]
         except Exception as e:
             raise AccountDeletionError from e
-        return res > 0
+        CacheUtilisateurs().invalider(ids_utilisateurs)
+        return len(ids_utilisateurs) > 0
 
     @staticmethod
     def read(id_utilisateur: int) -> User | None:
@@ -184,7 +258,10 @@ class UtilisateurDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
                     """
                     SELECT
@@ -193,7 +270,8 @@ class UtilisateurDAO(metaclass=Singleton):
                         mail,
                         mot_de_passe,
                         date_naissance,
-                        date_inscription
+                        date_inscription,
+                        version_identifiants
                     FROM utilisateur
                     WHERE id_utilisateur = %(id_utilisateur)s
                     """,
@@ -210,6 +288,7 @@ class UtilisateurDAO(metaclass=Singleton):
                     date_inscription=row["date_inscription"].isoformat()
                     if row["date_inscription"]
                     else None,
+                    version_identifiants=row["version_identifiants"],
                 )
         except DBError as exc:
             raise DAOError from exc
@@ -236,40 +315,16 @@ class UtilisateurDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT
-                        id_utilisateur,
-                        pseudo,
-                        mail,
-                        date_naissance,
-                        mot_de_passe,
-                        date_inscription
-                    FROM utilisateur
-                    WHERE pseudo = %(pseudo)s
-                    """,
-                    {"pseudo": pseudo},
-                )
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                cursor.execute(_SQL_UTILISATEUR_PAR_PSEUDO, {"pseudo": pseudo})
                 res = cursor.fetchone()
         except Exception as e:
             raise DAOError from e
 
-        utilisateur = None
-        if res:
-            utilisateur = User(
-                id_utilisateur=res["id_utilisateur"],
-                pseudo=res["pseudo"],
-                mail=res["mail"],
-                date_naissance=res["date_naissance"].isoformat()
-                if res["date_naissance"]
-                else None,
-                mot_de_passe_hashed=res["mot_de_passe"],
-                date_inscription=res["date_inscription"].isoformat()
-                if res["date_inscription"]
-                else None,
-            )
-        return utilisateur
+        return _utilisateur(res) if res else None
 
     @staticmethod
     def pseudo_existe(pseudo: str) -> bool:
@@ -292,7 +347,7 @@ class UtilisateurDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection:
+            with DBConnection().connection() as connection:
                 with connection.cursor() as cursor:
                     cursor.execute(
                         "SELECT EXISTS(SELECT 1 FROM utilisateur WHERE pseudo = "
@@ -327,7 +382,7 @@ class UtilisateurDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection:
+            with DBConnection().connection() as connection:
                 with connection.cursor() as cursor:
                     cursor.execute(
                         "SELECT EXISTS(SELECT 1 FROM utilisateur WHERE mail = "
@@ -363,21 +418,22 @@ class UtilisateurDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
-                    """
-                    UPDATE utilisateur
-                    SET mot_de_passe = %(mot_de_passe_nouveau_hashed)s
-                    WHERE pseudo = %(pseudo)s
-                    """,
+                    _SQL_CHANGER_MOT_DE_PASSE,
                     {
                         "mot_de_passe_nouveau_hashed": mdps.mot_de_passe_nouveau_hashed,
                         "pseudo": mdps.pseudo,
                     },
                 )
-                return cursor.rowcount > 0
+                ids_utilisateurs = [row["id_utilisateur"] for row in cursor.fetchall()]
         except Exception as e:
             raise DAOError from e
+        CacheUtilisateurs().invalider(ids_utilisateurs)
+        return len(ids_utilisateurs) > 0
 
     @staticmethod
     @log
@@ -405,23 +461,30 @@ class UtilisateurDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
                     """
                     UPDATE utilisateur
-                    SET pseudo = %(nouveau_pseudo)s
+                    SET pseudo = %(nouveau_pseudo)s,
+                        version_identifiants = version_identifiants + 1
                     WHERE pseudo = %(ancien_pseudo)s
+                    RETURNING id_utilisateur
                     """,
                     {
                         "nouveau_pseudo": nouveau_pseudo,
                         "ancien_pseudo": ancien_pseudo,
                     },
                 )
-                return cursor.rowcount > 0
+                ids_utilisateurs = [row["id_utilisateur"] for row in cursor.fetchall()]
         except UniqueViolation:
             raise UserAlreadyExistsError(nouveau_pseudo) from None
         except DBError as e:
             raise PseudoChangingError from e
+        CacheUtilisateurs().invalider(ids_utilisateurs)
+        return len(ids_utilisateurs) > 0
 
     @staticmethod
     @log
@@ -446,7 +509,10 @@ class UtilisateurDAO(metaclass=Singleton):
 
         """
         try:
-            with DBConnection().connection as connection, connection.cursor() as cursor:
+            with (
+                DBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
                 cursor.execute(
                     """
                     SELECT date_inscription
@@ -465,3 +531,140 @@ class UtilisateurDAO(metaclass=Singleton):
                 return None
         except Exception as e:
             raise DAOError from e
+
+
+class AsyncUtilisateurDAO(metaclass=Singleton):
+    """Versions asynchrones des méthodes de UtilisateurDAO appelées autour d'un
+    hachage de mot de passe (connexion, inscription, suppression, changement de
+    mot de passe).
+    """
+
+    @staticmethod
+    @log
+    async def create_compte(utilisateur: UserCreate) -> bool:
+        """Création d'un compte utilisateur.
+
+        Voir UtilisateurDAO.create_compte.
+        """
+        _verifier_compte(utilisateur)
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(_SQL_CREER_COMPTE, _parametres_compte(utilisateur))
+                res = await cursor.fetchone()
+        except AsyncUniqueViolation as e:
+            raise _doublon(e, utilisateur) from None
+        except Exception as e:
+            raise DAOError from e
+        return res is not None
+
+    @staticmethod
+    async def recuperer_par_pseudo(pseudo: str) -> User | None:
+        """Récupère un utilisateur par son pseudo.
+
+        Voir UtilisateurDAO.recuperer_par_pseudo.
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(_SQL_UTILISATEUR_PAR_PSEUDO, {"pseudo": pseudo})
+                res = await cursor.fetchone()
+        except Exception as e:
+            raise DAOError from e
+        return _utilisateur(res) if res else None
+
+    @staticmethod
+    @log
+    async def delete_compte(pseudo: str) -> bool:
+        """Supprimer un utilisateur de la base de données.
+
+        Voir UtilisateurDAO.delete_compte.
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(_SQL_SUPPRIMER_COMPTE, {"pseudo": pseudo})
+                ids_utilisateurs = [
+                    row["id_utilisateur"] for row in await cursor.fetchall()
+                ]
+        except Exception as e:
+            raise AccountDeletionError from e
+        CacheUtilisateurs().invalider(ids_utilisateurs)
+        return len(ids_utilisateurs) > 0
+
+    @staticmethod
+    @log
+    async def update_mot_de_passe(mdps: UserUpdatePassword) -> bool:
+        """Met à jour le mot de passe d'un utilisateur par son pseudo.
+
+        Voir UtilisateurDAO.update_mot_de_passe.
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(
+                    _SQL_CHANGER_MOT_DE_PASSE,
+                    {
+                        "mot_de_passe_nouveau_hashed": mdps.mot_de_passe_nouveau_hashed,
+                        "pseudo": mdps.pseudo,
+                    },
+                )
+                ids_utilisateurs = [
+                    row["id_utilisateur"] for row in await cursor.fetchall()
+                ]
+        except Exception as e:
+            raise DAOError from e
+        CacheUtilisateurs().invalider(ids_utilisateurs)
+        return len(ids_utilisateurs) > 0
+
+    @staticmethod
+    @log
+    async def remplacer_hachage(id_utilisateur: int, ancien: str, nouveau: str) -> bool:
+        """Remplace le hachage du mot de passe d'un utilisateur par un autre.
+
+        Le mot de passe reste le même (hachage refait avec un autre coût) : le
+        remplacement n'a pas lieu si le hachage a changé entre-temps.
+
+        Parameters
+        ----------
+        id_utilisateur : int
+            ID de l'utilisateur
+        ancien : str
+            Hachage lu à la connexion
+        nouveau : str
+            Nouveau hachage du même mot de passe
+
+        Returns
+        -------
+        bool
+            True si le hachage a été remplacé, False sinon
+
+        """
+        try:
+            async with (
+                AsyncDBConnection().connection() as connection,
+                connection.cursor() as cursor,
+            ):
+                await cursor.execute(
+                    _SQL_REMPLACER_HACHAGE,
+                    {
+                        "id_utilisateur": id_utilisateur,
+                        "ancien": ancien,
+                        "nouveau": nouveau,
+                    },
+                )
+                ids_utilisateurs = [
+                    row["id_utilisateur"] for row in await cursor.fetchall()
+                ]
+        except Exception as e:
+            raise DAOError from e
+        CacheUtilisateurs().invalider(ids_utilisateurs)
+        return len(ids_utilisateurs) > 0
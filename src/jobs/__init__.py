@@ -0,0 +1 @@
+"""Tâches d'administration à lancer ponctuellement sur la base."""
@@ -0,0 +1,188 @@
+"""Calcule hors ligne les cocktails réalisables de tous les utilisateurs.
+
+Le catalogue est chargé une seule fois dans un InstantaneIndex, transmis à
+chaque processus du pool à son démarrage. Les stocks de tous les utilisateurs
+sont lus en flux, triés par utilisateur, et découpés en lots évalués en
+parallèle. Les résumés sont enregistrés dans cocktails_realisables_utilisateur
+dans l'ordre des utilisateurs, avec un point de reprise : une exécution
+interrompue reprend après le dernier lot enregistré.
+
+Utilisation :
+    python -m src.jobs.calculer_realisables [--processus N] [--taille-lot N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import groupby, islice
+from operator import itemgetter
+
+import numpy as np
+
+from src.dao.cocktail_dao import CocktailDAO
+from src.dao.index_recettes import InstantaneIndex
+from src.dao.realisables_dao import RealisablesDAO
+
+NOM_TACHE = "calculer_realisables"
+
+logger = logging.getLogger(__name__)
+
+# Index des recettes de chaque processus du pool, installé par _initialiser
+_etat_processus: dict = {}
+
+
+def _initialiser(index: InstantaneIndex) -> None:
+    """Installe l'index des recettes dans un processus du pool."""
+    _etat_processus["index"] = index
+    _etat_processus["ids_cocktails"] = np.array(
+        [cocktail["id_cocktail"] for cocktail in index.cocktails],
+        dtype=np.int64,
+    )
+
+
+def evaluer_lot(
+    lot: list[tuple[int, list[dict]]],
+) -> list[tuple[int, list[int]]]:
+    """Évalue le stock de chaque utilisateur d'un lot (dans un processus du pool).
+
+    Parameters
+    ----------
+    lot : list[tuple[int, list[dict]]]
+        Pour chaque utilisateur, son id et ses lignes de stock
+
+    Returns
+    -------
+    list[tuple[int, list[int]]]
+        Pour chaque utilisateur, son id et les id des cocktails réalisables
+
+    """
+    index = _etat_processus["index"]
+    ids_cocktails = _etat_processus["ids_cocktails"]
+    return [
+        (
+            id_utilisateur,
+            ids_cocktails[index.evaluer(stock_rows).manquants == 0].tolist(),
+        )
+        for id_utilisateur, stock_rows in lot
+    ]
+
+
+def _stocks_par_utilisateur(
+    rows: Iterable[dict],
+) -> Iterator[tuple[int, list[dict]]]:
+    """Regroupe les lignes de stock (triées par utilisateur) par utilisateur."""
+    for id_utilisateur, lignes in groupby(rows, key=itemgetter("id_utilisateur")):
+        yield (
+            id_utilisateur,
+            [ligne for ligne in lignes if ligne["id_ingredient"] is not None],
+        )
+
+
+def _lots(
+    stocks: Iterator[tuple[int, list[dict]]],
+    taille_lot: int,
+) -> Iterator[list[tuple[int, list[dict]]]]:
+    """Découpe le flux des stocks en lots de taille_lot utilisateurs."""
+    while lot := list(islice(stocks, taille_lot)):
+        yield lot
+
+
+def executer(
+    nb_processus: int | None = None,
+    taille_lot: int = 200,
+) -> dict:
+    """Enregistre le résumé des cocktails réalisables de chaque utilisateur.
+
+    Au plus deux lots par processus sont en cours à la fois : la lecture des
+    stocks avance au rythme des calculs, et la mémoire reste bornée quel que
+    soit le nombre d'utilisateurs. Un lot n'est enregistré (avec le point de
+    reprise) qu'une fois tous les lots précédents enregistrés.
+
+    Parameters
+    ----------
+    nb_processus : int | None
+        Nombre de processus du pool (par défaut, le nombre de processeurs)
+    taille_lot : int
+        Nombre d'utilisateurs par lot
+
+    Returns
+    -------
+    dict
+        Format: {
+            "nb_utilisateurs": int,
+            "reprise_apres": int | None,
+            "duree": float (s),
+            "debit": float (utilisateurs/s)
+        }
+
+    """
+    dao = RealisablesDAO()
+    debut = time.perf_counter()
+    reprise_apres = dao.get_reprise(NOM_TACHE)
+    index = InstantaneIndex(CocktailDAO().get_tous_cocktails_avec_ingredients())
+    nb_utilisateurs = 0
+    nb_processus = nb_processus or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=nb_processus,
+        initializer=_initialiser,
+        initargs=(index,),
+    ) as pool:
+        en_cours: deque[Future] = deque()
+        max_en_cours = 2 * nb_processus
+
+        def enregistrer_plus_ancien() -> None:
+            nonlocal nb_utilisateurs
+            resumes = en_cours.popleft().result()
+            dao.enregistrer_resumes(resumes, NOM_TACHE)
+            nb_utilisateurs += len(resumes)
+            duree = time.perf_counter() - debut
+            logger.info(
+                "%d utilisateur(s) traité(s), %.0f utilisateurs/s",
+                nb_utilisateurs,
+                nb_utilisateurs / duree,
+            )
+
+        stocks = _stocks_par_utilisateur(dao.iterer_stocks(apres=reprise_apres))
+        for lot in _lots(stocks, taille_lot):
+            en_cours.append(pool.submit(evaluer_lot, lot))
+            if len(en_cours) >= max_en_cours:
+                enregistrer_plus_ancien()
+        while en_cours:
+            enregistrer_plus_ancien()
+
+    dao.supprimer_reprise(NOM_TACHE)
+    duree = time.perf_counter() - debut
+    return {
+        "nb_utilisateurs": nb_utilisateurs,
+        "reprise_apres": reprise_apres,
+        "duree": duree,
+        "debit": nb_utilisateurs / duree if duree else 0.0,
+    }
+
+
+def main() -> None:
+    """Lance le calcul et affiche le débit obtenu."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processus", type=int, default=None)
+    parser.add_argument("--taille-lot", type=int, default=200)
+    arguments = parser.parse_args()
+
+    resultat = executer(arguments.processus, arguments.taille_lot)
+    if resultat["reprise_apres"] is not None:
+        sys.stdout.write(
+            f"Reprise après l'utilisateur {resultat['reprise_apres']}\n",
+        )
+    sys.stdout.write(
+        f"{resultat['nb_utilisateurs']} utilisateur(s) traité(s) en "
+        f"{resultat['duree']:.1f} s ({resultat['debit']:.0f} utilisateurs/s)\n",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Calcule les documents de recherche plein texte des instructions existantes.
+
+Les nouvelles instructions sont indexées à l'insertion par InstructionDAO ;
+cette tâche ne traite que les instructions dont la colonne document est encore
+NULL (insérées avant son ajout, ou directement en SQL), et peut donc être
+relancée sans risque.
+
+Utilisation :
+    python -m src.jobs.indexer_instructions
+"""
+
+import sys
+
+from src.dao.instruction_dao import InstructionDAO
+
+
+def main() -> None:
+    """Indexe les instructions sans document et affiche le nombre de cocktails."""
+    nb_cocktails = InstructionDAO().indexer_instructions_manquantes()
+    sys.stdout.write(f"{nb_cocktails} cocktail(s) indexé(s)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Remplit les quantités normalisées (ml/g) des lignes insérées avant leur ajout.
+
+Les nouvelles lignes sont normalisées à l'insertion par les DAO ; cette tâche
+ne traite que les lignes existantes dont qte_normalisee est encore NULL, et
+peut donc être relancée sans risque.
+
+Utilisation :
+    python -m src.jobs.normaliser_quantites
+"""
+
+import sys
+
+from src.dao.cocktail_dao import CocktailDAO
+from src.dao.stock_dao import StockDAO
+
+
+def main() -> None:
+    """Normalise les recettes puis les stocks et affiche le nombre de lignes."""
+    nb_recettes = CocktailDAO().normaliser_quantites()
+    nb_stocks = StockDAO().normaliser_quantites()
+    sys.stdout.write(
+        f"{nb_recettes} ligne(s) de recette et {nb_stocks} ligne(s) de stock "
+        "normalisées\n",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,76 @@
 """Point d'entrée principal pour l'application FastAPI."""
 
+import logging
 import sys
+import time
+import uuid
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
+import psycopg2
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 if __name__ == "__main__":
     root_dir = Path(__file__).parent.parent
     sys.path.insert(0, str(root_dir))
 
 from src.api.main import api_router
+from src.dao.async_db_connection import AsyncDBConnection
+from src.dao.cache_utilisateurs import CacheUtilisateurs
+from src.dao.cocktail_dao import CocktailDAO
+from src.dao.db_connection import DBConnection
+from src.dao.index_ingredients import IndexIngredients
+from src.dao.index_noms import IndexNoms
+from src.dao.ingredient_dao import IngredientDAO
+from src.dao.unite_dao import UniteDAO
+from src.utils.contexte_logs import fermer_contexte, ouvrir_contexte
+from src.utils.exceptions import HachageSatureError, PoolTimeoutError
+from src.utils.log_init import PipelineLogs, initialiser_logs
+from src.utils.metriques import (
+    CACHE_UTILISATEURS,
+    HACHAGE_EN_COURS,
+    HTTP_DUREE,
+    HTTP_REPONSES,
+    LOGS_EN_ATTENTE,
+    LOGS_PERDUS,
+    POOL_ATTENTES,
+    POOL_CONNEXIONS,
+    RegistreMetriques,
+    modele_de_route,
+)
+from src.utils.pool_hachage import PoolHachage
 from src.utils.settings import settings
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
+    """Charge les données de référence au démarrage, ferme les pools à l'arrêt.
+
+    Les logs sont configurés en premier et arrêtés en dernier, pour écrire
+    les messages encore dans la file. Le pool de hachage est créé au
+    démarrage plutôt qu'à la première connexion. La table unite et les index des noms
+    de cocktails et d'ingrédients sont chargés au démarrage ; si la base
+    n'est pas joignable, ils le seront au premier besoin.
+    """
+    initialiser_logs("api")
+    PoolHachage().demarrer()
+    with suppress(psycopg2.Error, PoolTimeoutError):
+        UniteDAO().recharger()
+        IndexNoms().construire(CocktailDAO.get_tous_cocktails)
+        IndexIngredients().construire(IngredientDAO.get_all_ingredients)
+    try:
+        yield
+    finally:
+        await AsyncDBConnection().close()
+        PoolHachage().fermer()
+        PipelineLogs().arreter()
+
+
 app = FastAPI(
     title="API Cocktails",
     description="API REST pour gérer les cocktails TheCocktailDB",
@@ -20,9 +78,66 @@ app = FastAPI(
     root_path=settings.ROOT_PATH,
     docs_url="/",  # Swagger UI accessible directement à la racine
     redoc_url=None,  # Désactive ReDoc
+    lifespan=lifespan,
 )
 
 
+@app.middleware("http")
+async def connexion_par_requete(request: Request, call_next) -> Response:
+    """Partage une même connexion du pool entre tous les DAO d'une requête."""
+    with DBConnection().request_scope():
+        return await call_next(request)
+
+
+@app.middleware("http")
+async def contexte_de_requete(request: Request, call_next) -> Response:
+    """Ouvre le contexte des logs de la requête, trace et mesure sa réponse.
+
+    L'identifiant de requête vient de l'en-tête X-Request-ID (ou est généré)
+    et est renvoyé dans la réponse, pour relier les logs à un appel client.
+    La durée est mesurée par modèle de route (/api/cocktails/{id_cocktail}),
+    pour que les métriques ne dépendent pas des valeurs des paramètres.
+    """
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    jeton = ouvrir_contexte(request_id, f"{request.method} {request.url.path}")
+    debut = time.perf_counter()
+    statut = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        statut = response.status_code
+        response.headers["X-Request-ID"] = request_id
+        return response
+    finally:
+        duree = time.perf_counter() - debut
+        logger.info(
+            "%s %s %s",
+            request.method,
+            request.url.path,
+            statut,
+            extra={"duree_ms": round(duree * 1000, 3), "statut": statut},
+        )
+        route = modele_de_route(request)
+        registre = RegistreMetriques()
+        registre.observer(HTTP_DUREE, duree, methode=request.method, route=route)
+        registre.incrementer(
+            HTTP_REPONSES,
+            methode=request.method,
+            route=route,
+            statut=str(statut),
+        )
+        fermer_contexte(jeton)
+
+
+@app.exception_handler(HachageSatureError)
+def hachage_sature(_request: Request, exc: HachageSatureError) -> JSONResponse:
+    """Répond 503 quand le pool de hachage des mots de passe est saturé."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.get("/")
 def root() -> dict:
     """Route racine de l'API."""
@@ -36,6 +151,51 @@ def root() -> dict:
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    """Expose les métriques de l'API au format texte de Prometheus.
+
+    Les jauges d'utilisation des pools, de la file des logs et du cache des
+    utilisateurs sont relevées à chaque lecture.
+    """
+    registre = RegistreMetriques()
+    for pool, stats in _utilisation_des_pools().items():
+        for etat in ("max", "ouvertes", "utilisees"):
+            registre.definir(POOL_CONNEXIONS, stats[etat], pool=pool, etat=etat)
+        registre.definir(POOL_ATTENTES, stats["attentes"], pool=pool)
+    registre.definir(HACHAGE_EN_COURS, PoolHachage().en_cours)
+    logs = PipelineLogs().statistiques()
+    registre.definir(LOGS_EN_ATTENTE, logs["en_attente"])
+    registre.definir(LOGS_PERDUS, logs["perdus"])
+    for compteur, valeur in CacheUtilisateurs().statistiques().items():
+        registre.definir(CACHE_UTILISATEURS, valeur, compteur=compteur)
+    return PlainTextResponse(
+        registre.exporter(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+def _utilisation_des_pools() -> dict[str, dict[str, int]]:
+    """Relève l'utilisation des deux pools de connexions, sous les mêmes noms."""
+    sync = DBConnection().stats()
+    asynchrone = AsyncDBConnection().stats()
+    return {
+        "sync": {
+            "max": sync["max_size"],
+            "ouvertes": sync["opened"],
+            "utilisees": sync["in_use"],
+            "attentes": sync["waits"],
+        },
+        "async": {
+            "max": asynchrone.get("pool_max", 0),
+            "ouvertes": asynchrone.get("pool_size", 0),
+            "utilisees": asynchrone.get("pool_size", 0)
+            - asynchrone.get("pool_available", 0),
+            "attentes": asynchrone.get("requests_queued", 0),
+        },
+    }
+
+
 app.include_router(api_router)
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ This module aggregates all model classes for easy access throughout the app.
 
 from src.models.misc import Token as Token
 from src.models.misc import TokenPayload as TokenPayload
+from src.models.misc import UserClaims as UserClaims
 from src.models.utilisateurs import (
     User as User,
 )
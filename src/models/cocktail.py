@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from src.utils.facettes import Selection
+
 
 class CocktailWithoutId(BaseModel):
     """Rprésente un cocktail sans id_cocktail."""
@@ -169,3 +171,63 @@ class CocktailPriveCreate(BaseModel):
         default_factory=list,
         description="Liste des ingrédients avec quantités",
     )
+
+
+class FacettesCatalogue(BaseModel):
+    """Paramètres de requête filtrant le catalogue par facettes et ingrédients."""
+
+    categorie: list[str] = Field(
+        default=[],
+        description="Catégories acceptées (répéter le paramètre pour plusieurs)",
+    )
+    verre: list[str] = Field(
+        default=[],
+        description="Verres acceptés (répéter le paramètre pour plusieurs)",
+    )
+    alcool: bool | None = Field(
+        default=None,
+        description="Cocktails alcoolisés (true) ou sans alcool (false)",
+    )
+    ingredient: list[str] = Field(
+        default=[],
+        description="Ingrédients requis, par nom",
+    )
+    sans_ingredient: list[str] = Field(
+        default=[],
+        description="Ingrédients exclus, par nom",
+    )
+
+    def selection(self) -> Selection:
+        """Retourne les filtres sous la forme attendue par CocktailService."""
+        return Selection(
+            categorie=tuple(self.categorie),
+            verre=tuple(self.verre),
+            alcool=() if self.alcool is None else (self.alcool,),
+            avec=tuple(self.ingredient),
+            sans=tuple(self.sans_ingredient),
+        )
+
+
+class FiltresCatalogue(FacettesCatalogue):
+    """Paramètres de requête du parcours du catalogue par facettes."""
+
+    limit: int = Field(default=20, ge=1, le=100, description="Cocktails par page")
+    curseur: str | None = Field(
+        default=None,
+        description="Valeur de curseur_suivant de la page précédente",
+    )
+
+
+class FiltresTirage(FacettesCatalogue):
+    """Paramètres de requête du tirage de cocktails au hasard."""
+
+    nombre: int = Field(default=1, ge=1, le=50, description="Nombre de cocktails")
+    max_ingredients_manquants: int | None = Field(
+        default=None,
+        ge=0,
+        le=5,
+        description=(
+            "Si renseigné, seuls les cocktails auxquels il manque au plus ce "
+            "nombre d'ingrédients du stock de l'utilisateur connecté sont tirés"
+        ),
+    )
@@ -17,3 +17,13 @@ class TokenPayload(BaseModel):
     """Schema for the payload of an authentication token."""
 
     sub: str | None = None
+    # Absents des jetons émis avant l'ajout des claims
+    pseudo: str | None = None
+    ver: int | None = None
+
+
+class UserClaims(BaseModel):
+    """Schema for the user identity carried by an authentication token."""
+
+    id_utilisateur: int
+    pseudo: str
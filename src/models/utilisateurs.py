@@ -79,6 +79,7 @@ class User(UserRead, UserCreate):
     """Schéma pour un utilisateur dans la base de données."""
 
     date_inscription: str
+    version_identifiants: int = 0
 
 
 class UserDelete(BaseModel):
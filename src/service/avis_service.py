@@ -1,7 +1,8 @@
 """Couche service pour les opérations sur les avis."""
 
-from src.dao.avis_dao import AvisDAO
-from src.dao.cocktail_dao import CocktailDAO
+from src.business_object.cocktail import Cocktail
+from src.dao.avis_dao import AsyncAvisDAO, AvisDAO
+from src.dao.cocktail_dao import AsyncCocktailDAO, CocktailDAO
 from src.models.avis import AvisResponse, AvisSummary
 from src.utils.exceptions import (
     AvisNotFoundError,
@@ -19,6 +20,8 @@ class AvisService:
         """Initialise un AvisService."""
         self.avis_dao = AvisDAO()
         self.cocktail_dao = CocktailDAO()
+        self.avis_async_dao = AsyncAvisDAO()
+        self.cocktail_async_dao = AsyncCocktailDAO()
 
     def get_cocktail_by_name(self, nom_cocktail: str) -> dict:
         """Récupère un cocktail par son nom.
@@ -51,15 +54,46 @@ class AvisService:
                     max_resultats=5,
                 )
             )
-            suggestions = [c.nom for c in suggestions_cocktails]
-            if len(suggestions_cocktails) == 0:
-                raise CocktailNotFoundError(
-                    message=f"Cocktail '{nom_normalized}' non trouvé.",
+            self._cocktail_non_trouve(nom_normalized, suggestions_cocktails)
+        return self._cocktail_en_dict(cocktail)
+
+    async def get_cocktail_by_name_async(self, nom_cocktail: str) -> dict:
+        """Version asynchrone de get_cocktail_by_name."""
+        nom_normalized = normalize_ingredient_name(nom_cocktail)
+
+        cocktail = await self.cocktail_async_dao.rechercher_cocktail_par_nom(
+            nom_normalized,
+        )
+
+        if not cocktail:
+            suggestions_cocktails = (
+                await self.cocktail_async_dao.rechercher_cocktail_par_sequence_debut(
+                    nom_normalized[:3],
+                    5,
                 )
+            )
+            self._cocktail_non_trouve(nom_normalized, suggestions_cocktails)
+        return self._cocktail_en_dict(cocktail)
+
+    @staticmethod
+    def _cocktail_non_trouve(
+        nom_normalized: str,
+        suggestions_cocktails: list[Cocktail],
+    ) -> None:
+        """Lève CocktailNotFoundError, avec des suggestions s'il y en a."""
+        suggestions = [c.nom for c in suggestions_cocktails]
+        if len(suggestions_cocktails) == 0:
             raise CocktailNotFoundError(
-                message=f"Cocktail '{nom_normalized}' non trouvé. "
-                f"Vouliez-vous dire : {', '.join(suggestions[:3])} ?",
+                message=f"Cocktail '{nom_normalized}' non trouvé.",
             )
+        raise CocktailNotFoundError(
+            message=f"Cocktail '{nom_normalized}' non trouvé. "
+            f"Vouliez-vous dire : {', '.join(suggestions[:3])} ?",
+        )
+
+    @staticmethod
+    def _cocktail_en_dict(cocktail: Cocktail) -> dict:
+        """Convertit un Cocktail en dictionnaire de réponse."""
         return {
             "id_cocktail": cocktail.id_cocktail,
             "nom": cocktail.nom,
@@ -152,26 +186,44 @@ class AvisService:
 
         try:
             rows = self.avis_dao.get_avis_by_cocktail(cocktail["id_cocktail"])
+            return self._lignes_en_avis(rows)
+        except Exception as e:
+            raise ServiceError(
+                message=f"Erreur lors de la récupération des avis : {e}",
+            ) from e
 
-            return [
-                AvisResponse(
-                    id_utilisateur=row["id_utilisateur"],
-                    pseudo_utilisateur=row["pseudo_utilisateur"],
-                    id_cocktail=row["id_cocktail"],
-                    nom_cocktail=row["nom_cocktail"],
-                    note=row["note"],
-                    commentaire=row["commentaire"],
-                    favoris=row["favoris"],
-                    date_creation=row["date_creation"],
-                    date_modification=row["date_modification"],
-                )
-                for row in rows
-            ]
+    async def get_avis_cocktail_async(self, nom_cocktail: str) -> list[AvisResponse]:
+        """Version asynchrone de get_avis_cocktail."""
+        cocktail = await self.get_cocktail_by_name_async(nom_cocktail)
+
+        try:
+            rows = await self.avis_async_dao.get_avis_by_cocktail(
+                cocktail["id_cocktail"],
+            )
+            return self._lignes_en_avis(rows)
         except Exception as e:
             raise ServiceError(
                 message=f"Erreur lors de la récupération des avis : {e}",
             ) from e
 
+    @staticmethod
+    def _lignes_en_avis(rows: list[dict]) -> list[AvisResponse]:
+        """Convertit les lignes du DAO en AvisResponse."""
+        return [
+            AvisResponse(
+                id_utilisateur=row["id_utilisateur"],
+                pseudo_utilisateur=row["pseudo_utilisateur"],
+                id_cocktail=row["id_cocktail"],
+                nom_cocktail=row["nom_cocktail"],
+                note=row["note"],
+                commentaire=row["commentaire"],
+                favoris=row["favoris"],
+                date_creation=row["date_creation"],
+                date_modification=row["date_modification"],
+            )
+            for row in rows
+        ]
+
     def get_mes_avis_simple(self, id_utilisateur: int, pseudo: str) -> dict:
         """Récupère tous les avis d'un utilisateur (format simplifié).
 
@@ -195,6 +247,22 @@ class AvisService:
                 message=f"Erreur lors de la récupération des avis : {e}",
             ) from e
 
+        return self._formater_mes_avis(pseudo, rows)
+
+    async def get_mes_avis_simple_async(self, id_utilisateur: int, pseudo: str) -> dict:
+        """Version asynchrone de get_mes_avis_simple."""
+        try:
+            rows = await self.avis_async_dao.get_avis_by_user(id_utilisateur)
+        except Exception as e:
+            raise ServiceError(
+                message=f"Erreur lors de la récupération des avis : {e}",
+            ) from e
+
+        return self._formater_mes_avis(pseudo, rows)
+
+    @staticmethod
+    def _formater_mes_avis(pseudo: str, rows: list[dict]) -> dict:
+        """Construit la réponse simplifiée des avis d'un utilisateur."""
         avis = [
             {
                 "nom_cocktail": row["nom_cocktail"],
@@ -401,3 +469,23 @@ class AvisService:
             )
 
         return AvisSummary(**result)
+
+    async def get_avis_summary_async(self, nom_cocktail: str) -> AvisSummary:
+        """Version asynchrone de get_avis_summary."""
+        cocktail = await self.get_cocktail_by_name_async(nom_cocktail)
+
+        try:
+            result = await self.avis_async_dao.get_avis_summary(
+                cocktail["id_cocktail"],
+            )
+
+        except Exception as e:
+            raise ServiceError(
+                message=f"Erreur lors de la récupération du résumé : {e}",
+            ) from e
+        if not result:
+            raise ServiceError(
+                message=f"Impossible de récupérer le résumé pour '{cocktail['nom']}'",
+            )
+
+        return AvisSummary(**result)
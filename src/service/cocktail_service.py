@@ -1,16 +1,32 @@
 """Couche service pour les opérations sur les cocktails."""
 
+import heapq
+from functools import partial
+from operator import itemgetter
+
 from src.business_object.cocktail import Cocktail
-from src.dao.cocktail_dao import CocktailDAO
-from src.dao.instruction_dao import InstructionDAO
-from src.dao.stock_dao import StockDAO
+from src.dao.cache_realisables import CacheRealisables
+from src.dao.cocktail_dao import AsyncCocktailDAO, CocktailDAO
+from src.dao.index_recettes import Faisabilite, IndexRecettes, InstantaneIndex
+from src.dao.instruction_dao import AsyncInstructionDAO, InstructionDAO
+from src.dao.stock_dao import AsyncStockDAO, StockDAO
 from src.utils.conversion_unite import UnitConverter
 from src.utils.exceptions import (
     CocktailSearchError,
     DAOError,
     EmptyFieldError,
+    InstructionError,
     ServiceError,
 )
+from src.utils.facettes import Selection
+from src.utils.pagination import (
+    TYPES_CATALOGUE,
+    TYPES_RECHERCHE_TEXTE,
+    cle_quasi_realisable,
+    decoder_curseur,
+    encoder_curseur,
+)
+from src.utils.settings import settings
 
 
 class CocktailService:
@@ -21,6 +37,9 @@ class CocktailService:
         self.cocktail_dao = cocktail_dao
         self.stock_dao = StockDAO()
         self.instruction_dao = InstructionDAO()
+        self.cocktail_async_dao = AsyncCocktailDAO()
+        self.stock_async_dao = AsyncStockDAO()
+        self.instruction_async_dao = AsyncInstructionDAO()
 
     def rechercher_cocktail_par_nom(self, nom: str) -> Cocktail:
         """Recherche un cocktail par son nom.
@@ -45,24 +64,48 @@ class CocktailService:
             L'objet Cocktail correspondant au nom fourni.
 
         """
-        if not nom:
-            raise EmptyFieldError(nom)
+        self._valider_nom(nom)
 
-        if not isinstance(nom, str):
+        cocktail = self.cocktail_dao.rechercher_cocktail_par_nom(nom)
+
+        if cocktail is None:
             raise CocktailSearchError(
-                message="Le nom du cocktail doit être une chaîne de caractères.",
+                message=f"Aucun cocktail trouvé pour le nom '{nom}'",
             )
+        instructions = self.instruction_dao.get_instruction(cocktail.id_cocktail)
 
-        cocktail = self.cocktail_dao.rechercher_cocktail_par_nom(nom)
+        return cocktail, instructions
+
+    async def rechercher_cocktail_par_nom_async(
+        self,
+        nom: str,
+    ) -> tuple[Cocktail, str | None]:
+        """Version asynchrone de rechercher_cocktail_par_nom."""
+        self._valider_nom(nom)
+
+        cocktail = await self.cocktail_async_dao.rechercher_cocktail_par_nom(nom)
 
         if cocktail is None:
             raise CocktailSearchError(
                 message=f"Aucun cocktail trouvé pour le nom '{nom}'",
             )
-        instructions = self.instruction_dao.get_instruction(cocktail.id_cocktail)
+        instructions = await self.instruction_async_dao.get_instruction(
+            cocktail.id_cocktail,
+        )
 
         return cocktail, instructions
 
+    @staticmethod
+    def _valider_nom(nom: str) -> None:
+        """Vérifie que le nom recherché est une chaîne non vide."""
+        if not nom:
+            raise EmptyFieldError(nom)
+
+        if not isinstance(nom, str):
+            raise CocktailSearchError(
+                message="Le nom du cocktail doit être une chaîne de caractères.",
+            )
+
     def rechercher_cocktail_par_sequence_debut(
         self,
         sequence: str,
@@ -94,6 +137,57 @@ class CocktailService:
             Liste de cocktails commençant par la séquence fournie.
 
         """
+        self._valider_sequence(sequence, max_resultats)
+
+        cocktails = self.cocktail_dao.rechercher_cocktail_par_sequence_debut(
+            sequence,
+            max_resultats,
+        )
+
+        if not cocktails:
+            raise CocktailSearchError(
+                message=f"Aucun cocktail trouvé pour la séquence '{sequence}'",
+            )
+
+        instructions = self.instruction_dao.get_instructions(
+            [cocktail.id_cocktail for cocktail in cocktails],
+        )
+
+        return [
+            (cocktail, instructions.get(cocktail.id_cocktail)) for cocktail in cocktails
+        ]
+
+    async def rechercher_cocktail_par_sequence_debut_async(
+        self,
+        sequence: str,
+        max_resultats: int = 10,
+    ) -> list[tuple[Cocktail, str | None]]:
+        """Version asynchrone de rechercher_cocktail_par_sequence_debut."""
+        self._valider_sequence(sequence, max_resultats)
+
+        cocktails = (
+            await self.cocktail_async_dao.rechercher_cocktail_par_sequence_debut(
+                sequence,
+                max_resultats,
+            )
+        )
+
+        if not cocktails:
+            raise CocktailSearchError(
+                message=f"Aucun cocktail trouvé pour la séquence '{sequence}'",
+            )
+
+        instructions = await self.instruction_async_dao.get_instructions(
+            [cocktail.id_cocktail for cocktail in cocktails],
+        )
+
+        return [
+            (cocktail, instructions.get(cocktail.id_cocktail)) for cocktail in cocktails
+        ]
+
+    @staticmethod
+    def _valider_sequence(sequence: str, max_resultats: int) -> None:
+        """Vérifie les paramètres d'une recherche par séquence."""
         if not sequence:
             raise EmptyFieldError(sequence)
 
@@ -112,234 +206,513 @@ class CocktailService:
                 message="L'argument 'max_resultats' doit être supérieur ou égal à 1.",
             )
 
-        cocktails = self.cocktail_dao.rechercher_cocktail_par_sequence_debut(
-            sequence,
-            max_resultats,
-        )
-
-        if not cocktails:
-            raise CocktailSearchError(
-                message=f"Aucun cocktail trouvé pour la séquence '{sequence}'",
-            )
-
-        cocktails_avec_instructions = []
-        for cocktail in cocktails:
-            instructions = self.instruction_dao.get_instruction(cocktail.id_cocktail)
-            cocktails_avec_instructions.append((cocktail, instructions))
-
-        return cocktails_avec_instructions
-
-    def get_cocktails_realisables(self, id_utilisateur: int) -> dict:
-        """Récupère les cocktails réalisables avec le stock actuel.
+    def rechercher_plein_texte(
+        self,
+        texte: str,
+        langue: str = "en",
+        limit: int = 20,
+        curseur: str | None = None,
+    ) -> dict:
+        """Recherche classée dans les noms, ingrédients et instructions.
 
-        Compare le stock de l'utilisateur avec les ingrédients requis.
-        Utilise UnitConverter pour normaliser les unités avant comparaison.
+        Les cocktails sont classés par pertinence (un terme trouvé dans le nom
+        pèse plus que dans les ingrédients, puis que dans l'instruction) et
+        paginés sur la clé (rang, id_cocktail).
 
         Parameters
         ----------
-        id_utilisateur : int
-            ID de l'utilisateur
+        texte : str
+            Les termes recherchés ("mots exacts", or, -exclu)
+        langue : str
+            Langue des instructions et du dictionnaire (en, fr, es, ...)
+        limit : int
+            Taille de la page
+        curseur : str | None
+            Curseur_suivant retourné par la page précédente
 
         Returns
         -------
         dict
             Format: {
-                "cocktails_realisables": [...],
-                "nombre_cocktails": int
+                "resultats": [...],
+                "nombre_resultats": int,
+                "texte": str,
+                "langue": str,
+                "curseur_suivant": str | None
             }
 
         Raises
         ------
+        EmptyFieldError
+            Si le texte est vide
+        InvalidCursorError
+            Si le curseur est invalide
         ServiceError
-            En cas d'erreur de récupération
+            En cas d'erreur de recherche
 
         """
+        if not texte or not texte.strip():
+            raise EmptyFieldError(texte)
+        apres = decoder_curseur(curseur, TYPES_RECHERCHE_TEXTE) if curseur else None
         try:
-            stock_normalise = self._normaliser_stock(id_utilisateur)
-            cocktails_dict = self._construire_cocktails_avec_disponibilite(
-                stock_normalise,
+            resultats = self.instruction_dao.rechercher(
+                texte,
+                langue,
+                limite=limit + 1,
+                apres=apres,
             )
-            cocktails_realisables = self._filtrer_cocktails_realisables(cocktails_dict)
-
-            return {
-                "cocktails_realisables": cocktails_realisables,
-                "nombre_cocktails": len(cocktails_realisables),
-            }
-
         except DAOError as e:
             raise ServiceError(
-                message=f"Erreur lors de la récupération des cocktails "
-                f"réalisables : {e}",
+                message=f"Erreur lors de la recherche plein texte : {e}",
             ) from e
-        except Exception as e:
-            raise ServiceError(message=f"Erreur inattendue : {e}") from e
-
-    def _normaliser_stock(self, id_utilisateur: int) -> dict[int, float]:
-        """Normalise le stock de l'utilisateur en convertissant les unités.
+        return self._paginer_recherche(resultats, texte, langue, limit)
 
-        Parameters
-        ----------
-        id_utilisateur : int
-            ID de l'utilisateur
+    async def rechercher_plein_texte_async(
+        self,
+        texte: str,
+        langue: str = "en",
+        limit: int = 20,
+        curseur: str | None = None,
+    ) -> dict:
+        """Version asynchrone de rechercher_plein_texte."""
+        if not texte or not texte.strip():
+            raise EmptyFieldError(texte)
+        apres = decoder_curseur(curseur, TYPES_RECHERCHE_TEXTE) if curseur else None
+        try:
+            resultats = await self.instruction_async_dao.rechercher(
+                texte,
+                langue,
+                limite=limit + 1,
+                apres=apres,
+            )
+        except DAOError as e:
+            raise ServiceError(
+                message=f"Erreur lors de la recherche plein texte : {e}",
+            ) from e
+        return self._paginer_recherche(resultats, texte, langue, limit)
 
-        Returns
-        -------
-        dict[int, float]
-            Dictionnaire {id_ingredient: quantite_normalisee}
+    @staticmethod
+    def _paginer_recherche(
+        resultats: list[dict],
+        texte: str,
+        langue: str,
+        limit: int,
+    ) -> dict:
+        """Met en forme une page de résultats de la recherche plein texte.
 
+        Les résultats sont lus avec un élément de plus que la page : sa
+        présence indique qu'une page suivante existe.
         """
-        stock_rows = self.stock_dao.get_stock(id_utilisateur, only_available=True)
-        stock_normalise = {}
-
-        for row in stock_rows:
-            id_ingredient = row["id_ingredient"]
-            quantite = float(row["quantite"])
-            code_unite = row["code_unite"]
+        curseur_suivant = None
+        if len(resultats) > limit:
+            resultats = resultats[:limit]
+            dernier = resultats[-1]
+            curseur_suivant = encoder_curseur(
+                (float(dernier["rang"]), dernier["id_cocktail"]),
+            )
 
-            quantite_normalisee = self._convertir_quantite(quantite, code_unite)
-            if quantite_normalisee is not None:
-                stock_normalise[id_ingredient] = quantite_normalisee
+        return {
+            "resultats": [dict(resultat) for resultat in resultats],
+            "nombre_resultats": len(resultats),
+            "texte": texte,
+            "langue": langue,
+            "curseur_suivant": curseur_suivant,
+        }
 
-        return stock_normalise
+    def parcourir_catalogue(
+        self,
+        selection: Selection,
+        limit: int = 20,
+        curseur: str | None = None,
+    ) -> dict:
+        """Parcourt le catalogue filtré par facettes et par ingrédients.
 
-    @staticmethod
-    def _convertir_quantite(quantite: float, unite: str | None) -> float | None:
-        """Convertit une quantité vers son unité normalisée (ml ou g).
+        La sélection et le nombre de cocktails de chaque valeur de facette
+        sont calculés sur les bitmaps de l'index des recettes (voir
+        CatalogueFacettes), sans requête tant que l'index est à jour.
 
         Parameters
         ----------
-        quantite : float
-            Quantité à convertir
-        unite : str | None
-            Unité de la quantité
+        selection : Selection
+            Catégories, verres, alcool, ingrédients requis et exclus
+        limit : int
+            Taille de la page
+        curseur : str | None
+            Curseur_suivant retourné par la page précédente
 
         Returns
         -------
-        float | None
-            Quantité convertie ou None si conversion impossible
+        dict
+            Format: {
+                "cocktails": [...],
+                "nombre_cocktails": int,
+                "facettes": {"categorie": [{"valeur", "nombre"}], ...},
+                "curseur_suivant": str | None
+            }
+
+        Raises
+        ------
+        InvalidCursorError
+            Si le curseur est invalide
+        ServiceError
+            En cas d'erreur de chargement du catalogue
 
         """
-        if not unite:
-            return quantite
+        apres = decoder_curseur(curseur, TYPES_CATALOGUE) if curseur else None
+        try:
+            index = IndexRecettes().obtenir(
+                self.cocktail_dao.get_tous_cocktails_avec_ingredients,
+            )
+        except DAOError as e:
+            raise ServiceError(
+                message=f"Erreur lors du chargement du catalogue : {e}",
+            ) from e
+        return self._page_catalogue(index, selection, limit, apres)
 
-        if UnitConverter.is_liquid_unit(unite):
-            return UnitConverter.convert_to_ml(quantite, unite)
+    async def parcourir_catalogue_async(
+        self,
+        selection: Selection,
+        limit: int = 20,
+        curseur: str | None = None,
+    ) -> dict:
+        """Version asynchrone de parcourir_catalogue."""
+        apres = decoder_curseur(curseur, TYPES_CATALOGUE) if curseur else None
+        try:
+            index = await IndexRecettes().obtenir_async(
+                self.cocktail_async_dao.get_tous_cocktails_avec_ingredients,
+            )
+        except DAOError as e:
+            raise ServiceError(
+                message=f"Erreur lors du chargement du catalogue : {e}",
+            ) from e
+        return self._page_catalogue(index, selection, limit, apres)
 
-        if UnitConverter.is_solid_unit(unite):
-            return UnitConverter.convert_to_g(quantite, unite)
+    @staticmethod
+    def _page_catalogue(
+        index: InstantaneIndex,
+        selection: Selection,
+        limit: int,
+        apres: tuple[str, int] | None,
+    ) -> dict:
+        """Met en forme une page du catalogue et les comptes des facettes."""
+        facettes = index.facettes
+        cocktails, nombre_cocktails = facettes.parcourir(selection, limit + 1, apres)
+        curseur_suivant = None
+        if len(cocktails) > limit:
+            cocktails = cocktails[:limit]
+            curseur_suivant = encoder_curseur(
+                (cocktails[-1]["nom"], cocktails[-1]["id_cocktail"]),
+            )
 
-        # Unité spéciale ou inconnue
-        return quantite
+        return {
+            "cocktails": [dict(cocktail) for cocktail in cocktails],
+            "nombre_cocktails": nombre_cocktails,
+            "facettes": facettes.compter(selection),
+            "curseur_suivant": curseur_suivant,
+        }
 
-    def _construire_cocktails_avec_disponibilite(
+    def tirer_cocktails_aleatoires(
         self,
-        stock_normalise: dict[int, float],
+        nombre: int = 1,
+        selection: Selection | None = None,
+        id_utilisateur: int | None = None,
+        max_ingredients_manquants: int = 0,
     ) -> dict:
-        """Construit un dictionnaire des cocktails avec leur disponibilité.
+        """Tire au hasard des cocktails distincts, avec leurs instructions.
+
+        Sans filtre, le tirage est fait dans les identifiants de l'index des
+        noms ; avec des facettes ou un utilisateur, dans le bitmap des cocktails
+        retenus (voir CatalogueFacettes), sans trier ni parcourir la table.
 
         Parameters
         ----------
-        stock_normalise : dict[int, float]
-            Stock normalisé de l'utilisateur
+        nombre : int
+            Nombre de cocktails (moins si peu de cocktails sont retenus)
+        selection : Selection | None
+            Facettes et ingrédients requis ou exclus
+        id_utilisateur : int | None
+            Utilisateur dont le stock doit permettre de réaliser les cocktails
+        max_ingredients_manquants : int
+            Nombre d'ingrédients qui peuvent manquer au stock de l'utilisateur
 
         Returns
         -------
         dict
-            Dictionnaire des cocktails avec leurs informations et disponibilité
+            Format: {"cocktails": [...], "nombre_cocktails": int}
+
+        Raises
+        ------
+        ServiceError
+            En cas d'erreur de récupération
 
         """
-        cocktails_rows = self.cocktail_dao.get_tous_cocktails_avec_ingredients()
-        cocktails_dict = {}
+        try:
+            cocktails = self._tirer(
+                nombre,
+                selection,
+                id_utilisateur,
+                max_ingredients_manquants,
+            )
+            instructions = self.instruction_dao.get_instructions(
+                [cocktail["id_cocktail"] for cocktail in cocktails],
+            )
+        except (DAOError, InstructionError) as e:
+            raise ServiceError(
+                message=f"Erreur lors du tirage des cocktails : {e}",
+            ) from e
+        return self._formater_tirage(cocktails, instructions)
 
-        for row in cocktails_rows:
-            id_cocktail = row["id_cocktail"]
+    async def tirer_cocktails_aleatoires_async(
+        self,
+        nombre: int = 1,
+        selection: Selection | None = None,
+        id_utilisateur: int | None = None,
+        max_ingredients_manquants: int = 0,
+    ) -> dict:
+        """Version asynchrone de tirer_cocktails_aleatoires."""
+        try:
+            cocktails = await self._tirer_async(
+                nombre,
+                selection,
+                id_utilisateur,
+                max_ingredients_manquants,
+            )
+            instructions = await self.instruction_async_dao.get_instructions(
+                [cocktail["id_cocktail"] for cocktail in cocktails],
+            )
+        except (DAOError, InstructionError) as e:
+            raise ServiceError(
+                message=f"Erreur lors du tirage des cocktails : {e}",
+            ) from e
+        return self._formater_tirage(cocktails, instructions)
 
-            # Initialiser le cocktail s'il n'existe pas encore
-            if id_cocktail not in cocktails_dict:
-                cocktails_dict[id_cocktail] = {
-                    "info": {
-                        "id_cocktail": id_cocktail,
-                        "nom": row["nom"],
-                        "categorie": row["categorie"],
-                        "verre": row["verre"],
-                        "alcool": row["alcool"],
-                        "image": row["image"],
-                    },
-                    "realisable": True,
-                }
+    def _tirer(
+        self,
+        nombre: int,
+        selection: Selection | None,
+        id_utilisateur: int | None,
+        max_ingredients_manquants: int,
+    ) -> list[dict]:
+        """Tire les cocktails de tirer_cocktails_aleatoires."""
+        if id_utilisateur is None and not any(selection or ()):
+            return [
+                vars(cocktail)
+                for cocktail in self.cocktail_dao.rechercher_cocktails_aleatoires(
+                    nombre,
+                )
+            ]
+        faisabilite = None
+        if id_utilisateur is None:
+            index = IndexRecettes().obtenir(
+                self.cocktail_dao.get_tous_cocktails_avec_ingredients,
+            )
+        else:
+            index, faisabilite = self._evaluer_stock(id_utilisateur)
+        return self._tirer_dans_index(
+            index,
+            nombre,
+            selection,
+            faisabilite,
+            max_ingredients_manquants,
+        )
 
-            # Vérifier la disponibilité de l'ingrédient
-            if row["id_ingredient"]:
-                est_disponible = self._verifier_ingredient_disponible(
-                    row,
-                    stock_normalise,
+    async def _tirer_async(
+        self,
+        nombre: int,
+        selection: Selection | None,
+        id_utilisateur: int | None,
+        max_ingredients_manquants: int,
+    ) -> list[dict]:
+        """Version asynchrone de _tirer."""
+        if id_utilisateur is None and not any(selection or ()):
+            return [
+                vars(cocktail)
+                for cocktail in (
+                    await self.cocktail_async_dao.rechercher_cocktails_aleatoires(
+                        nombre,
+                    )
                 )
-                if not est_disponible:
-                    cocktails_dict[id_cocktail]["realisable"] = False
+            ]
+        faisabilite = None
+        if id_utilisateur is None:
+            index = await IndexRecettes().obtenir_async(
+                self.cocktail_async_dao.get_tous_cocktails_avec_ingredients,
+            )
+        else:
+            index, faisabilite = await self._evaluer_stock_async(id_utilisateur)
+        return self._tirer_dans_index(
+            index,
+            nombre,
+            selection,
+            faisabilite,
+            max_ingredients_manquants,
+        )
 
-        return cocktails_dict
+    @staticmethod
+    def _tirer_dans_index(
+        index: InstantaneIndex,
+        nombre: int,
+        selection: Selection | None,
+        faisabilite: Faisabilite | None,
+        max_ingredients_manquants: int,
+    ) -> list[dict]:
+        """Tire des cocktails parmi ceux retenus par les facettes et le stock."""
+        masque = index.facettes.masque(selection or Selection())
+        if faisabilite is not None:
+            masque &= index.bitmap_faisables(faisabilite, max_ingredients_manquants)
+        return index.facettes.tirer(masque, nombre)
 
-    def _verifier_ingredient_disponible(
-        self,
-        row: dict,
-        stock_normalise: dict[int, float],
-    ) -> bool:
-        """Vérifie si un ingrédient est disponible en quantité suffisante.
+    @staticmethod
+    def _formater_tirage(cocktails: list[dict], instructions: dict) -> dict:
+        """Met en forme des cocktails tirés au hasard avec leurs instructions."""
+        return {
+            "cocktails": [
+                {
+                    "id_cocktail": cocktail["id_cocktail"],
+                    "nom": cocktail["nom"],
+                    "categorie": cocktail["categorie"],
+                    "verre": cocktail["verre"],
+                    "alcool": cocktail["alcool"],
+                    "image": cocktail["image"],
+                    "instructions": instructions.get(cocktail["id_cocktail"]),
+                }
+                for cocktail in cocktails
+            ],
+            "nombre_cocktails": len(cocktails),
+        }
+
+    def get_cocktails_realisables(self, id_utilisateur: int) -> dict:
+        """Récupère les cocktails réalisables avec le stock actuel.
+
+        Compare le stock de l'utilisateur avec les ingrédients requis de tout
+        le catalogue en une seule opération vectorisée (voir IndexRecettes),
+        avec les mêmes règles de conversion d'unités que
+        is_ingredient_available.
 
         Parameters
         ----------
-        row : dict
-            Ligne contenant les informations de l'ingrédient requis
-        stock_normalise : dict[int, float]
-            Stock normalisé de l'utilisateur
+        id_utilisateur : int
+            ID de l'utilisateur
 
         Returns
         -------
-        bool
-            True si l'ingrédient est disponible, False sinon
+        dict
+            Format: {
+                "cocktails_realisables": [...],
+                "nombre_cocktails": int
+            }
+
+        Raises
+        ------
+        ServiceError
+            En cas d'erreur de récupération
 
         """
-        id_ingredient = row["id_ingredient"]
-        qte_requise = float(row["qte"]) if row["qte"] else 0
-        unite_requise = row["unite"]
+        try:
+            index, faisabilite = self._evaluer_stock(id_utilisateur)
+            cocktails_realisables = index.cocktails_realisables(faisabilite)
 
-        # Convertir la quantité requise
-        qte_requise_normalisee = self._convertir_quantite(qte_requise, unite_requise)
+            return {
+                "cocktails_realisables": cocktails_realisables,
+                "nombre_cocktails": len(cocktails_realisables),
+            }
 
-        # Vérifier la disponibilité dans le stock
-        if id_ingredient not in stock_normalise:
-            return False
+        except DAOError as e:
+            raise ServiceError(
+                message=f"Erreur lors de la récupération des cocktails "
+                f"réalisables : {e}",
+            ) from e
+        except Exception as e:
+            raise ServiceError(message=f"Erreur inattendue : {e}") from e
 
-        if qte_requise_normalisee is None:
-            return True
+    async def get_cocktails_realisables_async(self, id_utilisateur: int) -> dict:
+        """Version asynchrone de get_cocktails_realisables."""
+        try:
+            index, faisabilite = await self._evaluer_stock_async(id_utilisateur)
+            cocktails_realisables = index.cocktails_realisables(faisabilite)
 
-        return stock_normalise[id_ingredient] >= qte_requise_normalisee
+            return {
+                "cocktails_realisables": cocktails_realisables,
+                "nombre_cocktails": len(cocktails_realisables),
+            }
 
-    @staticmethod
-    def _filtrer_cocktails_realisables(cocktails_dict: dict) -> list[dict]:
-        """Filtre et retourne uniquement les cocktails réalisables.
+        except DAOError as e:
+            raise ServiceError(
+                message=f"Erreur lors de la récupération des cocktails "
+                f"réalisables : {e}",
+            ) from e
+        except Exception as e:
+            raise ServiceError(message=f"Erreur inattendue : {e}") from e
+
+    def _evaluer_stock(
+        self,
+        id_utilisateur: int,
+    ) -> tuple[InstantaneIndex, Faisabilite]:
+        """Évalue le catalogue pour le stock d'un utilisateur.
+
+        L'évaluation est mémorisée par CacheRealisables jusqu'à la prochaine
+        modification du stock : le stock n'est alors relu que si elle est
+        périmée, et seuls les ingrédients modifiés sont réévalués.
 
         Parameters
         ----------
-        cocktails_dict : dict
-            Dictionnaire des cocktails avec leur disponibilité
+        id_utilisateur : int
+            ID de l'utilisateur
 
         Returns
         -------
-        list[dict]
-            Liste des cocktails réalisables
+        tuple[InstantaneIndex, Faisabilite]
+            L'index des recettes et l'évaluation du stock
 
         """
-        return [data["info"] for data in cocktails_dict.values() if data["realisable"]]
+        index = IndexRecettes().obtenir(
+            self.cocktail_dao.get_tous_cocktails_avec_ingredients,
+        )
+        faisabilite = CacheRealisables().obtenir(
+            id_utilisateur,
+            index,
+            partial(self.stock_dao.get_stock, id_utilisateur, only_available=True),
+        )
+        return index, faisabilite
+
+    async def _evaluer_stock_async(
+        self,
+        id_utilisateur: int,
+    ) -> tuple[InstantaneIndex, Faisabilite]:
+        """Version asynchrone de _evaluer_stock."""
+        index = await IndexRecettes().obtenir_async(
+            self.cocktail_async_dao.get_tous_cocktails_avec_ingredients,
+        )
+        faisabilite = await CacheRealisables().obtenir_async(
+            id_utilisateur,
+            index,
+            partial(
+                self.stock_async_dao.get_stock,
+                id_utilisateur,
+                only_available=True,
+            ),
+        )
+        return index, faisabilite
 
     def get_cocktails_quasi_realisables(
         self,
         id_utilisateur: int,
         max_ingredients_manquants: int = 3,
+        *,
+        limit: int | None = None,
+        curseur: str | None = None,
     ) -> dict:
         """Récupère les cocktails réalisables avec peu d'ingrédients manquants.
 
-        Utilise UnitConverter pour gérer les conversions d'unités côté Python.
+        Les ingrédients manquants de tous les cocktails sont comptés en une
+        seule opération vectorisée (voir IndexRecettes), avec les règles de
+        is_ingredient_available. Si QUASI_REALISABLES_ENGINE vaut "sql", le
+        décompte est fait par la base et seuls les cocktails retenus sont lus
+        (voir CocktailDAO.calculer_cocktails_quasi_realisables).
+
+        Avec limit, seule une page est retournée : les cocktails suivant le
+        curseur sont sélectionnés sur la clé de tri (manquants, -pourcentage,
+        nom, id_cocktail) sans trier tout le résultat.
 
         Parameters
         ----------
@@ -347,6 +720,10 @@ class CocktailService:
             ID de l'utilisateur
         max_ingredients_manquants : int
             Nombre maximum d'ingrédients manquants (défaut: 3)
+        limit : int | None
+            Taille de la page (None : tous les cocktails)
+        curseur : str | None
+            Curseur_suivant retourné par la page précédente
 
         Returns
         -------
@@ -354,29 +731,47 @@ class CocktailService:
             Format: {
                 "cocktails_quasi_realisables": [...],
                 "nombre_cocktails": int,
-                "max_ingredients_manquants": int
+                "max_ingredients_manquants": int,
+                "curseur_suivant": str | None
             }
 
         Raises
         ------
+        InvalidCursorError
+            Si le curseur est invalide
         ServiceError
             En cas d'erreur de récupération
 
         """
+        apres = decoder_curseur(curseur) if curseur else None
         try:
-            rows = self.cocktail_dao.get_cocktails_quasi_realisables(id_utilisateur)
-            cocktails_dict = self.build_cocktails_dict(rows)
-            cocktails_quasi_realisables = self.filter_and_format_cocktails(
-                cocktails_dict,
+            if settings.QUASI_REALISABLES_ENGINE == "sql":
+                cocktails_quasi_realisables = (
+                    self.cocktail_dao.calculer_cocktails_quasi_realisables(
+                        id_utilisateur,
+                        max_ingredients_manquants,
+                        limit=limit + 1 if limit else None,
+                        apres=apres,
+                    )
+                )
+            else:
+                index, faisabilite = self._evaluer_stock(id_utilisateur)
+                cocktails_quasi_realisables = self.filter_and_format_cocktails(
+                    index.cocktails_quasi_realisables(
+                        faisabilite,
+                        max_ingredients_manquants,
+                    ),
+                    max_ingredients_manquants,
+                    limit=limit + 1 if limit else None,
+                    apres=apres,
+                )
+
+            return self._paginer_quasi_realisables(
+                cocktails_quasi_realisables,
                 max_ingredients_manquants,
+                limit,
             )
 
-            return {
-                "cocktails_quasi_realisables": cocktails_quasi_realisables,
-                "nombre_cocktails": len(cocktails_quasi_realisables),
-                "max_ingredients_manquants": max_ingredients_manquants,
-            }
-
         except DAOError as e:
             raise ServiceError(
                 message=(
@@ -387,6 +782,156 @@ class CocktailService:
         except Exception as e:
             raise ServiceError(message=f"Erreur inattendue : {e}") from e
 
+    async def get_cocktails_quasi_realisables_async(
+        self,
+        id_utilisateur: int,
+        max_ingredients_manquants: int = 3,
+        *,
+        limit: int | None = None,
+        curseur: str | None = None,
+    ) -> dict:
+        """Version asynchrone de get_cocktails_quasi_realisables."""
+        apres = decoder_curseur(curseur) if curseur else None
+        try:
+            if settings.QUASI_REALISABLES_ENGINE == "sql":
+                cocktails_quasi_realisables = (
+                    await self.cocktail_async_dao.calculer_cocktails_quasi_realisables(
+                        id_utilisateur,
+                        max_ingredients_manquants,
+                        limit=limit + 1 if limit else None,
+                        apres=apres,
+                    )
+                )
+            else:
+                index, faisabilite = await self._evaluer_stock_async(id_utilisateur)
+                cocktails_quasi_realisables = self.filter_and_format_cocktails(
+                    index.cocktails_quasi_realisables(
+                        faisabilite,
+                        max_ingredients_manquants,
+                    ),
+                    max_ingredients_manquants,
+                    limit=limit + 1 if limit else None,
+                    apres=apres,
+                )
+
+            return self._paginer_quasi_realisables(
+                cocktails_quasi_realisables,
+                max_ingredients_manquants,
+                limit,
+            )
+
+        except DAOError as e:
+            raise ServiceError(
+                message=(
+                    f"Erreur lors de la récupération des cocktails quasi-réalisables :"
+                    f"{e}"
+                ),
+            ) from e
+        except Exception as e:
+            raise ServiceError(message=f"Erreur inattendue : {e}") from e
+
+    @staticmethod
+    def _paginer_quasi_realisables(
+        cocktails: list[dict],
+        max_ingredients_manquants: int,
+        limit: int | None,
+    ) -> dict:
+        """Met en forme une page de cocktails quasi-réalisables.
+
+        Les cocktails sont lus avec un élément de plus que la page : sa
+        présence indique qu'une page suivante existe.
+        """
+        curseur_suivant = None
+        if limit is not None and len(cocktails) > limit:
+            cocktails = cocktails[:limit]
+            curseur_suivant = encoder_curseur(cle_quasi_realisable(cocktails[-1]))
+
+        return {
+            "cocktails_quasi_realisables": cocktails,
+            "nombre_cocktails": len(cocktails),
+            "max_ingredients_manquants": max_ingredients_manquants,
+            "curseur_suivant": curseur_suivant,
+        }
+
+    def get_meilleurs_achats(self, id_utilisateur: int, nb_achats: int = 3) -> dict:
+        """Détermine les ingrédients à acheter pour débloquer le plus de cocktails.
+
+        Les ingrédients manquants des cocktails quasi-réalisables sont codés en
+        bitsets et choisis par couverture maximale gloutonne (voir
+        InstantaneIndex.meilleurs_achats), sur l'évaluation mise en cache du
+        stock de l'utilisateur.
+
+        Parameters
+        ----------
+        id_utilisateur : int
+            ID de l'utilisateur
+        nb_achats : int
+            Nombre maximum d'ingrédients à acheter (défaut: 3)
+
+        Returns
+        -------
+        dict
+            Format: {
+                "ingredients_a_acheter": [{"id_ingredient": int, "nom": str}],
+                "cocktails_debloques": [...],
+                "nombre_cocktails_debloques": int,
+                "nb_achats": int
+            }
+
+        Raises
+        ------
+        ServiceError
+            En cas d'erreur de récupération
+
+        """
+        try:
+            index, faisabilite = self._evaluer_stock(id_utilisateur)
+            return self._formater_achats(
+                *index.meilleurs_achats(faisabilite, nb_achats),
+                nb_achats,
+            )
+
+        except DAOError as e:
+            raise ServiceError(
+                message=f"Erreur lors du calcul des meilleurs achats : {e}",
+            ) from e
+        except Exception as e:
+            raise ServiceError(message=f"Erreur inattendue : {e}") from e
+
+    async def get_meilleurs_achats_async(
+        self,
+        id_utilisateur: int,
+        nb_achats: int = 3,
+    ) -> dict:
+        """Version asynchrone de get_meilleurs_achats."""
+        try:
+            index, faisabilite = await self._evaluer_stock_async(id_utilisateur)
+            return self._formater_achats(
+                *index.meilleurs_achats(faisabilite, nb_achats),
+                nb_achats,
+            )
+
+        except DAOError as e:
+            raise ServiceError(
+                message=f"Erreur lors du calcul des meilleurs achats : {e}",
+            ) from e
+        except Exception as e:
+            raise ServiceError(message=f"Erreur inattendue : {e}") from e
+
+    @staticmethod
+    def _formater_achats(
+        ingredients: list[dict],
+        cocktails: list[dict],
+        nb_achats: int,
+    ) -> dict:
+        """Met en forme la réponse de get_meilleurs_achats."""
+        return {
+            "ingredients_a_acheter": ingredients,
+            "cocktails_debloques": cocktails,
+            "nombre_cocktails_debloques": len(cocktails),
+            "nb_achats": nb_achats,
+        }
+
     def build_cocktails_dict(self, rows: list[dict]) -> dict:
         """Construit le dictionnaire des cocktails avec leurs ingrédients.
 
@@ -572,11 +1117,16 @@ class CocktailService:
     def filter_and_format_cocktails(
         cocktails_dict: dict,
         max_ingredients_manquants: int,
+        *,
+        limit: int | None = None,
+        apres: tuple | None = None,
     ) -> list[dict]:
         """Filtre et formate les cocktails selon le nombre d'ingrédients manquants.
 
         Sélectionne les cocktails ayant entre 1 et max_ingredients_manquants ingrédients
         manquants, calcule le pourcentage de possession et trie les résultats.
+        Avec limit, seuls les limit premiers sont sélectionnés (tas de taille
+        limit, sans trier tous les cocktails) et mis en forme.
 
         Parameters
         ----------
@@ -584,6 +1134,10 @@ class CocktailService:
             Dictionnaire des cocktails construit par _build_cocktails_dict
         max_ingredients_manquants : int
             Nombre maximum d'ingrédients manquants autorisés
+        limit : int | None
+            Nombre maximum de cocktails retournés (None : tous)
+        apres : tuple | None
+            Clé de tri (voir cle_quasi_realisable) après laquelle commencer
 
         Returns
         -------
@@ -592,39 +1146,43 @@ class CocktailService:
             1. Nombre d'ingrédients manquants (croissant)
             2. Pourcentage de possession (décroissant)
             3. Nom (alphabétique)
+            4. ID du cocktail (pour départager les homonymes)
             Chaque dictionnaire contient : toutes les infos du cocktail,
             ingredients_manquants, nombre_ingredients_manquants,
             nombre_ingredients_total, pourcentage_possession
 
         """
-        cocktails_quasi_realisables = []
-
+        candidats = []
         for data in cocktails_dict.values():
             nb_manquants = len(data["ingredients_manquants"])
             nb_total = data["total_ingredients"]
 
             if 0 < nb_manquants <= max_ingredients_manquants and nb_total > 0:
                 pourcentage = round(100.0 * (nb_total - nb_manquants) / nb_total, 2)
-
-                cocktails_quasi_realisables.append(
-                    {
-                        **data["info"],
-                        "ingredients_manquants": data["ingredients_manquants"],
-                        "nombre_ingredients_manquants": nb_manquants,
-                        "nombre_ingredients_total": nb_total,
-                        "pourcentage_possession": pourcentage,
-                    },
+                cle = (
+                    nb_manquants,
+                    -pourcentage,
+                    data["info"]["nom"],
+                    data["info"]["id_cocktail"],
                 )
-
-        cocktails_quasi_realisables.sort(
-            key=lambda x: (
-                x["nombre_ingredients_manquants"],
-                -x["pourcentage_possession"],
-                x["nom"],
-            ),
-        )
-
-        return cocktails_quasi_realisables
+                if apres is None or cle > apres:
+                    candidats.append((cle, data))
+
+        if limit is None:
+            candidats.sort(key=itemgetter(0))
+        else:
+            candidats = heapq.nsmallest(limit, candidats, key=itemgetter(0))
+
+        return [
+            {
+                **data["info"],
+                "ingredients_manquants": data["ingredients_manquants"],
+                "nombre_ingredients_manquants": nb_manquants,
+                "nombre_ingredients_total": data["total_ingredients"],
+                "pourcentage_possession": -pourcentage_negatif,
+            }
+            for (nb_manquants, pourcentage_negatif, _, _), data in candidats
+        ]
 
     def get_instruction(self, nom_cocktail: str) -> str | None:
         """Récupère les instructions de préparation d'un cocktail."""
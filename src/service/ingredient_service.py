@@ -1,6 +1,6 @@
 """Couche service pour les opérations sur les ingrédients."""
 
-from src.dao.ingredient_dao import IngredientDAO
+from src.dao.ingredient_dao import AsyncIngredientDAO, IngredientDAO
 from src.utils.exceptions import IngredientNotFoundError, ServiceError
 from src.utils.log_decorator import log
 from src.utils.text_utils import normalize_ingredient_name
@@ -12,6 +12,7 @@ class IngredientService:
     def __init__(self) -> None:
         """Initialise un IngredientService."""
         self.dao = IngredientDAO()
+        self.async_dao = AsyncIngredientDAO()
 
     def check_if_alcoholic(self, ingredient_id: int) -> dict:
         """Vérifie si un ingrédient contient de l'alcool par son identifiant.
@@ -73,7 +74,20 @@ class IngredientService:
 
         """
         is_alcoholic = self.dao.is_alcoholic_by_name(ingredient_name)
-
+        return self._reponse_alcool_par_nom(ingredient_name, is_alcoholic=is_alcoholic)
+
+    async def check_if_alcoholic_by_name_async(self, ingredient_name: str) -> dict:
+        """Version asynchrone de check_if_alcoholic_by_name."""
+        is_alcoholic = await self.async_dao.is_alcoholic_by_name(ingredient_name)
+        return self._reponse_alcool_par_nom(ingredient_name, is_alcoholic=is_alcoholic)
+
+    @staticmethod
+    def _reponse_alcool_par_nom(
+        ingredient_name: str,
+        *,
+        is_alcoholic: bool | None,
+    ) -> dict:
+        """Construit la réponse de check_if_alcoholic_by_name."""
         if is_alcoholic is None:
             raise IngredientNotFoundError(
                 message=f"Ingrédient '{ingredient_name}' introuvable",
@@ -1,13 +1,14 @@
 """Couche service pour les opérations sur les listes de course."""
 
+from src.dao.cache_realisables import CacheRealisables
 from src.dao.ingredient_dao import IngredientDAO
 from src.dao.liste_course_dao import ListeCourseDAO
 from src.dao.stock_dao import StockDAO
+from src.dao.unite_dao import UniteDAO
 from src.dao.utilisateur_dao import UtilisateurDAO
 from src.models.liste_course import ListeCourseItem
 from src.service.ingredient_service import IngredientService
 from src.service.utilisateur_service import UtilisateurService
-from src.utils.conversion_unite import UnitConverter
 from src.utils.exceptions import (
     IngredientNotFoundError,
     ServiceError,
@@ -22,6 +23,7 @@ class ListeCourseService:
         """Initialise un ListeCourseService."""
         self.liste_course_dao = ListeCourseDAO()
         self.stock_dao = StockDAO()
+        self.unite_dao = UniteDAO()
         self.ingredient_dao = IngredientDAO()
         self.ingredient_svc = IngredientService()
         utilisateur_dao = UtilisateurDAO()
@@ -326,7 +328,6 @@ class ListeCourseService:
         """
         quantite_liste = float(liste_item["quantite"])
         id_unite_liste = liste_item["id_unite"]
-        code_unite_liste = liste_item["code_unite"]
 
         quantite_stock = float(stock_item["quantite"])
         id_unite_stock = stock_item["id_unite"]
@@ -335,166 +336,25 @@ class ListeCourseService:
         if id_unite_liste == id_unite_stock:
             return quantite_stock + quantite_liste, id_unite_liste
 
-        # Unités différentes : conversion nécessaire
-        stock_unite_info = self.stock_dao.get_unite_info(id_unite_stock)
-        code_unite_stock = (
-            stock_unite_info["abbreviation"] if stock_unite_info else None
-        )
-
-        if not (code_unite_stock and code_unite_liste):
+        # Unités différentes : addition en ml ou en g si elles sont de même type
+        table = self.unite_dao.get_table_conversion((id_unite_liste, id_unite_stock))
+        type_liste, _ = table.get(id_unite_liste)
+        type_stock, facteur_stock = table.get(id_unite_stock)
+        if type_liste == type_stock and type_stock in {"liquide", "solide"}:
+            total = table.convert_many(
+                [quantite_liste, quantite_stock],
+                [id_unite_liste, id_unite_stock],
+            ).sum()
+            return float(total) / facteur_stock, id_unite_stock
+
+        # Types différents (2 oz et 500 g) : addition en g si les deux unités
+        # ont une masse
+        g_liste = table.facteur_solide(id_unite_liste)
+        g_stock = table.facteur_solide(id_unite_stock)
+        if g_liste is None or g_stock is None:
             return quantite_liste, id_unite_liste
-
-        return self._convertir_et_additionner(
-            quantite_liste,
-            code_unite_liste,
-            quantite_stock,
-            code_unite_stock,
-            id_unite_stock,
-            id_unite_liste,
-        )
-
-    # ruff: noqa: PLR0913
-    # ruff: noqa: PLR0917
-    def _convertir_et_additionner(
-        self,
-        quantite_liste: float,
-        code_unite_liste: str,
-        quantite_stock: float,
-        code_unite_stock: str,
-        id_unite_stock: int,
-        id_unite_liste: int,
-    ) -> tuple[float, int]:
-        """Convertit et additionne les quantités selon leur type.
-
-        Parameters
-        ----------
-        quantite_liste : float
-            Quantité de la liste de course
-        code_unite_liste : str
-            Code unité de la liste
-        quantite_stock : float
-            Quantité du stock
-        code_unite_stock : str
-            Code unité du stock
-        id_unite_stock : int
-            ID unité du stock
-        id_unite_liste : int
-            ID unité de la liste
-
-        Returns
-        -------
-        tuple[float, int]
-            (nouvelle_quantite, id_unite_finale)
-
-        """
-        # Vérifier si les deux unités sont liquides
-        if UnitConverter.is_liquid_unit(
-            code_unite_liste,
-        ) and UnitConverter.is_liquid_unit(code_unite_stock):
-            return self._additionner_liquides(
-                quantite_liste,
-                code_unite_liste,
-                quantite_stock,
-                code_unite_stock,
-                id_unite_stock,
-            )
-
-        # Vérifier si les deux unités sont solides
-        if UnitConverter.is_solid_unit(
-            code_unite_liste,
-        ) and UnitConverter.is_solid_unit(code_unite_stock):
-            return self._additionner_solides(
-                quantite_liste,
-                code_unite_liste,
-                quantite_stock,
-                code_unite_stock,
-                id_unite_stock,
-            )
-
-        # Types incompatibles : garder la quantité de la liste
-        return quantite_liste, id_unite_liste
-
-    @staticmethod
-    def _additionner_liquides(
-        quantite_liste: float,
-        code_unite_liste: str,
-        quantite_stock: float,
-        code_unite_stock: str,
-        id_unite_stock: int,
-    ) -> tuple[float, int]:
-        """Additionne deux quantités liquides avec conversion.
-
-        Parameters
-        ----------
-        quantite_liste : float
-            Quantité de la liste de course
-        code_unite_liste : str
-            Code unité de la liste
-        quantite_stock : float
-            Quantité du stock
-        code_unite_stock : str
-            Code unité du stock
-        id_unite_stock : int
-            ID unité du stock
-
-        Returns
-        -------
-        tuple[float, int]
-            (nouvelle_quantite, id_unite_finale)
-
-        """
-        ml_stock = UnitConverter.convert_to_ml(quantite_stock, code_unite_stock)
-        ml_liste = UnitConverter.convert_to_ml(quantite_liste, code_unite_liste)
-
-        if ml_stock is None or ml_liste is None:
-            return quantite_liste, id_unite_stock
-
-        total_ml = ml_stock + ml_liste
-        facteur_stock = UnitConverter.LIQUID_TO_ML.get(code_unite_stock.lower(), 1)
-        nouvelle_quantite = total_ml / facteur_stock
-
-        return nouvelle_quantite, id_unite_stock
-
-    @staticmethod
-    def _additionner_solides(
-        quantite_liste: float,
-        code_unite_liste: str,
-        quantite_stock: float,
-        code_unite_stock: str,
-        id_unite_stock: int,
-    ) -> tuple[float, int]:
-        """Additionne deux quantités solides avec conversion.
-
-        Parameters
-        ----------
-        quantite_liste : float
-            Quantité de la liste de course
-        code_unite_liste : str
-            Code unité de la liste
-        quantite_stock : float
-            Quantité du stock
-        code_unite_stock : str
-            Code unité du stock
-        id_unite_stock : int
-            ID unité du stock
-
-        Returns
-        -------
-        tuple[float, int]
-            (nouvelle_quantite, id_unite_finale)
-
-        """
-        g_stock = UnitConverter.convert_to_g(quantite_stock, code_unite_stock)
-        g_liste = UnitConverter.convert_to_g(quantite_liste, code_unite_liste)
-
-        if g_stock is None or g_liste is None:
-            return quantite_liste, id_unite_stock
-
-        total_g = g_stock + g_liste
-        facteur_stock = UnitConverter.SOLID_TO_G.get(code_unite_stock.lower(), 1)
-        nouvelle_quantite = total_g / facteur_stock
-
-        return nouvelle_quantite, id_unite_stock
+        total_g = quantite_liste * g_liste + quantite_stock * g_stock
+        return total_g / g_stock, id_unite_stock
 
     def _transferer_vers_stock(
         self,
@@ -538,6 +398,9 @@ class ListeCourseService:
             raise ServiceError(
                 message=f"Erreur lors du transfert vers le stock : {e}",
             ) from e
+        finally:
+            # Le stock a pu changer même si le retrait de la liste a échoué
+            CacheRealisables().signaler_modification(id_utilisateur, id_ingredient)
 
     def _generer_message_confirmation(
         self,
@@ -3,7 +3,7 @@
 import re
 
 from src.dao.ingredient_dao import IngredientDAO
-from src.dao.stock_dao import StockDAO
+from src.dao.stock_dao import AsyncStockDAO, StockDAO
 from src.models.stock import Stock, StockItem
 from src.utils.exceptions import (
     DAOError,
@@ -22,6 +22,7 @@ class StockService:
     def __init__(self) -> None:
         """Initialise un StockService."""
         self.stock_dao = StockDAO()
+        self.stock_async_dao = AsyncStockDAO()
         self.ingredient_dao = IngredientDAO()
 
     def get_ingredient_by_name(self, nom_ingredient: str) -> dict:
@@ -160,28 +161,50 @@ class StockService:
                 id_utilisateur=id_utilisateur,
                 only_available=only_available,
             )
+            return self._construire_stock(id_utilisateur, rows)
+        except Exception as e:
+            raise ServiceError(
+                message=f"Erreur lors de la récupération du stock : {e}",
+            ) from e
 
-            items = [
-                StockItem(
-                    id_ingredient=row["id_ingredient"],
-                    nom_ingredient=row["nom_ingredient"],
-                    quantite=float(row["quantite"]),
-                    id_unite=row["id_unite"],
-                    code_unite=row["code_unite"],
-                    nom_unite_complet=row["nom_unite_complet"],
-                )
-                for row in rows
-            ]
-
-            return Stock(
-                id_utilisateur=id_utilisateur,
-                items=items,
+    async def get_user_stock_async(
+        self,
+        id_utilisateur: int,
+        *,
+        only_available: bool = True,
+    ) -> Stock:
+        """Version asynchrone de get_user_stock."""
+        try:
+            rows = await self.stock_async_dao.get_stock(
+                id_utilisateur,
+                only_available=only_available,
             )
+            return self._construire_stock(id_utilisateur, rows)
         except Exception as e:
             raise ServiceError(
                 message=f"Erreur lors de la récupération du stock : {e}",
             ) from e
 
+    @staticmethod
+    def _construire_stock(id_utilisateur: int, rows: list[dict]) -> Stock:
+        """Construit le Stock d'un utilisateur à partir des lignes du DAO."""
+        items = [
+            StockItem(
+                id_ingredient=row["id_ingredient"],
+                nom_ingredient=row["nom_ingredient"],
+                quantite=float(row["quantite"]),
+                id_unite=row["id_unite"],
+                code_unite=row["code_unite"],
+                nom_unite_complet=row["nom_unite_complet"],
+            )
+            for row in rows
+        ]
+
+        return Stock(
+            id_utilisateur=id_utilisateur,
+            items=items,
+        )
+
     def get_ingredient_from_stock_by_name(
         self,
         id_utilisateur: int,
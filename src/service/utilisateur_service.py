@@ -2,7 +2,7 @@
 
 from datetime import UTC, date, datetime
 
-from src.dao.utilisateur_dao import UtilisateurDAO
+from src.dao.utilisateur_dao import AsyncUtilisateurDAO, UtilisateurDAO
 from src.models.utilisateurs import (
     DateInscriptionResponse,
     User,
@@ -15,13 +15,16 @@ from src.models.utilisateurs import (
 from src.utils.exceptions import (
     AuthError,
     EmptyFieldError,
+    HachageSatureError,
     InvalidBirthDateError,
     InvalidPasswordError,
     PseudoChangingError,
     ServiceError,
     UserNotFoundError,
 )
+from src.utils.pool_hachage import PoolHachage
 from src.utils.securite import (
+    hachage_a_migrer,
     hacher_mot_de_passe,
     validate_password,
     verifier_mot_de_passe,
@@ -34,6 +37,7 @@ class UtilisateurService:
     def __init__(self, utilisateur_dao: UtilisateurDAO) -> None:
         """Initialise un UtilisateurService."""
         self.utilisateur_dao = utilisateur_dao
+        self.utilisateur_async_dao = AsyncUtilisateurDAO()
 
     def creer_compte(self, donnees: UserRegister) -> str:
         """Créer un nouveau compte utilisateur à partir des données fournies.
@@ -61,6 +65,43 @@ class UtilisateurService:
             ou de la création en base.
 
         """
+        birth_date = self._valider_inscription(donnees)
+
+        # Hachage du mot de passe
+        try:
+            mot_de_passe_hashed = hacher_mot_de_passe(donnees.mot_de_passe)
+        except Exception as e:
+            raise ServiceError(
+                message=f"Erreur lors du hachage du mot de passe : {e}",
+            ) from e
+
+        user_create = self._compte_a_creer(donnees, mot_de_passe_hashed, birth_date)
+        succes = self.utilisateur_dao.create_compte(user_create)
+        if not succes:
+            raise ServiceError(message="Impossible de créer le compte")
+
+        return "compte créé avec succès."
+
+    async def creer_compte_async(self, donnees: UserRegister) -> str:
+        """Version asynchrone de creer_compte (hachage dans le pool de hachage).
+
+        Raises
+        ------
+        HachageSatureError
+            Si le pool de hachage est saturé
+
+        """
+        birth_date = self._valider_inscription(donnees)
+        mot_de_passe_hashed = await self._hacher_async(donnees.mot_de_passe)
+        user_create = self._compte_a_creer(donnees, mot_de_passe_hashed, birth_date)
+        succes = await self.utilisateur_async_dao.create_compte(user_create)
+        if not succes:
+            raise ServiceError(message="Impossible de créer le compte")
+
+        return "compte créé avec succès."
+
+    def _valider_inscription(self, donnees: UserRegister) -> date:
+        """Vérifie les données d'inscription et retourne la date de naissance."""
         # Validation des champs vides
         if not donnees.pseudo or not donnees.pseudo.strip():
             raise EmptyFieldError(field="pseudo")
@@ -77,17 +118,15 @@ class UtilisateurService:
             raise InvalidPasswordError(errors=validation_result.errors)
 
         # Valider la date de naissance
-        birth_date = self._parse_and_validate_birth_date(donnees.date_naissance)
-
-        # Hachage du mot de passe
-        try:
-            mot_de_passe_hashed = hacher_mot_de_passe(donnees.mot_de_passe)
-        except Exception as e:
-            raise ServiceError(
-                message=f"Erreur lors du hachage du mot de passe : {e}",
-            ) from e
+        return self._parse_and_validate_birth_date(donnees.date_naissance)
 
-        # Préparer dict pour UserCreate
+    @staticmethod
+    def _compte_a_creer(
+        donnees: UserRegister,
+        mot_de_passe_hashed: str,
+        birth_date: date,
+    ) -> UserCreate:
+        """Construit le compte à créer en base (mot de passe haché)."""
         compte = donnees.model_dump()
         compte.pop("mot_de_passe", None)
         compte["mot_de_passe_hashed"] = mot_de_passe_hashed
@@ -95,17 +134,23 @@ class UtilisateurService:
 
         # Valider le modèle
         try:
-            user_create = UserCreate.model_validate(compte)
+            return UserCreate.model_validate(compte)
         except Exception as e:
             raise ServiceError(
                 message=f"Erreur lors de la validation du modèle : {e}",
             ) from e
 
-        succes = self.utilisateur_dao.create_compte(user_create)
-        if not succes:
-            raise ServiceError(message="Impossible de créer le compte")
-
-        return "compte créé avec succès."
+    @staticmethod
+    async def _hacher_async(mot_de_passe: str) -> str:
+        """Hache un mot de passe dans le pool de hachage."""
+        try:
+            return await PoolHachage().hacher(mot_de_passe)
+        except HachageSatureError:
+            raise
+        except Exception as e:
+            raise ServiceError(
+                message=f"Erreur lors du hachage du mot de passe : {e}",
+            ) from e
 
     def authenticate(self, pseudo: str, mot_de_passe: str) -> User:
         """Authentifier un utilisateur à partir de son pseudo et de son mot de passe.
@@ -139,6 +184,67 @@ class UtilisateurService:
             raise AuthError
         return db_utilisateur
 
+    async def authenticate_async(self, pseudo: str, mot_de_passe: str) -> User:
+        """Version asynchrone de authenticate (vérification dans le pool de hachage).
+
+        Si le hachage de l'utilisateur n'a pas le coût configuré, l'appelant
+        peut ensuite le refaire avec migrer_hachage_async (voir hachage_a_migrer).
+
+        Raises
+        ------
+        HachageSatureError
+            Si le pool de hachage est saturé
+
+        """
+        db_utilisateur = await self.utilisateur_async_dao.recuperer_par_pseudo(pseudo)
+        if db_utilisateur is None:
+            raise UserNotFoundError(message=f"Utilisateur '{pseudo}' introuvable.")
+        if not await PoolHachage().verifier(
+            mot_de_passe,
+            db_utilisateur.mot_de_passe_hashed,
+        ):
+            raise AuthError
+        return db_utilisateur
+
+    @staticmethod
+    def hachage_a_migrer(utilisateur: User) -> bool:
+        """Indique si le mot de passe d'un utilisateur doit être rehaché.
+
+        C'est le cas quand son hachage n'a pas le coût configuré
+        (BCRYPT_ROUNDS), par exemple après une modification de ce coût.
+        """
+        return hachage_a_migrer(utilisateur.mot_de_passe_hashed)
+
+    async def migrer_hachage_async(self, utilisateur: User, mot_de_passe: str) -> bool:
+        """Rehache le mot de passe d'un utilisateur avec le coût configuré.
+
+        Appelé en tâche de fond après une connexion réussie, seul moment où le
+        mot de passe en clair est connu. Si le pool de hachage est saturé, la
+        migration est simplement remise à la prochaine connexion.
+
+        Parameters
+        ----------
+        utilisateur : User
+            L'utilisateur authentifié (avec le hachage lu à la connexion)
+        mot_de_passe : str
+            Son mot de passe, qui vient d'être vérifié
+
+        Returns
+        -------
+        bool
+            True si le hachage a été remplacé, False sinon
+
+        """
+        try:
+            mot_de_passe_hashed = await PoolHachage().hacher(mot_de_passe)
+        except HachageSatureError:
+            return False
+        return await self.utilisateur_async_dao.remplacer_hachage(
+            utilisateur.id_utilisateur,
+            utilisateur.mot_de_passe_hashed,
+            mot_de_passe_hashed,
+        )
+
     def supprimer_compte(self, donnees: UserDelete) -> str:
         """Supprimer un compte utilisateur après authentification.
 
@@ -166,18 +272,13 @@ class UtilisateurService:
             En cas d'erreur générale
 
         """
-        # Validation des champs vides
-        if not donnees.pseudo or not donnees.pseudo.strip():
-            raise EmptyFieldError(donnees.pseudo)
-        if not donnees.mot_de_passe or not donnees.mot_de_passe.strip():
-            raise EmptyFieldError(donnees.mot_de_passe)
+        self._valider_suppression(donnees)
 
         # Récupérer l'utilisateur pour vérifier le mot de passe
-        utilisateur = self.utilisateur_dao.recuperer_par_pseudo(donnees.pseudo)
-        if not utilisateur:
-            raise UserNotFoundError(
-                message=f"L'utilisateur '{donnees.pseudo}' est introuvable.",
-            )
+        utilisateur = self._existant(
+            self.utilisateur_dao.recuperer_par_pseudo(donnees.pseudo),
+            donnees.pseudo,
+        )
 
         # Vérifier le mot de passe
         if not verifier_mot_de_passe(
@@ -193,6 +294,49 @@ class UtilisateurService:
 
         return "Compte supprimé avec succès."
 
+    async def supprimer_compte_async(self, donnees: UserDelete) -> str:
+        """Version asynchrone de supprimer_compte (vérification dans le pool).
+
+        Raises
+        ------
+        HachageSatureError
+            Si le pool de hachage est saturé
+
+        """
+        self._valider_suppression(donnees)
+        utilisateur = self._existant(
+            await self.utilisateur_async_dao.recuperer_par_pseudo(donnees.pseudo),
+            donnees.pseudo,
+        )
+        if not await PoolHachage().verifier(
+            donnees.mot_de_passe,
+            utilisateur.mot_de_passe_hashed,
+        ):
+            raise AuthError
+
+        succes = await self.utilisateur_async_dao.delete_compte(donnees.pseudo)
+        if not succes:
+            raise ServiceError(message="Impossible de supprimer le compte")
+
+        return "Compte supprimé avec succès."
+
+    @staticmethod
+    def _valider_suppression(donnees: UserDelete) -> None:
+        """Vérifie que les champs d'une demande de suppression sont remplis."""
+        if not donnees.pseudo or not donnees.pseudo.strip():
+            raise EmptyFieldError(donnees.pseudo)
+        if not donnees.mot_de_passe or not donnees.mot_de_passe.strip():
+            raise EmptyFieldError(donnees.mot_de_passe)
+
+    @staticmethod
+    def _existant(utilisateur: User | None, pseudo: str) -> User:
+        """Retourne l'utilisateur lu par son pseudo, ou lève UserNotFoundError."""
+        if not utilisateur:
+            raise UserNotFoundError(
+                message=f"L'utilisateur '{pseudo}' est introuvable.",
+            )
+        return utilisateur
+
     def changer_mot_de_passe(self, donnees: UserChangePassword) -> str:
         """Changer le mot de passe d'un utilisateur après vérification.
 
@@ -222,31 +366,13 @@ class UtilisateurService:
             Si les mots de passe sont identiques ou erreur générale
 
         """
-        # Validation des champs vides
-        if not donnees.pseudo or not donnees.pseudo.strip():
-            raise EmptyFieldError(field="pseudo")
-        if not donnees.mot_de_passe_actuel or not donnees.mot_de_passe_actuel.strip():
-            raise EmptyFieldError(field="mot_de_passe_actuel")
-        if not donnees.mot_de_passe_nouveau or not donnees.mot_de_passe_nouveau.strip():
-            raise EmptyFieldError(field="mot_de_passe_nouveau")
-
-        # Vérifier que les deux mots de passe ne sont pas identiques
-        if donnees.mot_de_passe_actuel == donnees.mot_de_passe_nouveau:
-            raise ServiceError(
-                message="Le nouveau mot de passe doit être différent de l'ancien",
-            )
-
-        # Validation du nouveau mot de passe
-        validation_result = validate_password(donnees.mot_de_passe_nouveau)
-        if not validation_result.is_valid:
-            raise InvalidPasswordError(errors=validation_result.errors)
+        self._valider_changement(donnees)
 
         # Récupérer l'utilisateur pour vérifier le mot de passe actuel
-        utilisateur = self.utilisateur_dao.recuperer_par_pseudo(donnees.pseudo)
-        if not utilisateur:
-            raise UserNotFoundError(
-                message=f"L'utilisateur '{donnees.pseudo}' est introuvable.",
-            )
+        utilisateur = self._existant(
+            self.utilisateur_dao.recuperer_par_pseudo(donnees.pseudo),
+            donnees.pseudo,
+        )
 
         # Vérifier le mot de passe actuel
         if not verifier_mot_de_passe(
@@ -278,6 +404,60 @@ class UtilisateurService:
 
         return "Mot de passe modifié avec succès"
 
+    async def changer_mot_de_passe_async(self, donnees: UserChangePassword) -> str:
+        """Version asynchrone de changer_mot_de_passe (hachage dans le pool).
+
+        Raises
+        ------
+        HachageSatureError
+            Si le pool de hachage est saturé
+
+        """
+        self._valider_changement(donnees)
+        utilisateur = self._existant(
+            await self.utilisateur_async_dao.recuperer_par_pseudo(donnees.pseudo),
+            donnees.pseudo,
+        )
+        if not await PoolHachage().verifier(
+            donnees.mot_de_passe_actuel,
+            utilisateur.mot_de_passe_hashed,
+        ):
+            raise AuthError
+
+        mdps_update = UserUpdatePassword(
+            pseudo=donnees.pseudo,
+            mot_de_passe_nouveau_hashed=await self._hacher_async(
+                donnees.mot_de_passe_nouveau,
+            ),
+        )
+        succes = await self.utilisateur_async_dao.update_mot_de_passe(mdps_update)
+        if not succes:
+            raise ServiceError(message="Impossible de mettre à jour le mot de passe")
+
+        return "Mot de passe modifié avec succès"
+
+    @staticmethod
+    def _valider_changement(donnees: UserChangePassword) -> None:
+        """Vérifie une demande de changement de mot de passe (sans la base)."""
+        # Validation des champs vides
+        if not donnees.pseudo or not donnees.pseudo.strip():
+            raise EmptyFieldError(field="pseudo")
+        if not donnees.mot_de_passe_actuel or not donnees.mot_de_passe_actuel.strip():
+            raise EmptyFieldError(field="mot_de_passe_actuel")
+        if not donnees.mot_de_passe_nouveau or not donnees.mot_de_passe_nouveau.strip():
+            raise EmptyFieldError(field="mot_de_passe_nouveau")
+
+        # Vérifier que les deux mots de passe ne sont pas identiques
+        if donnees.mot_de_passe_actuel == donnees.mot_de_passe_nouveau:
+            raise ServiceError(
+                message="Le nouveau mot de passe doit être différent de l'ancien",
+            )
+
+        # Validation du nouveau mot de passe
+        validation_result = validate_password(donnees.mot_de_passe_nouveau)
+        if not validation_result.is_valid:
+            raise InvalidPasswordError(errors=validation_result.errors)
+
     @staticmethod
     def _parse_and_validate_birth_date(birth_date_input) -> date:
         """Parse et valide la date de naissance.
@@ -78,10 +78,11 @@ def populate_test_database(load_test_env) -> None:
 @pytest.fixture
 def db_connection() -> None:
     """Fournit une connexion à la base de données de test pour chaque test."""
-    connection = DBConnection().connection
-    yield connection
-    connection.rollback()
-    connection.close()
+    # La portée fait partager cette connexion aux DAO appelés pendant le test
+    with DBConnection().request_scope() as portee:
+        connection = portee.connection
+        yield connection
+        connection.rollback()
 
 
 @pytest.fixture(autouse=True)
@@ -96,8 +97,12 @@ def reset_singletons() -> None:
     """
     yield
     # Après chaque test, nettoyer toutes les instances singleton
+    # (en fermant le pool de connexions pour ne pas laisser de connexions ouvertes)
+    db = DBConnection.instance_existante()
+    if db is not None:
+        db.close()
 
-    Singleton._instances = {}
+    Singleton.reinitialiser()
 
 
 @pytest.fixture
@@ -0,0 +1 @@
+"""Package contenant les tests des dépendances et routes de l'API."""
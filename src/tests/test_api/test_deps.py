@@ -0,0 +1,100 @@
+"""Tests d'intégration des dépendances d'authentification de l'API."""
+
+from datetime import UTC, datetime, timedelta
+
+import jwt
+import pytest
+from fastapi import HTTPException, status
+
+from src.api.deps import get_user_claims
+from src.dao.utilisateur_dao import UtilisateurDAO
+from src.models import UserClaims
+from src.models.utilisateurs import UserUpdatePassword
+from src.utils import securite
+from src.utils.settings import settings
+
+_DUREE = timedelta(minutes=5)
+
+
+@pytest.fixture
+def id_alice(db_connection) -> int:
+    """Crée l'utilisatrice alice et retourne son identifiant."""
+    with db_connection.cursor() as cursor:
+        cursor.execute("""
+            INSERT INTO utilisateur (pseudo, mail, mot_de_passe, date_naissance)
+            VALUES ('alice', 'alice@example.com', 'hash', '1990-01-01')
+            RETURNING id_utilisateur
+        """)
+        id_utilisateur = cursor.fetchone()["id_utilisateur"]
+        db_connection.commit()
+    return id_utilisateur
+
+
+def jeton_sans_claims(id_utilisateur: int) -> str:
+    """Construit un jeton émis avant l'ajout des claims pseudo et ver."""
+    return jwt.encode(
+        {"exp": datetime.now(UTC) + _DUREE, "sub": str(id_utilisateur)},
+        settings.SECRET_KEY,
+        algorithm=securite.ALGORITHM,
+    )
+
+
+class TestGetUserClaims:
+    """Tests de get_user_claims."""
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_jeton_revoque_apres_changement_mot_de_passe(id_alice: int) -> None:
+        """Teste qu'un changement de mot de passe révoque les jetons émis avant."""
+        # GIVEN
+        ancien = securite.create_access_token(id_alice, _DUREE, "alice", 0)
+        get_user_claims(ancien)
+
+        # WHEN
+        UtilisateurDAO().update_mot_de_passe(
+            UserUpdatePassword(pseudo="alice", mot_de_passe_nouveau_hashed="h2"),
+        )
+        with pytest.raises(HTTPException) as erreur:
+            get_user_claims(ancien)
+        nouveau = get_user_claims(
+            securite.create_access_token(id_alice, _DUREE, "alice", 1),
+        )
+
+        # THEN
+        if erreur.value.status_code != status.HTTP_403_FORBIDDEN:
+            raise AssertionError(
+                message=f"403 attendu, obtenu: {erreur.value.status_code}",
+            )
+        attendu = UserClaims(id_utilisateur=id_alice, pseudo="alice")
+        if nouveau != attendu:
+            raise AssertionError(message=f"{attendu} attendu, obtenu: {nouveau}")
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_jeton_sans_claims_identite_lue_en_base(id_alice: int) -> None:
+        """Teste qu'un jeton sans pseudo ni version est accepté, pseudo lu en base."""
+        # WHEN
+        claims = get_user_claims(jeton_sans_claims(id_alice))
+
+        # THEN
+        attendu = UserClaims(id_utilisateur=id_alice, pseudo="alice")
+        if claims != attendu:
+            raise AssertionError(message=f"{attendu} attendu, obtenu: {claims}")
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_jeton_sans_claims_utilisateur_inconnu(id_alice: int) -> None:
+        """Teste qu'un jeton sans claims d'un utilisateur supprimé est refusé."""
+        # GIVEN
+        jeton = jeton_sans_claims(id_alice)
+        UtilisateurDAO().delete_compte("alice")
+
+        # WHEN
+        with pytest.raises(HTTPException) as erreur:
+            get_user_claims(jeton)
+
+        # THEN
+        if erreur.value.status_code != status.HTTP_404_NOT_FOUND:
+            raise AssertionError(
+                message=f"404 attendu, obtenu: {erreur.value.status_code}",
+            )
@@ -0,0 +1,220 @@
+"""Tests pour le cache par utilisateur des cocktails réalisables."""
+
+import pytest
+
+from src.dao.cache_realisables import CacheRealisables
+from src.dao.index_recettes import InstantaneIndex
+from src.dao.stock_dao import StockDAO
+from src.utils.settings import settings
+
+
+def ligne(id_cocktail: int, id_ingredient: int, qte: float) -> dict:
+    """Construit une ligne cocktail/ingrédient du catalogue (quantités en ml)."""
+    return {
+        "id_cocktail": id_cocktail,
+        "nom": f"Cocktail {id_cocktail}",
+        "categorie": "Cocktail",
+        "verre": "Highball glass",
+        "alcool": True,
+        "image": "cocktail.jpg",
+        "id_ingredient": id_ingredient,
+        "qte": qte,
+        "unite": "ml",
+        "nom_ingredient": f"Ingrédient {id_ingredient}",
+    }
+
+
+class ChargeurStock:
+    """Stock simulé qui compte ses chargements."""
+
+    def __init__(self, quantites: dict[int, float]) -> None:
+        """Initialise le stock avec les quantités {id_ingredient: ml}."""
+        self.quantites = quantites
+        self.chargements = 0
+
+    def __call__(self) -> list[dict]:
+        """Retourne les lignes de stock (format StockDAO.get_stock)."""
+        self.chargements += 1
+        return [
+            {"id_ingredient": id_ingredient, "quantite": quantite, "code_unite": "ml"}
+            for id_ingredient, quantite in self.quantites.items()
+        ]
+
+
+@pytest.fixture
+def index() -> InstantaneIndex:
+    """Catalogue de deux cocktails partageant l'ingrédient 1."""
+    return InstantaneIndex(
+        [ligne(1, 1, 50.0), ligne(1, 2, 20.0), ligne(2, 1, 10.0), ligne(2, 3, 10.0)],
+    )
+
+
+def realisables(index: InstantaneIndex, chargeur: ChargeurStock) -> list[int]:
+    """Retourne les identifiants des cocktails réalisables de l'utilisateur 1."""
+    faisabilite = CacheRealisables().obtenir(1, index, chargeur)
+    return [c["id_cocktail"] for c in index.cocktails_realisables(faisabilite)]
+
+
+class TestCacheRealisables:
+    """Tests du cache des évaluations par utilisateur."""
+
+    @staticmethod
+    def test_evaluation_reutilisee(index) -> None:
+        """Teste que le stock n'est pas relu tant qu'il n'a pas changé."""
+        # GIVEN
+        chargeur = ChargeurStock({1: 50.0, 2: 20.0})
+
+        # WHEN
+        premier = realisables(index, chargeur)
+        second = realisables(index, chargeur)
+
+        # THEN
+        if premier != [1] or second != [1] or chargeur.chargements != 1:
+            raise AssertionError(
+                message=f"1 chargement attendu, obtenu: {chargeur.chargements} "
+                f"({premier}, {second})",
+            )
+
+    @staticmethod
+    def test_reevaluation_apres_modification(index) -> None:
+        """Teste qu'une modification du stock est prise en compte."""
+        # GIVEN
+        chargeur = ChargeurStock({1: 50.0, 2: 20.0})
+        realisables(index, chargeur)
+
+        # WHEN
+        chargeur.quantites[1] = 30.0
+        chargeur.quantites[3] = 10.0
+        CacheRealisables().signaler_modification(1, 1)
+        CacheRealisables().signaler_modification(1, 3)
+        result = realisables(index, chargeur)
+
+        # THEN
+        nb_chargements = 2
+        if result != [2] or chargeur.chargements != nb_chargements:
+            raise AssertionError(
+                message=f"Seul le cocktail 2 devrait être réalisable, obtenu: "
+                f"{result} ({chargeur.chargements} chargements)",
+            )
+
+    @staticmethod
+    def test_reconstruction_de_l_index(index) -> None:
+        """Teste qu'une évaluation n'est pas réutilisée avec un autre index."""
+        # GIVEN
+        chargeur = ChargeurStock({1: 50.0, 2: 20.0})
+        realisables(index, chargeur)
+        nouvel_index = InstantaneIndex([ligne(3, 2, 10.0)])
+
+        # WHEN
+        result = realisables(nouvel_index, chargeur)
+
+        # THEN
+        if result != [3]:
+            raise AssertionError(
+                message=f"Le cocktail 3 devrait être réalisable, obtenu: {result}",
+            )
+
+    @staticmethod
+    def test_utilisateurs_independants(index) -> None:
+        """Teste que la modification d'un stock n'invalide pas les autres."""
+        # GIVEN
+        chargeur = ChargeurStock({1: 50.0, 2: 20.0})
+        realisables(index, chargeur)
+
+        # WHEN
+        CacheRealisables().signaler_modification(2, 1)
+        realisables(index, chargeur)
+
+        # THEN
+        if chargeur.chargements != 1:
+            raise AssertionError(
+                message=f"1 chargement attendu, obtenu: {chargeur.chargements}",
+            )
+
+    @staticmethod
+    def test_utilisateurs_suivis_bornes(index, monkeypatch) -> None:
+        """Teste que versions et modifications suivent la borne des évaluations."""
+        # GIVEN
+        monkeypatch.setattr(settings, "REALISABLES_CACHE_MAX_USERS", 2)
+        cache = CacheRealisables()
+        chargeur = ChargeurStock({1: 50.0, 2: 20.0})
+
+        # WHEN
+        for id_utilisateur in range(1, 11):
+            cache.obtenir(id_utilisateur, index, chargeur)
+            cache.signaler_modification(id_utilisateur, 1)
+
+        # THEN
+        statistiques = cache.statistiques()
+        if max(statistiques.values()) > settings.REALISABLES_CACHE_MAX_USERS:
+            raise AssertionError(
+                message=f"Au plus 2 utilisateurs suivis attendus: {statistiques}",
+            )
+
+    @staticmethod
+    def test_version_oubliee_sans_reutilisation(index, monkeypatch) -> None:
+        """Teste qu'une évaluation dont la version a été oubliée est recalculée."""
+        # GIVEN
+        monkeypatch.setattr(settings, "REALISABLES_CACHE_MAX_USERS", 2)
+        chargeur = ChargeurStock({1: 50.0, 2: 20.0})
+        realisables(index, chargeur)
+
+        # WHEN (la modification de l'utilisateur 1 est oubliée)
+        CacheRealisables().signaler_modification(1, 2)
+        chargeur.quantites[2] = 0.0
+        for id_utilisateur in (2, 3):
+            CacheRealisables().signaler_modification(id_utilisateur)
+        result = realisables(index, chargeur)
+
+        # THEN
+        if (result, chargeur.chargements) != ([], 2):
+            raise AssertionError(
+                message=f"Stock rechargé et aucun cocktail attendus, obtenu: "
+                f"{result} ({chargeur.chargements} chargements)",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_ecriture_stock_incremente_version(db_connection) -> None:
+        """Teste que les écritures de StockDAO incrémentent la version du stock."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO utilisateur (pseudo, mail, mot_de_passe, date_naissance)
+                VALUES ('testuser', 'test@example.com', 'pass', '1990-01-01')
+                RETURNING id_utilisateur
+                """,
+            )
+            user_id = cursor.fetchone()["id_utilisateur"]
+            cursor.execute(
+                """
+                INSERT INTO ingredient (nom, alcool) VALUES ('Rhum', TRUE)
+                RETURNING id_ingredient
+                """,
+            )
+            ingredient_id = cursor.fetchone()["id_ingredient"]
+            cursor.execute(
+                """
+                INSERT INTO unite (nom, abbreviation, type_unite)
+                VALUES ('millilitre', 'ml', 'liquide')
+                RETURNING id_unite
+                """,
+            )
+            unite_id = cursor.fetchone()["id_unite"]
+        db_connection.commit()
+        dao = StockDAO()
+
+        # WHEN
+        dao.update_or_create_stock_item(user_id, ingredient_id, 50.0, unite_id)
+        dao.set_stock_item(user_id, ingredient_id, 40.0, unite_id)
+        dao.decrement_stock_item(user_id, ingredient_id, 10.0)
+        dao.delete_stock_item(user_id, ingredient_id)
+
+        # THEN
+        nb_ecritures = 4
+        if CacheRealisables().version(user_id) != nb_ecritures:
+            raise AssertionError(
+                message=f"Version {nb_ecritures} attendue, obtenu: "
+                f"{CacheRealisables().version(user_id)}",
+            )
@@ -0,0 +1,191 @@
+"""Tests pour le cache des utilisateurs authentifiés."""
+
+import pytest
+
+from src.dao.cache_utilisateurs import CacheUtilisateurs
+from src.dao.utilisateur_dao import UtilisateurDAO
+from src.models.utilisateurs import User, UserUpdatePassword
+from src.utils.exceptions import UserNotFoundError
+from src.utils.settings import settings
+
+
+def utilisateur(id_utilisateur: int, pseudo: str = "alice") -> User:
+    """Construit un utilisateur."""
+    return User(
+        id_utilisateur=id_utilisateur,
+        pseudo=pseudo,
+        mail=f"{pseudo}@example.com",
+        date_naissance="1990-01-01",
+        mot_de_passe_hashed="hash",
+        date_inscription="2024-01-01",
+    )
+
+
+class TestCacheUtilisateurs:
+    """Tests du cache en mémoire."""
+
+    @staticmethod
+    def test_succes_et_echecs() -> None:
+        """Teste qu'un utilisateur n'est lu qu'une fois, et les compteurs."""
+        # GIVEN
+        cache = CacheUtilisateurs()
+        lectures = []
+
+        def charger() -> User:
+            lectures.append(1)
+            return utilisateur(1)
+
+        # WHEN
+        premier = cache.obtenir(1, charger)
+        second = cache.obtenir(1, charger)
+
+        # THEN
+        if premier != second or len(lectures) != 1:
+            raise AssertionError(message=f"Une lecture attendue: {len(lectures)}")
+        statistiques = cache.statistiques()
+        if statistiques != {"succes": 1, "echecs": 1, "taille": 1}:
+            raise AssertionError(message=f"Compteurs inattendus: {statistiques}")
+
+    @staticmethod
+    def test_moins_recemment_utilise_evince(monkeypatch) -> None:
+        """Teste que le cache garde les USER_CACHE_MAX_USERS plus récents."""
+        # GIVEN
+        monkeypatch.setattr(settings, "USER_CACHE_MAX_USERS", 2)
+        cache = CacheUtilisateurs()
+        for id_utilisateur in (1, 2):
+            cache.obtenir(id_utilisateur, lambda i=id_utilisateur: utilisateur(i))
+        cache.obtenir(1, lambda: utilisateur(1))
+
+        # WHEN
+        cache.obtenir(3, lambda: utilisateur(3))
+
+        # THEN
+        relu = []
+        cache.obtenir(2, lambda: relu.append(2) or utilisateur(2))
+        if relu != [2]:
+            raise AssertionError(message="L'utilisateur 2 aurait dû être évincé")
+
+    @staticmethod
+    def test_expiration(monkeypatch) -> None:
+        """Teste qu'un utilisateur est relu au bout de USER_CACHE_TTL secondes."""
+        # GIVEN
+        monkeypatch.setattr(settings, "USER_CACHE_TTL", 0)
+        cache = CacheUtilisateurs()
+        cache.obtenir(1, lambda: utilisateur(1))
+
+        # WHEN
+        relu = cache.obtenir(1, lambda: utilisateur(1, "bob"))
+
+        # THEN
+        if relu.pseudo != "bob":
+            raise AssertionError(message=f"Utilisateur relu attendu: {relu}")
+
+    @staticmethod
+    def test_lecture_anterieure_a_une_invalidation() -> None:
+        """Teste qu'une lecture concurrente d'une invalidation n'est pas gardée."""
+        # GIVEN
+        cache = CacheUtilisateurs()
+
+        def charger_pendant_invalidation() -> User:
+            cache.invalider([1])
+            return utilisateur(1)
+
+        # WHEN
+        cache.obtenir(1, charger_pendant_invalidation)
+
+        # THEN
+        if cache.statistiques()["taille"] != 0:
+            raise AssertionError(
+                message="La lecture périmée n'aurait pas dû être gardée",
+            )
+
+    @staticmethod
+    def test_utilisateur_introuvable_non_garde() -> None:
+        """Teste qu'une erreur de lecture se propage et n'est pas mémorisée."""
+
+        def charger() -> User:
+            raise UserNotFoundError(message="introuvable")
+
+        with pytest.raises(UserNotFoundError):
+            CacheUtilisateurs().obtenir(1, charger)
+        if CacheUtilisateurs().statistiques()["taille"] != 0:
+            raise AssertionError(message="Aucun utilisateur ne devrait être gardé")
+
+
+@pytest.mark.usefixtures("clean_database")
+class TestInvalidationParUtilisateurDAO:
+    """Tests de l'invalidation du cache par UtilisateurDAO."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "modifier",
+        [
+            lambda dao: dao.update_pseudo("alice", "alice2"),
+            lambda dao: dao.update_mot_de_passe(
+                UserUpdatePassword(pseudo="alice", mot_de_passe_nouveau_hashed="h2"),
+            ),
+            lambda dao: dao.delete_compte("alice"),
+        ],
+    )
+    def test_modification_invalide(db_connection, modifier) -> None:
+        """Teste que pseudo, mot de passe et suppression invalident le cache."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO utilisateur (pseudo, mail, mot_de_passe, date_naissance)
+                VALUES ('alice', 'alice@example.com', 'hash', '1990-01-01')
+                RETURNING id_utilisateur
+            """)
+            id_utilisateur = cursor.fetchone()["id_utilisateur"]
+            db_connection.commit()
+        dao = UtilisateurDAO()
+        cache = CacheUtilisateurs()
+        cache.obtenir(id_utilisateur, lambda: dao.read(id_utilisateur))
+
+        # WHEN
+        modifier(dao)
+
+        # THEN
+        if cache.statistiques()["taille"] != 0:
+            raise AssertionError(message="L'utilisateur aurait dû être invalidé")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "modifier",
+        [
+            lambda dao: dao.update_pseudo("alice", "alice2"),
+            lambda dao: dao.update_mot_de_passe(
+                UserUpdatePassword(pseudo="alice", mot_de_passe_nouveau_hashed="h2"),
+            ),
+        ],
+    )
+    def test_modification_change_la_version(db_connection, modifier) -> None:
+        """Teste que pseudo et mot de passe changent la version des identifiants."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO utilisateur (pseudo, mail, mot_de_passe, date_naissance)
+                VALUES ('alice', 'alice@example.com', 'hash', '1990-01-01')
+                RETURNING id_utilisateur
+            """)
+            id_utilisateur = cursor.fetchone()["id_utilisateur"]
+            db_connection.commit()
+        dao = UtilisateurDAO()
+        cache = CacheUtilisateurs()
+        avant = cache.version_identifiants(
+            id_utilisateur,
+            lambda: dao.read(id_utilisateur),
+        )
+
+        # WHEN
+        modifier(dao)
+        apres = cache.version_identifiants(
+            id_utilisateur,
+            lambda: dao.read(id_utilisateur),
+        )
+
+        # THEN
+        if apres != avant + 1:
+            raise AssertionError(
+                message=f"Version {avant + 1} attendue, obtenu: {apres}",
+            )
@@ -1,10 +1,17 @@
 """Tests d'intégration pour CocktailDAO."""
 
+import asyncio
+
 import pytest
 
 from src.business_object.cocktail import Cocktail
-from src.dao.cocktail_dao import CocktailDAO
+from src.dao.async_db_connection import AsyncDBConnection
+from src.dao.cocktail_dao import AsyncCocktailDAO, CocktailDAO
+from src.dao.index_recettes import InstantaneIndex
 from src.dao.instruction_dao import InstructionDAO
+from src.dao.stock_dao import StockDAO
+from src.service.cocktail_service import CocktailService
+from src.utils.pagination import cle_quasi_realisable
 
 
 class TestCocktailDAOIntegration:
@@ -725,6 +732,250 @@ class TestCocktailDAOIntegration:
                 message="Menthe devrait être dans les ingrédients",
             )
 
+    # ========== Tests pour calculer_cocktails_quasi_realisables ==========
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_calculer_cocktails_quasi_realisables_comme_l_index(
+        db_connection,
+    ) -> None:
+        """Teste que le calcul en base donne le résultat du moteur en mémoire."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO utilisateur (pseudo, mail, mot_de_passe, date_naissance)
+                VALUES ('testuser', 'test@example.com', 'pass', '1990-01-01')
+                RETURNING id_utilisateur
+                """,
+            )
+            user_id = cursor.fetchone()["id_utilisateur"]
+            cursor.execute(
+                """
+                INSERT INTO ingredient (nom)
+                VALUES ('Vodka'), ('Sucre'), ('Citron'), ('Sel'), ('Glace'),
+                       ('Sirop'), ('Menthe')
+                RETURNING id_ingredient
+                """,
+            )
+            ingredient = dict(
+                zip(
+                    ("vodka", "sucre", "citron", "sel", "glace", "sirop", "menthe"),
+                    (row["id_ingredient"] for row in cursor.fetchall()),
+                    strict=True,
+                ),
+            )
+            cursor.execute(
+                """
+                INSERT INTO unite (nom, abbreviation)
+                VALUES ('centilitre', 'cl'), ('gramme', 'g'), ('tranche', 'slice'),
+                       ('cuillère à soupe', 'tbsp'), ('pièce', 'pcs')
+                RETURNING id_unite
+                """,
+            )
+            unite = dict(
+                zip(
+                    ("cl", "g", "slice", "tbsp", "pcs"),
+                    (row["id_unite"] for row in cursor.fetchall()),
+                    strict=True,
+                ),
+            )
+            cursor.execute(
+                "INSERT INTO cocktail (nom) VALUES ('Alpha'), ('Beta'), ('Gamma'), "
+                "('Delta'), ('Epsilon') RETURNING id_cocktail",
+            )
+            alpha, beta, gamma, delta, epsilon = (
+                row["id_cocktail"] for row in cursor.fetchall()
+            )
+            vodka = ingredient["vodka"]
+            # Lignes non normalisées (antérieures à la normalisation)
+            cursor.execute(
+                """
+                INSERT INTO stock (id_utilisateur, id_ingredient, quantite, id_unite)
+                VALUES (%s, %s, 3, %s), (%s, %s, 1, %s), (%s, %s, 0, %s)
+                """,
+                (
+                    *(user_id, ingredient["glace"], unite["slice"]),
+                    *(user_id, ingredient["sirop"], unite["tbsp"]),
+                    *(user_id, ingredient["citron"], unite["cl"]),
+                ),
+            )
+            cursor.execute(
+                """
+                INSERT INTO cocktail_ingredient (id_cocktail, id_ingredient, qte, unite)
+                VALUES (%s, %s, 1, 'tblsp')
+                """,
+                (delta, ingredient["sirop"]),
+            )
+            db_connection.commit()
+
+        dao = CocktailDAO()
+        recettes = {
+            alpha: [(vodka, 50, "ml"), (ingredient["sucre"], 2, "oz")],
+            beta: [
+                (vodka, 60, "ml"),
+                (ingredient["citron"], 1, "slice"),
+                (ingredient["sel"], 10, "g"),
+            ],
+            gamma: [(ingredient["sucre"], 1, "cup"), (ingredient["glace"], 2, None)],
+            delta: [(vodka, 4, "cl"), (ingredient["citron"], 1, "slice")],
+            # Unité saisie avec sa quantité, stockée sous une autre écriture
+            epsilon: [
+                (vodka, 4, "cl"),
+                (ingredient["menthe"], 2, "2 pieces"),
+                (ingredient["sel"], 10, "g"),
+            ],
+        }
+        for id_cocktail, ingredients in recettes.items():
+            dao.add_ingredients_to_cocktail(
+                id_cocktail,
+                [
+                    {"id_ingredient": i, "quantite": qte, "unite": unite}
+                    for i, qte, unite in ingredients
+                ],
+            )
+        StockDAO().set_stock_item(user_id, vodka, 5, unite["cl"])
+        StockDAO().set_stock_item(user_id, ingredient["sucre"], 100, unite["g"])
+        StockDAO().set_stock_item(user_id, ingredient["sel"], 5, unite["cl"])
+        StockDAO().set_stock_item(user_id, ingredient["menthe"], 3, unite["pcs"])
+
+        # WHEN
+        result = dao.calculer_cocktails_quasi_realisables(user_id, 3)
+
+        # THEN
+        index = InstantaneIndex(dao.get_tous_cocktails_avec_ingredients())
+        attendu = CocktailService.filter_and_format_cocktails(
+            index.cocktails_quasi_realisables(
+                index.evaluer(StockDAO().get_stock(user_id)),
+                3,
+            ),
+            3,
+        )
+        if result != attendu:
+            raise AssertionError(
+                message=f"Résultat du moteur en mémoire attendu {attendu}, "
+                f"obtenu: {result}",
+            )
+        noms = [cocktail["nom"] for cocktail in result]
+        if noms != ["Delta", "Epsilon", "Gamma", "Beta"]:
+            raise AssertionError(
+                message=f"Delta, Epsilon, Gamma puis Beta attendus, obtenu: {noms}",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_calculer_cocktails_quasi_realisables_max_manquants(
+        db_connection,
+    ) -> None:
+        """Teste que seuls les cocktails sous le seuil de manquants sont lus."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO utilisateur (pseudo, mail, mot_de_passe, date_naissance)
+                VALUES ('testuser', 'test@example.com', 'pass', '1990-01-01')
+                RETURNING id_utilisateur
+                """,
+            )
+            user_id = cursor.fetchone()["id_utilisateur"]
+            cursor.execute(
+                "INSERT INTO ingredient (nom) VALUES ('Rhum'), ('Menthe') "
+                "RETURNING id_ingredient",
+            )
+            rhum, menthe = (row["id_ingredient"] for row in cursor.fetchall())
+            cursor.execute(
+                "INSERT INTO cocktail (nom) VALUES ('Ti Punch'), ('Mojito') "
+                "RETURNING id_cocktail",
+            )
+            ti_punch, mojito = (row["id_cocktail"] for row in cursor.fetchall())
+            cursor.execute(
+                """
+                INSERT INTO cocktail_ingredient (id_cocktail, id_ingredient)
+                VALUES (%s, %s), (%s, %s), (%s, %s)
+                """,
+                (ti_punch, rhum, mojito, rhum, mojito, menthe),
+            )
+            db_connection.commit()
+
+        # WHEN
+        result = CocktailDAO().calculer_cocktails_quasi_realisables(user_id, 1)
+
+        # THEN
+        if [cocktail["nom"] for cocktail in result] != ["Ti Punch"]:
+            raise AssertionError(
+                message=f"Seul Ti Punch attendu, obtenu: {result}",
+            )
+        if result[0]["ingredients_manquants"] != ["Rhum"]:
+            raise AssertionError(
+                message=f"Rhum manquant attendu, obtenu: {result[0]}",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_calculer_cocktails_quasi_realisables_pagination(db_connection) -> None:
+        """Teste que les pages par clé donnent la liste complète, homonymes compris."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO utilisateur (pseudo, mail, mot_de_passe, date_naissance)
+                VALUES ('testuser', 'test@example.com', 'pass', '1990-01-01')
+                RETURNING id_utilisateur
+                """,
+            )
+            user_id = cursor.fetchone()["id_utilisateur"]
+            cursor.execute(
+                "INSERT INTO ingredient (nom) VALUES ('Rhum'), ('Menthe'), "
+                "('Citron') RETURNING id_ingredient",
+            )
+            rhum, menthe, citron = (row["id_ingredient"] for row in cursor.fetchall())
+            cursor.execute(
+                "INSERT INTO cocktail (nom) VALUES ('Mojito'), ('Mojito'), "
+                "('Daiquiri'), ('Zombie') RETURNING id_cocktail",
+            )
+            ids = [row["id_cocktail"] for row in cursor.fetchall()]
+            cursor.execute(
+                """
+                INSERT INTO cocktail_ingredient (id_cocktail, id_ingredient)
+                VALUES (%s, %s), (%s, %s), (%s, %s), (%s, %s), (%s, %s), (%s, %s),
+                       (%s, %s)
+                """,
+                (
+                    *(ids[0], rhum, ids[0], menthe),
+                    *(ids[1], rhum, ids[1], menthe),
+                    *(ids[2], rhum, ids[2], citron),
+                    *(ids[3], menthe),
+                ),
+            )
+            cursor.execute(
+                "INSERT INTO stock (id_utilisateur, id_ingredient, quantite) "
+                "VALUES (%s, %s, 1)",
+                (user_id, rhum),
+            )
+            db_connection.commit()
+        dao = CocktailDAO()
+        complet = dao.calculer_cocktails_quasi_realisables(user_id, 2)
+
+        # WHEN
+        pages = []
+        apres = None
+        while page := dao.calculer_cocktails_quasi_realisables(
+            user_id,
+            2,
+            limit=3,
+            apres=apres,
+        ):
+            pages.append(page)
+            apres = cle_quasi_realisable(page[-1])
+
+        # THEN
+        obtenu = [cocktail["id_cocktail"] for page in pages for cocktail in page]
+        attendu = [cocktail["id_cocktail"] for cocktail in complet]
+        if obtenu != attendu or attendu != [ids[2], ids[0], ids[1], ids[3]]:
+            raise AssertionError(
+                message=f"Pages {obtenu} différentes de la liste {attendu}",
+            )
+
     @pytest.mark.usefixtures("clean_database")
     @staticmethod
     def test_ajouter_cocktail_success(db_connection) -> None:
@@ -880,3 +1131,213 @@ class TestCocktailDAOIntegration:
                     message=f"Texte devrait être '{texte_instruction}', obtenu: "
                     f"{instruction_row['texte']}",
                 )
+
+    # ========== Tests de la normalisation des quantités ==========
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_add_ingredient_to_cocktail_normalise_quantite(db_connection) -> None:
+        """Teste que la quantité est normalisée en ml à l'insertion."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO cocktail (nom) VALUES ('Mojito') RETURNING id_cocktail",
+            )
+            id_cocktail = cursor.fetchone()["id_cocktail"]
+            cursor.execute(
+                "INSERT INTO ingredient (nom) VALUES ('Rhum') RETURNING id_ingredient",
+            )
+            id_ingredient = cursor.fetchone()["id_ingredient"]
+            db_connection.commit()
+
+        # WHEN
+        CocktailDAO().add_ingredient_to_cocktail(id_cocktail, id_ingredient, 4, "cl")
+
+        # THEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT qte_normalisee, type_unite FROM cocktail_ingredient "
+                "WHERE id_cocktail = %s",
+                (id_cocktail,),
+            )
+            row = cursor.fetchone()
+        qte_ml = 40
+        if row["qte_normalisee"] != qte_ml or row["type_unite"] != "liquide":
+            raise AssertionError(
+                message=f"40 ml attendus, obtenu: {row}",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_normaliser_quantites_lignes_existantes(db_connection) -> None:
+        """Teste que la tâche de reprise normalise les lignes non normalisées."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO cocktail (nom) VALUES ('Mojito') RETURNING id_cocktail",
+            )
+            id_cocktail = cursor.fetchone()["id_cocktail"]
+            cursor.execute(
+                """
+                INSERT INTO ingredient (nom)
+                VALUES ('Rhum'), ('Sucre'), ('Citron vert')
+                RETURNING id_ingredient
+                """,
+            )
+            ids = [row["id_ingredient"] for row in cursor.fetchall()]
+            cursor.execute(
+                """
+                INSERT INTO cocktail_ingredient (id_cocktail, id_ingredient, qte, unite)
+                VALUES (%s, %s, 2, 'oz'), (%s, %s, 0.5, 'kg'), (%s, %s, 1, 'slice')
+                """,
+                (id_cocktail, ids[0], id_cocktail, ids[1], id_cocktail, ids[2]),
+            )
+            db_connection.commit()
+
+        # WHEN
+        nb_lignes = CocktailDAO().normaliser_quantites()
+
+        # THEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT qte_normalisee, type_unite FROM cocktail_ingredient "
+                "WHERE id_cocktail = %s ORDER BY id_ingredient",
+                (id_cocktail,),
+            )
+            obtenu = [
+                (float(row["qte_normalisee"]), row["type_unite"])
+                for row in cursor.fetchall()
+            ]
+        attendu = [(59.15, "liquide"), (500.0, "solide"), (1.0, "autre")]
+        if obtenu != attendu or nb_lignes != len(attendu):
+            raise AssertionError(
+                message=f"{attendu} attendu, obtenu: {obtenu} ({nb_lignes} lignes)",
+            )
+        if CocktailDAO().normaliser_quantites() != 0:
+            raise AssertionError(
+                message="Une seconde exécution ne devrait rien modifier",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_normaliser_quantites_mesures_texte_libre(db_connection) -> None:
+        """Teste la normalisation des unités saisies avec leur quantité."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO cocktail (nom) VALUES ('Mojito') RETURNING id_cocktail",
+            )
+            id_cocktail = cursor.fetchone()["id_cocktail"]
+            cursor.execute(
+                """
+                INSERT INTO ingredient (nom)
+                VALUES ('Rhum'), ('Angostura'), ('Citron vert')
+                RETURNING id_ingredient
+                """,
+            )
+            ids = [row["id_ingredient"] for row in cursor.fetchall()]
+            cursor.execute(
+                """
+                INSERT INTO cocktail_ingredient (id_cocktail, id_ingredient, qte, unite)
+                VALUES (%s, %s, NULL, '1 1/2 oz'), (%s, %s, 2, 'Dashes'),
+                       (%s, %s, NULL, 'Juice of 1/2')
+                """,
+                (id_cocktail, ids[0], id_cocktail, ids[1], id_cocktail, ids[2]),
+            )
+            db_connection.commit()
+
+        # WHEN
+        nb_lignes = CocktailDAO().normaliser_quantites()
+
+        # THEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT qte_normalisee, type_unite, unite_canonique "
+                "FROM cocktail_ingredient "
+                "WHERE id_cocktail = %s ORDER BY id_ingredient",
+                (id_cocktail,),
+            )
+            obtenu = [
+                (
+                    float(row["qte_normalisee"]),
+                    row["type_unite"],
+                    row["unite_canonique"],
+                )
+                for row in cursor.fetchall()
+            ]
+        attendu = [
+            (44.36, "liquide", "oz"),
+            (1.84, "liquide", "dash"),
+            (0.5, "autre", "juice"),
+        ]
+        if obtenu != attendu or nb_lignes != len(attendu):
+            raise AssertionError(
+                message=f"{attendu} attendu, obtenu: {obtenu} ({nb_lignes} lignes)",
+            )
+
+
+class TestAsyncCocktailDAOIntegration:
+    """Tests d'intégration pour AsyncCocktailDAO."""
+
+    @staticmethod
+    def executer(coroutine: object) -> object:
+        """Exécute une coroutine du DAO puis ferme le pool asynchrone."""
+
+        async def scenario() -> object:
+            try:
+                return await coroutine
+            finally:
+                await AsyncDBConnection().close()
+
+        return asyncio.run(scenario())
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_rechercher_cocktail_par_nom(self, db_connection) -> None:
+        """Teste que la version asynchrone retrouve le même cocktail."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO cocktail (nom, categorie, verre, alcool, image)
+                VALUES ('Mojito', 'Cocktail', 'Highball', TRUE, 'mojito.jpg')
+            """,
+            )
+            db_connection.commit()
+
+        # WHEN
+        result = self.executer(AsyncCocktailDAO().rechercher_cocktail_par_nom("mojito"))
+
+        # THEN
+        if result != CocktailDAO().rechercher_cocktail_par_nom("mojito"):
+            raise AssertionError(
+                message=f"Le même cocktail que le DAO synchrone attendu, obtenu: "
+                f"{result}",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_rechercher_cocktail_par_sequence_debut(self, db_connection) -> None:
+        """Teste la recherche asynchrone par séquence."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO cocktail (nom, categorie, verre, alcool, image)
+                VALUES
+                    ('Mojito', 'Cocktail', 'Highball', TRUE, 'img.jpg'),
+                    ('Margarita', 'Cocktail', 'Coupe', TRUE, 'img.jpg'),
+                    ('Manhattan', 'Cocktail', 'Coupe', TRUE, 'img.jpg')
+            """,
+            )
+            db_connection.commit()
+
+        # WHEN
+        result = self.executer(
+            AsyncCocktailDAO().rechercher_cocktail_par_sequence_debut("Ma", 10),
+        )
+
+        # THEN
+        noms = [c.nom for c in result]
+        if noms != ["Manhattan", "Margarita"]:
+            raise AssertionError(
+                message=f"['Manhattan', 'Margarita'] attendu, obtenu: {noms}",
+            )
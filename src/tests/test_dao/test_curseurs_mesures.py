@@ -0,0 +1,79 @@
+"""Tests d'intégration des curseurs qui mesurent les requêtes SQL."""
+
+import asyncio
+
+from src.dao.async_db_connection import AsyncDBConnection
+from src.dao.db_connection import DBConnection
+from src.utils.metriques import DAO_DUREE, DAO_LIGNES, RegistreMetriques
+
+
+def lire_trois_lignes() -> list[dict]:
+    """Exécute une requête qui retourne trois lignes."""
+    with DBConnection().connection() as connection, connection.cursor() as cursor:
+        cursor.execute("SELECT generate_series(1, 3) AS n")
+        return cursor.fetchall()
+
+
+async def lire_deux_lignes() -> list[dict]:
+    """Exécute, de façon asynchrone, une requête qui retourne deux lignes."""
+    try:
+        async with AsyncDBConnection().connection() as connection:
+            cursor = await connection.execute("SELECT generate_series(1, 2) AS n")
+            return await cursor.fetchall()
+    finally:
+        await AsyncDBConnection().close()
+
+
+def _lignes_comptees(methode: str) -> str | None:
+    """Retourne la ligne exportée du compteur de lignes d'une méthode."""
+    prefixe = f'{DAO_LIGNES}{{methode="{methode}"}} '
+    return next(
+        (
+            ligne
+            for ligne in RegistreMetriques().exporter().splitlines()
+            if ligne.startswith(prefixe)
+        ),
+        None,
+    )
+
+
+class TestCurseursMesures:
+    """Tests de CurseurMesure et CurseurAsyncMesure."""
+
+    @staticmethod
+    def test_requete_synchrone_mesuree() -> None:
+        """Teste qu'une requête est mesurée sous le nom de la fonction appelante."""
+        # WHEN
+        lignes = lire_trois_lignes()
+
+        # THEN
+        if [ligne["n"] for ligne in lignes] != [1, 2, 3]:
+            raise AssertionError(message=f"Lignes inattendues : {lignes}")
+        histogramme = RegistreMetriques().histogramme(
+            DAO_DUREE,
+            methode="lire_trois_lignes",
+        )
+        if histogramme is None or histogramme.nombre != 1:
+            raise AssertionError(message="Une requête mesurée attendue")
+        compte = _lignes_comptees("lire_trois_lignes")
+        if compte is None or not compte.endswith(" 3"):
+            raise AssertionError(message=f"3 lignes attendues, obtenu : {compte}")
+
+    @staticmethod
+    def test_requete_asynchrone_mesuree() -> None:
+        """Teste qu'une requête async est mesurée, psycopg sauté dans la pile."""
+        # WHEN
+        lignes = asyncio.run(lire_deux_lignes())
+
+        # THEN
+        if [ligne["n"] for ligne in lignes] != [1, 2]:
+            raise AssertionError(message=f"Lignes inattendues : {lignes}")
+        histogramme = RegistreMetriques().histogramme(
+            DAO_DUREE,
+            methode="lire_deux_lignes",
+        )
+        if histogramme is None or histogramme.nombre != 1:
+            raise AssertionError(message="Une requête mesurée attendue")
+        compte = _lignes_comptees("lire_deux_lignes")
+        if compte is None or not compte.endswith(" 2"):
+            raise AssertionError(message=f"2 lignes attendues, obtenu : {compte}")
@@ -0,0 +1,264 @@
+"""Tests d'intégration pour le pool de connexions."""
+
+import asyncio
+import contextlib
+import os
+import threading
+
+import pytest
+from psycopg2 import Error as DBError
+from psycopg2.extras import RealDictCursor
+
+from src.dao.async_db_connection import AsyncDBConnection
+from src.dao.db_connection import ConnectionPool, DBConnection
+from src.utils.exceptions import PoolTimeoutError
+
+
+def creer_pool(
+    minconn: int = 0,
+    maxconn: int = 2,
+    timeout: float = 0.1,
+) -> ConnectionPool:
+    """Crée un pool dédié au test sur la base de test."""
+    return ConnectionPool(
+        minconn,
+        maxconn,
+        timeout,
+        host=os.environ["POSTGRES_HOST"],
+        port=os.environ["POSTGRES_PORT"],
+        database=os.environ["POSTGRES_DATABASE"],
+        user=os.environ["POSTGRES_USER"],
+        password=os.environ["POSTGRES_PASSWORD"],
+        cursor_factory=RealDictCursor,
+    )
+
+
+class TestConnectionPool:
+    """Tests du ConnectionPool."""
+
+    @staticmethod
+    def test_minconn_ouvertes_a_la_creation() -> None:
+        """Teste que minconn connexions sont ouvertes dès la création."""
+        # GIVEN / WHEN
+        nb_connexions = 2
+        pool = creer_pool(minconn=nb_connexions, maxconn=3)
+
+        # THEN
+        stats = pool.stats()
+        pool.closeall()
+        if (
+            stats["opened"] != nb_connexions
+            or stats["idle"] != nb_connexions
+            or stats["in_use"] != 0
+        ):
+            raise AssertionError(
+                message=f"2 connexions inactives attendues, obtenu: {stats}",
+            )
+
+    @staticmethod
+    def test_connexion_recyclee() -> None:
+        """Teste qu'une connexion rendue est réutilisée au prochain emprunt."""
+        # GIVEN
+        pool = creer_pool()
+        premiere = pool.getconn()
+        pool.putconn(premiere)
+
+        # WHEN
+        seconde = pool.getconn()
+
+        # THEN
+        pool.putconn(seconde)
+        stats = pool.stats()
+        pool.closeall()
+        if seconde is not premiere:
+            raise AssertionError(message="La connexion aurait dû être recyclée")
+        nb_emprunts = 2
+        if stats["opened"] != 1 or stats["checkouts"] != nb_emprunts:
+            raise AssertionError(
+                message=f"1 connexion ouverte et 2 emprunts attendus, obtenu: {stats}",
+            )
+
+    @staticmethod
+    def test_timeout_quand_pool_plein() -> None:
+        """Teste qu'un emprunt sur un pool plein échoue après le timeout."""
+        # GIVEN
+        pool = creer_pool(maxconn=1, timeout=0.05)
+        connection = pool.getconn()
+
+        # WHEN / THEN
+        with pytest.raises(PoolTimeoutError):
+            pool.getconn()
+
+        pool.putconn(connection)
+        stats = pool.stats()
+        pool.closeall()
+        if stats["timeouts"] != 1:
+            raise AssertionError(message=f"1 timeout attendu, obtenu: {stats}")
+
+    @staticmethod
+    def test_attente_liberation_connexion() -> None:
+        """Teste qu'un emprunt bloqué reçoit la connexion rendue par un autre thread."""
+        # GIVEN
+        pool = creer_pool(maxconn=1, timeout=2)
+        connection = pool.getconn()
+        timer = threading.Timer(0.05, pool.putconn, args=(connection,))
+        timer.start()
+
+        # WHEN
+        obtenue = pool.getconn()
+
+        # THEN
+        timer.join()
+        pool.putconn(obtenue)
+        stats = pool.stats()
+        pool.closeall()
+        if obtenue is not connection:
+            raise AssertionError(message="La connexion libérée aurait dû être obtenue")
+        if stats["waits"] != 1 or stats["max_wait_ms"] <= 0:
+            raise AssertionError(message=f"1 attente attendue, obtenu: {stats}")
+
+    @staticmethod
+    def test_transaction_en_erreur_annulee_au_retour() -> None:
+        """Teste qu'une transaction en erreur est annulée avant recyclage."""
+        # GIVEN
+        pool = creer_pool()
+        connection = pool.getconn()
+        with connection.cursor() as cursor, contextlib.suppress(DBError):
+            cursor.execute("SELECT * FROM table_inexistante")
+
+        # WHEN
+        pool.putconn(connection)
+        recyclee = pool.getconn()
+
+        # THEN
+        with recyclee.cursor() as cursor:
+            cursor.execute("SELECT 1 AS un")
+            resultat = cursor.fetchone()
+        pool.putconn(recyclee)
+        pool.closeall()
+        if resultat["un"] != 1:
+            raise AssertionError(message="La connexion recyclée devrait être saine")
+
+    @staticmethod
+    def test_connexion_fermee_jetee() -> None:
+        """Teste qu'une connexion fermée n'est pas remise dans le pool."""
+        # GIVEN
+        pool = creer_pool()
+        connection = pool.getconn()
+        connection.close()
+
+        # WHEN
+        pool.putconn(connection)
+
+        # THEN
+        stats = pool.stats()
+        pool.closeall()
+        if stats["opened"] != 0 or stats["discarded"] != 1:
+            raise AssertionError(
+                message=f"La connexion aurait dû être jetée, obtenu: {stats}",
+            )
+
+
+class TestDBConnection:
+    """Tests de DBConnection."""
+
+    @staticmethod
+    def test_connection_rendue_au_pool() -> None:
+        """Teste que la connexion est rendue au pool à la sortie du bloc."""
+        # GIVEN
+        db = DBConnection()
+
+        # WHEN
+        with db.connection() as connection, connection.cursor() as cursor:
+            cursor.execute("SELECT 1 AS un")
+            pendant = db.stats()["in_use"]
+
+        # THEN
+        apres = db.stats()["in_use"]
+        if pendant != 1 or apres != 0:
+            raise AssertionError(
+                message=f"in_use attendu 1 puis 0, obtenu: {pendant} puis {apres}",
+            )
+
+    @staticmethod
+    def test_request_scope_partage_la_connexion() -> None:
+        """Teste que les DAO d'une même portée partagent une connexion."""
+        # GIVEN
+        db = DBConnection()
+
+        # WHEN
+        with db.request_scope():
+            with db.connection() as premiere:
+                pass
+            with db.connection() as seconde:
+                pass
+            pendant = db.stats()["in_use"]
+
+        # THEN
+        apres = db.stats()["in_use"]
+        if premiere is not seconde:
+            raise AssertionError(message="La connexion devrait être partagée")
+        if pendant != 1 or apres != 0:
+            raise AssertionError(
+                message=f"in_use attendu 1 puis 0, obtenu: {pendant} puis {apres}",
+            )
+
+
+class TestAsyncDBConnection:
+    """Tests de AsyncDBConnection."""
+
+    @staticmethod
+    def test_connection_asynchrone() -> None:
+        """Teste qu'une requête emprunte une connexion au pool asynchrone."""
+
+        # GIVEN
+        async def scenario() -> tuple[dict, dict]:
+            db = AsyncDBConnection()
+            try:
+                async with db.connection() as connection:
+                    cursor = await connection.execute("SELECT 1 AS un")
+                    ligne = await cursor.fetchone()
+                return ligne, db.stats()
+            finally:
+                await db.close()
+
+        # WHEN
+        ligne, stats = asyncio.run(scenario())
+
+        # THEN
+        if ligne != {"un": 1}:
+            raise AssertionError(message=f"{{'un': 1}} attendu, obtenu: {ligne}")
+        # Le retour de la connexion au pool n'est pas synchrone (pool_available
+        # peut être relevé avant) : seul l'emprunt est vérifié
+        if stats["requests_num"] != 1:
+            raise AssertionError(
+                message=f"1 emprunt au pool attendu, obtenu: {stats}",
+            )
+
+    @staticmethod
+    def test_requetes_concurrentes() -> None:
+        """Teste que des requêtes concurrentes empruntent des connexions distinctes."""
+
+        # GIVEN
+        async def requete(db: AsyncDBConnection) -> int:
+            async with db.connection() as connection:
+                cursor = await connection.execute(
+                    "SELECT pg_backend_pid() AS pid, pg_sleep(0.05)",
+                )
+                return (await cursor.fetchone())["pid"]
+
+        async def scenario() -> list[int]:
+            db = AsyncDBConnection()
+            try:
+                return await asyncio.gather(requete(db), requete(db))
+            finally:
+                await db.close()
+
+        # WHEN
+        pids = asyncio.run(scenario())
+
+        # THEN
+        if len(set(pids)) != len(pids):
+            raise AssertionError(
+                message=f"Connexions distinctes attendues, obtenu: {pids}",
+            )
@@ -0,0 +1,199 @@
+"""Tests pour l'index des noms de cocktails (recherche par préfixe)."""
+
+import pytest
+
+from src.business_object.cocktail import Cocktail
+from src.dao.cocktail_dao import CocktailDAO
+from src.dao.index_noms import IndexNoms
+
+
+def ligne(id_cocktail: int, nom: str) -> dict:
+    """Construit une ligne de la table cocktail."""
+    return {
+        "id_cocktail": id_cocktail,
+        "nom": nom,
+        "categorie": "Cocktail",
+        "verre": "Coupe",
+        "alcool": True,
+        "image": f"{nom}.jpg",
+    }
+
+
+def noms(lignes: list[dict]) -> list[str]:
+    """Retourne les noms des lignes, dans l'ordre."""
+    return [ligne["nom"] for ligne in lignes]
+
+
+def catalogue_interdit() -> list[dict]:
+    """Chargeur qui échoue : l'index aurait dû être servi en mémoire."""
+    raise AssertionError(message="L'index n'aurait pas dû être rechargé")
+
+
+@pytest.fixture
+def index() -> IndexNoms:
+    """Index construit sur un petit catalogue."""
+    index = IndexNoms()
+    index.construire(
+        lambda: [
+            ligne(1, "Mojito"),
+            ligne(2, "Margarita"),
+            ligne(3, "Manhattan"),
+            ligne(4, "mai tai"),
+            ligne(5, "Gin Tonic"),
+        ],
+    )
+    return index
+
+
+class TestIndexNoms:
+    """Tests de la recherche par préfixe en mémoire."""
+
+    @staticmethod
+    def test_rechercher_prefixe_insensible_a_la_casse(index) -> None:
+        """Teste la tranche du préfixe, triée comme ORDER BY nom."""
+        # WHEN
+        resultat = index.rechercher("MA", 10, catalogue_interdit)
+
+        # THEN
+        if noms(resultat) != ["Manhattan", "Margarita", "mai tai"]:
+            raise AssertionError(message=f"Résultat inattendu: {noms(resultat)}")
+
+    @staticmethod
+    def test_rechercher_limite(index) -> None:
+        """Teste que seuls les max_resultats premiers noms sont retournés."""
+        resultat = index.rechercher("m", 2, catalogue_interdit)
+
+        if noms(resultat) != ["Manhattan", "Margarita"]:
+            raise AssertionError(message=f"Résultat inattendu: {noms(resultat)}")
+
+    @staticmethod
+    def test_ajouter_et_retirer(index) -> None:
+        """Teste que l'index suit les ajouts et suppressions sans rechargement."""
+        # WHEN
+        index.ajouter(ligne(6, "Martini"))
+        index.retirer(2)
+
+        # THEN
+        resultat = index.rechercher("mar", 10, catalogue_interdit)
+        if noms(resultat) != ["Martini"]:
+            raise AssertionError(message=f"['Martini'] attendu: {noms(resultat)}")
+
+    @staticmethod
+    def test_ajouter_deja_indexe(index) -> None:
+        """Teste qu'un cocktail déjà indexé (lu au chargement) n'est pas dupliqué."""
+        # WHEN
+        index.ajouter(ligne(1, "Mojito"))
+        doublon = index.rechercher("mo", 10, catalogue_interdit)
+        index.retirer(1)
+
+        # THEN
+        if noms(doublon) != ["Mojito"]:
+            raise AssertionError(message=f"['Mojito'] attendu: {noms(doublon)}")
+        resultat = index.rechercher("m", 10, catalogue_interdit)
+        if noms(resultat) != ["Manhattan", "Margarita", "mai tai"]:
+            raise AssertionError(message=f"Résultat inattendu: {noms(resultat)}")
+        if len(index.tirer(10, catalogue_interdit)) != len(resultat) + 1:
+            raise AssertionError(message="Le tirage devrait couvrir 4 cocktails")
+
+    @staticmethod
+    def test_tirer_cocktails_distincts(index) -> None:
+        """Teste le tirage sans doublon, après ajouts et suppressions."""
+        # GIVEN
+        index.retirer(2)
+        index.ajouter(ligne(6, "Martini"))
+
+        # WHEN
+        tirage = index.tirer(10, catalogue_interdit)
+        un_seul = index.tirer(1, catalogue_interdit)
+
+        # THEN
+        ids = sorted(ligne["id_cocktail"] for ligne in tirage)
+        if ids != [1, 3, 4, 5, 6]:
+            raise AssertionError(message=f"Tous les cocktails attendus: {ids}")
+        if len(un_seul) != 1 or un_seul[0]["id_cocktail"] not in ids:
+            raise AssertionError(message=f"Un cocktail attendu: {un_seul}")
+
+    @staticmethod
+    def test_rechercher_index_froid() -> None:
+        """Teste que l'index froid est chargé une fois puis réutilisé."""
+        # GIVEN
+        chargements = []
+
+        def charger() -> list[dict]:
+            chargements.append(1)
+            return [ligne(1, "Mojito")]
+
+        index = IndexNoms()
+
+        # WHEN
+        premier = index.rechercher("mo", 10, charger)
+        second = index.rechercher("mo", 10, charger)
+
+        # THEN
+        if noms(premier) != ["Mojito"] or second != premier or len(chargements) != 1:
+            raise AssertionError(
+                message=f"Un seul chargement attendu, obtenu: {len(chargements)}",
+            )
+
+
+@pytest.mark.usefixtures("clean_database")
+class TestCocktailDAOIndexNoms:
+    """Tests de la synchronisation de l'index avec CocktailDAO."""
+
+    @staticmethod
+    def test_ajouter_puis_supprimer_cocktail() -> None:
+        """Teste que les cocktails ajoutés puis supprimés suivent l'index."""
+        # GIVEN
+        dao = CocktailDAO()
+        dao.rechercher_cocktail_par_sequence_debut("Ma", 10)
+
+        # WHEN
+        id_cocktail = dao.ajouter_cocktail(
+            Cocktail(None, "Margarita", "Cocktail", "Coupe", alcool=True, image=""),
+        )
+        apres_ajout = dao.rechercher_cocktail_par_sequence_debut("ma", 10)
+        dao.supprimer_cocktail(id_cocktail)
+        apres_suppression = dao.rechercher_cocktail_par_sequence_debut("ma", 10)
+
+        # THEN
+        if [c.id_cocktail for c in apres_ajout] != [id_cocktail]:
+            raise AssertionError(message="Le cocktail ajouté devrait être trouvé")
+        if apres_suppression:
+            raise AssertionError(message="Le cocktail supprimé ne devrait plus l'être")
+
+    @staticmethod
+    def test_rechercher_cocktail_aleatoire() -> None:
+        """Teste le tirage d'un cocktail de la base, et d'aucun si elle est vide."""
+        # GIVEN
+        dao = CocktailDAO()
+        vide = dao.rechercher_cocktail_aleatoire()
+        id_cocktail = dao.ajouter_cocktail(
+            Cocktail(None, "Margarita", "Cocktail", "Coupe", alcool=True, image=""),
+        )
+
+        # WHEN
+        cocktail = dao.rechercher_cocktail_aleatoire()
+
+        # THEN
+        if vide is not None or cocktail.id_cocktail != id_cocktail:
+            raise AssertionError(message=f"Margarita attendue, obtenu: {cocktail}")
+
+    @staticmethod
+    def test_sequence_avec_joker_confiee_a_la_base(db_connection) -> None:
+        """Teste qu'une séquence contenant % garde la sémantique de LIKE."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO cocktail (nom, categorie, verre, alcool, image)
+                VALUES ('Mojito', 'Cocktail', 'Highball', TRUE, 'img.jpg')
+            """,
+            )
+            db_connection.commit()
+
+        # WHEN
+        result = CocktailDAO().rechercher_cocktail_par_sequence_debut("%jit", 10)
+
+        # THEN
+        if [c.nom for c in result] != ["Mojito"]:
+            raise AssertionError(message=f"['Mojito'] attendu, obtenu: {result}")
@@ -0,0 +1,419 @@
+"""Tests pour l'index des recettes et la matrice de faisabilité."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.business_object.cocktail import Cocktail
+from src.dao.cocktail_dao import CocktailDAO
+from src.dao.index_recettes import IndexRecettes, InstantaneIndex, StockVectorise
+from src.service.cocktail_service import CocktailService
+
+
+def ligne(
+    id_cocktail: int,
+    nom: str,
+    id_ingredient: int | None,
+    qte: float | None = None,
+    unite: str | None = None,
+) -> dict:
+    """Construit une ligne cocktail/ingrédient du catalogue."""
+    return {
+        "id_cocktail": id_cocktail,
+        "nom": nom,
+        "categorie": "Cocktail",
+        "verre": "Highball glass",
+        "alcool": True,
+        "image": f"{nom}.jpg",
+        "id_ingredient": id_ingredient,
+        "qte": qte,
+        "unite": unite,
+        "nom_ingredient": f"Ingrédient {id_ingredient}",
+    }
+
+
+def stock(*items: tuple[int, float, str | None]) -> list[dict]:
+    """Construit des lignes de stock (id_ingredient, quantite, code_unite)."""
+    return [
+        {"id_ingredient": id_ingredient, "quantite": quantite, "code_unite": unite}
+        for id_ingredient, quantite, unite in items
+    ]
+
+
+@pytest.fixture
+def index() -> InstantaneIndex:
+    """Index d'un petit catalogue."""
+    return InstantaneIndex(
+        [
+            ligne(1, "Screwdriver", 1, 50.0, "ml"),
+            ligne(1, "Screwdriver", 2, 10.0, "cl"),
+            ligne(2, "Vodka Shot", 1, 4.0, "cl"),
+            ligne(3, "Eau", None),
+            ligne(4, "Gin Tonic", 3, 50.0, "ml"),
+            ligne(4, "Gin Tonic", 4, 100.0, "ml"),
+        ],
+    )
+
+
+class TestInstantaneIndex:
+    """Tests du calcul des cocktails réalisables avec la matrice."""
+
+    @staticmethod
+    def test_structure(index) -> None:
+        """Teste qu'une colonne est créée par ingrédient et une ligne par cocktail."""
+        # THEN
+        nb_ingredients = [2, 1, 0, 2]
+        if index.nb_ingredients.tolist() != nb_ingredients:
+            raise AssertionError(
+                message=f"Nombre d'ingrédients inattendu: {index.nb_ingredients}",
+            )
+        if sorted(index.colonnes) != [1, 2, 3, 4]:
+            raise AssertionError(
+                message=f"Colonnes inattendues: {index.colonnes}",
+            )
+
+    @staticmethod
+    def test_cocktails_realisables(index) -> None:
+        """Teste que seules les recettes entièrement couvertes sont retenues."""
+        # WHEN (100 ml de jus suffisent pour 10 cl, le gin tonic manque de tonic)
+        result = index.cocktails_realisables(
+            index.evaluer(stock((1, 60.0, "ml"), (2, 100.0, "ml"), (3, 500.0, "ml"))),
+        )
+
+        # THEN
+        noms = [cocktail["nom"] for cocktail in result]
+        if noms != ["Screwdriver", "Vodka Shot", "Eau"]:
+            raise AssertionError(
+                message=f"Screwdriver, Vodka Shot et Eau attendus, obtenu: {noms}",
+            )
+
+    @staticmethod
+    def test_quantite_insuffisante(index) -> None:
+        """Teste qu'une quantité insuffisante rend la recette irréalisable."""
+        # WHEN (45 ml de vodka < 50 ml requis pour le Screwdriver)
+        result = index.cocktails_realisables(
+            index.evaluer(stock((1, 45.0, "ml"), (2, 50.0, "cl"))),
+        )
+
+        # THEN
+        noms = [cocktail["nom"] for cocktail in result]
+        if noms != ["Vodka Shot", "Eau"]:
+            raise AssertionError(
+                message=f"Vodka Shot et Eau attendus, obtenu: {noms}",
+            )
+
+    @staticmethod
+    def test_cocktails_quasi_realisables(index) -> None:
+        """Teste le décompte des ingrédients manquants."""
+        # WHEN
+        result = index.cocktails_quasi_realisables(
+            index.evaluer(stock((3, 50.0, "ml"))),
+            1,
+        )
+
+        # THEN (il manque 2 ingrédients au Screwdriver et aucun à l'Eau)
+        attendu = {
+            2: ["Ingrédient 1"],
+            4: ["Ingrédient 4"],
+        }
+        obtenu = {
+            id_cocktail: data["ingredients_manquants"]
+            for id_cocktail, data in result.items()
+        }
+        if obtenu != attendu:
+            raise AssertionError(
+                message=f"Ingrédients manquants attendus {attendu}, obtenu: {obtenu}",
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("qte_requise", "unite_requise", "qte_stock", "unite_stock"),
+        [
+            (50.0, "ml", 5.0, "cl"),
+            (50.0, "ml", 4.0, "cl"),
+            (2.0, "oz", 1.0, "cup"),
+            (10.0, "g", 1.0, "tsp"),
+            (1.0, "tbsp", 1.0, "tblsp"),
+            (2.0, "ml", 10.0, "g"),
+            (2.0, None, 1.0, "cl"),
+            (2.0, "slice", 3.0, None),
+            (1.0, "slice", 5.0, "wedge"),
+            (1.0, "cl", 0.0, "cl"),
+        ],
+    )
+    def test_memes_regles_que_le_service(
+        qte_requise,
+        unite_requise,
+        qte_stock,
+        unite_stock,
+    ) -> None:
+        """Teste que la matrice applique les règles de is_ingredient_available."""
+        # GIVEN
+        index = InstantaneIndex([ligne(1, "Test", 1, qte_requise, unite_requise)])
+        attendu = CocktailService(MagicMock()).is_ingredient_available(
+            {
+                "quantite_requise": qte_requise,
+                "unite_requise": unite_requise,
+                "quantite_stock": qte_stock,
+                "unite_stock": unite_stock,
+            },
+        )
+
+        # WHEN
+        faisabilite = index.evaluer(stock((1, qte_stock, unite_stock)))
+        result = bool(index.cocktails_realisables(faisabilite))
+
+        # THEN
+        if result != attendu:
+            raise AssertionError(
+                message=f"{qte_stock} {unite_stock} pour {qte_requise} "
+                f"{unite_requise}: {attendu} attendu, obtenu: {result}",
+            )
+
+    @staticmethod
+    def test_quantites_normalisees_en_base() -> None:
+        """Teste que les quantités normalisées stockées sont utilisées."""
+        # GIVEN (recette et stock normalisés en base : 6 cl = 60 ml)
+        catalogue = [
+            {
+                **ligne(1, "Test", 1, 6.0, "cl"),
+                "qte_normalisee": 60.0,
+                "type_unite": "liquide",
+            },
+        ]
+        index = InstantaneIndex(catalogue)
+        stock_normalise = [
+            {**row, "qte_normalisee": 50.0, "type_unite": "liquide"}
+            for row in stock((1, 5.0, "cl"))
+        ]
+
+        # WHEN
+        realisables = index.cocktails_realisables(index.evaluer(stock_normalise))
+
+        # THEN
+        if realisables:
+            raise AssertionError(
+                message=f"50 ml ne couvrent pas 60 ml, obtenu: {realisables}",
+            )
+        if index.cocktails_realisables(index.evaluer(stock((1, 6.0, "cl")))) == []:
+            raise AssertionError(
+                message="Un stock non normalisé devrait être converti à la lecture",
+            )
+
+    @staticmethod
+    def test_reevaluation_identique_a_evaluation_complete(index) -> None:
+        """Teste qu'une réévaluation partielle donne le résultat d'une complète."""
+        # GIVEN
+        avant = index.evaluer(stock((1, 60.0, "ml"), (2, 100.0, "ml")))
+        apres = stock((1, 2.0, "cl"), (3, 50.0, "ml"), (4, 1.0, "l"))
+
+        # WHEN
+        partielle = index.reevaluer(avant, apres, {1, 2, 3, 4})
+
+        # THEN
+        complete = index.evaluer(apres)
+        if (
+            partielle.manquants.tolist() != complete.manquants.tolist()
+            or partielle.satisfaits.tolist() != complete.satisfaits.tolist()
+        ):
+            raise AssertionError(
+                message=f"Manquants attendus {complete.manquants}, "
+                f"obtenu: {partielle.manquants}",
+            )
+        if avant.manquants.tolist() != [0, 0, 0, 2]:
+            raise AssertionError(
+                message="L'évaluation précédente ne devrait pas être modifiée",
+            )
+
+    @staticmethod
+    def test_evaluation_limitee_aux_ingredients_en_stock(monkeypatch) -> None:
+        """Teste que le travail ne croît pas avec les cocktails hors du stock."""
+        # GIVEN
+        recettes = [
+            ligne(1, "Screwdriver", 1, 50.0, "ml"),
+            ligne(1, "Screwdriver", 2, 10.0, "cl"),
+            ligne(2, "Vodka Shot", 1, 4.0, "cl"),
+        ]
+        hors_stock = [
+            ligne(id_cocktail, f"Cocktail {id_cocktail}", id_cocktail, 1.0, "cl")
+            for id_cocktail in range(100, 1100)
+        ]
+        entrees_comparees = []
+        comparer = InstantaneIndex.ingredients_satisfaits
+
+        def comparer_compte(
+            self: InstantaneIndex,
+            stock_vectorise: StockVectorise,
+            entrees: np.ndarray | None = None,
+        ) -> np.ndarray:
+            if entrees is None:
+                # Ancien comportement : tout le catalogue
+                entrees_comparees.append(int(self.nb_ingredients.sum()))
+                return comparer(self, stock_vectorise)
+            entrees_comparees.append(len(entrees))
+            return comparer(self, stock_vectorise, entrees)
+
+        monkeypatch.setattr(
+            InstantaneIndex,
+            "ingredients_satisfaits",
+            comparer_compte,
+        )
+
+        # WHEN
+        petit = InstantaneIndex(recettes).evaluer(stock((1, 60.0, "ml")))
+        grand = InstantaneIndex(recettes + hors_stock).evaluer(stock((1, 60.0, "ml")))
+
+        # THEN
+        if entrees_comparees != [2, 2]:
+            raise AssertionError(
+                message="Seules les 2 entrées de l'ingrédient en stock devraient "
+                f"être comparées, obtenu: {entrees_comparees}",
+            )
+        manquants = (petit.manquants.tolist(), grand.manquants[:2].tolist())
+        if manquants != ([1, 0], [1, 0]):
+            raise AssertionError(
+                message=f"Manquants [1, 0] attendus, obtenu: {manquants}",
+            )
+        if set(grand.manquants[2:].tolist()) != {1}:
+            raise AssertionError(
+                message="Les cocktails hors du stock devraient manquer 1 ingrédient",
+            )
+
+    @staticmethod
+    def test_meilleurs_achats(index) -> None:
+        """Teste le choix des ingrédients qui débloquent le plus de cocktails."""
+        # GIVEN (la vodka débloque Vodka Shot et, avec le jus en stock, le
+        # Screwdriver ; le Gin Tonic demande deux achats)
+        faisabilite = index.evaluer(stock((2, 100.0, "ml")))
+
+        # WHEN
+        ingredients, cocktails = index.meilleurs_achats(faisabilite, 1)
+
+        # THEN
+        if ingredients != [{"id_ingredient": 1, "nom": "Ingrédient 1"}]:
+            raise AssertionError(
+                message=f"Ingrédient 1 attendu, obtenu: {ingredients}",
+            )
+        noms = [cocktail["nom"] for cocktail in cocktails]
+        if noms != ["Screwdriver", "Vodka Shot"]:
+            raise AssertionError(
+                message=f"Screwdriver et Vodka Shot attendus, obtenu: {noms}",
+            )
+
+    @staticmethod
+    def test_mesures_en_texte_libre() -> None:
+        """Teste les unités saisies avec leur quantité ou au pluriel."""
+        # GIVEN
+        index = InstantaneIndex(
+            [
+                ligne(1, "Daiquiri", 1, None, "1 1/2 oz"),
+                ligne(1, "Daiquiri", 2, 2.0, "Pieces"),
+            ],
+        )
+
+        # WHEN
+        suffisant = index.evaluer(stock((1, 5.0, "cl"), (2, 2.0, "pcs")))
+        insuffisant = index.evaluer(stock((1, 4.0, "cl"), (2, 2.0, "pcs")))
+
+        # THEN
+        if list(suffisant.manquants) != [0] or list(insuffisant.manquants) != [1]:
+            raise AssertionError(
+                message=f"44 ml et 2 pièces requis, obtenu: {suffisant.manquants}, "
+                f"{insuffisant.manquants}",
+            )
+
+    @staticmethod
+    def test_resultats_independants_de_l_index(index) -> None:
+        """Teste que modifier un résultat ne modifie pas l'index partagé."""
+        # GIVEN
+        result = index.cocktails_realisables(index.evaluer([]))
+
+        # WHEN
+        result[0]["nom"] = "Modifié"
+
+        # THEN
+        if index.cocktails[2]["nom"] != "Eau":
+            raise AssertionError(message="L'index ne devrait pas être modifié")
+
+
+class TestIndexRecettes:
+    """Tests du cycle de vie de l'index partagé."""
+
+    @staticmethod
+    def test_construit_une_seule_fois() -> None:
+        """Teste que le catalogue n'est chargé qu'une fois tant qu'il ne change pas."""
+        # GIVEN
+        chargements = []
+
+        def charger() -> list[dict]:
+            chargements.append(1)
+            return [ligne(1, "Eau", None)]
+
+        # WHEN
+        premier = IndexRecettes().obtenir(charger)
+        second = IndexRecettes().obtenir(charger)
+
+        # THEN
+        if premier is not second or len(chargements) != 1:
+            raise AssertionError(
+                message=f"1 chargement attendu, obtenu: {len(chargements)}",
+            )
+
+    @staticmethod
+    def test_invalidation_pendant_construction() -> None:
+        """Teste qu'un index construit avant une invalidation n'est pas conservé."""
+        # GIVEN
+        chargements = []
+
+        def charger() -> list[dict]:
+            if not chargements:
+                IndexRecettes().invalider()
+            chargements.append(1)
+            return [ligne(1, "Eau", None)]
+
+        # WHEN
+        IndexRecettes().obtenir(charger)
+        IndexRecettes().obtenir(charger)
+
+        # THEN
+        nb_chargements = 2
+        if len(chargements) != nb_chargements:
+            raise AssertionError(
+                message=f"L'index périmé n'aurait pas dû être gardé, "
+                f"{len(chargements)} chargement(s)",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_invalide_par_ajout_cocktail(db_connection) -> None:
+        """Teste qu'un cocktail ajouté via le DAO apparaît dans l'index."""
+        # GIVEN
+        dao = CocktailDAO()
+        avant = IndexRecettes().obtenir(
+            dao.get_tous_cocktails_avec_ingredients,
+        )
+
+        # WHEN
+        id_cocktail = dao.ajouter_cocktail(
+            Cocktail(
+                None,
+                "Eau",
+                "Cocktail",
+                "Highball glass",
+                alcool=False,
+                image="eau.jpg",
+            ),
+        )
+        db_connection.commit()
+        apres = IndexRecettes().obtenir(
+            dao.get_tous_cocktails_avec_ingredients,
+        )
+
+        # THEN
+        ids_avant = [cocktail["id_cocktail"] for cocktail in avant.cocktails]
+        ids_apres = [cocktail["id_cocktail"] for cocktail in apres.cocktails]
+        if id_cocktail in ids_avant or id_cocktail not in ids_apres:
+            raise AssertionError(
+                message="Le nouveau cocktail devrait apparaître après invalidation",
+            )
@@ -2,23 +2,8 @@
 
 import pytest
 
+from src.dao.db_connection import DBConnection
 from src.dao.ingredient_dao import IngredientDAO
-from src.utils.exceptions import DAOError
-
-
-def check_pg_trgm_available(db_connection) -> bool:
-    """Vérifie si l'extension pg_trgm est disponible."""
-    try:
-        with db_connection.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'
-            """,
-            )
-            return cursor.fetchone() is not None
-    except Exception as e:
-        raise DAOError from e
-    return False
 
 
 class TestIngredientDAOIntegration:
@@ -262,9 +247,6 @@ class TestIngredientDAOIntegration:
     def test_search_by_name_resultats_multiples(db_connection) -> None:
         """Teste la recherche avec plusieurs résultats."""
         # GIVEN
-        if not check_pg_trgm_available(db_connection):
-            pytest.skip("Extension pg_trgm non disponible")
-
         with db_connection.cursor() as cursor:
             cursor.execute(
                 """
@@ -300,9 +282,6 @@ class TestIngredientDAOIntegration:
     def test_search_by_name_limite_respectee(db_connection) -> None:
         """Teste que la limite de résultats est respectée."""
         # GIVEN
-        if not check_pg_trgm_available(db_connection):
-            pytest.skip("Extension pg_trgm non disponible")
-
         with db_connection.cursor() as cursor:
             # Créer 10 ingrédients avec "Rhum"
             for i in range(10):
@@ -332,9 +311,6 @@ class TestIngredientDAOIntegration:
     def test_search_by_name_aucun_resultat(db_connection) -> None:
         """Teste la recherche sans résultat."""
         # GIVEN
-        if not check_pg_trgm_available(db_connection):
-            pytest.skip("Extension pg_trgm non disponible")
-
         with db_connection.cursor() as cursor:
             cursor.execute(
                 """
@@ -364,9 +340,6 @@ class TestIngredientDAOIntegration:
     def test_search_by_name_similarite(db_connection) -> None:
         """Teste que la recherche utilise la similarité."""
         # GIVEN
-        if not check_pg_trgm_available(db_connection):
-            pytest.skip("Extension pg_trgm non disponible")
-
         with db_connection.cursor() as cursor:
             cursor.execute(
                 """
@@ -387,6 +360,38 @@ class TestIngredientDAOIntegration:
                 message="Des résultats devraient être trouvés",
             )
 
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_search_by_name_servi_en_memoire(db_connection, monkeypatch) -> None:
+        """Teste qu'une fois l'index chargé, les suggestions ne touchent pas la base.
+
+        Un ingrédient créé par create_ingredient est aussitôt suggéré.
+        """
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO ingredient (nom, alcool) VALUES ('Vodka', TRUE)",
+            )
+            db_connection.commit()
+        dao = IngredientDAO()
+        dao.search_by_name("Vodka")
+        dao.create_ingredient("Vodka Citron", alcool=True)
+
+        def connexion_interdite(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError(message="Aucune requête n'était attendue")
+
+        monkeypatch.setattr(DBConnection, "connection", connexion_interdite)
+
+        # WHEN
+        result = dao.search_by_name("Vodkaa", limit=5)
+
+        # THEN
+        noms = [ingredient["nom"] for ingredient in result]
+        if noms != ["Vodka", "Vodka Citron"]:
+            raise AssertionError(
+                message=f"['Vodka', 'Vodka Citron'] attendu, obtenu: {noms}",
+            )
+
     # ========== Tests pour is_alcoholic ==========
 
     @pytest.mark.usefixtures("clean_database")
@@ -1,8 +1,11 @@
 """Tests d'intégration pour InstructionDAO."""
 
 import pytest
+from psycopg2.extras import RealDictCursor
 
+from src.dao.cocktail_dao import CocktailDAO
 from src.dao.instruction_dao import InstructionDAO
+from src.service.cocktail_service import CocktailService
 from src.utils.exceptions import DAOError
 
 
@@ -113,3 +116,193 @@ class TestInstructionDAOAjout:
         # WHEN / THEN
         with pytest.raises(DAOError):
             dao.ajouter_instruction(id_cocktail_inexistant, texte_instruction)
+
+
+def inserer_cocktails(db_connection, noms: list[str]) -> list[int]:
+    """Insère des cocktails ayant chacun une instruction en anglais."""
+    ids_cocktails = []
+    with db_connection.cursor() as cursor:
+        for nom in noms:
+            cursor.execute(
+                """
+                INSERT INTO cocktail (nom, categorie, verre, alcool, image)
+                VALUES (%s, 'Cocktail', 'Coupe', TRUE, 'img.jpg')
+                RETURNING id_cocktail
+                """,
+                (nom,),
+            )
+            id_cocktail = cursor.fetchone()["id_cocktail"]
+            cursor.execute(
+                "INSERT INTO instruction (id_cocktail, langue, texte) "
+                "VALUES (%s, 'en', %s)",
+                (id_cocktail, f"Shake {nom}"),
+            )
+            ids_cocktails.append(id_cocktail)
+        db_connection.commit()
+    return ids_cocktails
+
+
+class TestInstructionDAOLecture:
+    """Tests pour la lecture des instructions par lot."""
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_get_instructions_par_lot(db_connection) -> None:
+        """Teste la lecture des instructions de plusieurs cocktails et la langue."""
+        # GIVEN
+        mojito, margarita = inserer_cocktails(db_connection, ["Mojito", "Margarita"])
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO instruction (id_cocktail, langue, texte) "
+                "VALUES (%s, 'fr', 'Agiter')",
+                (margarita,),
+            )
+            db_connection.commit()
+
+        # WHEN
+        toutes = InstructionDAO.get_instructions([mojito, margarita, 99999])
+        en_francais = InstructionDAO.get_instructions([mojito, margarita], "fr")
+
+        # THEN
+        attendu = {mojito: "Shake Mojito", margarita: "Shake Margarita"}
+        if toutes != attendu:
+            raise AssertionError(message=f"Attendu {attendu}, obtenu: {toutes}")
+        if en_francais != {margarita: "Agiter"}:
+            raise AssertionError(
+                message=f"Seule l'instruction en français attendue: {en_francais}",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_recherche_par_sequence_nombre_de_requetes_fixe(
+        db_connection,
+        monkeypatch,
+    ) -> None:
+        """Teste que le nombre de requêtes ne dépend pas du nombre de résultats."""
+        # GIVEN
+        inserer_cocktails(
+            db_connection,
+            ["Mojito", "Manhattan", "Margarita", "Mai Tai", "Martini", "Gin Fizz"],
+        )
+        service = CocktailService(CocktailDAO())
+        # Premier appel : chargement de l'index des noms
+        service.rechercher_cocktail_par_sequence_debut("g", 1)
+
+        requetes = []
+        execute = RealDictCursor.execute
+
+        def compter(cursor: RealDictCursor, *args: object, **kwargs: object) -> None:
+            requetes.append(args[0])
+            return execute(cursor, *args, **kwargs)
+
+        monkeypatch.setattr(RealDictCursor, "execute", compter)
+
+        # WHEN
+        un_resultat = service.rechercher_cocktail_par_sequence_debut("g", 10)
+        nb_requetes_un = len(requetes)
+        cinq_resultats = service.rechercher_cocktail_par_sequence_debut("m", 10)
+        nb_requetes_cinq = len(requetes) - nb_requetes_un
+
+        # THEN
+        nb_cocktails_m = 5
+        if (len(un_resultat), len(cinq_resultats)) != (1, nb_cocktails_m):
+            raise AssertionError(message="1 puis 5 cocktails attendus")
+        if nb_requetes_un != 1 or nb_requetes_cinq != 1:
+            raise AssertionError(
+                message=f"1 requête par recherche attendue, obtenu: "
+                f"{nb_requetes_un} et {nb_requetes_cinq}",
+            )
+        if any(instructions is None for _, instructions in cinq_resultats):
+            raise AssertionError(message="Chaque cocktail a une instruction")
+
+
+def inserer_cocktail(db_connection, nom: str) -> int:
+    """Insère un cocktail sans instruction."""
+    with db_connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO cocktail (nom, categorie, verre, alcool, image)
+            VALUES (%s, 'Cocktail', 'Coupe', TRUE, 'img.jpg')
+            RETURNING id_cocktail
+            """,
+            (nom,),
+        )
+        id_cocktail = cursor.fetchone()["id_cocktail"]
+        db_connection.commit()
+    return id_cocktail
+
+
+class TestInstructionDAORecherche:
+    """Tests pour la recherche plein texte."""
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_recherche_classee_nom_ingredients_instructions(db_connection) -> None:
+        """Teste que le nom pèse plus que les ingrédients, puis que le texte."""
+        # GIVEN
+        julep = inserer_cocktail(db_connection, "Mint Julep")
+        mojito = inserer_cocktail(db_connection, "Mojito")
+        fizz = inserer_cocktail(db_connection, "Gin Fizz")
+        InstructionDAO.ajouter_instruction(julep, "Stir with bourbon")
+        InstructionDAO.ajouter_instruction(mojito, "Muddle the mint leaves")
+        InstructionDAO.ajouter_instruction(fizz, "Shake well")
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO ingredient (nom) VALUES ('Mint') RETURNING id_ingredient",
+            )
+            id_menthe = cursor.fetchone()["id_ingredient"]
+            db_connection.commit()
+        # L'ingrédient est lié après l'instruction : le document est recalculé
+        CocktailDAO.add_ingredient_to_cocktail(fizz, id_menthe, 2, "leaves")
+
+        # WHEN
+        resultats = InstructionDAO.rechercher("mint")
+
+        # THEN
+        ids = [resultat["id_cocktail"] for resultat in resultats]
+        if ids != [julep, fizz, mojito]:
+            raise AssertionError(
+                message=f"Ordre attendu {[julep, fizz, mojito]}, obtenu: {ids}",
+            )
+        if resultats[2]["instructions"] != "Muddle the mint leaves":
+            raise AssertionError(message=f"Instruction attendue: {resultats[2]}")
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_recherche_dictionnaire_de_la_langue(db_connection) -> None:
+        """Teste la racinisation française et le filtre sur la langue."""
+        # GIVEN
+        id_cocktail = inserer_cocktail(db_connection, "Kir")
+        InstructionDAO.ajouter_instruction(id_cocktail, "Mélanger doucement", "fr")
+
+        # WHEN
+        en_francais = InstructionDAO.rechercher("mélangez", "fr")
+        en_anglais = InstructionDAO.rechercher("mélangez", "en")
+
+        # THEN
+        if [resultat["id_cocktail"] for resultat in en_francais] != [id_cocktail]:
+            raise AssertionError(message=f"Kir attendu, obtenu: {en_francais}")
+        if en_anglais:
+            raise AssertionError(message=f"Aucun résultat attendu: {en_anglais}")
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_recherche_paginee_sans_doublon(db_connection) -> None:
+        """Teste que les pages successives couvrent tous les résultats une fois."""
+        # GIVEN
+        ids_cocktails = inserer_cocktails(
+            db_connection,
+            ["Mojito", "Manhattan", "Margarita", "Mai Tai", "Martini"],
+        )
+        InstructionDAO.indexer_instructions_manquantes()
+
+        # WHEN
+        pages, apres = [], None
+        while page := InstructionDAO.rechercher("shake", limite=2, apres=apres):
+            pages.append([resultat["id_cocktail"] for resultat in page])
+            apres = (page[-1]["rang"], page[-1]["id_cocktail"])
+
+        # THEN
+        tous = [id_cocktail for page in pages for id_cocktail in page]
+        if sorted(tous) != sorted(ids_cocktails) or len(pages) != len([2, 2, 1]):
+            raise AssertionError(message=f"3 pages sans doublon attendues: {pages}")
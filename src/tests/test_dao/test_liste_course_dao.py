@@ -310,6 +310,72 @@ class TestListeCourseDAOIntegration:
                 f"obtenu: {result['quantite']}",
             )
 
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_add_to_liste_course_liquides_convertis(db_connection) -> None:
+        """Teste l'ajout d'un liquide dans une autre unité (somme dans l'existante)."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO utilisateur (
+                    pseudo, mail, mot_de_passe, date_naissance
+                )
+                VALUES ('testuser', 'test@example.com', 'pass', '1990-01-01')
+                RETURNING id_utilisateur
+            """,
+            )
+            user_id = cursor.fetchone()["id_utilisateur"]
+
+            cursor.execute(
+                """
+                INSERT INTO ingredient (nom, alcool)
+                VALUES ('Rhum', TRUE)
+                RETURNING id_ingredient
+            """,
+            )
+            ingredient_id = cursor.fetchone()["id_ingredient"]
+
+            cursor.execute(
+                """
+                INSERT INTO unite (nom, abbreviation, type_unite)
+                VALUES
+                    ('centilitre', 'cl', 'liquide'),
+                    ('millilitre', 'ml', 'liquide')
+                RETURNING id_unite
+            """,
+            )
+            unite_cl_id, unite_ml_id = (row["id_unite"] for row in cursor.fetchall())
+
+            cursor.execute(
+                """
+                INSERT INTO liste_course (
+                    id_utilisateur, id_ingredient, quantite, id_unite, effectue
+                )
+                VALUES (%s, %s, 10.0, %s, FALSE)
+            """,
+                (user_id, ingredient_id, unite_cl_id),
+            )
+            db_connection.commit()
+
+        dao = ListeCourseDAO()
+
+        # WHEN - Ajouter 50 ml à un item existant de 10 cl
+        result = dao.add_to_liste_course(
+            id_utilisateur=user_id,
+            id_ingredient=ingredient_id,
+            quantite=50.0,
+            id_unite=unite_ml_id,
+        )
+
+        # THEN - Devrait être 15 cl
+        qte = 15
+        if result["quantite"] != qte or result["id_unite"] != unite_cl_id:
+            raise AssertionError(
+                message=f"15 cl attendus, obtenu: {result['quantite']} "
+                f"(unité {result['id_unite']})",
+            )
+
     @pytest.mark.usefixtures("clean_database")
     @staticmethod
     def test_add_to_liste_course_unite_differente_remplace(
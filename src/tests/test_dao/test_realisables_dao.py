@@ -0,0 +1,143 @@
+"""Tests du calcul hors ligne des cocktails réalisables de tous les utilisateurs."""
+
+import pytest
+
+from src.dao.realisables_dao import RealisablesDAO
+from src.jobs import calculer_realisables
+
+
+@pytest.fixture
+def catalogue(db_connection) -> dict:
+    """Trois utilisateurs et deux cocktails (Mojito : rhum + menthe, Ti Punch : rhum).
+
+    Alice a du rhum et de la menthe, Bob du rhum, Chloé rien.
+    """
+    with db_connection.cursor() as cursor:
+        cursor.execute("DELETE FROM reprise_tache")
+        cursor.execute(
+            """
+            INSERT INTO utilisateur (pseudo, mail, mot_de_passe, date_naissance)
+            VALUES ('alice', 'alice@example.com', 'pass', '1990-01-01'),
+                   ('bob', 'bob@example.com', 'pass', '1990-01-01'),
+                   ('chloe', 'chloe@example.com', 'pass', '1990-01-01')
+            RETURNING id_utilisateur
+            """,
+        )
+        alice, bob, chloe = (row["id_utilisateur"] for row in cursor.fetchall())
+        cursor.execute(
+            "INSERT INTO ingredient (nom) VALUES ('Rhum'), ('Menthe') "
+            "RETURNING id_ingredient",
+        )
+        rhum, menthe = (row["id_ingredient"] for row in cursor.fetchall())
+        cursor.execute(
+            "INSERT INTO cocktail (nom) VALUES ('Mojito'), ('Ti Punch') "
+            "RETURNING id_cocktail",
+        )
+        mojito, ti_punch = (row["id_cocktail"] for row in cursor.fetchall())
+        cursor.execute(
+            """
+            INSERT INTO cocktail_ingredient (id_cocktail, id_ingredient)
+            VALUES (%s, %s), (%s, %s), (%s, %s)
+            """,
+            (mojito, rhum, mojito, menthe, ti_punch, rhum),
+        )
+        cursor.execute(
+            """
+            INSERT INTO stock (id_utilisateur, id_ingredient, quantite)
+            VALUES (%s, %s, 1), (%s, %s, 1), (%s, %s, 1)
+            """,
+            (alice, rhum, alice, menthe, bob, rhum),
+        )
+        db_connection.commit()
+
+    return {
+        "utilisateurs": (alice, bob, chloe),
+        "menthe": menthe,
+        "cocktails": (mojito, ti_punch),
+    }
+
+
+def resumes(utilisateurs: tuple[int, ...]) -> list[tuple[list[int], int] | None]:
+    """Retourne (ids des cocktails triés, nb_nouveaux) de chaque utilisateur."""
+    resultat = []
+    for id_utilisateur in utilisateurs:
+        resume = RealisablesDAO().get_resume(id_utilisateur)
+        resultat.append(
+            (sorted(resume["ids_cocktails"]), resume["nb_nouveaux"])
+            if resume
+            else None,
+        )
+    return resultat
+
+
+@pytest.mark.usefixtures("clean_database")
+class TestCalculerRealisables:
+    """Tests de la tâche calculer_realisables et de RealisablesDAO."""
+
+    @staticmethod
+    def test_executer(catalogue) -> None:
+        """Teste le résumé de chaque utilisateur et la suppression de la reprise."""
+        # GIVEN
+        mojito, ti_punch = catalogue["cocktails"]
+
+        # WHEN
+        resultat = calculer_realisables.executer(nb_processus=1, taille_lot=2)
+
+        # THEN
+        attendu = [([mojito, ti_punch], 2), ([ti_punch], 1), ([], 0)]
+        obtenu = resumes(catalogue["utilisateurs"])
+        if obtenu != attendu or resultat["nb_utilisateurs"] != len(attendu):
+            raise AssertionError(
+                message=f"Résumés attendus: {attendu}, obtenu: {obtenu} ({resultat})",
+            )
+        if RealisablesDAO().get_reprise(calculer_realisables.NOM_TACHE) is not None:
+            raise AssertionError(message="La reprise aurait dû être supprimée")
+
+    @staticmethod
+    def test_executer_reprise(catalogue) -> None:
+        """Teste qu'une exécution interrompue reprend après le dernier lot."""
+        # GIVEN
+        alice, bob, chloe = catalogue["utilisateurs"]
+        RealisablesDAO().enregistrer_resumes(
+            [(alice, [])],
+            calculer_realisables.NOM_TACHE,
+        )
+
+        # WHEN
+        resultat = calculer_realisables.executer(nb_processus=1, taille_lot=1)
+
+        # THEN
+        obtenu = resumes((alice, bob, chloe))
+        if resultat["reprise_apres"] != alice or obtenu[0] != ([], 0):
+            raise AssertionError(
+                message=f"Alice ne devait pas être recalculée: {obtenu} ({resultat})",
+            )
+        if resultat["nb_utilisateurs"] != len((bob, chloe)):
+            raise AssertionError(
+                message=f"2 utilisateurs attendus, obtenu: {resultat}",
+            )
+
+    @staticmethod
+    def test_executer_nouveaux_cocktails(catalogue, db_connection) -> None:
+        """Teste que nb_nouveaux compte les cocktails devenus réalisables."""
+        # GIVEN
+        _, bob, _ = catalogue["utilisateurs"]
+        mojito, ti_punch = catalogue["cocktails"]
+        calculer_realisables.executer(nb_processus=1)
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO stock (id_utilisateur, id_ingredient, quantite) "
+                "VALUES (%s, %s, 1)",
+                (bob, catalogue["menthe"]),
+            )
+            db_connection.commit()
+
+        # WHEN
+        calculer_realisables.executer(nb_processus=1)
+
+        # THEN
+        obtenu = resumes((bob,))
+        if obtenu != [([mojito, ti_punch], 1)]:
+            raise AssertionError(
+                message=f"1 nouveau cocktail attendu pour Bob, obtenu: {obtenu}",
+            )
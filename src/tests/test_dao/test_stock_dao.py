@@ -1430,3 +1430,99 @@ class TestStockDAOIntegration:
                 message=f"La quantité devrait être 50.0 (remplacée, pas cumulée), "
                 f"obtenu: {stock_item['quantite']}",
             )
+
+    # ========== Tests de la normalisation des quantités ==========
+
+    @staticmethod
+    def creer_stock_cl(db_connection) -> tuple[int, int, int]:
+        """Crée un utilisateur, un ingrédient et l'unité cl."""
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO utilisateur (
+                    pseudo, mail, mot_de_passe, date_naissance
+                )
+                VALUES ('testuser', 'test@example.com', 'pass', '1990-01-01')
+                RETURNING id_utilisateur
+            """,
+            )
+            user_id = cursor.fetchone()["id_utilisateur"]
+            cursor.execute(
+                "INSERT INTO ingredient (nom) VALUES ('Rhum') RETURNING id_ingredient",
+            )
+            ingredient_id = cursor.fetchone()["id_ingredient"]
+            cursor.execute(
+                """
+                INSERT INTO unite (nom, abbreviation, type_unite)
+                VALUES ('centilitre', 'cl', 'liquide')
+                RETURNING id_unite
+            """,
+            )
+            unite_id = cursor.fetchone()["id_unite"]
+            db_connection.commit()
+        return user_id, ingredient_id, unite_id
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_update_or_create_normalise_quantite_cumulee(self, db_connection) -> None:
+        """Teste que la quantité cumulée est normalisée en ml."""
+        # GIVEN
+        user_id, ingredient_id, unite_id = self.creer_stock_cl(db_connection)
+        dao = StockDAO()
+
+        # WHEN
+        dao.update_or_create_stock_item(user_id, ingredient_id, 5.0, unite_id)
+        dao.update_or_create_stock_item(user_id, ingredient_id, 2.5, unite_id)
+
+        # THEN
+        row = dao.get_stock(user_id)[0]
+        qte_ml = 75
+        if row["qte_normalisee"] != qte_ml or row["type_unite"] != "liquide":
+            raise AssertionError(
+                message=f"75 ml attendus, obtenu: {row}",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_decrement_normalise_quantite(self, db_connection) -> None:
+        """Teste que la quantité normalisée suit une décrémentation."""
+        # GIVEN
+        user_id, ingredient_id, unite_id = self.creer_stock_cl(db_connection)
+        dao = StockDAO()
+        dao.set_stock_item(user_id, ingredient_id, 5.0, unite_id)
+
+        # WHEN
+        dao.decrement_stock_item(user_id, ingredient_id, 2.0)
+
+        # THEN
+        row = dao.get_stock(user_id)[0]
+        qte_ml = 30
+        if row["qte_normalisee"] != qte_ml:
+            raise AssertionError(
+                message=f"30 ml attendus, obtenu: {row['qte_normalisee']}",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    def test_normaliser_quantites_lignes_existantes(self, db_connection) -> None:
+        """Teste que la tâche de reprise normalise les stocks existants."""
+        # GIVEN
+        user_id, ingredient_id, unite_id = self.creer_stock_cl(db_connection)
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO stock (id_utilisateur, id_ingredient, quantite, id_unite)
+                VALUES (%s, %s, 3.0, %s)
+            """,
+                (user_id, ingredient_id, unite_id),
+            )
+            db_connection.commit()
+
+        # WHEN
+        nb_lignes = StockDAO().normaliser_quantites()
+
+        # THEN
+        row = StockDAO().get_stock(user_id)[0]
+        qte_ml = 30
+        if nb_lignes != 1 or row["qte_normalisee"] != qte_ml:
+            raise AssertionError(
+                message=f"1 ligne à 30 ml attendue, obtenu: {nb_lignes} ligne(s), "
+                f"{row['qte_normalisee']}",
+            )
@@ -2,6 +2,8 @@
 
 import pytest
 
+from src.dao import unite_dao
+from src.dao.db_connection import DBConnection
 from src.dao.unite_dao import UniteDAO
 
 
@@ -362,3 +364,122 @@ class TestUniteDAOIntegration:
                 message=f"Les noms devraient être identiques, "
                 f"obtenu: {nom_1}, {nom_2}, {nom_3}",
             )
+
+    # ========== Tests pour get_table_conversion ==========
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_get_table_conversion_recharge_unite_inconnue(
+        db_connection,
+        monkeypatch,
+    ) -> None:
+        """Teste que la table est rechargée pour une unité créée après elle."""
+        # GIVEN
+        monkeypatch.setattr(unite_dao.settings, "UNIT_RELOAD_COOLDOWN", 0.0)
+        dao = UniteDAO()
+        table = dao.get_table_conversion()
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO unite (nom, abbreviation, type_unite)
+                VALUES ('centilitre', 'cl', 'liquide')
+                RETURNING id_unite
+            """,
+            )
+            id_cl = cursor.fetchone()["id_unite"]
+            db_connection.commit()
+
+        # WHEN
+        memoisee = dao.get_table_conversion()
+        rechargee = dao.get_table_conversion((id_cl,))
+
+        # THEN
+        if memoisee is not table or rechargee.get(id_cl) != ("liquide", 10.0):
+            raise AssertionError(
+                message=f"Table rechargée attendue, obtenu: {rechargee.get(id_cl)}",
+            )
+        if dao.get_table_conversion((id_cl,)) is not rechargee:
+            raise AssertionError(message="La table rechargée devrait être réutilisée")
+
+    # ========== Tests du cache de la table unite ==========
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_lectures_servies_en_memoire(db_connection, monkeypatch) -> None:
+        """Teste qu'une fois la table chargée, les lectures ne touchent pas la base."""
+        # GIVEN
+        with db_connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO unite (nom, abbreviation, type_unite)
+                VALUES ('centilitre', 'cl', 'liquide')
+                RETURNING id_unite
+            """,
+            )
+            id_cl = cursor.fetchone()["id_unite"]
+            db_connection.commit()
+        dao = UniteDAO()
+        dao.recharger()
+
+        def connexion_interdite(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError(message="Aucune requête n'était attendue")
+
+        monkeypatch.setattr(DBConnection, "connection", connexion_interdite)
+
+        # WHEN
+        nom = dao.get_unit_name_by_id(id_cl)
+        par_abreviation = dao.get_id_par_abreviation("CL")
+        par_nom = dao.get_or_create_unit("Centilitre")
+
+        # THEN
+        if (nom, par_abreviation, par_nom) != ("centilitre", id_cl, id_cl):
+            raise AssertionError(
+                message=f"Attendu (centilitre, {id_cl}, {id_cl}), obtenu: "
+                f"{(nom, par_abreviation, par_nom)}",
+            )
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_get_or_create_unit_rafraichit_le_cache() -> None:
+        """Teste qu'une unité créée est aussitôt visible dans la table en mémoire."""
+        # GIVEN
+        dao = UniteDAO()
+        dao.recharger()
+
+        # WHEN
+        id_unite = dao.get_or_create_unit("splash")
+
+        # THEN
+        unite = dao.get_unite(id_unite)
+        if unite is None or unite["nom"] != "splash":
+            raise AssertionError(message=f"Unité splash attendue, obtenu: {unite}")
+
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_unites_inconnues_relectures_espacees(monkeypatch) -> None:
+        """Teste que des unités inconnues en rafale ne relisent pas la table."""
+        # GIVEN
+        dao = UniteDAO()
+        dao.recharger()
+        relectures = []
+        connection = DBConnection.connection
+
+        def connection_comptee(*args: object, **kwargs: object) -> object:
+            relectures.append(args)
+            return connection(*args, **kwargs)
+
+        monkeypatch.setattr(DBConnection, "connection", connection_comptee)
+
+        # WHEN
+        for numero in range(20):
+            dao.get_id_par_abreviation(f"inconnue-{numero}")
+        en_rafale = len(relectures)
+        monkeypatch.setattr(unite_dao.settings, "UNIT_RELOAD_COOLDOWN", 0.0)
+        dao.get_id_par_abreviation("inconnue")
+
+        # THEN
+        if (en_rafale, len(relectures)) != (0, 1):
+            raise AssertionError(
+                message="Aucune relecture en rafale puis une après le délai "
+                f"attendues, obtenu: {en_rafale} puis {len(relectures)}",
+            )
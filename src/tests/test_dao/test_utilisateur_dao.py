@@ -1,11 +1,13 @@
 """Tests d'intégration pour UtilisateurDAO."""
 
+import asyncio
 from datetime import datetime
 
 import pytest
 
 from src.business_object.utilisateur import Utilisateur
-from src.dao.utilisateur_dao import UtilisateurDAO
+from src.dao.async_db_connection import AsyncDBConnection
+from src.dao.utilisateur_dao import AsyncUtilisateurDAO, UtilisateurDAO
 from src.models.utilisateurs import User, UserCreate, UserUpdatePassword
 from src.utils.exceptions import (
     UserAlreadyExistsError,
@@ -560,3 +562,53 @@ class TestUtilisateurDAOIntegration:
             raise AssertionError(
                 message=f"La date devrait être None, obtenu: {date_inscription}",
             )
+
+    # ========== Tests pour AsyncUtilisateurDAO.remplacer_hachage ==========
+    @pytest.mark.usefixtures("clean_database")
+    @staticmethod
+    def test_remplacer_hachage_si_inchange() -> None:
+        """Teste que le hachage n'est remplacé que s'il n'a pas changé."""
+        # GIVEN
+        dao = UtilisateurDAO()
+        dao.create_compte(
+            UserCreate(
+                pseudo="alice",
+                mail="alice@example.com",
+                mot_de_passe_hashed="hachage_initial",
+                date_naissance="2000-01-15",
+            ),
+        )
+        id_utilisateur = dao.recuperer_par_pseudo("alice").id_utilisateur
+
+        async def scenario() -> tuple[bool, bool]:
+            async_dao = AsyncUtilisateurDAO()
+            try:
+                remplace = await async_dao.remplacer_hachage(
+                    id_utilisateur,
+                    "hachage_initial",
+                    "hachage_migre",
+                )
+                # Le hachage a changé depuis : pas de remplacement
+                perime = await async_dao.remplacer_hachage(
+                    id_utilisateur,
+                    "hachage_initial",
+                    "hachage_perime",
+                )
+                return remplace, perime
+            finally:
+                await AsyncDBConnection().close()
+
+        # WHEN
+        remplace, perime = asyncio.run(scenario())
+
+        # THEN
+        if not remplace or perime:
+            raise AssertionError(
+                message=f"Seul le premier remplacement devrait avoir lieu : "
+                f"{remplace}, {perime}",
+            )
+        hachage = dao.recuperer_par_pseudo("alice").mot_de_passe_hashed
+        if hachage != "hachage_migre":
+            raise AssertionError(
+                message=f"Le hachage devrait être 'hachage_migre', obtenu: {hachage}",
+            )
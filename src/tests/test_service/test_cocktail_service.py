@@ -1,6 +1,7 @@
 """Tests pour le service CocktailService."""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -11,8 +12,11 @@ from src.utils.exceptions import (
     CocktailSearchError,
     DAOError,
     EmptyFieldError,
+    InvalidCursorError,
     ServiceError,
 )
+from src.utils.facettes import Selection
+from src.utils.settings import settings
 
 
 @pytest.fixture
@@ -46,6 +50,38 @@ def sample_cocktail() -> Cocktail:
     )
 
 
+def simuler_catalogue_et_stock(cocktail_service: CocktailService, rows: list) -> None:
+    """Répartit des lignes (cocktail, ingrédient, stock) entre les DAO mockés.
+
+    Les colonnes du catalogue alimentent get_tous_cocktails_avec_ingredients et
+    les colonnes du stock alimentent StockDAO.get_stock.
+    """
+    catalogue = [
+        {
+            **{cle: row[cle] for cle in ("id_cocktail", "nom", "categorie")},
+            **{cle: row[cle] for cle in ("verre", "alcool", "image")},
+            "id_ingredient": row["id_ingredient"],
+            "qte": row["quantite_requise"],
+            "unite": row["unite_requise"],
+            "nom_ingredient": row["nom_ingredient"],
+        }
+        for row in rows
+    ]
+    stock = [
+        {
+            "id_ingredient": row["id_ingredient"],
+            "quantite": row["quantite_stock"],
+            "code_unite": row["unite_stock"],
+        }
+        for row in rows
+        if row["quantite_stock"] is not None
+    ]
+    cocktail_service.cocktail_dao.get_tous_cocktails_avec_ingredients.return_value = (
+        catalogue
+    )
+    cocktail_service.stock_dao.get_stock = MagicMock(return_value=stock)
+
+
 class TestRechercherCocktailParNom:
     """Tests pour la méthode rechercher_cocktail_par_nom."""
 
@@ -144,9 +180,9 @@ class TestRechercherCocktailParSequenceDebut:
 
         # Mock l'instruction_dao si le service l'utilise
         cocktail_service.instruction_dao = MagicMock()
-        cocktail_service.instruction_dao.get_instruction.return_value = (
-            "Mélanger tous les ingrédients"
-        )
+        cocktail_service.instruction_dao.get_instructions.return_value = {
+            sample_cocktail.id_cocktail: "Mélanger tous les ingrédients",
+        }
 
         # Act
         result = cocktail_service.rechercher_cocktail_par_sequence_debut("Moj", 10)
@@ -175,8 +211,8 @@ class TestRechercherCocktailParSequenceDebut:
             "Moj",
             10,
         )
-        cocktail_service.instruction_dao.get_instruction.assert_called_once_with(
-            sample_cocktail.id_cocktail,
+        cocktail_service.instruction_dao.get_instructions.assert_called_once_with(
+            [sample_cocktail.id_cocktail],
         )
 
     @staticmethod
@@ -416,10 +452,7 @@ class TestGetCocktailsQuasiRealisables:
     """Tests pour la méthode get_cocktails_quasi_realisables."""
 
     @staticmethod
-    def test_get_cocktails_quasi_realisables_success(
-        cocktail_service,
-        mock_cocktail_dao,
-    ) -> None:
+    def test_get_cocktails_quasi_realisables_success(cocktail_service) -> None:
         """Test de récupération réussie des cocktails quasi-réalisables."""
         # Arrange
         id_utilisateur = 1
@@ -454,7 +487,7 @@ class TestGetCocktailsQuasiRealisables:
             },
         ]
 
-        mock_cocktail_dao.get_cocktails_quasi_realisables.return_value = rows
+        simuler_catalogue_et_stock(cocktail_service, rows)
 
         # Act
         result = cocktail_service.get_cocktails_quasi_realisables(
@@ -498,13 +531,10 @@ class TestGetCocktailsQuasiRealisables:
             )
 
     @staticmethod
-    def test_get_cocktails_quasi_realisables_aucun_resultat(
-        cocktail_service,
-        mock_cocktail_dao,
-    ) -> None:
+    def test_get_cocktails_quasi_realisables_aucun_resultat(cocktail_service) -> None:
         """Test quand aucun cocktail quasi-réalisable n'est trouvé."""
         # Arrange
-        mock_cocktail_dao.get_cocktails_quasi_realisables.return_value = []
+        simuler_catalogue_et_stock(cocktail_service, [])
 
         # Act
         result = cocktail_service.get_cocktails_quasi_realisables(
@@ -525,10 +555,7 @@ class TestGetCocktailsQuasiRealisables:
             )
 
     @staticmethod
-    def test_get_cocktails_quasi_realisables_tri(
-        cocktail_service,
-        mock_cocktail_dao,
-    ) -> None:
+    def test_get_cocktails_quasi_realisables_tri(cocktail_service) -> None:
         """Test du tri des cocktails quasi-réalisables."""
         # Arrange
         rows = [
@@ -606,7 +633,7 @@ class TestGetCocktailsQuasiRealisables:
             },
         ]
 
-        mock_cocktail_dao.get_cocktails_quasi_realisables.return_value = rows
+        simuler_catalogue_et_stock(cocktail_service, rows)
 
         # Act
         result = cocktail_service.get_cocktails_quasi_realisables(
@@ -635,19 +662,323 @@ class TestGetCocktailsQuasiRealisables:
             )
 
     @staticmethod
-    def test_get_cocktails_quasi_realisables_dao_error(
+    def test_get_cocktails_quasi_realisables_dao_error(cocktail_service) -> None:
+        """Test avec erreur DAO."""
+        # Arrange
+        cocktail_service.stock_dao.get_stock = MagicMock(
+            side_effect=DAOError("Erreur DAO"),
+        )
+
+        # Act & Assert
+        with pytest.raises(ServiceError):
+            cocktail_service.get_cocktails_quasi_realisables(1)
+
+    @staticmethod
+    def test_get_cocktails_quasi_realisables_moteur_sql(
         cocktail_service,
-        mock_cocktail_dao,
+        monkeypatch,
     ) -> None:
+        """Test du calcul délégué à la base (QUASI_REALISABLES_ENGINE=sql)."""
+        # Arrange
+        monkeypatch.setattr(settings, "QUASI_REALISABLES_ENGINE", "sql")
+        cocktails = [{"id_cocktail": 1, "nom": "Mojito"}]
+        dao = cocktail_service.cocktail_dao
+        dao.calculer_cocktails_quasi_realisables.return_value = cocktails
+        async_dao = MagicMock()
+        async_dao.calculer_cocktails_quasi_realisables = AsyncMock(
+            return_value=cocktails,
+        )
+        cocktail_service.cocktail_async_dao = async_dao
+
+        # Act
+        result = cocktail_service.get_cocktails_quasi_realisables(1, 2)
+        result_async = asyncio.run(
+            cocktail_service.get_cocktails_quasi_realisables_async(1, 2),
+        )
+
+        # Assert
+        quasi_realisables = result["cocktails_quasi_realisables"]
+        if result != result_async or quasi_realisables != cocktails:
+            raise AssertionError(
+                message=f"Résultat du DAO attendu, obtenu: {result}",
+            )
+        dao.get_tous_cocktails_avec_ingredients.assert_not_called()
+
+
+class TestPaginationQuasiRealisables:
+    """Tests de la pagination des cocktails quasi-réalisables."""
+
+    @staticmethod
+    def catalogue() -> list[dict]:
+        """Cinq cocktails (dont deux homonymes) de 1 à 2 ingrédients manquants."""
+        return [
+            {
+                "id_cocktail": id_cocktail,
+                "nom": nom,
+                "categorie": "Cocktail",
+                "verre": "Highball glass",
+                "alcool": True,
+                "image": f"{nom}.jpg",
+                "id_ingredient": id_ingredient,
+                "quantite_requise": None,
+                "unite_requise": None,
+                "nom_ingredient": f"Ingrédient {id_ingredient}",
+                "quantite_stock": 1 if id_ingredient == 1 else None,
+                "unite_stock": None,
+            }
+            for id_cocktail, nom, ingredients in [
+                (1, "Mojito", [1, 2]),
+                (2, "Daiquiri", [1, 3]),
+                (3, "Mojito", [1, 4]),
+                (4, "Zombie", [2, 3]),
+                (5, "Caipirinha", [1, 5, 6]),
+            ]
+            for id_ingredient in ingredients
+        ]
+
+    def test_pages_identiques_au_resultat_complet(self, cocktail_service) -> None:
+        """Teste que les pages enchaînées donnent la liste complète triée."""
+        # Arrange
+        simuler_catalogue_et_stock(cocktail_service, self.catalogue())
+        complet = cocktail_service.get_cocktails_quasi_realisables(1, 2)
+
+        # Act
+        pages = []
+        curseur = None
+        while True:
+            page = cocktail_service.get_cocktails_quasi_realisables(
+                1,
+                2,
+                limit=2,
+                curseur=curseur,
+            )
+            pages.append(page["cocktails_quasi_realisables"])
+            curseur = page["curseur_suivant"]
+            if curseur is None:
+                break
+
+        # Assert
+        ids = [c["id_cocktail"] for page in pages for c in page]
+        attendu = [c["id_cocktail"] for c in complet["cocktails_quasi_realisables"]]
+        if ids != attendu or attendu != [2, 1, 3, 5, 4]:
+            raise AssertionError(
+                message=f"Pages {ids} différentes du résultat complet {attendu}",
+            )
+        if [len(page) for page in pages] != [2, 2, 1]:
+            raise AssertionError(
+                message=f"Pages de 2, 2 et 1 cocktails attendues: {pages}",
+            )
+
+    @staticmethod
+    def test_curseur_invalide(cocktail_service) -> None:
+        """Teste qu'un curseur invalide est refusé."""
+        # Act & Assert
+        with pytest.raises(InvalidCursorError):
+            cocktail_service.get_cocktails_quasi_realisables(
+                1,
+                limit=2,
+                curseur="pas-un-curseur",
+            )
+
+
+class TestRechercherPleinTexte:
+    """Tests pour la recherche plein texte."""
+
+    @staticmethod
+    def test_page_et_curseur_suivant(cocktail_service) -> None:
+        """Teste que la ligne en trop donne le curseur de la page suivante."""
+        # Arrange
+        cocktail_service.instruction_dao = MagicMock()
+        cocktail_service.instruction_dao.rechercher.return_value = [
+            {"id_cocktail": id_cocktail, "nom": nom, "rang": rang}
+            for id_cocktail, nom, rang in [(3, "Mojito", 0.6), (1, "Julep", 0.2)]
+        ]
+
+        # Act
+        page = cocktail_service.rechercher_plein_texte("mint", limit=1)
+        suivante = cocktail_service.rechercher_plein_texte(
+            "mint",
+            limit=1,
+            curseur=page["curseur_suivant"],
+        )
+
+        # Assert
+        if page["resultats"] != [{"id_cocktail": 3, "nom": "Mojito", "rang": 0.6}]:
+            raise AssertionError(message=f"Seul Mojito attendu: {page}")
+        appel = cocktail_service.instruction_dao.rechercher.call_args
+        if appel.kwargs != {"limite": 2, "apres": (0.6, 3)}:
+            raise AssertionError(message=f"Clé (0.6, 3) attendue: {appel}")
+        if suivante["nombre_resultats"] != 1:
+            raise AssertionError(message=f"Un résultat attendu: {suivante}")
+
+    @staticmethod
+    def test_texte_vide(cocktail_service) -> None:
+        """Teste qu'un texte vide est refusé."""
+        # Act & Assert
+        with pytest.raises(EmptyFieldError):
+            cocktail_service.rechercher_plein_texte("  ")
+
+    @staticmethod
+    def test_dao_error(cocktail_service) -> None:
+        """Teste qu'une erreur DAO devient une ServiceError."""
+        # Arrange
+        cocktail_service.instruction_dao = MagicMock()
+        cocktail_service.instruction_dao.rechercher.side_effect = DAOError("boom")
+
+        # Act & Assert
+        with pytest.raises(ServiceError):
+            cocktail_service.rechercher_plein_texte("mint")
+
+
+class TestParcourirCatalogue:
+    """Tests pour le parcours du catalogue par facettes."""
+
+    @staticmethod
+    def test_pages_et_facettes(cocktail_service, mock_cocktail_dao) -> None:
+        """Teste la page, le nombre total, les facettes et le curseur."""
+        # Arrange
+        mock_cocktail_dao.get_tous_cocktails_avec_ingredients.return_value = [
+            {
+                "id_cocktail": id_cocktail,
+                "nom": nom,
+                "categorie": "Cocktail",
+                "verre": verre,
+                "alcool": True,
+                "image": "img.jpg",
+                "id_ingredient": None,
+                "qte": None,
+                "unite": None,
+            }
+            for id_cocktail, nom, verre in [
+                (1, "Mojito", "Highball"),
+                (2, "Daiquiri", "Coupe"),
+                (3, "Zombie", "Highball"),
+            ]
+        ]
+        selection = Selection(verre=("Highball",))
+
+        # Act
+        page = cocktail_service.parcourir_catalogue(selection, limit=1)
+        suivante = cocktail_service.parcourir_catalogue(
+            selection,
+            limit=1,
+            curseur=page["curseur_suivant"],
+        )
+
+        # Assert
+        noms = [c["nom"] for c in page["cocktails"] + suivante["cocktails"]]
+        if noms != ["Mojito", "Zombie"] or page["nombre_cocktails"] != len(noms):
+            raise AssertionError(message=f"Mojito puis Zombie attendus: {noms}")
+        if suivante["curseur_suivant"] is not None:
+            raise AssertionError(message="Pas de page après Zombie")
+        verres = {c["valeur"]: c["nombre"] for c in page["facettes"]["verre"]}
+        if verres != {"Highball": 2, "Coupe": 1}:
+            raise AssertionError(message=f"Comptes des verres inattendus: {verres}")
+        mock_cocktail_dao.get_tous_cocktails_avec_ingredients.assert_called_once()
+
+
+class TestTirerCocktailsAleatoires:
+    """Tests pour le tirage de cocktails au hasard."""
+
+    @staticmethod
+    def test_tirage_filtre_par_stock(cocktail_service) -> None:
+        """Teste que seuls les cocktails réalisables et retenus sont tirés."""
+        # Arrange
+        simuler_catalogue_et_stock(
+            cocktail_service,
+            TestPaginationQuasiRealisables.catalogue(),
+        )
+        cocktail_service.instruction_dao = MagicMock()
+        cocktail_service.instruction_dao.get_instructions.return_value = {
+            1: "Muddle",
+        }
+
+        # Act
+        resultat = cocktail_service.tirer_cocktails_aleatoires(
+            10,
+            Selection(categorie=("Cocktail",), sans=("Ingrédient 4",)),
+            id_utilisateur=1,
+            max_ingredients_manquants=1,
+        )
+
+        # Assert
+        tires = {c["id_cocktail"]: c["instructions"] for c in resultat["cocktails"]}
+        if tires != {1: "Muddle", 2: None}:
+            raise AssertionError(message=f"Cocktails 1 et 2 attendus: {tires}")
+
+    @staticmethod
+    def test_tirage_sans_filtre(cocktail_service, mock_cocktail_dao) -> None:
+        """Teste que le tirage sans filtre est confié au DAO."""
+        # Arrange
+        mojito = Cocktail(1, "Mojito", "Cocktail", "Highball", alcool=True, image="")
+        mock_cocktail_dao.rechercher_cocktails_aleatoires.return_value = [mojito]
+        cocktail_service.instruction_dao = MagicMock()
+        cocktail_service.instruction_dao.get_instructions.return_value = {}
+
+        # Act
+        resultat = cocktail_service.tirer_cocktails_aleatoires(1, Selection())
+
+        # Assert
+        if resultat["nombre_cocktails"] != 1 or resultat["cocktails"][0]["nom"] != (
+            "Mojito"
+        ):
+            raise AssertionError(message=f"Mojito attendu: {resultat}")
+        mock_cocktail_dao.get_tous_cocktails_avec_ingredients.assert_not_called()
+
+
+class TestGetMeilleursAchats:
+    """Tests pour la méthode get_meilleurs_achats."""
+
+    @staticmethod
+    def test_get_meilleurs_achats(cocktail_service) -> None:
+        """Test du choix des ingrédients à acheter."""
+        # Arrange (Mojito : rhum en stock, menthe manquante ; Daiquiri : rien)
+        rows = [
+            {
+                "id_cocktail": id_cocktail,
+                "nom": nom,
+                "categorie": "Cocktail",
+                "verre": "Highball glass",
+                "alcool": True,
+                "image": f"{nom}.jpg",
+                "id_ingredient": id_ingredient,
+                "quantite_requise": 50,
+                "unite_requise": "ml",
+                "nom_ingredient": nom_ingredient,
+                "quantite_stock": quantite_stock,
+                "unite_stock": "ml",
+            }
+            for id_cocktail, nom, id_ingredient, nom_ingredient, quantite_stock in [
+                (1, "Mojito", 1, "Rhum", 100),
+                (1, "Mojito", 2, "Menthe", None),
+                (2, "Daiquiri", 1, "Rhum", 100),
+                (2, "Daiquiri", 3, "Citron", None),
+                (2, "Daiquiri", 4, "Sucre", None),
+            ]
+        ]
+        simuler_catalogue_et_stock(cocktail_service, rows)
+
+        # Act
+        result = cocktail_service.get_meilleurs_achats(1, 1)
+
+        # Assert
+        achats = [ingredient["nom"] for ingredient in result["ingredients_a_acheter"]]
+        if achats != ["Menthe"] or result["nombre_cocktails_debloques"] != 1:
+            raise AssertionError(
+                message=f"Menthe pour débloquer le Mojito attendue, obtenu: {result}",
+            )
+
+    @staticmethod
+    def test_get_meilleurs_achats_dao_error(cocktail_service) -> None:
         """Test avec erreur DAO."""
         # Arrange
-        mock_cocktail_dao.get_cocktails_quasi_realisables.side_effect = DAOError(
-            "Erreur DAO",
+        cocktail_service.stock_dao.get_stock = MagicMock(
+            side_effect=DAOError("Erreur DAO"),
         )
 
         # Act & Assert
         with pytest.raises(ServiceError):
-            cocktail_service.get_cocktails_quasi_realisables(1)
+            cocktail_service.get_meilleurs_achats(1)
 
 
 class TestIsIngredientAvailable:
@@ -859,3 +1190,107 @@ class TestCompareSolidQuantities:
         # Assert
         if result is not True:
             raise AssertionError(message=f"Devrait être True, obtenu: {result}")
+
+
+class TestVersionsAsynchrones:
+    """Tests pour les variantes asynchrones du service."""
+
+    @staticmethod
+    def test_rechercher_cocktail_par_nom_async(
+        cocktail_service,
+        sample_cocktail,
+    ) -> None:
+        """Test de la recherche asynchrone par nom avec instructions."""
+        # Arrange
+        cocktail_async_dao = AsyncMock()
+        cocktail_async_dao.rechercher_cocktail_par_nom.return_value = sample_cocktail
+        cocktail_service.cocktail_async_dao = cocktail_async_dao
+        cocktail_service.instruction_async_dao = AsyncMock()
+        cocktail_service.instruction_async_dao.get_instruction.return_value = "Mélanger"
+
+        # Act
+        cocktail, instructions = asyncio.run(
+            cocktail_service.rechercher_cocktail_par_nom_async("Mojito"),
+        )
+
+        # Assert
+        if cocktail != sample_cocktail or instructions != "Mélanger":
+            raise AssertionError(
+                message=f"Mojito et ses instructions attendus, obtenu: "
+                f"{cocktail}, {instructions}",
+            )
+
+    @staticmethod
+    def test_rechercher_par_sequence_async_aucun_resultat(cocktail_service) -> None:
+        """Test de la recherche asynchrone par séquence sans résultat."""
+        # Arrange
+        cocktail_async_dao = AsyncMock()
+        cocktail_async_dao.rechercher_cocktail_par_sequence_debut.return_value = []
+        cocktail_service.cocktail_async_dao = cocktail_async_dao
+
+        # Act & Assert
+        with pytest.raises(CocktailSearchError):
+            asyncio.run(
+                cocktail_service.rechercher_cocktail_par_sequence_debut_async("Zz"),
+            )
+
+    @staticmethod
+    def test_get_cocktails_realisables_async(cocktail_service) -> None:
+        """Test que la version asynchrone applique la même logique."""
+        # Arrange
+        stock_rows = [
+            {"id_ingredient": 1, "quantite": 500.0, "code_unite": "ml"},
+        ]
+        cocktails_rows = [
+            {
+                "id_cocktail": 1,
+                "nom": "Vodka Shot",
+                "categorie": "Shot",
+                "verre": "Shot glass",
+                "alcool": True,
+                "image": "shot.jpg",
+                "id_ingredient": 1,
+                "qte": 50.0,
+                "unite": "ml",
+            },
+            {
+                "id_cocktail": 2,
+                "nom": "Gin Shot",
+                "categorie": "Shot",
+                "verre": "Shot glass",
+                "alcool": True,
+                "image": "shot.jpg",
+                "id_ingredient": 2,
+                "qte": 50.0,
+                "unite": "ml",
+            },
+        ]
+        cocktail_service.stock_async_dao = AsyncMock()
+        cocktail_service.stock_async_dao.get_stock.return_value = stock_rows
+        cocktail_async_dao = AsyncMock()
+        cocktail_async_dao.get_tous_cocktails_avec_ingredients.return_value = (
+            cocktails_rows
+        )
+        cocktail_service.cocktail_async_dao = cocktail_async_dao
+
+        # Act
+        result = asyncio.run(cocktail_service.get_cocktails_realisables_async(1))
+
+        # Assert
+        noms = [c["nom"] for c in result["cocktails_realisables"]]
+        if noms != ["Vodka Shot"] or result["nombre_cocktails"] != 1:
+            raise AssertionError(
+                message=f"Seul 'Vodka Shot' devrait être réalisable, obtenu: {noms}",
+            )
+
+    @staticmethod
+    def test_get_cocktails_realisables_async_dao_error(cocktail_service) -> None:
+        """Test avec erreur DAO dans la version asynchrone."""
+        # Arrange
+        cocktail_service.stock_async_dao = AsyncMock()
+        cocktail_service.stock_async_dao.get_stock.side_effect = DAOError("Erreur DAO")
+        cocktail_service.cocktail_async_dao = AsyncMock()
+
+        # Act & Assert
+        with pytest.raises(ServiceError):
+            asyncio.run(cocktail_service.get_cocktails_realisables_async(1))
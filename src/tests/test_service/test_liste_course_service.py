@@ -4,13 +4,16 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.dao.cache_realisables import CacheRealisables
 from src.dao.ingredient_dao import IngredientDAO
 from src.dao.liste_course_dao import ListeCourseDAO
 from src.dao.stock_dao import StockDAO
+from src.dao.unite_dao import UniteDAO
 from src.models.utilisateurs import User
 from src.service.ingredient_service import IngredientService
 from src.service.liste_course_service import ListeCourseService
 from src.service.utilisateur_service import UtilisateurService
+from src.utils.conversion_unite import TableConversion
 from src.utils.exceptions import (
     IngredientNotFoundError,
     ServiceError,
@@ -601,6 +604,10 @@ class TestListeCourseServiceRemoveAddStock:
             )
 
         stock_dao_mock.set_stock_item.assert_called_once()
+        if CacheRealisables().version(id_utilisateur) != 1:
+            raise AssertionError(
+                message="Le transfert devrait incrémenter la version du stock",
+            )
 
     @staticmethod
     def test_remove_and_add_to_stock_meme_unite() -> None:
@@ -670,6 +677,69 @@ class TestListeCourseServiceRemoveAddStock:
                 f"{call_args[1]['quantite']}",
             )
 
+    @staticmethod
+    def test_remove_and_add_to_stock_oz_et_g() -> None:
+        """Teste l'addition de 2 oz (liste) à 500 g (stock), convertie en g."""
+        # GIVEN
+        id_utilisateur = 1
+        nom_ingredient = "sucre"
+
+        ingredient = {
+            "id_ingredient": 7,
+            "nom": "Sucre",
+        }
+
+        liste_item = {
+            "quantite": 2.0,
+            "id_unite": 2,
+            "type_unite": "liquide",
+            "code_unite": "oz",
+        }
+
+        stock_item = {
+            "quantite": 500.0,
+            "id_unite": 1,
+        }
+
+        liste_course_dao_mock = MagicMock(spec=ListeCourseDAO)
+        liste_course_dao_mock.get_liste_course_item.return_value = liste_item
+        liste_course_dao_mock.remove_from_liste_course.return_value = True
+
+        stock_dao_mock = MagicMock(spec=StockDAO)
+        stock_dao_mock.get_stock_item.return_value = stock_item
+        stock_dao_mock.set_stock_item.return_value = None
+
+        unite_dao_mock = MagicMock(spec=UniteDAO)
+        unite_dao_mock.get_table_conversion.return_value = TableConversion(
+            [
+                {"id_unite": 1, "abbreviation": "g"},
+                {"id_unite": 2, "abbreviation": "oz"},
+            ],
+        )
+
+        ingredient_svc_mock = MagicMock(spec=IngredientService)
+        ingredient_svc_mock.get_by_name_with_suggestions.return_value = ingredient
+
+        # WHEN
+        service = ListeCourseService()
+        service.liste_course_dao = liste_course_dao_mock
+        service.stock_dao = stock_dao_mock
+        service.unite_dao = unite_dao_mock
+        service.ingredient_svc = ingredient_svc_mock
+
+        service.remove_from_liste_course_and_add_to_stock(
+            id_utilisateur,
+            nom_ingredient,
+        )
+
+        # THEN : 500 g + 2 x 28.3495 g, gardés en g
+        call_args = stock_dao_mock.set_stock_item.call_args
+        quantite, id_unite = call_args[1]["quantite"], call_args[1]["id_unite"]
+        if id_unite != 1 or quantite != pytest.approx(556.699):
+            raise AssertionError(
+                message=f"556.699 g attendus, obtenu: {quantite} (unité {id_unite})",
+            )
+
     @staticmethod
     def test_remove_and_add_to_stock_non_dans_liste() -> None:
         """Teste le transfert d'un ingrédient non présent dans la liste."""
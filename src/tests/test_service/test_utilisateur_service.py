@@ -1,11 +1,12 @@
 """Classe de test de UtilisateurService."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.dao.utilisateur_dao import UtilisateurDAO
+from src.dao.utilisateur_dao import AsyncUtilisateurDAO, UtilisateurDAO
 from src.models.utilisateurs import (
     DateInscriptionResponse,
     User,
@@ -21,7 +22,13 @@ from src.utils.exceptions import (
     ServiceError,
     UserNotFoundError,
 )
-from src.utils.securite import hacher_mot_de_passe
+from src.utils.pool_hachage import PoolHachage
+from src.utils.securite import (
+    hachage_a_migrer,
+    hacher_mot_de_passe,
+    pwd_context,
+    verifier_mot_de_passe,
+)
 
 
 class TestUtilisateurService:
@@ -702,3 +709,81 @@ class TestUtilisateurService:
                 "obtenu: {resultat.date_inscription}",
             )
         dao_mock.get_date_inscription.assert_called_once_with(pseudo)
+
+
+class TestMigrationHachage:
+    """Tests de la connexion asynchrone et du rehachage des mots de passe."""
+
+    @staticmethod
+    def test_connexion_puis_migration_du_hachage() -> None:
+        """Teste qu'un hachage d'un autre coût est refait après la connexion."""
+        # GIVEN
+        mot_de_passe = "SecurePass123!"
+        ancien_hachage = (
+            pwd_context.handler("bcrypt").using(rounds=4).hash(mot_de_passe)
+        )
+        utilisateur = User(
+            id_utilisateur=1,
+            pseudo="john_doe",
+            mail="john@example.com",
+            mot_de_passe_hashed=ancien_hachage,
+            date_naissance="2000-01-01",
+            date_inscription="2024-01-15",
+        )
+        service = UtilisateurService(MagicMock(spec=UtilisateurDAO))
+        service.utilisateur_async_dao = AsyncMock(spec=AsyncUtilisateurDAO)
+        service.utilisateur_async_dao.recuperer_par_pseudo.return_value = utilisateur
+        service.utilisateur_async_dao.remplacer_hachage.return_value = True
+
+        async def scenario() -> tuple[User, bool, bool]:
+            try:
+                connecte = await service.authenticate_async("john_doe", mot_de_passe)
+                a_migrer = service.hachage_a_migrer(connecte)
+                migre = await service.migrer_hachage_async(connecte, mot_de_passe)
+                return connecte, a_migrer, migre
+            finally:
+                PoolHachage().fermer()
+
+        # WHEN
+        connecte, a_migrer, migre = asyncio.run(scenario())
+
+        # THEN
+        if connecte != utilisateur or not a_migrer or not migre:
+            raise AssertionError(
+                message=f"Connexion puis migration attendues, obtenu: "
+                f"{connecte}, {a_migrer}, {migre}",
+            )
+        id_utilisateur, ancien, nouveau = (
+            service.utilisateur_async_dao.remplacer_hachage.call_args.args
+        )
+        if (id_utilisateur, ancien) != (1, ancien_hachage):
+            raise AssertionError(
+                message=f"Le hachage lu à la connexion devrait être remplacé, "
+                f"obtenu: {id_utilisateur}, {ancien}",
+            )
+        if not verifier_mot_de_passe(mot_de_passe, nouveau) or hachage_a_migrer(
+            nouveau,
+        ):
+            raise AssertionError(
+                message=f"Nouveau hachage du coût configuré attendu: {nouveau}",
+            )
+
+    @staticmethod
+    def test_connexion_sans_migration() -> None:
+        """Teste qu'un hachage du coût configuré n'est pas à refaire."""
+        # GIVEN
+        utilisateur = User(
+            id_utilisateur=1,
+            pseudo="john_doe",
+            mail="john@example.com",
+            mot_de_passe_hashed=hacher_mot_de_passe("SecurePass123!"),
+            date_naissance="2000-01-01",
+            date_inscription="2024-01-15",
+        )
+
+        # WHEN
+        a_migrer = UtilisateurService.hachage_a_migrer(utilisateur)
+
+        # THEN
+        if a_migrer:
+            raise AssertionError(message="Le hachage ne devrait pas être à refaire")
@@ -1,6 +1,10 @@
 """Tests unitaires pour les fonctions de conversion d'unité."""
 
-from src.utils.conversion_unite import UnitConverter
+from typing import ClassVar
+
+import numpy as np
+
+from src.utils.conversion_unite import TableConversion, UnitConverter
 
 
 class TestUnitConverterNormalizeUnit:
@@ -340,3 +344,94 @@ class TestUnitConverterGetUnitType:
             raise AssertionError(
                 message=f"Attendu None, obtenu: {result}",
             )
+
+
+class TestUnitConverterNormaliser:
+    """Tests pour la normalisation des quantités stockées en base."""
+
+    @staticmethod
+    def test_normaliser_liquide() -> None:
+        """Teste qu'une quantité liquide est ramenée en ml."""
+        result = UnitConverter.normaliser(2, "oz")
+        if result != (59.15, "liquide"):
+            raise AssertionError(
+                message=f"Attendu (59.15, 'liquide'), obtenu: {result}",
+            )
+
+    @staticmethod
+    def test_normaliser_solide() -> None:
+        """Teste qu'une quantité solide est ramenée en g."""
+        result = UnitConverter.normaliser(0.5, "kg")
+        if result != (500.0, "solide"):
+            raise AssertionError(
+                message=f"Attendu (500.0, 'solide'), obtenu: {result}",
+            )
+
+    @staticmethod
+    def test_normaliser_unite_speciale() -> None:
+        """Teste qu'une unité spéciale garde la quantité saisie."""
+        result = UnitConverter.normaliser(3, "slice")
+        if result != (3, "autre"):
+            raise AssertionError(
+                message=f"Attendu (3, 'autre'), obtenu: {result}",
+            )
+
+    @staticmethod
+    def test_normaliser_sans_quantite() -> None:
+        """Teste qu'une quantité absente reste absente."""
+        result = UnitConverter.normaliser(None, "cl")
+        if result != (None, "liquide"):
+            raise AssertionError(
+                message=f"Attendu (None, 'liquide'), obtenu: {result}",
+            )
+
+
+class TestTableConversion:
+    """Tests pour la table de conversion compilée par id_unite."""
+
+    UNITES: ClassVar[list[dict]] = [
+        {"id_unite": 1, "abbreviation": "cl"},
+        {"id_unite": 2, "abbreviation": "TBLSP"},
+        {"id_unite": 3, "abbreviation": "tbsp"},
+        {"id_unite": 4, "abbreviation": "slice"},
+        {"id_unite": 6, "abbreviation": "kg"},
+    ]
+
+    def test_get(self) -> None:
+        """Teste le type et le facteur de chaque unité."""
+        table = TableConversion(self.UNITES)
+        obtenu = [table.get(id_unite) for id_unite in (1, 4, 6, 5, None)]
+        attendu = [
+            ("liquide", 10.0),
+            ("autre", None),
+            ("solide", 1000.0),
+            (None, None),
+            (None, None),
+        ]
+        if obtenu != attendu:
+            raise AssertionError(message=f"Attendu {attendu}, obtenu: {obtenu}")
+
+    def test_convert_many(self) -> None:
+        """Teste la conversion groupée, NaN pour les unités non convertibles."""
+        table = TableConversion(self.UNITES)
+        obtenu = table.convert_many([5, 2, 3, 1, 1], [1, 6, 4, 99, None])
+        attendu = np.array([50.0, 2000.0, np.nan, np.nan, np.nan])
+        if not np.array_equal(obtenu, attendu, equal_nan=True):
+            raise AssertionError(message=f"Attendu {attendu}, obtenu: {obtenu}")
+
+    def test_normaliser_identique_unit_converter(self) -> None:
+        """Teste que normaliser donne le même résultat que UnitConverter."""
+        table = TableConversion(self.UNITES)
+        for unite in self.UNITES:
+            obtenu = table.normaliser(1.5, unite["id_unite"])
+            attendu = UnitConverter.normaliser(1.5, unite["abbreviation"])
+            if obtenu != attendu:
+                raise AssertionError(
+                    message=f"{unite}: attendu {attendu}, obtenu: {obtenu}",
+                )
+
+    def test_meme_unite(self) -> None:
+        """Teste que les variantes d'une même unité sont reconnues."""
+        table = TableConversion(self.UNITES)
+        if not table.meme_unite(2, 3) or table.meme_unite(1, 3):
+            raise AssertionError(message="tblsp et tbsp sont la même unité, pas cl")
@@ -0,0 +1,95 @@
+"""Tests pour la couverture maximale gloutonne."""
+
+from src.utils.couverture import couverture_maximale, elements
+
+
+def ensembles(*contenus: list[int]) -> list[int]:
+    """Construit les bitsets d'ensembles donnés par leurs éléments."""
+    return [sum(1 << element for element in contenu) for contenu in contenus]
+
+
+class TestElements:
+    """Tests du décodage des bitsets."""
+
+    @staticmethod
+    def test_elements_au_dela_de_64() -> None:
+        """Teste que les éléments au-delà de 64 bits sont retrouvés."""
+        # WHEN
+        result = elements(ensembles([0, 63, 64, 200])[0])
+
+        # THEN
+        if result != [0, 63, 64, 200]:
+            raise AssertionError(message=f"Éléments inattendus: {result}")
+
+
+class TestCouvertureMaximale:
+    """Tests du choix glouton des éléments."""
+
+    @staticmethod
+    def test_choisit_l_element_le_plus_partage() -> None:
+        """Teste qu'un élément commun à plusieurs ensembles est choisi d'abord."""
+        # WHEN
+        etapes, couverts = couverture_maximale(
+            ensembles([1], [1], [1], [2], [3, 4]),
+            1,
+        )
+
+        # THEN
+        if [elements(etape) for etape in etapes] != [[1]]:
+            raise AssertionError(message=f"[[1]] attendu, obtenu: {etapes}")
+        if couverts != [True, True, True, False, False]:
+            raise AssertionError(message=f"Couverture inattendue: {couverts}")
+
+    @staticmethod
+    def test_complete_un_ensemble_de_plusieurs_elements() -> None:
+        """Teste que deux éléments sont choisis ensemble s'ils débloquent plus."""
+        # GIVEN (3 et 4 couvrent trois ensembles, 1 puis 2 n'en couvrent que deux)
+        bitsets = ensembles([3, 4], [3, 4], [3, 4], [1], [2])
+
+        # WHEN
+        etapes, couverts = couverture_maximale(bitsets, 2)
+
+        # THEN
+        choisis = sorted(e for etape in etapes for e in elements(etape))
+        if choisis != [3, 4] or couverts != [True, True, True, False, False]:
+            raise AssertionError(
+                message=f"3 et 4 attendus, obtenu: {choisis} ({couverts})",
+            )
+
+    @staticmethod
+    def test_sous_ensembles_comptes_dans_le_gain() -> None:
+        """Teste qu'un complément couvre aussi les ensembles qu'il contient."""
+        # GIVEN ({1, 2} couvre aussi [1] et [2] : 3 ensembles pour 2 éléments)
+        bitsets = ensembles([1, 2], [1], [2], [5], [6])
+
+        # WHEN
+        etapes, couverts = couverture_maximale(bitsets, 2)
+
+        # THEN
+        if couverts != [True, True, True, False, False]:
+            raise AssertionError(
+                message=f"Les trois premiers ensembles attendus, obtenu: {etapes}",
+            )
+
+    @staticmethod
+    def test_budget_respecte() -> None:
+        """Teste qu'aucun ensemble trop grand pour le budget n'est complété."""
+        # WHEN
+        etapes, couverts = couverture_maximale(ensembles([1, 2, 3], [4, 5]), 2)
+
+        # THEN
+        nb_choisis = sum(len(elements(etape)) for etape in etapes)
+        if nb_choisis > len([4, 5]) or couverts != [False, True]:
+            raise AssertionError(
+                message=f"Seul le second ensemble attendu, obtenu: {couverts}",
+            )
+
+    @staticmethod
+    def test_rien_a_debloquer() -> None:
+        """Teste qu'aucun élément n'est choisi si rien ne peut être couvert."""
+        # WHEN
+        etapes, couverts = couverture_maximale(ensembles([1, 2, 3]), 2)
+
+        # THEN
+        if etapes or any(couverts):
+            raise AssertionError(message=f"Aucun choix attendu, obtenu: {etapes}")
@@ -0,0 +1,107 @@
+"""Tests unitaires pour la navigation à facettes du catalogue."""
+
+import numpy as np
+import pytest
+
+from src.utils.facettes import CatalogueFacettes, Selection
+
+
+@pytest.fixture
+def catalogue() -> CatalogueFacettes:
+    """Cinq cocktails, dans le désordre, avec leurs ingrédients."""
+    cocktails = [
+        ("Mojito", "Cocktail", "Highball", True, ["Rum", "Mint", "Lime"]),
+        ("Daiquiri", "Cocktail", "Coupe", True, ["Rum", "Lime"]),
+        ("Virgin Mojito", "Mocktail", "Highball", False, ["Mint", "Lime"]),
+        ("Gin Fizz", "Cocktail", "Highball", True, ["Gin", "Lime"]),
+        ("Mojito", "Cocktail", None, True, []),
+    ]
+    return CatalogueFacettes(
+        [
+            {
+                "id_cocktail": id_cocktail,
+                "nom": nom,
+                "categorie": categorie,
+                "verre": verre,
+                "alcool": alcool,
+            }
+            for id_cocktail, (nom, categorie, verre, alcool, _) in enumerate(
+                cocktails,
+                start=1,
+            )
+        ],
+        [
+            (position, ingredient)
+            for position, (*_, ingredients) in enumerate(cocktails)
+            for ingredient in ingredients
+        ],
+    )
+
+
+def ids(cocktails: list[dict]) -> list[int]:
+    """Retourne les id_cocktail d'une liste de cocktails."""
+    return [cocktail["id_cocktail"] for cocktail in cocktails]
+
+
+class TestCatalogueFacettes:
+    """Tests pour CatalogueFacettes."""
+
+    @staticmethod
+    def test_selection_triee_par_nom(catalogue) -> None:
+        """Teste la combinaison des facettes et des ingrédients requis ou exclus."""
+        selection = Selection(
+            verre=("Highball", "Coupe"),
+            avec=("lime",),
+            sans=("Gin",),
+        )
+
+        cocktails, total = catalogue.parcourir(selection, 10)
+
+        if (ids(cocktails), total) != ([2, 1, 3], len([2, 1, 3])):
+            raise AssertionError(message=f"Attendu [2, 1, 3], obtenu: {cocktails}")
+
+    @staticmethod
+    def test_comptes_des_facettes(catalogue) -> None:
+        """Teste que le filtre d'une facette n'influe pas sur ses propres comptes."""
+        comptes = catalogue.compter(Selection(verre=("Coupe",), avec=("Lime",)))
+
+        attendu = {
+            "categorie": [{"valeur": "Cocktail", "nombre": 1}],
+            "verre": [
+                {"valeur": "Highball", "nombre": 3},
+                {"valeur": "Coupe", "nombre": 1},
+            ],
+            "alcool": [{"valeur": True, "nombre": 1}],
+        }
+        if comptes != attendu:
+            raise AssertionError(message=f"Attendu {attendu}, obtenu: {comptes}")
+
+    @staticmethod
+    def test_pages_successives(catalogue) -> None:
+        """Teste la pagination sur la clé (nom, id_cocktail), homonymes compris."""
+        pages, apres = [], None
+        while page := catalogue.parcourir(Selection(), 2, apres)[0]:
+            pages.append(ids(page))
+            apres = (page[-1]["nom"], page[-1]["id_cocktail"])
+
+        if pages != [[2, 4], [1, 5], [3]]:
+            raise AssertionError(message=f"Pages inattendues: {pages}")
+
+    @staticmethod
+    def test_ingredient_inconnu(catalogue) -> None:
+        """Teste qu'un ingrédient requis inconnu ne retient aucun cocktail."""
+        cocktails, total = catalogue.parcourir(Selection(avec=("Whisky",)), 10)
+
+        if cocktails or total:
+            raise AssertionError(message=f"Aucun cocktail attendu: {cocktails}")
+
+    @staticmethod
+    def test_tirer_dans_la_selection(catalogue) -> None:
+        """Teste le tirage sans doublon parmi les cocktails retenus."""
+        masque = catalogue.masque(Selection(avec=("Mint",)))
+        masque &= catalogue.bitmap_catalogue(np.array([0, 1, 2]))
+
+        tirage = catalogue.tirer(masque, 5)
+
+        if sorted(ids(tirage)) != [1, 3]:
+            raise AssertionError(message=f"Mojito et Virgin Mojito attendus: {tirage}")
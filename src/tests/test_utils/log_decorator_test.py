@@ -0,0 +1,136 @@
+"""Tests du décorateur @log."""
+
+import asyncio
+import logging
+
+import pytest
+
+from src.utils.log_decorator import log
+
+LOGGER = "src.utils.log_decorator"
+
+
+class NonAffichable:
+    """Argument dont la mise en forme fait échouer le test."""
+
+    def __str__(self) -> str:
+        """Echoue : l'argument n'aurait pas dû être mis en forme."""
+        raise AssertionError(message="Argument mis en forme sans log actif")
+
+
+class DAOExemple:
+    """Méthodes décorées comme celles des DAO."""
+
+    decalage = 0
+
+    @staticmethod
+    @log
+    def connecter(pseudo: str, mot_de_passe: str, mdp: str | None = None) -> bool:
+        """Retourne True si les deux mots de passe diffèrent."""
+        return bool(pseudo) and mot_de_passe != mdp
+
+    @log
+    def externe(self, valeur: int) -> int:
+        """Appelle interne."""
+        return self.interne(valeur) + 1
+
+    @log
+    def interne(self, valeur: int) -> int:
+        """Retourne la valeur, ou échoue si elle est négative."""
+        if valeur < 0:
+            raise ValueError(valeur)
+        return valeur + self.decalage
+
+    @log
+    async def externe_async(self, valeur: int) -> int:
+        """Appelle interne_async."""
+        await asyncio.sleep(0)
+        return await self.interne_async(valeur)
+
+    @log
+    async def interne_async(self, valeur: int) -> int:
+        """Retourne la valeur après avoir rendu la main."""
+        await asyncio.sleep(0)
+        return valeur + self.decalage
+
+
+def indentations(caplog: pytest.LogCaptureFixture, fragment: str) -> list[int]:
+    """Retourne l'indentation des messages contenant un fragment."""
+    return [
+        len(message) - len(message.lstrip(" "))
+        for message in caplog.messages
+        if fragment in message
+    ]
+
+
+class TestLog:
+    """Tests de log."""
+
+    @staticmethod
+    def test_aucune_mise_en_forme_sans_log(caplog: pytest.LogCaptureFixture) -> None:
+        """Teste que les arguments ne sont pas mis en forme si DEBUG est inactif."""
+        # GIVEN
+        caplog.set_level(logging.INFO, logger=LOGGER)
+
+        # WHEN
+        resultat = DAOExemple.connecter(NonAffichable(), NonAffichable())
+
+        # THEN
+        if resultat is not True or caplog.messages:
+            raise AssertionError(message=f"Aucun log attendu: {caplog.messages}")
+
+    @staticmethod
+    def test_mots_de_passe_masques(caplog: pytest.LogCaptureFixture) -> None:
+        """Teste le masquage des mots de passe, par position et par nom."""
+        # GIVEN
+        caplog.set_level(logging.DEBUG, logger=LOGGER)
+
+        # WHEN
+        DAOExemple.connecter("alice", "secret1", mdp="secret2")
+
+        # THEN
+        debut = caplog.messages[0]
+        if debut != "    DAOExemple.connecter(alice, *****, mdp=*****) - DEBUT":
+            raise AssertionError(message=f"Message inattendu: {debut}")
+        if "secret" in " ".join(caplog.messages):
+            raise AssertionError(message="Un mot de passe apparaît dans les logs")
+
+    @staticmethod
+    def test_profondeur_retablie_apres_exception(
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Teste l'indentation des appels imbriqués, y compris après une erreur."""
+        # GIVEN
+        caplog.set_level(logging.DEBUG, logger=LOGGER)
+        dao = DAOExemple()
+        with pytest.raises(ValueError, match="-1"):
+            dao.externe(-1)
+        caplog.clear()
+
+        # WHEN
+        dao.externe(1)
+
+        # THEN
+        if indentations(caplog, "DEBUT") != [4, 8]:
+            raise AssertionError(message=f"Indentation inattendue: {caplog.messages}")
+
+    @staticmethod
+    def test_profondeur_propre_a_chaque_tache(
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Teste que des tâches entrelacées ne décalent pas leurs indentations."""
+        # GIVEN
+        caplog.set_level(logging.DEBUG, logger=LOGGER)
+        dao = DAOExemple()
+
+        async def scenario() -> list[int]:
+            return await asyncio.gather(*(dao.externe_async(i) for i in range(3)))
+
+        # WHEN
+        resultats = asyncio.run(scenario())
+
+        # THEN
+        if resultats != [0, 1, 2]:
+            raise AssertionError(message=f"Résultats inattendus: {resultats}")
+        if indentations(caplog, "interne_async") != [8] * 6:
+            raise AssertionError(message=f"Indentation inattendue: {caplog.messages}")
@@ -0,0 +1,136 @@
+"""Tests du pipeline des logs JSON et du contexte des requêtes."""
+
+import json
+import logging
+import queue
+
+import pytest
+
+from src.utils import contexte_logs
+from src.utils.contexte_logs import (
+    definir_utilisateur,
+    fermer_contexte,
+    ouvrir_contexte,
+    trace_echantillonnee,
+)
+from src.utils.log_init import FormatJSON, PipelineLogs, QueueHandlerBornee
+
+
+def _record(message: str = "bonjour %s", *args: object) -> logging.LogRecord:
+    """Construit un message de log de test."""
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, args, None)
+
+
+class TestQueueHandlerBornee:
+    """Tests de QueueHandlerBornee."""
+
+    @staticmethod
+    def test_file_pleine_message_perdu() -> None:
+        """Teste qu'un message est abandonné et compté si la file est pleine."""
+        # GIVEN
+        handler = QueueHandlerBornee(queue.Queue(maxsize=1))
+
+        # WHEN
+        handler.handle(_record())
+        handler.handle(_record())
+
+        # THEN
+        if handler.queue.qsize() != 1 or handler.perdus != 1:
+            raise AssertionError(
+                message=f"Un message en file et un perdu attendus : "
+                f"{handler.queue.qsize()}, {handler.perdus}",
+            )
+
+    @staticmethod
+    def test_contexte_ajoute_au_message() -> None:
+        """Teste que le contexte de la requête est porté par la ligne JSON."""
+        # GIVEN
+        handler = QueueHandlerBornee(queue.Queue())
+        jeton = ouvrir_contexte("abc123", "GET /api/cocktails")
+        definir_utilisateur(7)
+
+        # WHEN
+        try:
+            handler.handle(_record("bonjour %s", "alice"))
+        finally:
+            fermer_contexte(jeton)
+        ligne = json.loads(FormatJSON().format(handler.queue.get_nowait()))
+
+        # THEN
+        attendu = {
+            "message": "bonjour alice",
+            "request_id": "abc123",
+            "route": "GET /api/cocktails",
+            "id_utilisateur": 7,
+        }
+        if any(ligne.get(champ) != valeur for champ, valeur in attendu.items()):
+            raise AssertionError(
+                message=f"Champs attendus {attendu}, obtenu : {ligne}",
+            )
+
+
+class TestEchantillonnage:
+    """Tests de l'échantillonnage des traces DEBUG par requête."""
+
+    @staticmethod
+    @pytest.mark.parametrize("taux", [0.0, 1.0])
+    def test_trace_selon_taux(monkeypatch: pytest.MonkeyPatch, taux: float) -> None:
+        """Teste que la requête suit le taux d'échantillonnage."""
+        # GIVEN
+        monkeypatch.setattr(contexte_logs.settings, "LOG_DEBUG_SAMPLE_RATE", taux)
+
+        # WHEN
+        jeton = ouvrir_contexte("abc123", "GET /")
+        try:
+            trace = trace_echantillonnee()
+        finally:
+            fermer_contexte(jeton)
+
+        # THEN
+        attendu = taux > 0
+        if trace is not attendu:
+            raise AssertionError(
+                message=f"Trace {attendu} attendue avec un taux {taux}",
+            )
+
+    @staticmethod
+    def test_hors_requete_toujours_trace() -> None:
+        """Teste que les traces sont gardées hors requête."""
+        # WHEN / THEN
+        if not trace_echantillonnee():
+            raise AssertionError(message="Traces attendues hors requête")
+
+
+class TestPipelineLogs:
+    """Tests de PipelineLogs."""
+
+    @staticmethod
+    def test_demarrer_ecrit_le_fichier(
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path,
+    ) -> None:
+        """Teste que les messages sont écrits en JSON dans logs/<nom>.log."""
+        # GIVEN
+        monkeypatch.chdir(tmp_path)
+        racine = logging.getLogger()
+        handlers, niveau = list(racine.handlers), racine.level
+        pipeline = PipelineLogs()
+
+        # WHEN
+        try:
+            pipeline.demarrer("test")
+            logging.getLogger("test").warning("attention %d", 42)
+        finally:
+            pipeline.arreter()
+            racine.handlers[:] = handlers
+            racine.setLevel(niveau)
+        lignes = (tmp_path / "logs" / "test.log").read_text().splitlines()
+
+        # THEN
+        messages = [json.loads(ligne)["message"] for ligne in lignes]
+        if messages != ["attention 42"]:
+            raise AssertionError(message=f"Message attendu, obtenu : {messages}")
+        if pipeline.statistiques() != {"en_attente": 0, "perdus": 0}:
+            raise AssertionError(
+                message=f"Pipeline arrêté attendu : {pipeline.statistiques()}",
+            )
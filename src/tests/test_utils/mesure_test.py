@@ -0,0 +1,77 @@
+"""Tests unitaires pour l'analyse des mesures en texte libre."""
+
+import pytest
+
+from src.utils.mesure import (
+    MesureAnalysee,
+    analyser_mesure,
+    analyser_mesures,
+    normaliser_mesure,
+)
+
+
+class TestAnalyserMesure:
+    """Tests pour analyser_mesure."""
+
+    @pytest.mark.parametrize(
+        ("texte", "attendu"),
+        [
+            ("1 1/2 oz", (1.5, "oz", "liquide")),
+            ("½ cup", (0.5, "cup", "liquide")),
+            ("1,5 cl", (1.5, "cl", "liquide")),
+            ("2 Dashes", (2.0, "dash", "liquide")),
+            ("1-2 tsp", (1.5, "tsp", "liquide")),
+            ("1 to 2 Shots", (1.5, "shot", "liquide")),
+            ("2 fl. oz", (2.0, "fl oz", "liquide")),
+            ("3 Tablespoons", (3.0, "tbsp", "liquide")),
+            ("tblsp", (None, "tbsp", "liquide")),
+            ("3 leaves", (3.0, "leaf", "autre")),
+            ("2 pcs", (2.0, "piece", "autre")),
+            ("Juice of 1/2", (0.5, "juice", "autre")),
+            ("Fill with", (None, "fill", "autre")),
+            ("1 can", (1.0, "can", None)),
+            ("1", (1.0, None, None)),
+            (None, (None, None, None)),
+        ],
+    )
+    @staticmethod
+    def test_analyser_mesure(texte, attendu) -> None:
+        """Teste les fractions, intervalles, pluriels et variantes d'unités."""
+        resultat = analyser_mesure(texte)
+        if resultat != MesureAnalysee(*attendu):
+            raise AssertionError(
+                message=f"{texte!r}: attendu {attendu}, obtenu: {resultat}",
+            )
+
+    @staticmethod
+    def test_analyser_mesures_memorise() -> None:
+        """Teste que le lot n'analyse qu'une fois chaque texte distinct."""
+        analyser_mesure.cache_clear()
+
+        resultat = analyser_mesures(["1 oz", "2 cl", "1 oz", "1 oz"])
+
+        infos = analyser_mesure.cache_info()
+        if resultat[0] != resultat[2] or infos.misses != len(["1 oz", "2 cl"]):
+            raise AssertionError(
+                message=f"2 analyses attendues, obtenu: {infos} ({resultat})",
+            )
+
+
+class TestNormaliserMesure:
+    """Tests pour normaliser_mesure."""
+
+    @staticmethod
+    def test_quantite_lue_dans_le_texte() -> None:
+        """Teste qu'une quantité absente est lue dans le texte de l'unité."""
+        resultat = normaliser_mesure(None, "1 1/2 oz")
+        if resultat != (44.36, "liquide"):
+            raise AssertionError(
+                message=f"Attendu (44.36, liquide), obtenu: {resultat}",
+            )
+
+    @staticmethod
+    def test_quantite_saisie_prioritaire() -> None:
+        """Teste que la quantité saisie l'emporte sur celle du texte."""
+        resultat = normaliser_mesure(2, "1 cl")
+        if resultat != (20.0, "liquide"):
+            raise AssertionError(message=f"Attendu (20.0, liquide), obtenu: {resultat}")
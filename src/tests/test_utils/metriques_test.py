@@ -0,0 +1,173 @@
+"""Tests du registre des métriques et de ses histogrammes."""
+
+import pytest
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from src.utils.metriques import (
+    DAO_LIGNES,
+    HTTP_DUREE,
+    NON_ROUTEE,
+    POOL_CONNEXIONS,
+    Histogramme,
+    RegistreMetriques,
+    modele_de_route,
+)
+
+
+def client_des_modeles(modeles: list[str]) -> TestClient:
+    """Construit une API dont chaque requête ajoute son modèle de route."""
+    cocktails = APIRouter(prefix="/cocktails")
+
+    @cocktails.get("/sequence/{sequence}")
+    def par_sequence(sequence: str) -> str:
+        return sequence
+
+    @cocktails.get("/{id_cocktail}/avis/{id_avis}")
+    def avis(id_cocktail: int, id_avis: int) -> int:
+        return id_cocktail + id_avis
+
+    api = APIRouter(prefix="/api")
+    api.include_router(cocktails)
+    app = FastAPI()
+    app.include_router(api)
+
+    @app.middleware("http")
+    async def relever(request: Request, call_next) -> Response:
+        response = await call_next(request)
+        modeles.append(modele_de_route(request))
+        return response
+
+    return TestClient(app)
+
+
+class TestHistogramme:
+    """Tests d'Histogramme."""
+
+    @staticmethod
+    @pytest.mark.parametrize("duree", [0.000_007, 0.000_333, 0.0042, 0.17, 3.5, 42.0])
+    def test_precision_relative(duree: float) -> None:
+        """Teste que le quantile surestime la durée d'au plus 12,5 %."""
+        # GIVEN
+        histogramme = Histogramme()
+
+        # WHEN
+        histogramme.observer(duree)
+        quantile = histogramme.quantile(0.5)
+
+        # THEN
+        if not duree <= quantile <= duree * 1.125 + 0.000_001:
+            raise AssertionError(
+                message=f"Quantile {quantile} trop loin de la durée {duree}",
+            )
+
+    @staticmethod
+    def test_quantiles() -> None:
+        """Teste les quantiles d'une série de durées de 1 à 100 ms."""
+        # GIVEN
+        histogramme = Histogramme()
+        for milli in range(1, 101):
+            histogramme.observer(milli / 1000)
+
+        # WHEN
+        mediane, p99 = histogramme.quantile(0.5), histogramme.quantile(0.99)
+
+        # THEN
+        attendus = {"p50": (0.050, 0.057), "p99": (0.099, 0.112)}
+        if not (
+            attendus["p50"][0] <= mediane <= attendus["p50"][1]
+            and attendus["p99"][0] <= p99 <= attendus["p99"][1]
+        ):
+            raise AssertionError(
+                message=f"Quantiles inattendus : p50={mediane}, p99={p99}",
+            )
+
+
+class TestRegistreMetriques:
+    """Tests de RegistreMetriques."""
+
+    @staticmethod
+    def test_export_histogramme() -> None:
+        """Teste que les seaux exportés sont cumulés et finissent par +Inf."""
+        # GIVEN
+        registre = RegistreMetriques()
+        durees = (0.0002, 0.003, 0.003, 1.5)
+        for duree in durees:
+            registre.observer(HTTP_DUREE, duree, methode="GET", route="/api/x/{id}")
+
+        # WHEN
+        lignes = registre.exporter().splitlines()
+
+        # THEN
+        seaux = [
+            int(ligne.rsplit(" ", 1)[1])
+            for ligne in lignes
+            if ligne.startswith(f"{HTTP_DUREE}_bucket")
+        ]
+        if seaux != sorted(seaux) or seaux[-1] != len(durees):
+            raise AssertionError(message=f"Seaux non cumulés : {seaux}")
+        attendues = {
+            f"# TYPE {HTTP_DUREE} histogram",
+            f'{HTTP_DUREE}_bucket{{methode="GET",route="/api/x/{{id}}",le="+Inf"}} 4',
+            f'{HTTP_DUREE}_count{{methode="GET",route="/api/x/{{id}}"}} 4',
+        }
+        if not attendues <= set(lignes):
+            raise AssertionError(
+                message=f"Lignes manquantes : {attendues - set(lignes)}",
+            )
+
+    @staticmethod
+    def test_export_compteurs_et_jauges() -> None:
+        """Teste l'export des compteurs, des jauges et l'échappement."""
+        # GIVEN
+        registre = RegistreMetriques()
+        registre.incrementer(DAO_LIGNES, 3, methode='Dao."lire"')
+        registre.incrementer(DAO_LIGNES, 2, methode='Dao."lire"')
+        registre.definir(POOL_CONNEXIONS, 4, pool="sync", etat="utilisees")
+
+        # WHEN
+        lignes = set(registre.exporter().splitlines())
+
+        # THEN
+        attendues = {
+            f"# TYPE {DAO_LIGNES} counter",
+            f'{DAO_LIGNES}{{methode="Dao.\\"lire\\""}} 5',
+            f"# TYPE {POOL_CONNEXIONS} gauge",
+            f'{POOL_CONNEXIONS}{{pool="sync",etat="utilisees"}} 4',
+        }
+        if not attendues <= lignes:
+            raise AssertionError(message=f"Lignes manquantes : {attendues - lignes}")
+        if any(ligne.startswith(HTTP_DUREE) for ligne in lignes):
+            raise AssertionError(message="Une série vide ne doit pas être exportée")
+
+
+class TestModeleDeRoute:
+    """Tests de modele_de_route."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("chemin", "attendu"),
+        [
+            ("/api/cocktails/sequence/abc", "/api/cocktails/sequence/{sequence}"),
+            # Valeur égale à un segment fixe du chemin
+            (
+                "/api/cocktails/sequence/cocktails",
+                "/api/cocktails/sequence/{sequence}",
+            ),
+            # Deux paramètres de même valeur
+            ("/api/cocktails/7/avis/7", "/api/cocktails/{id_cocktail}/avis/{id_avis}"),
+            ("/api/inconnu/7", NON_ROUTEE),
+        ],
+    )
+    def test_modele(chemin: str, attendu: str) -> None:
+        """Teste le modèle relevé, quelles que soient les valeurs du chemin."""
+        # GIVEN
+        modeles = []
+        client = client_des_modeles(modeles)
+
+        # WHEN
+        client.get(chemin)
+
+        # THEN
+        if modeles != [attendu]:
+            raise AssertionError(message=f"{attendu} attendu, obtenu : {modeles}")
@@ -0,0 +1,39 @@
+"""Tests unitaires pour les curseurs de pagination."""
+
+import pytest
+
+from src.utils.exceptions import InvalidCursorError
+from src.utils.pagination import (
+    TYPES_RECHERCHE_TEXTE,
+    decoder_curseur,
+    encoder_curseur,
+)
+
+
+class TestCurseur:
+    """Tests de l'encodage des curseurs."""
+
+    @staticmethod
+    def test_aller_retour() -> None:
+        """Teste qu'un curseur décodé redonne la clé encodée."""
+        cle = (1, -66.67, "Piña Colada", 42)
+        result = decoder_curseur(encoder_curseur(cle))
+        if result != cle:
+            raise AssertionError(message=f"Attendu {cle}, obtenu: {result}")
+
+    @staticmethod
+    def test_cle_recherche_texte() -> None:
+        """Teste le curseur (rang, id_cocktail) de la recherche plein texte."""
+        result = decoder_curseur(encoder_curseur((1, 7)), TYPES_RECHERCHE_TEXTE)
+        if result != (1.0, 7) or not isinstance(result[0], float):
+            raise AssertionError(message=f"Attendu (1.0, 7), obtenu: {result}")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "curseur",
+        ["pas-un-curseur", encoder_curseur((1, 2.0)), "W3RydWUsIDEsICJhIiwgMV0="],
+    )
+    def test_curseur_invalide(curseur) -> None:
+        """Teste qu'un curseur mal formé lève InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decoder_curseur(curseur)
@@ -0,0 +1,115 @@
+"""Tests du pool de processus de hachage des mots de passe."""
+
+import asyncio
+
+import pytest
+from passlib.context import CryptContext
+
+from src.utils import securite
+from src.utils.exceptions import HachageSatureError
+from src.utils.pool_hachage import PoolHachage
+from src.utils.securite import verifier_mot_de_passe
+from src.utils.settings import settings
+
+
+class TestPoolHachage:
+    """Tests de PoolHachage."""
+
+    @staticmethod
+    def test_hacher_puis_verifier() -> None:
+        """Teste qu'un hachage fait par le pool se vérifie, dans le pool ou non."""
+
+        # GIVEN
+        async def scenario() -> tuple[str, bool, bool]:
+            pool = PoolHachage()
+            try:
+                hachage = await pool.hacher("SecurePass123!")
+                return (
+                    hachage,
+                    await pool.verifier("SecurePass123!", hachage),
+                    await pool.verifier("MauvaisPass123!", hachage),
+                )
+            finally:
+                pool.fermer()
+
+        # WHEN
+        hachage, valide, invalide = asyncio.run(scenario())
+
+        # THEN
+        if not valide or invalide:
+            raise AssertionError(
+                message=f"Seul le bon mot de passe devrait être valide : "
+                f"{valide}, {invalide}",
+            )
+        if not verifier_mot_de_passe("SecurePass123!", hachage):
+            raise AssertionError(message="Le hachage du pool devrait se vérifier")
+
+    @staticmethod
+    def test_refus_immediat_si_sature(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Teste qu'une demande au-delà de la file est refusée sans attendre."""
+        # GIVEN
+        monkeypatch.setattr(settings, "BCRYPT_WORKERS", 1)
+        monkeypatch.setattr(settings, "BCRYPT_MAX_QUEUE", 1)
+
+        async def scenario() -> tuple[bool, int, int]:
+            pool = PoolHachage()
+            try:
+                en_attente = [
+                    asyncio.create_task(pool.hacher(f"SecurePass{i}!"))
+                    for i in range(2)
+                ]
+                # Laisse les deux tâches soumettre leur hachage
+                await asyncio.sleep(0)
+                try:
+                    await pool.hacher("SecurePass3!")
+                except HachageSatureError:
+                    refuse = True
+                else:
+                    refuse = False
+                en_cours = pool.en_cours
+                await asyncio.gather(*en_attente)
+                return refuse, en_cours, pool.en_cours
+            finally:
+                pool.fermer()
+
+        # WHEN
+        refuse, en_cours, en_cours_apres = asyncio.run(scenario())
+
+        # THEN
+        if not refuse:
+            raise AssertionError(message="La 3e demande devrait être refusée")
+        capacite = settings.BCRYPT_WORKERS + settings.BCRYPT_MAX_QUEUE
+        if en_cours != capacite or en_cours_apres != 0:
+            raise AssertionError(
+                message=f"{capacite} opérations puis 0 attendues, obtenu: "
+                f"{en_cours}, {en_cours_apres}",
+            )
+
+    @staticmethod
+    def test_processus_sans_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Teste que les processus du pool n'héritent pas de la mémoire de l'API."""
+        # GIVEN (un processus forké hériterait de ce contexte à 4 tours)
+        monkeypatch.setattr(
+            securite,
+            "pwd_context",
+            CryptContext(schemes=["bcrypt"], bcrypt__rounds=4),
+        )
+
+        async def scenario() -> str:
+            pool = PoolHachage()
+            pool.demarrer()
+            try:
+                return await pool.hacher("SecurePass123!")
+            finally:
+                pool.fermer()
+
+        # WHEN
+        hachage = asyncio.run(scenario())
+
+        # THEN
+        attendu = f"$2b${settings.BCRYPT_ROUNDS:02d}$"
+        if not hachage.startswith(attendu):
+            raise AssertionError(
+                message=f"Hachage avec le coût configuré attendu ({attendu}), "
+                f"obtenu : {hachage[:7]}",
+            )
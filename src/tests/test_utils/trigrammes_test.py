@@ -0,0 +1,74 @@
+"""Tests unitaires pour la similarité par trigrammes."""
+
+import pytest
+
+from src.utils.trigrammes import IndexTrigrammes, similarite, trigrammes
+
+
+class TestTrigrammes:
+    """Tests pour trigrammes et similarite (mêmes résultats que pg_trgm)."""
+
+    @staticmethod
+    def test_trigrammes_par_mot() -> None:
+        """Teste le découpage en mots, la casse et le remplissage par espaces."""
+        resultat = trigrammes("Gin-Tonic")
+        attendu = {"  g", " gi", "gin", "in ", "  t", " to", "ton", "oni", "nic", "ic "}
+        if resultat != attendu:
+            raise AssertionError(message=f"Attendu {attendu}, obtenu: {resultat}")
+
+    @pytest.mark.parametrize(
+        ("texte_a", "texte_b", "attendu"),
+        [
+            ("Rhum", "Rhum", 1.0),
+            ("Rhum", "Rum", 2 / 7),
+            ("Vdoka", "Vodka", 0.2),
+            ("Rhum", "Xyz", 0.0),
+            ("", "Rhum", 0.0),
+        ],
+    )
+    @staticmethod
+    def test_similarite(texte_a, texte_b, attendu) -> None:
+        """Teste la similarité (trigrammes communs / trigrammes distincts)."""
+        resultat = similarite(texte_a, texte_b)
+        if resultat != pytest.approx(attendu):
+            raise AssertionError(message=f"Attendu {attendu}, obtenu: {resultat}")
+
+
+class TestIndexTrigrammes:
+    """Tests pour la recherche des noms les plus similaires."""
+
+    @pytest.fixture
+    @staticmethod
+    def index() -> IndexTrigrammes:
+        """Index de quelques ingrédients."""
+        return IndexTrigrammes(
+            [
+                {"id_ingredient": i, "nom": nom}
+                for i, nom in enumerate(
+                    ["Rhum Blanc", "Rhum Ambré", "Rum", "Vodka", "Rhum"],
+                )
+            ],
+        )
+
+    @staticmethod
+    def test_rechercher_ordre_et_seuil(index) -> None:
+        """Teste l'ordre par similarité décroissante puis par nom, et le seuil."""
+        resultat = [ligne["nom"] for ligne in index.rechercher("rhum", 10, 0.2)]
+        if resultat != ["Rhum", "Rhum Ambré", "Rhum Blanc", "Rum"]:
+            raise AssertionError(message=f"Résultat inattendu: {resultat}")
+
+    @staticmethod
+    def test_rechercher_seuil_atteint_en_simple_precision(index) -> None:
+        """Teste qu'une similarité de 1/5 dépasse le seuil 0.2, comme en base."""
+        resultat = [ligne["nom"] for ligne in index.rechercher("Vdoka", 10, 0.2)]
+        if resultat != ["Vodka"]:
+            raise AssertionError(message=f"['Vodka'] attendu, obtenu: {resultat}")
+
+    @staticmethod
+    def test_ajouter_et_limite(index) -> None:
+        """Teste qu'une ligne ajoutée est trouvée et que la limite est respectée."""
+        index.ajouter({"id_ingredient": 5, "nom": "Rhum Vieux"})
+
+        resultat = [ligne["nom"] for ligne in index.rechercher("Rhum Vieux", 2, 0.2)]
+        if resultat != ["Rhum Vieux", "Rhum"]:
+            raise AssertionError(message=f"Résultat inattendu: {resultat}")
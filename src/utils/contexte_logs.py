@@ -0,0 +1,71 @@
+"""Contexte de la requête en cours, ajouté à chaque message de log.
+
+Le middleware de l'API ouvre un contexte par requête (identifiant de requête,
+route) ; les dépendances d'authentification y ajoutent l'utilisateur. Le
+contexte est un dictionnaire partagé par tous les appels de la requête : une
+dépendance synchrone, exécutée dans un thread avec une copie des variables de
+contexte, le complète donc pour toute la requête.
+
+Le contexte décide aussi, une fois par requête, si les traces DEBUG des DAO
+(décorateur @log) sont gardées : une requête sur 1 / LOG_DEBUG_SAMPLE_RATE
+l'est en entier, les autres n'en produisent aucune.
+"""
+
+import random
+from contextvars import ContextVar, Token
+
+from src.utils.settings import settings
+
+_contexte: ContextVar[dict | None] = ContextVar("contexte_logs", default=None)
+
+
+def ouvrir_contexte(request_id: str, route: str) -> Token:
+    """Ouvre le contexte d'une requête.
+
+    Parameters
+    ----------
+    request_id : str
+        Identifiant de la requête (en-tête X-Request-ID ou généré)
+    route : str
+        Méthode et chemin de la requête
+
+    Returns
+    -------
+    Token
+        Jeton à passer à fermer_contexte
+
+    """
+    return _contexte.set(
+        {
+            "request_id": request_id,
+            "route": route,
+            "id_utilisateur": None,
+            "trace": random.random() < settings.LOG_DEBUG_SAMPLE_RATE,  # ruff: ignore[suspicious-non-cryptographic-random-usage]
+        },
+    )
+
+
+def fermer_contexte(jeton: Token) -> None:
+    """Ferme le contexte d'une requête."""
+    _contexte.reset(jeton)
+
+
+def contexte_courant() -> dict | None:
+    """Retourne le contexte de la requête en cours (None hors requête)."""
+    return _contexte.get()
+
+
+def definir_utilisateur(id_utilisateur: int) -> None:
+    """Rattache l'utilisateur authentifié à la requête en cours."""
+    contexte = _contexte.get()
+    if contexte is not None:
+        contexte["id_utilisateur"] = id_utilisateur
+
+
+def trace_echantillonnee() -> bool:
+    """Indique si les traces DEBUG de la requête en cours sont gardées.
+
+    Hors requête (jobs, tests), toutes les traces sont gardées.
+    """
+    contexte = _contexte.get()
+    return contexte is None or contexte["trace"]
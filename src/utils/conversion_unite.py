@@ -1,7 +1,10 @@
 """Module qui gère la conversion des unités de la base de données."""
 
+from collections.abc import Iterable, Sequence
 from typing import ClassVar, Literal
 
+import numpy as np
+
 
 class UnitConverter:
     """Convertisseur d'unités pour les ingrédients de cocktails.
@@ -278,6 +281,71 @@ class UnitConverter:
 
         return None
 
+    @classmethod
+    def facteur_normalisation(
+        cls,
+        unit: str | None,
+    ) -> tuple[float | None, Literal["liquide", "solide", "autre"] | None]:
+        """Retourne le facteur de conversion vers l'unité de référence d'une unité.
+
+        Les unités liquides sont ramenées en ml et les unités solides en g ; les
+        autres unités (spéciales, inconnues ou absentes) ne sont pas converties.
+
+        Returns
+        -------
+        tuple[float | None, Literal['liquide', 'solide', 'autre'] | None]
+            Le facteur (None si l'unité n'est pas convertible) et le type
+            d'unité (voir get_unit_type)
+
+        Examples
+        --------
+        >>> UnitConverter.facteur_normalisation("cl")
+        (10.0, 'liquide')
+        >>> UnitConverter.facteur_normalisation("slice")
+        (None, 'autre')
+
+        """
+        unit_type = cls.get_unit_type(unit)
+        if unit_type == "liquide":
+            return cls.LIQUID_TO_ML[unit.lower().strip()], unit_type
+        if unit_type == "solide":
+            return cls.SOLID_TO_G[unit.lower().strip()], unit_type
+        return None, unit_type
+
+    @classmethod
+    def normaliser(
+        cls,
+        value: float | None,
+        unit: str | None,
+    ) -> tuple[float | None, Literal["liquide", "solide", "autre"] | None]:
+        """Normalise une quantité pour son stockage en base.
+
+        Parameters
+        ----------
+        value : float | None
+            La quantité à normaliser
+        unit : str | None
+            Son unité
+
+        Returns
+        -------
+        tuple[float | None, Literal['liquide', 'solide', 'autre'] | None]
+            La quantité en ml (liquide) ou en g (solide), inchangée pour les
+            autres unités, et le type d'unité
+
+        Examples
+        --------
+        >>> UnitConverter.normaliser(5, "cl")
+        (50.0, 'liquide')
+        >>> UnitConverter.normaliser(2, None)
+        (2, None)
+
+        """
+        facteur, unit_type = cls.facteur_normalisation(unit)
+        if value is None or facteur is None:
+            return value, unit_type
+        return round(float(value) * facteur, 2), unit_type
+
     @staticmethod
     def normalize_unit(unit_code: str) -> str:
         """Normalise les variantes d'unités."""
@@ -292,6 +360,152 @@ class UnitConverter:
         return unit_code
 
 
+class TableConversion:
+    """Table compilée des unités de la base : id_unite -> (type, facteur).
+
+    Chaque unité est analysée une seule fois, à la construction de la table ;
+    les conversions ne manipulent ensuite plus que des identifiants et des
+    tableaux numpy. Le facteur ramène une quantité en ml (liquide) ou en g
+    (solide), comme UnitConverter.facteur_normalisation.
+
+    Attributes
+    ----------
+    types : dict[int, Literal['liquide', 'solide', 'autre'] | None]
+        Type de chaque unité (voir UnitConverter.get_unit_type)
+
+    """
+
+    def __init__(self, unites: Iterable[dict]) -> None:
+        """Compile la table à partir des lignes de la table unite.
+
+        Parameters
+        ----------
+        unites : Iterable[dict]
+            Lignes de la table unite (id_unite, abbreviation)
+
+        """
+        unites = list(unites)
+        self.types: dict[int, Literal["liquide", "solide", "autre"] | None] = {}
+        self._codes: dict[int, str | None] = {}
+        # Facteur vers g de chaque unité qui a une masse, y compris celles
+        # classées liquides (oz, tsp, tbsp, cup)
+        self._facteurs_solides: dict[int, float] = {}
+        taille = max((unite["id_unite"] for unite in unites), default=-1) + 1
+        # NaN pour les unités non convertibles et les id inconnus
+        self._facteurs = np.full(taille + 1, np.nan)
+
+        for unite in unites:
+            id_unite = unite["id_unite"]
+            facteur, unit_type = UnitConverter.facteur_normalisation(
+                unite["abbreviation"],
+            )
+            self.types[id_unite] = unit_type
+            self._codes[id_unite] = UnitConverter.normalize_unit(
+                unite["abbreviation"].lower().strip()
+                if unite["abbreviation"]
+                else None,
+            )
+            if facteur is not None:
+                self._facteurs[id_unite] = facteur
+            if UnitConverter.is_solid_unit(unite["abbreviation"]):
+                self._facteurs_solides[id_unite] = UnitConverter.SOLID_TO_G[
+                    unite["abbreviation"].lower().strip()
+                ]
+
+    def __contains__(self, id_unite: int | None) -> bool:
+        """Indique si l'unité est connue de la table."""
+        return id_unite in self.types
+
+    def get(
+        self,
+        id_unite: int | None,
+    ) -> tuple[Literal["liquide", "solide", "autre"] | None, float | None]:
+        """Retourne le type et le facteur vers ml ou g d'une unité.
+
+        Returns
+        -------
+        tuple[Literal['liquide', 'solide', 'autre'] | None, float | None]
+            Le type (None si l'unité est inconnue) et le facteur (None si
+            l'unité n'est pas convertible)
+
+        """
+        if id_unite not in self.types:
+            return None, None
+        facteur = self._facteurs[id_unite]
+        return self.types[id_unite], None if np.isnan(facteur) else float(facteur)
+
+    def facteur_solide(self, id_unite: int | None) -> float | None:
+        """Retourne le facteur vers g d'une unité, même classée liquide.
+
+        Sert à additionner une unité liquide qui a aussi une masse (2 oz) à
+        une unité solide (500 g), comme UnitConverter.is_solid_unit.
+
+        Returns
+        -------
+        float | None
+            Le facteur vers g (None si l'unité n'a pas de masse)
+
+        """
+        return self._facteurs_solides.get(id_unite)
+
+    def meme_unite(self, id_unite_a: int | None, id_unite_b: int | None) -> bool:
+        """Indique si deux unités sont identiques (tblsp et tbsp par exemple)."""
+        return id_unite_a == id_unite_b or (
+            self._codes.get(id_unite_a) == self._codes.get(id_unite_b)
+        )
+
+    def normaliser(
+        self,
+        value: float | None,
+        id_unite: int | None,
+    ) -> tuple[float | None, Literal["liquide", "solide", "autre"] | None]:
+        """Normalise une quantité pour son stockage en base.
+
+        Voir UnitConverter.normaliser, dont le résultat est identique pour
+        l'abréviation de l'unité.
+        """
+        unit_type, facteur = self.get(id_unite)
+        if value is None or facteur is None:
+            return value, unit_type
+        return round(float(value) * facteur, 2), unit_type
+
+    def convert_many(
+        self,
+        values: Sequence[float] | np.ndarray,
+        unit_ids: Sequence[int | None] | np.ndarray,
+    ) -> np.ndarray:
+        """Convertit des quantités en ml ou en g, en une seule opération.
+
+        Parameters
+        ----------
+        values : Sequence[float] | np.ndarray
+            Les quantités
+        unit_ids : Sequence[int | None] | np.ndarray
+            L'id de l'unité de chaque quantité
+
+        Returns
+        -------
+        np.ndarray
+            Les quantités converties (arrondies à 0,01 comme convert_to_ml et
+            convert_to_g), NaN lorsque l'unité n'est pas convertible ou est
+            inconnue
+
+        Examples
+        --------
+        >>> table = TableConversion([{"id_unite": 1, "abbreviation": "cl"}])
+        >>> table.convert_many([5, 2], [1, 7])
+        array([50., nan])
+
+        """
+        ids = np.array(
+            [-1 if id_unite is None else id_unite for id_unite in unit_ids],
+            dtype=np.int64,
+        )
+        # Les id hors de la table pointent sur la dernière case (NaN)
+        ids[(ids < 0) | (ids >= len(self._facteurs))] = len(self._facteurs) - 1
+        return np.round(np.asarray(values, dtype=float) * self._facteurs[ids], 2)
+
+
 # Alias pour faciliter l'import
 convert_to_ml = UnitConverter.convert_to_ml
 convert_to_g = UnitConverter.convert_to_g
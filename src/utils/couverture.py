@@ -0,0 +1,88 @@
+"""Couverture maximale gloutonne sur des ensembles codés en bitsets.
+
+Chaque ensemble (par exemple les ingrédients manquants d'un cocktail) est un
+entier dont le bit j vaut 1 si l'élément j appartient à l'ensemble. Un ensemble
+est couvert lorsque tous ses éléments ont été choisis.
+"""
+
+from collections import Counter
+
+
+def elements(bitset: int) -> list[int]:
+    """Retourne les éléments (positions des bits à 1) d'un bitset."""
+    resultat = []
+    while bitset:
+        bit = bitset & -bitset
+        resultat.append(bit.bit_length() - 1)
+        bitset ^= bit
+    return resultat
+
+
+def couverture_maximale(
+    ensembles: list[int],
+    budget: int,
+) -> tuple[list[int], list[bool]]:
+    """Choisit au plus budget éléments pour couvrir le plus d'ensembles.
+
+    Heuristique gloutonne du problème de couverture maximale à budget : à
+    chaque étape, parmi les compléments possibles (ce qui manque encore à un
+    ensemble non couvert, dans la limite du budget restant), est retenu celui
+    qui couvre le plus de nouveaux ensembles par élément ajouté, puis, à
+    égalité, celui qui en couvre le plus.
+
+    Un complément ne couvre que les ensembles dont ce qui manque est l'un de
+    ses sous-ensembles : son gain est la somme, sur ses sous-ensembles, du
+    nombre d'ensembles auxquels il manque exactement ce sous-ensemble.
+
+    Parameters
+    ----------
+    ensembles : list[int]
+        Bitsets des ensembles
+    budget : int
+        Nombre maximum d'éléments à choisir
+
+    Returns
+    -------
+    tuple[list[int], list[bool]]
+        Les compléments retenus, dans l'ordre du choix, et pour chaque
+        ensemble s'il est couvert par leur union
+
+    """
+    # Les ensembles identiques (souvent un même ingrédient manquant) ne sont
+    # traités qu'une fois, avec leur nombre d'occurrences
+    occurrences = Counter(ensembles)
+    choisis = 0
+    etapes = []
+    reste = budget
+
+    while reste > 0:
+        manques: Counter[int] = Counter()
+        for ensemble, nombre in occurrences.items():
+            manque = ensemble & ~choisis
+            if 0 < manque.bit_count() <= reste:
+                manques[manque] += nombre
+        if not manques:
+            break
+
+        gains = {}
+        for complement, nombre in manques.items():
+            # Somme sur les sous-ensembles stricts non vides du complément
+            gain = nombre
+            sous_ensemble = (complement - 1) & complement
+            while sous_ensemble:
+                gain += manques.get(sous_ensemble, 0)
+                sous_ensemble = (sous_ensemble - 1) & complement
+            gains[complement] = gain
+        meilleur = max(
+            gains,
+            key=lambda complement: (
+                gains[complement] / complement.bit_count(),
+                gains[complement],
+                -complement,
+            ),
+        )
+        etapes.append(meilleur)
+        choisis |= meilleur
+        reste -= meilleur.bit_count()
+
+    return etapes, [ensemble & ~choisis == 0 for ensemble in ensembles]
@@ -19,6 +19,22 @@ class DAOError(Exception):
         # pour avoir une vrai Exception python avec le message personnalisé
 
 
+class PoolTimeoutError(DAOError):
+    """Raised when no database connection could be borrowed from the pool in time."""
+
+
+class HachageSatureError(Exception):
+    """Raised when the password hashing pool has too many pending operations."""
+
+    def __init__(self, en_cours: int) -> None:
+        """Initialize HachageSatureError.
+
+        :param en_cours: number of hashing operations running or queued
+        :return: None
+        """
+        super().__init__(f"Pool de hachage saturé ({en_cours} opérations en cours)")
+
+
 class ServiceError(Exception):
     """Raised for general errors in the Service layer."""
 
@@ -346,3 +362,13 @@ class CocktailDupeError(Exception):
         if message is None:
             message = "Ce nom de cocktail existe déjà !"
         super().__init__(message)
+
+
+class InvalidCursorError(Exception):
+    """Exception levée quand un curseur de pagination est invalide."""
+
+    def __init__(self, message: str | None = None) -> None:
+        """Initialize InvalidCursorError."""
+        if message is None:
+            message = "Curseur de pagination invalide."
+        super().__init__(message)
@@ -0,0 +1,244 @@
+"""Catalogue en colonnes encodées par dictionnaire, pour la navigation à facettes.
+
+Chaque facette (categorie, verre, alcool) est une colonne encodée par
+dictionnaire : ses valeurs distinctes, peu nombreuses, sont numérotées, et
+chaque valeur possède un bitmap des cocktails qui la portent (un bit par
+cocktail, tableaux NumPy de uint8). Chaque ingrédient a de même le bitmap des
+cocktails qui l'utilisent.
+
+Une sélection est alors une suite de ET (et de OU entre les valeurs retenues
+d'une même facette) sur ces bitmaps, et le nombre de cocktails de chaque
+valeur de facette un ET suivi d'un comptage des bits, sans parcourir les
+cocktails ni regrouper en base.
+
+Les cocktails sont rangés par (nom, id_cocktail) : les bits d'une sélection
+donnent directement les résultats dans l'ordre d'affichage.
+"""
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import numpy as np
+
+FACETTES = ("categorie", "verre", "alcool")
+
+
+class Selection(NamedTuple):
+    """Filtres d'une navigation dans le catalogue.
+
+    Les valeurs d'une même facette sont combinées par OU, les facettes et les
+    ingrédients par ET. Une facette sans valeur n'est pas filtrée.
+    """
+
+    categorie: tuple[str, ...] = ()
+    verre: tuple[str, ...] = ()
+    alcool: tuple[bool, ...] = ()
+    avec: tuple[str, ...] = ()
+    sans: tuple[str, ...] = ()
+
+
+def _nombre_de_bits(bitmap: np.ndarray) -> int:
+    """Retourne le nombre de bits à 1 d'un bitmap."""
+    return int(np.bitwise_count(bitmap).sum())
+
+
+class CatalogueFacettes:
+    """Bitmaps des valeurs de facettes et des ingrédients du catalogue.
+
+    Attributes
+    ----------
+    cocktails : list[dict]
+        Les cocktails, triés par (nom, id_cocktail) ; le bit i de chaque
+        bitmap correspond à cocktails[i]
+
+    """
+
+    def __init__(
+        self,
+        cocktails: list[dict],
+        compositions: Iterable[tuple[int, str | None]],
+    ) -> None:
+        """Encode le catalogue.
+
+        Parameters
+        ----------
+        cocktails : list[dict]
+            Les cocktails (id_cocktail, nom, categorie, verre, alcool, image)
+        compositions : Iterable[tuple[int, str | None]]
+            Couples (position du cocktail dans cocktails, nom d'ingrédient)
+
+        """
+        ordre = sorted(
+            range(len(cocktails)),
+            key=lambda position: (
+                cocktails[position]["nom"],
+                cocktails[position]["id_cocktail"],
+            ),
+        )
+        rang = np.empty(len(cocktails), dtype=np.int32)
+        rang[ordre] = np.arange(len(cocktails), dtype=np.int32)
+
+        self._rang = rang
+        self.cocktails = [cocktails[position] for position in ordre]
+        self._cles = [
+            (cocktail["nom"], cocktail["id_cocktail"]) for cocktail in self.cocktails
+        ]
+        self._tous = self._bitmap(np.arange(len(cocktails)))
+        self._vide = np.zeros_like(self._tous)
+
+        # Colonne encodée : valeurs distinctes, et bitmap de chaque valeur
+        self._bitmaps: dict[str, dict[object, np.ndarray]] = {}
+        for facette in FACETTES:
+            colonne = [cocktail[facette] for cocktail in self.cocktails]
+            valeurs = sorted({valeur for valeur in colonne if valeur is not None})
+            code_de = {valeur: code for code, valeur in enumerate(valeurs)}
+            codes = np.array(
+                [code_de.get(valeur, -1) for valeur in colonne],
+                dtype=np.int32,
+            )
+            self._bitmaps[facette] = {
+                valeur: self._bitmap(np.flatnonzero(codes == code))
+                for code, valeur in enumerate(valeurs)
+            }
+
+        positions_ingredients: dict[str, list[int]] = {}
+        for position, nom in compositions:
+            if nom:
+                positions_ingredients.setdefault(nom.lower(), []).append(
+                    rang[position],
+                )
+        self._ingredients = {
+            nom: self._bitmap(np.array(positions))
+            for nom, positions in positions_ingredients.items()
+        }
+
+    def _bitmap(self, positions: np.ndarray) -> np.ndarray:
+        """Construit le bitmap des cocktails aux positions données."""
+        bits = np.zeros(len(self.cocktails), dtype=bool)
+        bits[positions] = True
+        return np.packbits(bits, bitorder="little")
+
+    def masque(self, selection: Selection, sauf: str | None = None) -> np.ndarray:
+        """Retourne le bitmap des cocktails retenus par une sélection.
+
+        Parameters
+        ----------
+        selection : Selection
+            Les filtres
+        sauf : str | None
+            Facette dont le filtre est ignoré (pour compter ses valeurs)
+
+        Returns
+        -------
+        np.ndarray
+            Le bitmap des cocktails retenus
+
+        """
+        masque = self._tous.copy()
+        for facette in FACETTES:
+            valeurs = getattr(selection, facette)
+            if facette == sauf or not valeurs:
+                continue
+            une_des_valeurs = self._vide.copy()
+            for valeur in valeurs:
+                une_des_valeurs |= self._bitmaps[facette].get(valeur, self._vide)
+            masque &= une_des_valeurs
+        for nom in selection.avec:
+            masque &= self._ingredients.get(nom.lower(), self._vide)
+        for nom in selection.sans:
+            masque &= ~self._ingredients.get(nom.lower(), self._vide)
+        return masque
+
+    def bitmap_catalogue(self, positions: np.ndarray) -> np.ndarray:
+        """Retourne le bitmap de cocktails repérés par leur position d'origine.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions des cocktails dans la liste passée au constructeur (par
+            exemple, les cocktails réalisables d'après l'index des recettes)
+
+        """
+        return self._bitmap(self._rang[positions])
+
+    def tirer(self, masque: np.ndarray, nombre: int) -> list[dict]:
+        """Retourne jusqu'à nombre cocktails distincts du bitmap, tirés au hasard."""
+        positions = self.positions(masque)
+        tirage = np.random.default_rng().choice(
+            positions,
+            size=min(nombre, len(positions)),
+            replace=False,
+        )
+        return [self.cocktails[position] for position in tirage]
+
+    def positions(self, masque: np.ndarray) -> np.ndarray:
+        """Retourne les positions (dans cocktails) des bits à 1 d'un bitmap."""
+        return np.flatnonzero(
+            np.unpackbits(masque, count=len(self.cocktails), bitorder="little"),
+        )
+
+    def compter(self, selection: Selection) -> dict[str, list[dict]]:
+        """Compte les cocktails de chaque valeur de facette pour une sélection.
+
+        Le nombre de cocktails d'une valeur est celui qu'on obtiendrait en
+        l'ajoutant aux valeurs retenues de sa facette : le filtre de la facette
+        elle-même est ignoré, les autres sont appliqués.
+
+        Parameters
+        ----------
+        selection : Selection
+            Les filtres
+
+        Returns
+        -------
+        dict[str, list[dict]]
+            Pour chaque facette, les valeurs ({"valeur", "nombre"}) ayant au
+            moins un cocktail ou retenues, par nombre décroissant
+
+        """
+        facettes = {}
+        for facette in FACETTES:
+            masque = self.masque(selection, sauf=facette)
+            comptes = [
+                {"valeur": valeur, "nombre": _nombre_de_bits(masque & bitmap)}
+                for valeur, bitmap in self._bitmaps[facette].items()
+            ]
+            retenues = getattr(selection, facette)
+            facettes[facette] = sorted(
+                (
+                    compte
+                    for compte in comptes
+                    if compte["nombre"] or compte["valeur"] in retenues
+                ),
+                key=lambda compte: -compte["nombre"],
+            )
+        return facettes
+
+    def parcourir(
+        self,
+        selection: Selection,
+        limite: int,
+        apres: tuple[str, int] | None = None,
+    ) -> tuple[list[dict], int]:
+        """Retourne une page des cocktails retenus, triés par nom.
+
+        Parameters
+        ----------
+        selection : Selection
+            Les filtres
+        limite : int
+            Nombre maximum de cocktails
+        apres : tuple[str, int] | None
+            Clé (nom, id_cocktail) du dernier cocktail de la page précédente
+
+        Returns
+        -------
+        tuple[list[dict], int]
+            Les cocktails de la page et le nombre total de cocktails retenus
+
+        """
+        positions = self.positions(self.masque(selection))
+        debut = bisect_right(self._cles, tuple(apres)) if apres else 0
+        page = positions[np.searchsorted(positions, debut) :][:limite]
+        return [self.cocktails[position] for position in page], len(positions)
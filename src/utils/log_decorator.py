@@ -1,108 +1,148 @@
-"""Décorateur des logs."""
-
-import logging.config
-import numbers
+"""Décorateur des logs.
+
+Le décorateur trace (niveau DEBUG) l'entrée et la sortie des méthodes,
+surtout des DAO, indentées selon la profondeur d'appel ; la trace de sortie
+porte la durée de l'appel (duree_ms). Quand ses logs ne sont écoutés par
+personne (niveau DEBUG désactivé) ou que la requête en cours n'est pas
+échantillonnée (voir contexte_logs), un appel ne coûte qu'un test : aucun
+argument n'est mis en forme.
+
+La profondeur est gardée dans une variable de contexte, propre à chaque
+thread et à chaque tâche asyncio : les requêtes servies en parallèle ne
+décalent pas l'indentation les unes des autres.
+"""
+
+import inspect
+import logging
+import time
+from contextvars import ContextVar
 from functools import wraps
 
+from src.utils.contexte_logs import trace_echantillonnee
+
+logger = logging.getLogger(__name__)
+
+_MOTS_DE_PASSE = frozenset(
+    {"password", "passwd", "pwd", "pass", "mot_de_passe", "mdp"},
+)
+_MASQUE = "*****"
+
+# Profondeur d'appel des méthodes tracées
+_profondeur: ContextVar[int] = ContextVar("profondeur_log", default=0)
 
-class LogIndetation:
-    """Pour indenter les logs lorsque l'on rentre dans une nouvelle méthode."""
 
-    current_indentation = 0
+class _Signature:
+    """Ce qu'il faut savoir d'une fonction pour tracer ses appels.
 
-    @classmethod
-    def increase_indentation(cls) -> None:
-        """Ajouter une indentation."""
-        cls.current_indentation += 1
+    Calculé une fois, à la décoration : nom affiché, présence de self/cls
+    (non affiché) et positions des paramètres à masquer.
+    """
 
-    @classmethod
-    def decrease_indentation(cls) -> None:
-        """Retirer une indentation."""
-        cls.current_indentation -= 1
+    def __init__(self, func) -> None:
+        """Analyse la signature de la fonction décorée."""
+        self.nom = func.__qualname__
+        positionnels = [
+            parametre.name
+            for parametre in inspect.signature(func).parameters.values()
+            if parametre.kind
+            in (parametre.POSITIONAL_ONLY, parametre.POSITIONAL_OR_KEYWORD)
+        ]
+        self.premier = 1 if positionnels[:1] in (["self"], ["cls"]) else 0
+        self.masques = frozenset(
+            position
+            for position, nom in enumerate(positionnels)
+            if nom in _MOTS_DE_PASSE
+        )
 
-    @classmethod
-    def get_indentation(cls) -> None:
-        """Obtenir l'indentation."""
-        return "    " * cls.current_indentation
+    def formater_appel(self, args: tuple, kwargs: dict) -> str:
+        """Met en forme les arguments d'un appel (mots de passe masqués)."""
+        valeurs = [
+            _MASQUE if position in self.masques else _abreger(valeur)
+            for position, valeur in enumerate(args)
+            if position >= self.premier
+        ]
+        valeurs.extend(
+            f"{nom}={_MASQUE if nom in _MOTS_DE_PASSE else _abreger(valeur)}"
+            for nom, valeur in kwargs.items()
+        )
+        return f"({', '.join(valeurs)})"
+
+
+def _abreger(valeur: object) -> str:
+    """Réduit l'affichage d'une valeur si elle est trop longue."""
+    carac = 50
+    if isinstance(valeur, list):
+        return f"{[str(item) for item in valeur[:3]]} ... ({len(valeur)} elements)"
+    if isinstance(valeur, dict):
+        elements = [(str(k), str(v)) for k, v in list(valeur.items())[:3]]
+        return f"{elements} ... ({len(valeur)} elements)"
+    texte = str(valeur)
+    if len(texte) > carac:
+        return f"{texte[:carac]} ... ({len(texte)} caracteres)"
+    return texte
+
+
+def _debut(signature: _Signature, args: tuple, kwargs: dict) -> tuple:
+    """Trace l'entrée dans une méthode et augmente la profondeur."""
+    profondeur = _profondeur.get() + 1
+    jeton = _profondeur.set(profondeur)
+    indentation = "    " * profondeur
+    appel = signature.formater_appel(args, kwargs)
+    logger.debug("%s%s%s - DEBUT", indentation, signature.nom, appel)
+    return jeton, indentation, appel, time.perf_counter()
+
+
+def _fin(signature: _Signature, contexte: tuple, result) -> None:
+    """Trace la sortie d'une méthode."""
+    _, indentation, appel, debut = contexte
+    logger.debug(
+        "%s%s%s - FIN",
+        indentation,
+        signature.nom,
+        appel,
+        extra={"duree_ms": round((time.perf_counter() - debut) * 1000, 3)},
+    )
+    logger.debug("%s   └─> Sortie : %s", indentation, _abreger(result))
 
 
 def log(func):
     """Création d'un décorateur nommé log.
 
     Lorsque ce décorateur est appliqué à une méthode, cela affichera dans les
-    logs :
+    logs (niveau DEBUG) :
     - l'appel de cette méthode avec les valeurs de paramètres
     - la sortie retournée par cette méthode
+
+    Les méthodes asynchrones (async def) sont également prises en charge.
     """
+    signature = _Signature(func)
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        logger = logging.getLogger(__name__)
-
-        LogIndetation.increase_indentation()
-        indentation = LogIndetation.get_indentation()
-
-        # Recuperation des parametres de la methode
-        class_name = args[0].__class__.__name__ if args else ""
-        method_name = func.__name__
-        args_list = list(
-            [
-                str(arg) if not isinstance(arg, numbers.Number) else arg
-                for arg in args[1:]
-            ]
-            + list(kwargs.values()),
-        )
+    if inspect.iscoroutinefunction(func):
 
-        # pour cacher les mots de passe
-        param_names = func.__code__.co_varnames[1 : func.__code__.co_argcount]
-        for i, v in enumerate(param_names):
-            if v in [
-                "password",
-                "passwd",
-                "pwd",
-                "pass",
-                "mot_de_passe",
-                "mdp",
-            ]:
-                args_list[i] = "*****"
-
-        # Transforme en tuple pour avoir un affichage avec des parentheses
-        args_list = tuple(args_list)
-
-        # Affichage dans le fichier de log
-        logger.info(
-            "%s%s.%s%s - DEBUT",
-            indentation,
-            class_name,
-            method_name,
-            args_list,
-        )
-        result = func(*args, **kwargs)
-        logger.info(
-            "%s%s.%s%s - FIN",
-            indentation,
-            class_name,
-            method_name,
-            args_list,
-        )
-        carac = 50
-        # Reduction de l affichage de la sortie si trop longue
-        if isinstance(result, list):
-            result_str = str([str(item) for item in result[:3]])
-            result_str += " ... (" + str(len(result)) + " elements)"
-        elif isinstance(result, dict):
-            result_str = [(str(k), str(v)) for k, v in result.items()][:3]
-            result_str += " ... (" + str(len(result)) + " elements)"
-        elif isinstance(result, str) and len(result) > carac:
-            result_str = result[:50]
-            result_str += " ... (" + str(len(result)) + " caracteres)"
-        else:
-            result_str = str(result)
-
-        logger.info("%s   └─> Sortie : %s", indentation, result_str)
-
-        LogIndetation.decrease_indentation()
+        @wraps(func)
+        async def async_wrapper(*args: object, **kwargs: object) -> object:
+            if not logger.isEnabledFor(logging.DEBUG) or not trace_echantillonnee():
+                return await func(*args, **kwargs)
+            contexte = _debut(signature, args, kwargs)
+            try:
+                result = await func(*args, **kwargs)
+                _fin(signature, contexte, result)
+            finally:
+                _profondeur.reset(contexte[0])
+            return result
+
+        return async_wrapper
 
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not logger.isEnabledFor(logging.DEBUG) or not trace_echantillonnee():
+            return func(*args, **kwargs)
+        contexte = _debut(signature, args, kwargs)
+        try:
+            result = func(*args, **kwargs)
+            _fin(signature, contexte, result)
+        finally:
+            _profondeur.reset(contexte[0])
         return result
 
     return wrapper
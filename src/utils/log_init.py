@@ -1,20 +1,153 @@
-"""log."""
+"""Configuration des logs : messages JSON écrits par un thread dédié.
 
+Les messages ne sont plus écrits par le thread qui les émet : un QueueHandler
+les dépose dans une file bornée (LOG_QUEUE_SIZE messages), qu'un
+QueueListener vide vers le fichier logs/<nom>.log et la sortie d'erreur. La
+durée d'une requête ne dépend donc plus de la vitesse du disque ; si la file
+est pleine, le message est abandonné et compté (PipelineLogs.statistiques)
+plutôt que d'attendre.
+
+Chaque message est une ligne JSON portant le contexte de la requête
+(request_id, route, id_utilisateur, voir contexte_logs) et, pour les traces
+des DAO, leur durée (duree_ms).
+"""
+
+import json
 import logging
-import logging.config
 import pathlib
+import queue
+import sys
+import threading
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from src.utils.contexte_logs import contexte_courant
+from src.utils.settings import settings
+from src.utils.singleton import Singleton
+
+_CHAMPS_CONTEXTE = ("request_id", "route", "id_utilisateur")
+_CHAMPS_EXTRA = ("duree_ms", "statut")
+
+
+class FormatJSON(logging.Formatter):
+    """Met en forme un message de log en une ligne JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Retourne le message et ses champs structurés en JSON."""
+        message = {
+            "horodatage": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "niveau": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for champ in _CHAMPS_CONTEXTE + _CHAMPS_EXTRA:
+            valeur = getattr(record, champ, None)
+            if valeur is not None:
+                message[champ] = valeur
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message["exception"] = record.exc_text
+        return json.dumps(message, ensure_ascii=False, default=str)
+
+
+class QueueHandlerBornee(QueueHandler):
+    """QueueHandler qui abandonne (et compte) les messages si la file est pleine."""
+
+    def __init__(self, file: queue.Queue) -> None:
+        """Initialise le handler sur une file bornée."""
+        super().__init__(file)
+        self._verrou = threading.Lock()
+        self._format_exception = logging.Formatter().formatException
+        self.perdus = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Fige le message et y ajoute le contexte de la requête en cours.
+
+        Appelé dans le thread qui émet le message, seul à voir le contexte.
+        """
+        contexte = contexte_courant()
+        if contexte is not None:
+            for champ in _CHAMPS_CONTEXTE:
+                setattr(record, champ, contexte[champ])
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = self._format_exception(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Dépose le message dans la file, sans attendre si elle est pleine."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._verrou:
+                self.perdus += 1
+
+
+class PipelineLogs(metaclass=Singleton):
+    """File des messages de log et thread qui les écrit."""
+
+    def __init__(self) -> None:
+        """Initialise un pipeline arrêté."""
+        self._listener: QueueListener | None = None
+        self._handler: QueueHandlerBornee | None = None
+
+    def demarrer(self, nom: str) -> None:
+        """Configure les logs (niveau LOG_LEVEL) et lance le thread d'écriture.
+
+        Parameters
+        ----------
+        nom : str
+            Nom du programme, qui donne le fichier logs/<nom>.log
+
+        """
+        self.arreter()
+        pathlib.Path("logs").mkdir(exist_ok=True, parents=True)
+
+        format_json = FormatJSON()
+        fichier = logging.FileHandler(f"logs/{nom}.log", encoding="utf-8")
+        console = logging.StreamHandler(sys.stderr)
+        for handler in (fichier, console):
+            handler.setFormatter(format_json)
+
+        file: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        self._handler = QueueHandlerBornee(file)
+        self._listener = QueueListener(
+            file,
+            fichier,
+            console,
+            respect_handler_level=True,
+        )
 
-import yaml
+        racine = logging.getLogger()
+        for handler in list(racine.handlers):
+            racine.removeHandler(handler)
+        racine.addHandler(self._handler)
+        racine.setLevel(settings.LOG_LEVEL)
+        self._listener.start()
 
+    def arreter(self) -> None:
+        """Écrit les messages en attente et arrête le thread d'écriture."""
+        if self._listener is not None:
+            self._listener.stop()
+            logging.getLogger().removeHandler(self._handler)
+            for handler in self._listener.handlers:
+                handler.close()
+        self._listener = self._handler = None
 
-def initialiser_logs(nom) -> None:
-    """Initialise les logs à partir du fichier de config."""
-    pathlib.Path("logs").mkdir(exist_ok=True, parents=True)
+    def statistiques(self) -> dict:
+        """Retourne les compteurs de la file des logs (en_attente, perdus)."""
+        if self._handler is None:
+            return {"en_attente": 0, "perdus": 0}
+        return {
+            "en_attente": self._handler.queue.qsize(),
+            "perdus": self._handler.perdus,
+        }
 
-    stream = pathlib.Path("logging_config.yml").open(encoding="utf-8")
-    config = yaml.load(stream, Loader=yaml.FullLoader)
-    logging.config.dictConfig(config)
 
-    logging.info("-" * 50)
-    logging.info("Lancement %s                           ", nom)
-    logging.info("-" * 50)
+def initialiser_logs(nom: str) -> None:
+    """Configure les logs à partir des paramètres LOG_* et les démarre."""
+    PipelineLogs().demarrer(nom)
+    logging.info("Lancement %s", nom)
@@ -0,0 +1,259 @@
+"""Analyse des mesures en texte libre du catalogue (format TheCocktailDB).
+
+Les unités de cocktail_ingredient sont souvent saisies avec leur quantité
+("1 1/2 oz", "2 dashes", "1-2 tsp", "Juice of 1/2") alors qu'UnitConverter ne
+reconnaît que des unités seules ("oz", "cl"). analyser_mesure sépare la
+quantité (fractions, nombres mixtes, intervalles) de l'unité, ramenée à sa
+forme canonique (pluriels et variantes d'écriture).
+
+Les mêmes quelques centaines de textes se répètent sur des milliers de
+lignes : les résultats sont mémorisés dans un cache borné.
+"""
+
+import re
+from collections.abc import Iterable
+from fractions import Fraction
+from functools import lru_cache
+from typing import Literal, NamedTuple
+
+from src.utils.conversion_unite import UnitConverter
+
+_TAILLE_CACHE = 4096
+
+_FRACTIONS_UNICODE = str.maketrans(
+    {"½": " 1/2", "¼": " 1/4", "¾": " 3/4", "⅓": " 1/3", "⅔": " 2/3", "⅛": " 1/8"},
+)
+
+# Nombre mixte (1 1/2), fraction (1/2) ou décimal (1.5, 1,5)
+_NOMBRE = r"\d+\s+\d+/\d+|\d+/\d+|\d+(?:[.,]\d+)?"
+_QUANTITE = re.compile(
+    rf"(?P<debut>{_NOMBRE})(?:\s*(?:-|\u2013|to|or|à|ou)\s*(?P<fin>{_NOMBRE}))?",
+)
+_JUS_DE = re.compile(rf"^(?:juice|jus) (?:of|de) (?P<nombre>{_NOMBRE})\b")
+
+# Variantes d'écriture de chaque unité canonique (les pluriels en -s et -es
+# sont reconnus sans être listés)
+_VARIANTES = {
+    "oz": ("ounce", "once"),
+    "fl oz": ("fl. oz", "floz", "fluid ounce", "fluid oz"),
+    "ml": ("milliliter", "millilitre"),
+    "cl": ("centiliter", "centilitre"),
+    "dl": ("deciliter", "decilitre", "décilitre"),
+    "l": ("liter", "litre"),
+    "tsp": ("teaspoon", "cuillère à café", "cuillères à café", "c. à café"),
+    "tbsp": (
+        "tblsp",
+        "tbs",
+        "tbl",
+        "tablespoon",
+        "cuillère à soupe",
+        "cuillères à soupe",
+        "c. à soupe",
+    ),
+    "cup": ("tasse",),
+    "pint": ("pinte",),
+    "g": ("gr", "gram", "gramme"),
+    "kg": ("kilogram", "kilogramme"),
+    "lb": ("lbs", "pound"),
+    "dash": ("trait",),
+    "drop": ("goutte",),
+    "pinch": ("pincée",),
+    "piece": ("pcs", "pc", "pièce"),
+    "slice": ("tranche",),
+    "wedge": ("quartier",),
+    "sprig": ("brin",),
+    "leaf": ("leaves", "feuille"),
+    "peel": ("zeste",),
+    "top": ("top up", "top off"),
+    "fill": ("fill with", "fill up"),
+    "juice": ("jus",),
+}
+
+_UNITES_CANONIQUES = {
+    unite: unite
+    for unite in (
+        UnitConverter.LIQUID_TO_ML.keys()
+        | UnitConverter.SOLID_TO_G.keys()
+        | UnitConverter.SPECIAL_UNITS
+    )
+} | {
+    variante: unite for unite, variantes in _VARIANTES.items() for variante in variantes
+}
+_MOTS_MAX = max(len(unite.split()) for unite in _UNITES_CANONIQUES)
+
+
+class MesureAnalysee(NamedTuple):
+    """Résultat de l'analyse d'une mesure en texte libre.
+
+    Attributes
+    ----------
+    quantite : float | None
+        Quantité lue dans le texte (milieu de l'intervalle pour "1-2"), None
+        si le texte n'en contient pas
+    unite : str | None
+        Unité canonique (clé d'UnitConverter) si elle est reconnue, sinon le
+        texte restant tel quel ; None si le texte n'a pas d'unité
+    type : Literal['liquide', 'solide', 'autre'] | None
+        Type de l'unité (voir UnitConverter.get_unit_type)
+
+    """
+
+    quantite: float | None
+    unite: str | None
+    type: Literal["liquide", "solide", "autre"] | None
+
+
+def _valeur(nombre: str) -> float:
+    """Convertit un nombre mixte, une fraction ou un décimal en float."""
+    return float(sum(Fraction(partie.replace(",", ".")) for partie in nombre.split()))
+
+
+def _unite_canonique(mot: str) -> str | None:
+    """Retourne l'unité canonique d'un mot ou groupe de mots, pluriel compris."""
+    for candidat in (mot, mot.removesuffix("s"), mot.removesuffix("es")):
+        if candidat in _UNITES_CANONIQUES:
+            return _UNITES_CANONIQUES[candidat]
+    return None
+
+
+def _lire_unite(texte: str) -> str | None:
+    """Lit l'unité en tête du texte (après la quantité)."""
+    mots = texte.replace(".", ". ").split()
+    for taille in range(min(_MOTS_MAX, len(mots)), 0, -1):
+        unite = _unite_canonique(" ".join(mots[:taille]).rstrip("."))
+        if unite is not None:
+            return unite
+    return texte or None
+
+
+@lru_cache(maxsize=_TAILLE_CACHE)
+def analyser_mesure(texte: str | None) -> MesureAnalysee:
+    """Analyse une mesure en texte libre.
+
+    Parameters
+    ----------
+    texte : str | None
+        La mesure, avec ou sans quantité (ex: "1 1/2 oz", "2 dashes", "cl")
+
+    Returns
+    -------
+    MesureAnalysee
+        La quantité, l'unité canonique et son type
+
+    Examples
+    --------
+    >>> analyser_mesure("1 1/2 oz")
+    MesureAnalysee(quantite=1.5, unite='oz', type='liquide')
+    >>> analyser_mesure("2-3 Dashes")
+    MesureAnalysee(quantite=2.5, unite='dash', type='liquide')
+    >>> analyser_mesure("Juice of 1/2")
+    MesureAnalysee(quantite=0.5, unite='juice', type='autre')
+
+    """
+    if not texte:
+        return MesureAnalysee(None, None, None)
+
+    texte = " ".join(texte.translate(_FRACTIONS_UNICODE).lower().split())
+
+    jus = _JUS_DE.match(texte)
+    if jus:
+        return MesureAnalysee(_valeur(jus["nombre"]), "juice", "autre")
+
+    quantite = None
+    correspondance = _QUANTITE.match(texte)
+    if correspondance:
+        quantite = _valeur(correspondance["debut"])
+        if correspondance["fin"]:
+            quantite = (quantite + _valeur(correspondance["fin"])) / 2
+        texte = texte[correspondance.end() :].strip()
+
+    unite = _lire_unite(texte)
+    return MesureAnalysee(quantite, unite, UnitConverter.get_unit_type(unite))
+
+
+def unite_comparee(texte: str | None) -> str | None:
+    """Retourne l'unité d'une mesure telle que la comparent les moteurs.
+
+    C'est la clé d'égalité des unités, commune à l'index des recettes et à la
+    requête SQL des cocktails quasi-réalisables (colonne unite_canonique).
+
+    Examples
+    --------
+    >>> unite_comparee("2 Pieces")
+    'piece'
+    >>> unite_comparee("tblsp")
+    'tbsp'
+
+    """
+    unite = analyser_mesure(texte).unite
+    return UnitConverter.normalize_unit(unite) if unite else None
+
+
+def alias_unites() -> dict[str, str]:
+    """Retourne l'unité comparée de chaque écriture connue d'une unité seule.
+
+    Les écritures sont les unités canoniques, leurs variantes et leurs
+    pluriels en -s et -es ; la requête SQL des cocktails quasi-réalisables s'en
+    sert pour les abréviations de la table unite.
+
+    Examples
+    --------
+    >>> alias_unites()["pcs"]
+    'piece'
+
+    """
+    alias = {}
+    for suffixe in ("", "s", "es"):
+        for ecriture in _UNITES_CANONIQUES:
+            cle = ecriture + suffixe
+            if cle not in alias:
+                alias[cle] = unite_comparee(cle)
+    return alias
+
+
+def analyser_mesures(textes: Iterable[str | None]) -> list[MesureAnalysee]:
+    """Analyse un lot de mesures (chaque texte distinct n'est analysé qu'une fois).
+
+    Parameters
+    ----------
+    textes : Iterable[str | None]
+        Les mesures
+
+    Returns
+    -------
+    list[MesureAnalysee]
+        Les résultats, dans l'ordre des textes
+
+    """
+    textes = list(textes)
+    distincts = {texte: analyser_mesure(texte) for texte in dict.fromkeys(textes)}
+    return [distincts[texte] for texte in textes]
+
+
+def normaliser_mesure(
+    quantite: float | None,
+    texte: str | None,
+) -> tuple[float | None, Literal["liquide", "solide", "autre"] | None]:
+    """Normalise une quantité de recette dont l'unité est en texte libre.
+
+    La quantité saisie est prioritaire ; à défaut, celle lue dans le texte de
+    l'unité est utilisée (colonne qte vide et unite = "1 1/2 oz").
+
+    Returns
+    -------
+    tuple[float | None, Literal['liquide', 'solide', 'autre'] | None]
+        Voir UnitConverter.normaliser
+
+    Examples
+    --------
+    >>> normaliser_mesure(None, "1 1/2 oz")
+    (44.36, 'liquide')
+    >>> normaliser_mesure(2, "dashes")
+    (1.84, 'liquide')
+
+    """
+    mesure = analyser_mesure(texte)
+    return UnitConverter.normaliser(
+        mesure.quantite if quantite is None else quantite,
+        mesure.unite,
+    )
@@ -0,0 +1,268 @@
+"""Métriques du processus de l'API, exposées au format texte de Prometheus.
+
+Le registre compte les réponses et mesure les latences des routes (par
+modèle de route, voir modele_de_route et le middleware de main.py) et des
+requêtes SQL (par méthode de DAO, voir curseurs_mesures). Il garde aussi des
+jauges, relevées à chaque lecture de /metrics (utilisation des pools, file
+des logs).
+
+Les latences sont rangées dans des histogrammes à précision relative
+constante, à la manière de HdrHistogram : chaque puissance de 2 de
+microsecondes est découpée en 8 seaux, soit au plus 12,5 % d'erreur sur un
+quantile, quelle que soit l'échelle (de la microseconde à la minute).
+L'export Prometheus regroupe ces seaux par puissance de 2 et ajoute les
+quantiles calculés sur les seaux fins.
+"""
+
+import math
+import threading
+
+from starlette.requests import Request
+from starlette.routing import NoMatchFound
+
+from src.utils.singleton import Singleton
+
+HTTP_DUREE = "http_requete_duree_secondes"
+HTTP_REPONSES = "http_reponses_total"
+DAO_DUREE = "dao_requete_duree_secondes"
+DAO_LIGNES = "dao_lignes_total"
+POOL_CONNEXIONS = "pool_connexions"
+POOL_ATTENTES = "pool_attentes_total"
+HACHAGE_EN_COURS = "hachage_operations_en_cours"
+LOGS_EN_ATTENTE = "logs_en_attente"
+LOGS_PERDUS = "logs_perdus_total"
+CACHE_UTILISATEURS = "cache_utilisateurs"
+
+# Route des requêtes qui ne correspondent à aucune route (404)
+NON_ROUTEE = "<non_routé>"
+
+# Type Prometheus et description de chaque famille, dans l'ordre de l'export
+_FAMILLES = {
+    HTTP_DUREE: ("histogram", "Durée de traitement des requêtes HTTP"),
+    HTTP_REPONSES: ("counter", "Réponses HTTP par route et statut"),
+    DAO_DUREE: ("histogram", "Durée des requêtes SQL par méthode de DAO"),
+    DAO_LIGNES: ("counter", "Lignes retournées ou modifiées par méthode de DAO"),
+    POOL_CONNEXIONS: ("gauge", "Connexions des pools par état"),
+    POOL_ATTENTES: ("counter", "Emprunts de connexion qui ont dû attendre"),
+    HACHAGE_EN_COURS: ("gauge", "Hachages bcrypt en cours ou en attente"),
+    LOGS_EN_ATTENTE: ("gauge", "Messages de log en attente d'écriture"),
+    LOGS_PERDUS: ("counter", "Messages de log perdus (file pleine)"),
+    CACHE_UTILISATEURS: ("gauge", "Compteurs du cache des utilisateurs"),
+}
+
+_QUANTILES = (0.5, 0.9, 0.99)
+
+# Seaux des histogrammes : un par microseconde de 0 à 15 us, puis 8 par
+# puissance de 2 jusqu'à 2^36 us (environ 19 h, au-delà tout est rangé au
+# dernier seau)
+_BITS = 3
+_SOUS_SEAUX = 1 << _BITS
+_LINEAIRES = 2 * _SOUS_SEAUX
+_NB_SEAUX = _LINEAIRES + 32 * _SOUS_SEAUX
+
+# Bornes exportées : puissances de 2 de 128 us à 16,8 s
+_PUISSANCES_EXPORTEES = range(7, 25)
+
+
+def _indice(microsecondes: int) -> int:
+    """Retourne le seau d'une durée en microsecondes."""
+    if microsecondes < _LINEAIRES:
+        return max(microsecondes, 0)
+    decalage = microsecondes.bit_length() - _BITS - 1
+    indice = (
+        _LINEAIRES
+        + (decalage - 1) * _SOUS_SEAUX
+        + (microsecondes >> decalage)
+        - _SOUS_SEAUX
+    )
+    return min(indice, _NB_SEAUX - 1)
+
+
+def _borne_superieure(indice: int) -> int:
+    """Retourne la borne supérieure (exclue) d'un seau, en microsecondes."""
+    if indice < _LINEAIRES:
+        return indice + 1
+    decalage, rang = divmod(indice - _LINEAIRES, _SOUS_SEAUX)
+    return (_SOUS_SEAUX + rang + 1) << (decalage + 1)
+
+
+class Histogramme:
+    """Histogramme de latences à précision relative constante.
+
+    N'est pas thread-safe : le registre le protège par son verrou.
+    """
+
+    def __init__(self) -> None:
+        """Initialise un histogramme vide."""
+        self.seaux = [0] * _NB_SEAUX
+        self.nombre = 0
+        self.somme = 0.0
+
+    def observer(self, duree: float) -> None:
+        """Ajoute une durée, en secondes."""
+        self.seaux[_indice(round(duree * 1_000_000))] += 1
+        self.nombre += 1
+        self.somme += duree
+
+    def quantile(self, q: float) -> float:
+        """Retourne le quantile q (entre 0 et 1), en secondes.
+
+        La valeur est la borne supérieure du seau du quantile : elle le
+        surestime d'au plus 12,5 %.
+        """
+        if self.nombre == 0:
+            return math.nan
+        rang = max(math.ceil(q * self.nombre), 1)
+        cumul = 0
+        for indice, nombre in enumerate(self.seaux):
+            cumul += nombre
+            if cumul >= rang:
+                return _borne_superieure(indice) / 1_000_000
+        return _borne_superieure(_NB_SEAUX - 1) / 1_000_000
+
+    def cumuls_exportes(self) -> list[tuple[str, int]]:
+        """Retourne les nombres cumulés de durées sous chaque borne exportée."""
+        cumuls = []
+        cumul, debut = 0, 0
+        for puissance in _PUISSANCES_EXPORTEES:
+            fin = _indice(1 << puissance)
+            cumul += sum(self.seaux[debut:fin])
+            debut = fin
+            cumuls.append((repr((1 << puissance) / 1_000_000), cumul))
+        cumuls.append(("+Inf", self.nombre))
+        return cumuls
+
+
+def _etiquettes(etiquettes: tuple[tuple[str, str], ...], **autres: str) -> str:
+    """Met en forme des étiquettes Prometheus ({nom="valeur",...})."""
+    paires = [*etiquettes, *autres.items()]
+    if not paires:
+        return ""
+    texte = ",".join(f'{nom}="{_echapper(valeur)}"' for nom, valeur in paires)
+    return f"{{{texte}}}"
+
+
+def _echapper(valeur: object) -> str:
+    """Échappe une valeur d'étiquette Prometheus."""
+    return str(valeur).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _nombre(valeur: float) -> str:
+    """Met en forme une valeur Prometheus."""
+    if isinstance(valeur, float) and math.isnan(valeur):
+        return "NaN"
+    return repr(valeur)
+
+
+class RegistreMetriques(metaclass=Singleton):
+    """Métriques du processus, partagées par les threads et la boucle async."""
+
+    def __init__(self) -> None:
+        """Initialise un registre vide."""
+        self._verrou = threading.Lock()
+        self._series: dict[str, dict[tuple, Histogramme | float]] = {
+            nom: {} for nom in _FAMILLES
+        }
+
+    def observer(self, nom: str, duree: float, **etiquettes: str) -> None:
+        """Ajoute une durée (en secondes) à l'histogramme d'une série."""
+        cle = tuple(etiquettes.items())
+        with self._verrou:
+            series = self._series[nom]
+            histogramme = series.get(cle)
+            if histogramme is None:
+                histogramme = series[cle] = Histogramme()
+            histogramme.observer(duree)
+
+    def incrementer(self, nom: str, valeur: float = 1, **etiquettes: str) -> None:
+        """Augmente le compteur d'une série."""
+        cle = tuple(etiquettes.items())
+        with self._verrou:
+            series = self._series[nom]
+            series[cle] = series.get(cle, 0) + valeur
+
+    def definir(self, nom: str, valeur: float, **etiquettes: str) -> None:
+        """Donne sa valeur à une jauge (ou d'un compteur tenu ailleurs)."""
+        with self._verrou:
+            self._series[nom][tuple(etiquettes.items())] = valeur
+
+    def histogramme(self, nom: str, **etiquettes: str) -> Histogramme | None:
+        """Retourne l'histogramme d'une série (None si rien n'a été mesuré)."""
+        with self._verrou:
+            return self._series[nom].get(tuple(etiquettes.items()))
+
+    def exporter(self) -> str:
+        """Retourne toutes les séries au format texte de Prometheus."""
+        lignes = []
+        with self._verrou:
+            for nom, (type_, aide) in _FAMILLES.items():
+                series = self._series[nom]
+                if not series:
+                    continue
+                lignes.extend((f"# HELP {nom} {aide}", f"# TYPE {nom} {type_}"))
+                if type_ == "histogram":
+                    lignes.extend(_lignes_histogrammes(nom, series))
+                else:
+                    lignes.extend(
+                        f"{nom}{_etiquettes(cle)} {_nombre(valeur)}"
+                        for cle, valeur in series.items()
+                    )
+            for nom, (type_, aide) in _FAMILLES.items():
+                if type_ == "histogram" and self._series[nom]:
+                    lignes.extend(_lignes_quantiles(nom, aide, self._series[nom]))
+        return "\n".join(lignes) + "\n"
+
+
+def _lignes_histogrammes(nom: str, series: dict) -> list[str]:
+    """Met en forme les seaux, la somme et le nombre des histogrammes."""
+    lignes = []
+    for cle, histogramme in series.items():
+        lignes.extend(
+            f"{nom}_bucket{_etiquettes(cle, le=borne)} {cumul}"
+            for borne, cumul in histogramme.cumuls_exportes()
+        )
+        lignes.extend(
+            (
+                f"{nom}_sum{_etiquettes(cle)} {_nombre(histogramme.somme)}",
+                f"{nom}_count{_etiquettes(cle)} {histogramme.nombre}",
+            ),
+        )
+    return lignes
+
+
+def _lignes_quantiles(nom: str, aide: str, series: dict) -> list[str]:
+    """Met en forme les quantiles des histogrammes, en jauges."""
+    nom_quantile = nom.removesuffix("_secondes") + "_quantile_secondes"
+    lignes = [
+        f"# HELP {nom_quantile} {aide} (quantiles, erreur au plus 12,5 %)",
+        f"# TYPE {nom_quantile} gauge",
+    ]
+    for cle, histogramme in series.items():
+        lignes.extend(
+            f"{nom_quantile}{_etiquettes(cle, quantile=str(q))} "
+            f"{_nombre(histogramme.quantile(q))}"
+            for q in _QUANTILES
+        )
+    return lignes
+
+
+def modele_de_route(request: Request) -> str:
+    """Retourne le modèle de la route d'une requête (ex: /api/cocktails/{id}).
+
+    Le modèle est celui de la route trouvée par le routeur (scope["route"]),
+    précédé des préfixes des routeurs inclus (api_router) que FastAPI n'y
+    reporte pas : ils sont repris du chemin de la requête, devant le chemin
+    concret de la route. Une requête qui ne correspond à aucune route est
+    comptée sous NON_ROUTEE, pour que des chemins arbitraires ne créent pas
+    autant de séries.
+    """
+    route = request.scope.get("route")
+    if route is None:
+        return NON_ROUTEE
+    chemin = request.scope["path"]
+    try:
+        concret = route.url_path_for(route.name, **request.path_params)
+    except NoMatchFound:
+        return route.path
+    prefixe = chemin.removesuffix(concret) if chemin.endswith(concret) else ""
+    return prefixe + route.path
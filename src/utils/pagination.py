@@ -0,0 +1,90 @@
+"""Curseurs de pagination des listes de cocktails.
+
+Un curseur encode la clé de tri du dernier élément d'une page : la page
+suivante commence au premier élément de clé strictement supérieure, ce qui
+reste stable même si des éléments sont ajoutés entre deux requêtes.
+"""
+
+import base64
+import binascii
+import json
+
+from src.utils.exceptions import InvalidCursorError
+
+
+def cle_quasi_realisable(cocktail: dict) -> tuple[int, float, str, int]:
+    """Clé de tri d'un cocktail quasi-réalisable.
+
+    Parameters
+    ----------
+    cocktail : dict
+        Cocktail au format de CocktailService.filter_and_format_cocktails
+
+    Returns
+    -------
+    tuple[int, float, str, int]
+        (nombre d'ingrédients manquants, -pourcentage de possession, nom,
+        id_cocktail)
+
+    """
+    return (
+        cocktail["nombre_ingredients_manquants"],
+        -cocktail["pourcentage_possession"],
+        cocktail["nom"],
+        cocktail["id_cocktail"],
+    )
+
+
+# Types des éléments de la clé de tri des cocktails quasi-réalisables
+TYPES_QUASI_REALISABLE = (int, (int, float), str, int)
+
+# Types des éléments de la clé de la recherche plein texte : (rang, id_cocktail)
+TYPES_RECHERCHE_TEXTE = ((int, float), int)
+
+# Types des éléments de la clé du parcours du catalogue : (nom, id_cocktail)
+TYPES_CATALOGUE = (str, int)
+
+
+def encoder_curseur(cle: tuple) -> str:
+    """Encode une clé de tri en curseur opaque (base64 url-safe)."""
+    return base64.urlsafe_b64encode(json.dumps(cle).encode()).decode()
+
+
+def decoder_curseur(
+    curseur: str,
+    types: tuple = TYPES_QUASI_REALISABLE,
+) -> tuple:
+    """Décode un curseur produit par encoder_curseur.
+
+    Parameters
+    ----------
+    curseur : str
+        Le curseur reçu
+    types : tuple
+        Type attendu de chaque élément de la clé ; les nombres (int, float)
+        sont rendus en float
+
+    Raises
+    ------
+    InvalidCursorError
+        Si le curseur n'a pas été produit par encoder_curseur
+
+    """
+    try:
+        cle = json.loads(base64.urlsafe_b64decode(curseur.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError from e
+
+    if (
+        not isinstance(cle, list)
+        or len(cle) != len(types)
+        or not all(
+            isinstance(valeur, attendu) and not isinstance(valeur, bool)
+            for valeur, attendu in zip(cle, types, strict=False)
+        )
+    ):
+        raise InvalidCursorError
+    return tuple(
+        float(valeur) if attendu == (int, float) else valeur
+        for valeur, attendu in zip(cle, types, strict=True)
+    )
@@ -0,0 +1,121 @@
+"""Pool de processus dédié au hachage des mots de passe.
+
+bcrypt est lent par construction (environ 250 ms par hachage ou vérification
+avec 12 tours) : appelé dans les routes, il occupait les threads du serveur et
+une rafale de connexions bloquait tous les autres endpoints. Les hachages et
+vérifications sont confiés à BCRYPT_WORKERS processus, attendus sans bloquer
+la boucle d'évènements.
+
+Au-delà de BCRYPT_WORKERS + BCRYPT_MAX_QUEUE opérations en cours ou en
+attente, une nouvelle demande est refusée aussitôt (HachageSatureError, que
+l'API traduit en 503) plutôt que d'allonger une file qu'aucun client
+n'attendra.
+
+Les processus ne sont pas créés par fork : l'API a déjà des threads (écriture
+des logs, pools de connexions, threads d'anyio) et un processus forké pendant
+que l'un d'eux tient un verrou resterait bloqué sur ce verrou. Ils sont
+lancés par un serveur de fork démarré à vide (forkserver), ou à défaut
+(hors Unix) par spawn.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from src.utils.exceptions import HachageSatureError
+from src.utils.securite import hacher_mot_de_passe, verifier_mot_de_passe
+from src.utils.settings import settings
+from src.utils.singleton import Singleton
+
+_METHODE_DE_DEMARRAGE = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _nouvel_executeur() -> ProcessPoolExecutor:
+    """Crée un pool de BCRYPT_WORKERS processus, lancés sans fork."""
+    return ProcessPoolExecutor(
+        max_workers=settings.BCRYPT_WORKERS,
+        mp_context=multiprocessing.get_context(_METHODE_DE_DEMARRAGE),
+    )
+
+
+class PoolHachage(metaclass=Singleton):
+    """Processus de hachage partagés par tout le processus de l'API."""
+
+    def __init__(self) -> None:
+        """Initialise le pool, créé par demarrer ou à défaut au premier usage."""
+        self._verrou = threading.Lock()
+        self._executeur: ProcessPoolExecutor | None = None
+        self._en_cours = 0
+
+    @property
+    def en_cours(self) -> int:
+        """Nombre d'opérations en cours ou en attente d'un processus."""
+        with self._verrou:
+            return self._en_cours
+
+    def demarrer(self) -> None:
+        """Crée le pool de processus (au démarrage de l'API)."""
+        with self._verrou:
+            if self._executeur is None:
+                self._executeur = _nouvel_executeur()
+
+    def _soumettre(self, fonction: Callable, *arguments: str) -> Future:
+        """Confie une opération au pool, ou la refuse s'il est saturé."""
+        with self._verrou:
+            if self._en_cours >= settings.BCRYPT_WORKERS + settings.BCRYPT_MAX_QUEUE:
+                raise HachageSatureError(self._en_cours)
+            if self._executeur is None:
+                self._executeur = _nouvel_executeur()
+            try:
+                futur = self._executeur.submit(fonction, *arguments)
+            except BrokenProcessPool:
+                # Un processus est mort : le pool est inutilisable, on le remplace
+                self._executeur.shutdown(wait=False, cancel_futures=True)
+                self._executeur = _nouvel_executeur()
+                futur = self._executeur.submit(fonction, *arguments)
+            self._en_cours += 1
+        futur.add_done_callback(self._terminer)
+        return futur
+
+    def _terminer(self, _futur: Future) -> None:
+        """Libère la place d'une opération terminée."""
+        with self._verrou:
+            self._en_cours -= 1
+
+    async def hacher(self, mot_de_passe: str) -> str:
+        """Hache un mot de passe dans un processus du pool.
+
+        Raises
+        ------
+        HachageSatureError
+            Si le pool a déjà trop d'opérations en cours ou en attente
+
+        """
+        return await asyncio.wrap_future(
+            self._soumettre(hacher_mot_de_passe, mot_de_passe),
+        )
+
+    async def verifier(self, mot_de_passe: str, hashed_mot_de_passe: str) -> bool:
+        """Vérifie un mot de passe avec son hachage dans un processus du pool.
+
+        Raises
+        ------
+        HachageSatureError
+            Si le pool a déjà trop d'opérations en cours ou en attente
+
+        """
+        return await asyncio.wrap_future(
+            self._soumettre(verifier_mot_de_passe, mot_de_passe, hashed_mot_de_passe),
+        )
+
+    def fermer(self) -> None:
+        """Arrête les processus du pool (à l'arrêt de l'API)."""
+        with self._verrou:
+            executeur, self._executeur = self._executeur, None
+        if executeur is not None:
+            executeur.shutdown(wait=True, cancel_futures=True)
@@ -11,7 +11,11 @@ from passlib.context import CryptContext
 
 from src.utils.settings import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 ALGORITHM = "HS256"
 
 
@@ -25,15 +29,35 @@ def verifier_mot_de_passe(mot_de_passe: str, hashed_mot_de_passe: str) -> bool:
     return pwd_context.verify(mot_de_passe, hashed_mot_de_passe)
 
 
-def create_access_token(subject: int, expires_delta: timedelta) -> str:
+def hachage_a_migrer(hashed_mot_de_passe: str) -> bool:
+    """Indique si un hachage n'a pas le coût configuré (BCRYPT_ROUNDS)."""
+    return pwd_context.needs_update(hashed_mot_de_passe)
+
+
+def create_access_token(
+    subject: int,
+    expires_delta: timedelta,
+    pseudo: str,
+    version: int,
+) -> str:
     """Create a JWT access token.
 
+    The token carries the user's pseudo and credentials version, so that
+    routes can identify the user without reading the database.
+
     :param subject: Subject (user ID) for the token
     :param expires_delta: Expiration time delta
+    :param pseudo: User's pseudo
+    :param version: User's credentials version (utilisateur.version_identifiants)
     :return: Encoded JWT token
     """
     expire = datetime.now(UTC) + expires_delta
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {
+        "exp": expire,
+        "sub": str(subject),
+        "pseudo": pseudo,
+        "ver": version,
+    }
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
 
 
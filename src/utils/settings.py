@@ -3,6 +3,8 @@
 Defines environment variables and computed properties for database connection.
 """
 
+from typing import Literal
+
 from pydantic import PostgresDsn, computed_field
 from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -31,6 +33,33 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_PORT: int
 
+    POSTGRES_POOL_MIN_SIZE: int = 1
+    POSTGRES_POOL_MAX_SIZE: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 5.0
+
+    RECIPE_INDEX_TTL: float = 300.0
+    REALISABLES_CACHE_TTL: float = 300.0
+    REALISABLES_CACHE_MAX_USERS: int = 10_000
+    USER_CACHE_TTL: float = 60.0
+    USER_CACHE_MAX_USERS: int = 10_000
+    UNIT_RELOAD_COOLDOWN: float = 1.0
+    # Hachage des mots de passe : coût bcrypt (les hachages d'un autre coût
+    # sont refaits à la connexion), processus dédiés et opérations acceptées
+    # en attente d'un processus libre
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_WORKERS: int = 2
+    BCRYPT_MAX_QUEUE: int = 32
+    # Logs : niveau, taille de la file des messages en attente d'écriture
+    # (au-delà, ils sont perdus) et part des requêtes dont les traces DEBUG
+    # des DAO sont gardées. Le décorateur @log trace au niveau DEBUG (et non
+    # plus INFO) : LOG_LEVEL=DEBUG pour voir l'entrée et la sortie des DAO
+    LOG_LEVEL: str = "INFO"
+    LOG_QUEUE_SIZE: int = 10_000
+    LOG_DEBUG_SAMPLE_RATE: float = 0.01
+    # Moteur des cocktails quasi-réalisables : "index" (matrice en mémoire) ou
+    # "sql" (décompte des ingrédients manquants fait par la base)
+    QUASI_REALISABLES_ENGINE: Literal["index", "sql"] = "index"
+
     @computed_field
     def postgres_dsn(self) -> PostgresDsn:
         """Compute postgres url from variables.
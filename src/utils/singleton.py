@@ -8,3 +8,12 @@ class Singleton(type):
             instance = super().__call__(*args, **kwargs)
             cls._instances[cls] = instance
         return cls._instances[cls]
+
+    def instance_existante(cls):
+        """Retourne l'instance de la classe si elle a déjà été créée, sinon None."""
+        return Singleton._instances.get(cls)
+
+    @staticmethod
+    def reinitialiser() -> None:
+        """Oublie toutes les instances (les prochains appels en recréent)."""
+        Singleton._instances.clear()
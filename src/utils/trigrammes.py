@@ -0,0 +1,135 @@
+"""Similarité par trigrammes, identique à SIMILARITY de l'extension pg_trgm.
+
+Chaque mot (suite de lettres et de chiffres) est mis en minuscules et entouré
+de deux espaces à gauche et d'un à droite ; ses trigrammes sont toutes les
+suites de trois caractères consécutifs. La similarité de deux textes est le
+nombre de trigrammes communs divisé par le nombre de trigrammes distincts des
+deux textes, calculée comme pg_trgm en simple précision (real) : comparée à un
+seuil (SIMILARITY(...) > 0.2), 1/5 le dépasse donc, comme en base.
+
+IndexTrigrammes cherche les noms les plus similaires à un texte sans parcourir
+tout le catalogue : un index inversé (trigramme -> noms qui le contiennent)
+compte les trigrammes communs des seuls noms qui en partagent au moins un.
+"""
+
+import re
+from collections import Counter
+from heapq import nsmallest
+
+import numpy as np
+
+_MOT = re.compile(r"[^\W_]+")
+
+# Seuil par défaut de pg_trgm (pg_trgm.similarity_threshold)
+SEUIL_SIMILARITE = 0.3
+
+
+def trigrammes(texte: str) -> frozenset[str]:
+    """Retourne les trigrammes d'un texte, comme show_trgm de pg_trgm.
+
+    Examples
+    --------
+    >>> sorted(trigrammes("Rhum"))
+    ['  r', ' rh', 'hum', 'rhu', 'um ']
+
+    """
+    return frozenset(
+        mot[i : i + 3]
+        for mot in (f"  {mot} " for mot in _MOT.findall(texte.lower()))
+        for i in range(len(mot) - 2)
+    )
+
+
+def _score(communs: int, taille_a: int, taille_b: int) -> float:
+    """Retourne la similarité en simple précision, comme pg_trgm."""
+    if not taille_a or not taille_b:
+        return 0.0
+    return float(np.float32(communs / (taille_a + taille_b - communs)))
+
+
+def similarite(texte_a: str, texte_b: str) -> float:
+    """Retourne la similarité de deux textes, comme SIMILARITY de pg_trgm.
+
+    Examples
+    --------
+    >>> round(similarite("Rhum", "Rum"), 4)
+    0.2857
+
+    """
+    a, b = trigrammes(texte_a), trigrammes(texte_b)
+    return _score(len(a & b), len(a), len(b))
+
+
+class IndexTrigrammes:
+    """Index inversé des trigrammes des noms d'un catalogue."""
+
+    def __init__(self, lignes: list[dict], cle: str = "nom") -> None:
+        """Indexe les lignes d'après leur colonne cle.
+
+        Parameters
+        ----------
+        lignes : list[dict]
+            Les lignes du catalogue (ex: id_ingredient, nom)
+        cle : str
+            Colonne contenant le nom
+
+        """
+        self._cle = cle
+        self._lignes: list[dict] = []
+        self._tailles: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        for ligne in lignes:
+            self.ajouter(ligne)
+
+    def ajouter(self, ligne: dict) -> None:
+        """Ajoute une ligne à l'index."""
+        position = len(self._lignes)
+        trigrammes_nom = trigrammes(ligne[self._cle])
+        self._lignes.append(ligne)
+        self._tailles.append(len(trigrammes_nom))
+        for trigramme in trigrammes_nom:
+            self._postings.setdefault(trigramme, []).append(position)
+
+    def rechercher(
+        self,
+        texte: str,
+        limite: int,
+        seuil: float = SEUIL_SIMILARITE,
+    ) -> list[dict]:
+        """Retourne les lignes dont le nom est le plus similaire au texte.
+
+        Equivalent à WHERE SIMILARITY(nom, texte) > seuil
+        ORDER BY SIMILARITY(nom, texte) DESC LIMIT limite (à égalité, par nom).
+
+        Parameters
+        ----------
+        texte : str
+            Le texte recherché
+        limite : int
+            Nombre maximum de résultats
+        seuil : float
+            Similarité à dépasser strictement
+
+        Returns
+        -------
+        list[dict]
+            Les lignes, de la plus similaire à la moins similaire
+
+        """
+        trigrammes_texte = trigrammes(texte)
+        communs = Counter(
+            position
+            for trigramme in trigrammes_texte
+            for position in self._postings.get(trigramme, ())
+        )
+        taille = len(trigrammes_texte)
+        scores = (
+            (_score(nb, taille, self._tailles[position]), position)
+            for position, nb in communs.items()
+        )
+        meilleurs = nsmallest(
+            limite,
+            ((score, position) for score, position in scores if score > seuil),
+            key=lambda candidat: (-candidat[0], self._lignes[candidat[1]][self._cle]),
+        )
+        return [self._lignes[position] for _, position in meilleurs]